@@ -0,0 +1,171 @@
+"""
+Browser Profile Benchmark
+Launch time and memory of each browser profile (scrapers/browser_profiles.py)
+
+For every profile and round: launch Chromium, open a context with the
+profile's viewport, render a few archived pages (or live URLs) in tabs, then
+measure the browser's resident memory before closing it. Memory is summed
+over the Chromium processes started by this run; PSS (shared pages split
+between processes) is shown where /proc provides it.
+
+Usage:
+    python benchmark_browser_profiles.py                     # archived pages, 3 rounds
+    python benchmark_browser_profiles.py --rounds 5 --tabs 4
+    python benchmark_browser_profiles.py --url https://roadsurfer.com/
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASE_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.browser_profiles import BROWSER_PROFILES, BrowserProfile, launch_browser
+
+
+def _child_pids(root: int) -> List[int]:
+    """Every descendant process of root (Linux /proc)"""
+    parents: Dict[int, List[int]] = {}
+    for entry in Path('/proc').iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / 'stat').read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces, so split after its closing paren
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        parents.setdefault(ppid, []).append(int(entry.name))
+
+    found, stack = [], [root]
+    while stack:
+        for child in parents.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _read_kb(path: Path, key: str) -> Optional[int]:
+    try:
+        for line in path.read_text().splitlines():
+            if line.startswith(key):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def browser_memory_mb() -> Dict[str, Optional[float]]:
+    """RSS and PSS (MB) of the Chromium processes under this interpreter"""
+    if not Path('/proc').is_dir():
+        return {'rss': None, 'pss': None}
+
+    rss = pss = 0
+    has_pss = True
+    for pid in _child_pids(os.getpid()):
+        proc = Path('/proc') / str(pid)
+        try:
+            comm = (proc / 'comm').read_text()
+        except OSError:
+            continue
+        if 'chrom' not in comm and 'headless' not in comm:
+            continue
+        rss += _read_kb(proc / 'status', 'VmRSS:') or 0
+        value = _read_kb(proc / 'smaps_rollup', 'Pss:')
+        if value is None:
+            has_pss = False
+        else:
+            pss += value
+    return {'rss': rss / 1024, 'pss': pss / 1024 if has_pss else None}
+
+
+def load_pages(limit: int) -> List[str]:
+    """The largest archived pages, so rendering cost is realistic"""
+    from reextract_html_archive import DEFAULT_ARCHIVE_PATTERNS, discover_pages
+
+    paths = sorted(discover_pages(DEFAULT_ARCHIVE_PATTERNS), key=lambda p: p.stat().st_size, reverse=True)
+    return [p.read_text(encoding='utf-8', errors='replace') for p in paths[:limit]]
+
+
+async def run_round(playwright, profile: BrowserProfile, pages: List[str], urls: List[str], tabs: int) -> Dict:
+    start = time.perf_counter()
+    browser = await launch_browser(playwright, profile)
+    launched = time.perf_counter()
+    try:
+        context = await browser.new_context(**profile.context_options())
+        profile.apply_timeouts(context)
+
+        async def render(index: int):
+            page = await context.new_page()
+            if urls:
+                await page.goto(urls[index % len(urls)], wait_until='load')
+            elif pages:
+                await page.set_content(pages[index % len(pages)], wait_until='load')
+
+        await asyncio.gather(*(render(i) for i in range(tabs)))
+        rendered = time.perf_counter()
+        memory = browser_memory_mb()
+    finally:
+        await browser.close()
+
+    return {
+        'launch_s': launched - start,
+        'render_s': rendered - launched,
+        'rss_mb': memory['rss'],
+        'pss_mb': memory['pss'],
+    }
+
+
+async def benchmark(rounds: int, tabs: int, urls: List[str]) -> Dict[str, Dict]:
+    """
+    Measure every profile.
+
+    Args:
+        rounds: Browser launches per profile (median is reported)
+        tabs: Pages rendered concurrently per launch
+        urls: Live URLs to load instead of archived pages
+
+    Returns:
+        Dict mapping profile name to median launch_s, render_s, rss_mb, pss_mb
+    """
+    from playwright.async_api import async_playwright
+
+    pages = [] if urls else load_pages(tabs)
+    source = f"{len(urls)} live URL(s)" if urls else f"{len(pages)} archived page(s)"
+    print(f"🌐 {tabs} tab(s) per launch from {source}, median of {rounds} rounds\n")
+
+    results = {}
+    async with async_playwright() as playwright:
+        for name, profile in BROWSER_PROFILES.items():
+            runs = [await run_round(playwright, profile, pages, urls, tabs) for _ in range(rounds)]
+            results[name] = {
+                key: statistics.median(r[key] for r in runs) if runs[0][key] is not None else None
+                for key in runs[0]
+            }
+
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else format('n/a', '>9')
+
+    print(f"{'Profile':<10} {'launch s':>9} {'render s':>9} {'RSS MB':>9} {'PSS MB':>9}")
+    print("-" * 50)
+    for name, r in results.items():
+        print(f"{name:<10} {fmt(r['launch_s'], '9.2f')} {fmt(r['render_s'], '9.2f')} "
+              f"{fmt(r['rss_mb'], '9.0f')} {fmt(r['pss_mb'], '9.0f')}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark browser launch profiles')
+    parser.add_argument('--rounds', type=int, default=3, help='Launches per profile')
+    parser.add_argument('--tabs', type=int, default=3, help='Pages rendered per launch')
+    parser.add_argument('--url', action='append', default=[], help='Live URL to load (repeatable)')
+
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.rounds, args.tabs, args.url))
@@ -0,0 +1,129 @@
+"""
+HTML Parsing Benchmark
+Compares BeautifulSoup html.parser with the shared parsing layer on saved pages
+
+Runs the same work the botasaurus scrapers do per page - flat visible text
+plus the three price find_all lookups - over the HTML archive, once per
+available backend.
+
+Usage:
+    python benchmark_html_parsing.py                  # whole archive, 5 rounds
+    python benchmark_html_parsing.py --rounds 20
+    python benchmark_html_parsing.py research/*.html
+"""
+
+import argparse
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BASE_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers import html_parsing
+from reextract_html_archive import DEFAULT_ARCHIVE_PATTERNS, discover_pages
+
+PRICE_STRING = re.compile(r'[€$]\s*\d+|\d+\s*[€$]')
+PRICE_CLASS = re.compile(r'price|cost|rate|amount', re.I)
+PRICE_TAGS = ['span', 'div', 'p', 'strong', 'h1', 'h2', 'h3']
+
+
+def run_beautifulsoup(html: str) -> int:
+    """Baseline: what the scrapers did before the shared parsing layer"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    text = soup.get_text(separator=' ', strip=True)
+    found = len(soup.find_all(PRICE_TAGS, string=PRICE_STRING))
+    found += len(soup.find_all(attrs={'data-price': True}))
+    found += len(soup.find_all(class_=PRICE_CLASS))
+    return len(text) + found
+
+
+def run_shared_layer(html: str) -> int:
+    """The same work through scrapers.html_parsing"""
+    doc = html_parsing.parse_html(html)
+    text = doc.get_text(separator=' ')
+    found = len(doc.find_all(PRICE_TAGS, string=PRICE_STRING))
+    found += len(doc.find_all(attrs={'data-price': True}))
+    found += len(doc.find_all(class_=PRICE_CLASS))
+    return len(text) + found
+
+
+def available_backends() -> List[str]:
+    backends = []
+    if html_parsing.HAS_SELECTOLAX:
+        backends.append('selectolax')
+    if html_parsing.HAS_LXML:
+        backends.append('lxml')
+    backends.append('stdlib')
+    return backends
+
+
+def time_runner(runner: Callable[[str], int], pages: List[str], rounds: int) -> float:
+    """Best-of-N seconds to process every page once"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for html in pages:
+            runner(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(patterns: List[str], rounds: int) -> Dict[str, float]:
+    """
+    Time every parser over the archive.
+
+    Args:
+        patterns: Archive globs, directories or files
+        rounds: Timing rounds per parser (best round is reported)
+
+    Returns:
+        Dict mapping parser name to best seconds per pass over the archive
+    """
+    paths = discover_pages(patterns)
+    pages = [p.read_text(encoding='utf-8', errors='replace') for p in paths]
+    total_mb = sum(len(html) for html in pages) / 1_000_000
+    print(f"📂 {len(pages)} pages, {total_mb:.1f} MB of HTML, best of {rounds} rounds\n")
+
+    results = {}
+    if importlib.util.find_spec('bs4') is not None:
+        results['beautifulsoup (html.parser)'] = time_runner(run_beautifulsoup, pages, rounds)
+    else:
+        print("⚠️ bs4 not installed - skipping the BeautifulSoup baseline")
+
+    # Each backend is timed with the flags forced, so lxml and stdlib are
+    # measured even when selectolax is installed
+    saved = (html_parsing.BACKEND, html_parsing.HAS_SELECTOLAX, html_parsing.HAS_LXML)
+    try:
+        for backend in available_backends():
+            html_parsing.BACKEND = backend
+            html_parsing.HAS_SELECTOLAX = backend == 'selectolax'
+            html_parsing.HAS_LXML = backend in ('selectolax', 'lxml') and saved[2]
+            results[f"html_parsing ({backend})"] = time_runner(run_shared_layer, pages, rounds)
+    finally:
+        html_parsing.BACKEND, html_parsing.HAS_SELECTOLAX, html_parsing.HAS_LXML = saved
+
+    baseline = results.get('beautifulsoup (html.parser)')
+    print(f"{'Parser':<32} {'ms/page':>10} {'pages/sec':>10} {'speedup':>9}")
+    print("-" * 64)
+    for name, seconds in results.items():
+        per_page = seconds / len(pages) * 1000 if pages else 0.0
+        rate = len(pages) / seconds if seconds > 0 else 0.0
+        speedup = f"{baseline / seconds:.1f}x" if baseline and seconds > 0 else '-'
+        print(f"{name:<32} {per_page:>10.2f} {rate:>10.1f} {speedup:>9}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark HTML parsing backends on saved pages')
+    parser.add_argument('paths', nargs='*', help='Globs, directories or files (default: whole archive)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timing rounds per parser')
+
+    args = parser.parse_args()
+    benchmark(args.paths or DEFAULT_ARCHIVE_PATTERNS, args.rounds)
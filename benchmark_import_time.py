@@ -0,0 +1,130 @@
+"""
+Import Time Benchmark
+Startup cost of a single-competitor scrape and of the dashboard, eager vs lazy
+
+Each scenario runs in a fresh interpreter under `python -X importtime`; the
+reported time is the sum of its top-level imports minus an empty interpreter's,
+median of several runs. The eager scenarios import what the old module layout
+loaded up front (every tier 1 scraper plus Playwright; pandas, plotly and the
+models for the dashboard), so the table shows the gain from lazy loading.
+
+Lazy scenarios also fail the run if they pull in a module they should defer
+(e.g. Playwright for a registry lookup), which makes this usable as a
+regression check.
+
+Usage:
+    python benchmark_import_time.py
+    python benchmark_import_time.py --rounds 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BASE_DIR = Path(__file__).parent.resolve()
+
+# (name, statement, compared against, modules that must not be imported)
+SCENARIOS: List[Tuple[str, str, str, Tuple[str, ...]]] = [
+    (
+        'scraper: eager (all tier 1 + playwright)',
+        "import playwright.async_api, scrapers.tier1_scrapers as t; [getattr(t, n) for n in t.__all__]",
+        '',
+        (),
+    ),
+    (
+        'scraper: registry (one competitor)',
+        "from scrapers.registry import get_scraper_class; get_scraper_class('McRent')",
+        'scraper: eager (all tier 1 + playwright)',
+        ('playwright', 'scrapers.competitors.roadsurfer', 'scrapers.competitors.goboony'),
+    ),
+    (
+        'dashboard: eager imports',
+        "import streamlit, pandas, plotly.express, plotly.graph_objects, database.models",
+        '',
+        (),
+    ),
+    (
+        'dashboard: app module (cold start)',
+        "import dashboard.app",
+        'dashboard: eager imports',
+        ('pandas', 'plotly.express', 'database.models'),
+    ),
+]
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Top-level module -> cumulative microseconds for one fresh interpreter"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit() and not name[1:].startswith(' '):
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def all_imported(statement: str) -> List[str]:
+    """Every module a statement imports"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    return [line.split('|')[2].strip() for line in proc.stderr.splitlines()
+            if line.startswith('import time:') and line.count('|') == 2]
+
+
+def measure(statement: str, rounds: int, baseline_ms: float = 0.0) -> float:
+    """Median milliseconds of import work for a statement"""
+    totals = [sum(import_times(statement).values()) / 1000 for _ in range(rounds)]
+    return max(statistics.median(totals) - baseline_ms, 0.0)
+
+
+def benchmark(rounds: int) -> bool:
+    """
+    Time every scenario and check the lazy ones.
+
+    Args:
+        rounds: Fresh interpreters per scenario (median is reported)
+
+    Returns:
+        True if no lazy scenario imported a deferred module
+    """
+    baseline = measure('pass', rounds)
+    print(f"⏱️ median of {rounds} runs, interpreter startup ({baseline:.1f} ms) subtracted\n")
+
+    results: Dict[str, float] = {}
+    ok = True
+    print(f"{'Scenario':<44} {'ms':>9} {'speedup':>9}")
+    print("-" * 64)
+    for name, statement, compare_to, forbidden in SCENARIOS:
+        results[name] = measure(statement, rounds, baseline)
+        reference = results.get(compare_to)
+        speedup = f"{reference / results[name]:.1f}x" if reference and results[name] > 0 else '-'
+        print(f"{name:<44} {results[name]:>9.1f} {speedup:>9}")
+
+        if forbidden:
+            leaked = sorted({m for m in all_imported(statement) if m.startswith(forbidden)})
+            if leaked:
+                ok = False
+                print(f"   ⚠️ imported deferred modules: {', '.join(leaked[:5])}")
+
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark scraper and dashboard import time')
+    parser.add_argument('--rounds', type=int, default=5, help='Fresh interpreters per scenario')
+
+    args = parser.parse_args()
+    sys.exit(0 if benchmark(args.rounds) else 1)
@@ -1,12 +1,12 @@
 """
 Focused Competitive Intelligence Dashboard
 Actionable insights > Raw data
+
+pandas, plotly and the database models are imported where they are first
+used, so the page header and sidebar render before those load.
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -14,11 +14,6 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database.models import (
-    get_session, CompetitorPrice, MarketIntelligence,
-    PriceAlert, CompetitorIntelligence
-)
-
 # Page config
 st.set_page_config(
     page_title="Indie Campers Intelligence",
@@ -61,6 +56,7 @@ st.markdown("""
 def export_data_to_csv(prices):
     """Export price data to CSV"""
     import io
+    import pandas as pd
     
     if not prices:
         st.warning("No data to export")
@@ -85,20 +81,12 @@ def export_data_to_csv(prices):
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_latest_data():
     """Load latest intelligence data with caching"""
-    session = get_session()
+    from database.models import get_session, get_current_prices, MarketIntelligence, PriceAlert
 
-    # Get latest price for each competitor
-    from sqlalchemy import func
-    subquery = session.query(
-        CompetitorPrice.company_name,
-        func.max(CompetitorPrice.scrape_timestamp).label('max_timestamp')
-    ).group_by(CompetitorPrice.company_name).subquery()
+    session = get_session()
 
-    prices = session.query(CompetitorPrice).join(
-        subquery,
-        (CompetitorPrice.company_name == subquery.c.company_name) &
-        (CompetitorPrice.scrape_timestamp == subquery.c.max_timestamp)
-    ).all()
+    # Latest price for each competitor (one row per company)
+    prices = get_current_prices(session)
 
     # Convert to dictionaries for caching
     prices_data = [{
@@ -331,6 +319,8 @@ def show_executive_summary(prices, market, alerts):
     st.subheader("🏢 Competitor Snapshot")
 
     if prices:
+        import pandas as pd
+
         # Define regional groups
         european_competitors = ['Roadsurfer', 'McRent', 'Goboony', 'Yescapa', 'Camperdays']
         us_competitors = ['Outdoorsy', 'RVshare', 'Cruise America']
@@ -383,6 +373,9 @@ def show_price_intelligence(prices, market):
     price_data = [p['base_nightly_rate'] for p in prices if p.get('base_nightly_rate')]
     
     if price_data:
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         col1, col2 = st.columns(2)
         
         with col1:
@@ -15,7 +15,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.models import (
-    get_session, CompetitorPrice, MarketIntelligence,
+    get_session, get_current_prices, MarketIntelligence,
     PriceAlert, CompetitorIntelligence
 )
 
@@ -82,18 +82,8 @@ def load_latest_data():
     """Load latest intelligence data with caching"""
     session = get_session()
 
-    # Get latest price for each competitor
-    from sqlalchemy import func
-    subquery = session.query(
-        CompetitorPrice.company_name,
-        func.max(CompetitorPrice.scrape_timestamp).label('max_timestamp')
-    ).group_by(CompetitorPrice.company_name).subquery()
-
-    prices = session.query(CompetitorPrice).join(
-        subquery,
-        (CompetitorPrice.company_name == subquery.c.company_name) &
-        (CompetitorPrice.scrape_timestamp == subquery.c.max_timestamp)
-    ).all()
+    # Latest price for each competitor (one row per company)
+    prices = get_current_prices(session)
 
     # Convert to dict format
     price_data = []
@@ -16,6 +16,36 @@ st.set_page_config(page_title="Pricing Calendar", page_icon="📅", layout="wide
 st.title("📅 Comprehensive Pricing Calendar")
 st.markdown("**Model-specific pricing for every date across all competitors**")
 
+
+@st.cache_data(ttl=300)
+def load_market_rollups(period: str) -> pd.DataFrame:
+    """Pre-aggregated company pricing per week/month (database/price_rollups.py)"""
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from database.pricing_calendar_schema import get_pricing_session
+    from database.price_rollups import load_rollups
+
+    session = get_pricing_session()
+    try:
+        return load_rollups(session, period)
+    except Exception:
+        # Pricing database not initialised yet
+        return pd.DataFrame()
+    finally:
+        session.close()
+
+
+# Market overview from the rollup tables
+rollup_period = st.radio("Market overview by", ["week", "month"], horizontal=True)
+rollups = load_market_rollups(rollup_period)
+if not rollups.empty:
+    fig = px.line(rollups, x='period_start', y='avg_price_per_night', color='company_name',
+                  hover_data=['min_price_per_night', 'max_price_per_night', 'num_models_available'],
+                  title=f"Average price per night by {rollup_period}", markers=True)
+    fig.update_layout(height=400, hovermode='x unified')
+    st.plotly_chart(fig, use_container_width=True)
+    st.divider()
+
 # Load latest pricing calendar
 calendar_files = list(Path("output").glob("pricing_calendar_*.json"))
 if not calendar_files:
@@ -3,7 +3,6 @@ Data Quality Validator
 Validate, clean, and ensure quality of scraped data
 """
 
-import sqlite3
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -22,16 +21,21 @@ BASE_DIR = Path(__file__).parent.resolve()
 
 try:
     from core_config import config as sys_config
-    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_PATH)
+    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_URL)
 except ImportError:
     DEFAULT_DB_PATH = str(BASE_DIR / "database" / "campervan_intelligence.db")
 
+from database.engine import create_database_engine
+from database.queries import PriceQueries, since_days
+from database.retention import apply_retention
+
 
 class DataValidator:
     """Validate and maintain data quality"""
     
     def __init__(self, db_path: str | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
+        self.queries = PriceQueries(self.db_path)
         
         # Quality thresholds
         self.min_price = 20  # Minimum realistic price (€/night)
@@ -91,22 +95,18 @@ class DataValidator:
     def check_for_duplicates(self, price_data: Dict[str, Any]) -> bool:
         """Check if this exact data already exists"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT COUNT(*) FROM prices
-                WHERE company_name = ?
-                AND base_price = ?
-                AND scrape_date = date(?)
-            """, (
-                price_data.get('company_name'),
-                price_data.get('base_price'),
+            day = datetime.fromisoformat(
                 price_data.get('scrape_date', datetime.now().strftime('%Y-%m-%d'))
-            ))
+            ).date()
             
-            count = cursor.fetchone()[0]
-            conn.close()
+            # Same company and price scraped on the same day
+            count = self.queries.scalar(
+                'duplicate_count',
+                company=price_data.get('company_name'),
+                price=price_data.get('base_price'),
+                day_start=day.isoformat(),
+                day_end=(day + timedelta(days=1)).isoformat()
+            )
             
             return count > 0
             
@@ -117,29 +117,10 @@ class DataValidator:
     def detect_anomalies(self, company: str = None) -> List[Dict[str, Any]]:
         """Detect price anomalies (outliers)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            where_clause = ""
             if company:
-                where_clause = f"WHERE company_name = '{company}'"
-            
-            query = f"""
-                SELECT 
-                    id,
-                    company_name,
-                    base_price,
-                    scrape_date,
-                    discount_percentage
-                FROM prices
-                {where_clause}
-                ORDER BY scrape_date DESC
-                LIMIT 100
-            """
-            
-            cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            conn.close()
+                rows = self.queries.all('latest_company_prices', company=company, limit=100)
+            else:
+                rows = self.queries.all('latest_prices', limit=100)
             
             if not rows:
                 return []
@@ -191,20 +172,7 @@ class DataValidator:
     def check_data_freshness(self) -> Dict[str, Any]:
         """Check how fresh the data is for each company"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT 
-                    company_name,
-                    MAX(scrape_date) as last_scrape,
-                    COUNT(*) as total_records
-                FROM prices
-                GROUP BY company_name
-            """)
-            
-            rows = cursor.fetchall()
-            conn.close()
+            rows = self.queries.all('company_freshness')
             
             now = datetime.now()
             freshness_report = {
@@ -239,62 +207,31 @@ class DataValidator:
             return {'error': str(e)}
     
     def clean_old_data(self, days_to_keep: int = 90) -> int:
-        """Remove data older than specified days"""
+        """Downsample raw data older than specified days into daily summaries"""
+        engine = create_database_engine(self.db_path)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).strftime('%Y-%m-%d')
+            downsampled = apply_retention(engine, raw_days=days_to_keep)['raw_rows']
             
-            cursor.execute("""
-                DELETE FROM prices
-                WHERE scrape_date < ?
-            """, (cutoff_date,))
-            
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"🗑️  Cleaned {deleted_count} old records (older than {days_to_keep} days)")
-            return deleted_count
+            logger.info(f"🗑️  Downsampled {downsampled} old records (older than {days_to_keep} days)")
+            return downsampled
             
         except Exception as e:
             logger.error(f"Data cleaning failed: {e}")
             return 0
+        finally:
+            engine.dispose()
     
     def calculate_quality_score(self) -> Dict[str, Any]:
         """Calculate overall data quality score (0-100)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Total records
-            cursor.execute("SELECT COUNT(*) FROM prices")
-            total_records = cursor.fetchone()[0]
+            # Total, recent (last 7 days), companies with data and valid price range in one pass
+            total_records, recent_records, companies_with_data, valid_prices = self.queries.one(
+                'quality_counts', since=since_days(7), min_price=self.min_price, max_price=self.max_price
+            )
             
             if total_records == 0:
                 return {'score': 0, 'message': 'No data available'}
             
-            # Recent data (last 7 days)
-            cursor.execute("""
-                SELECT COUNT(*) FROM prices
-                WHERE scrape_date >= date('now', '-7 days')
-            """)
-            recent_records = cursor.fetchone()[0]
-            
-            # Companies with data
-            cursor.execute("SELECT COUNT(DISTINCT company_name) FROM prices")
-            companies_with_data = cursor.fetchone()[0]
-            
-            # Valid price range
-            cursor.execute(f"""
-                SELECT COUNT(*) FROM prices
-                WHERE base_price BETWEEN {self.min_price} AND {self.max_price}
-            """)
-            valid_prices = cursor.fetchone()[0]
-            
-            conn.close()
-            
             # Calculate scores
             freshness_score = min(100, (recent_records / total_records) * 100 * 2)  # Weight freshness
             completeness_score = min(100, (companies_with_data / 15) * 100)  # Assume 15 target companies
@@ -9,10 +9,23 @@ from .models import (
     CompetitorIntelligence,
     MarketIntelligence,
     PriceAlert,
+    CompetitorPriceDaily,
+    CompetitorPriceWeekly,
+    LatestCompetitorPrice,
+    CompetitorPriceAttribute,
+    PRICE_ATTRIBUTE_COLUMNS,
     init_database,
     get_session,
     add_price_record,
     get_latest_prices,
+    get_current_prices,
+    get_last_scrape_time,
+    refresh_latest_prices,
+    refresh_price_attributes,
+    find_companies_by_attribute,
+    get_companies_serving_location,
+    get_companies_with_feature,
+    get_active_promotions,
     get_market_summary,
     get_active_alerts,
     calculate_data_completeness
@@ -0,0 +1,137 @@
+"""
+Pricing Dimensions
+Interns company and vehicle model names into integer keys for the pricing database
+
+daily_prices, price_snapshots and the rollup tables store companies.id and
+vehicle_models.id instead of repeating the names in every row (and every
+index entry). DimensionCache resolves a name to its key once per engine,
+creating the dimension row on a miss, so ingesting a 365-day calendar costs
+one lookup per company and model rather than one per price.
+
+measure_storage() reports the bytes each table and index occupies (SQLite
+files), for comparing a database before and after the 0002 pricing
+migration.
+
+Usage:
+    python -m database.dimensions                        # pricing_calendar.db
+    python -m database.dimensions --db path/to/pricing.db
+"""
+
+import argparse
+import sqlite3
+import sys
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.engine import dialect_insert
+from database.pricing_calendar_schema import PRICING_DB_PATH, Company, VehicleModel
+
+
+class DimensionCache:
+    """Name -> id maps for the companies and vehicle_models of one database"""
+
+    def __init__(self):
+        self.companies: Dict[str, int] = {}
+        self.models: Dict[Tuple[int, str], int] = {}
+
+    def company_id(self, session: Session, name: str) -> int:
+        """Key of a company, inserting it on first sight"""
+        key = self.companies.get(name)
+        if key is None:
+            session.execute(dialect_insert(session.get_bind(), Company).values(
+                name=name, created_at=datetime.now()
+            ).on_conflict_do_nothing(index_elements=['name']))
+            key = session.execute(select(Company.id).where(Company.name == name)).scalar_one()
+            self.companies[name] = key
+        return key
+
+    def model_id(self, session: Session, company_id: int, model_name: str, **attributes: Any) -> int:
+        """
+        Key of a company's vehicle model, inserting it on first sight.
+
+        Args:
+            attributes: model_category, sleeps, features, ... for a new model
+                (an existing model is left unchanged)
+        """
+        key = self.models.get((company_id, model_name))
+        if key is None:
+            session.execute(dialect_insert(session.get_bind(), VehicleModel).values(
+                company_id=company_id, model_name=model_name, **attributes
+            ).on_conflict_do_nothing(index_elements=['company_id', 'model_name']))
+            key = session.execute(select(VehicleModel.id).where(
+                VehicleModel.company_id == company_id, VehicleModel.model_name == model_name
+            )).scalar_one()
+            self.models[(company_id, model_name)] = key
+        return key
+
+    def clear(self):
+        """Forget every key (after a rollback, the inserted rows may be gone)"""
+        self.companies.clear()
+        self.models.clear()
+
+
+# Engine -> cache; an engine is one database, and a disposed engine drops its cache
+_CACHES: 'weakref.WeakKeyDictionary[Any, DimensionCache]' = weakref.WeakKeyDictionary()
+
+
+def dimension_cache(session: Session) -> DimensionCache:
+    """The interning cache for the database a session is bound to"""
+    engine = session.get_bind().engine
+    cache = _CACHES.get(engine)
+    if cache is None:
+        cache = _CACHES[engine] = DimensionCache()
+    return cache
+
+
+def measure_storage(db_path: Path) -> Dict[str, Any]:
+    """
+    Bytes used by each table and index (SQLite dbstat).
+
+    Returns:
+        {'tables': {name: bytes}, 'indexes': {name: bytes}, 'file_bytes': int}
+    """
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT s.name, m.type, SUM(s.pgsize) FROM dbstat s "
+            "LEFT JOIN sqlite_master m ON m.name = s.name GROUP BY s.name"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    usage = {'tables': {}, 'indexes': {}, 'file_bytes': Path(db_path).stat().st_size}
+    for name, kind, size in rows:
+        usage['indexes' if kind == 'index' else 'tables'][name] = size
+    return usage
+
+
+def print_storage(usage: Dict[str, Any], title: Optional[str] = None):
+    """Print measure_storage() output, largest first"""
+    print("=" * 60)
+    print(title or "STORAGE BY TABLE AND INDEX")
+    print("=" * 60)
+    for section in ('tables', 'indexes'):
+        sizes = usage[section]
+        print(f"\n{section.title()} ({sum(sizes.values()) / 1024:,.0f} KiB):")
+        for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+            print(f"  {name:<45} {size / 1024:>10,.0f} KiB")
+    print(f"\nFile: {usage['file_bytes'] / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Report pricing database storage per table and index')
+    parser.add_argument('--db', type=Path, default=PRICING_DB_PATH, help='SQLite database to measure')
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"❌ Database not found: {args.db}")
+        sys.exit(1)
+    print_storage(measure_storage(args.db), f"STORAGE: {args.db.name}")
@@ -0,0 +1,245 @@
+"""
+Database Engines
+Turns a database URL into a pooled SQLAlchemy engine, for either backend
+
+Everything that talks to the intelligence or pricing database gets its
+engine here, so core_config's DATABASE_URL / PRICING_DATABASE_URL select
+the backend end to end:
+
+- SQLite (default): one file per database; a QueuePool per URL
+- PostgreSQL: a QueuePool sized by DatabaseConfig (POOL_SIZE, MAX_OVERFLOW,
+  POOL_TIMEOUT, POOL_RECYCLE, POOL_PRE_PING), COPY for bulk inserts
+  (copy_rows, upsert_rows) and BRIN indexes on append-only timestamps
+  (migrations 0003)
+
+Engines are cached per URL, so every caller in a process shares one pool.
+
+Usage:
+    engine = get_database_engine(DATABASE_URL)
+    with engine.begin() as connection:
+        copy_rows(connection, CompetitorPrice.__table__, rows)
+"""
+
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from sqlalchemy import JSON, Table, create_engine, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine, make_url
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from core_config import config as sys_config
+    POOL_SIZE = sys_config.database.POOL_SIZE
+    MAX_OVERFLOW = sys_config.database.MAX_OVERFLOW
+    POOL_TIMEOUT = sys_config.database.POOL_TIMEOUT
+    POOL_RECYCLE = sys_config.database.POOL_RECYCLE
+    POOL_PRE_PING = sys_config.database.POOL_PRE_PING
+    ECHO_SQL = sys_config.database.ECHO_SQL
+except (ImportError, AttributeError):
+    POOL_SIZE, MAX_OVERFLOW, POOL_TIMEOUT, POOL_RECYCLE = 5, 10, 30, 1800
+    POOL_PRE_PING, ECHO_SQL = True, False
+
+COPY_NULL = r'\N'
+
+_ENGINES: Dict[str, Engine] = {}
+
+
+def database_url(location: Union[str, Path]) -> str:
+    """A SQLAlchemy URL for a URL or a SQLite file path"""
+    location = str(location)
+    return location if '://' in location else f'sqlite:///{location}'
+
+
+def sqlite_path(url: Union[str, Engine, Connection]) -> Optional[Path]:
+    """The file behind a SQLite URL (None for other backends and in-memory databases)"""
+    if not isinstance(url, str):
+        url = url.engine.url.render_as_string(hide_password=False)
+    parsed = make_url(url)
+    if parsed.get_backend_name() != 'sqlite' or parsed.database in (None, '', ':memory:'):
+        return None
+    return Path(parsed.database)
+
+
+def is_sqlite(bind: Union[Engine, Connection]) -> bool:
+    return bind.dialect.name == 'sqlite'
+
+
+# create_engine() arguments that configure QueuePool only
+POOL_SIZING_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """create_engine() keyword arguments for a URL's backend"""
+    parsed = make_url(url)
+    options: Dict[str, Any] = {'echo': ECHO_SQL}
+    if parsed.get_backend_name() == 'sqlite':
+        if parsed.database in (None, '', ':memory:'):
+            return options  # SQLAlchemy's single-connection pool
+        # Local file: no network to ping or recycle for
+        options.update(pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_timeout=POOL_TIMEOUT)
+        return options
+    options.update(
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,  # Drop connections before server/proxy idle timeouts do
+        pool_pre_ping=POOL_PRE_PING,
+    )
+    return options
+
+
+def create_database_engine(location: Union[str, Path], **overrides: Any) -> Engine:
+    """A new engine (own pool) for a URL or SQLite path; overrides win over engine_options()"""
+    url = database_url(location)
+    path = sqlite_path(url)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    options = engine_options(url)
+    if 'poolclass' in overrides:
+        # Sizing only applies to the default QueuePool (NullPool rejects it)
+        for key in POOL_SIZING_OPTIONS:
+            options.pop(key, None)
+    return create_engine(url, **{**options, **overrides})
+
+
+def get_database_engine(location: Union[str, Path]) -> Engine:
+    """The process-wide engine for a URL or SQLite path"""
+    url = database_url(location)
+    if url not in _ENGINES:
+        _ENGINES[url] = create_database_engine(url)
+    return _ENGINES[url]
+
+
+def dispose_engines():
+    """Close every cached pool (tests, forked workers)"""
+    for engine in _ENGINES.values():
+        engine.dispose()
+    _ENGINES.clear()
+
+
+def dialect_insert(bind: Union[Engine, Connection], table):
+    """INSERT with on_conflict_do_nothing / on_conflict_do_update for the bind's backend"""
+    if bind.dialect.name == 'postgresql':
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def _with_defaults(table: Table, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows with the Python-side column defaults an ORM insert would apply"""
+    defaults = {
+        column.name: column.default
+        for column in table.columns
+        if column.default is not None and not column.default.is_sequence
+    }
+    filled = []
+    for row in rows:
+        row = dict(row)
+        for name, default in defaults.items():
+            if name not in row:
+                row[name] = default.arg(None) if default.is_callable else default.arg
+        filled.append(row)
+    return filled
+
+
+def _copy_value(value: Any, is_json: bool) -> Any:
+    if value is None:
+        return COPY_NULL
+    if is_json:
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _copy(connection: Connection, table_name: str, table: Table,
+          columns: List[str], rows: Iterable[Dict[str, Any]]):
+    """COPY rows into table_name (laid out like table) through the driver"""
+    json_columns = {c.name for c in table.columns if isinstance(c.type, JSON)}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column), column in json_columns) for column in columns])
+    buffer.seek(0)
+
+    sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    cursor = connection.connection.cursor()
+    try:
+        if hasattr(cursor, 'copy_expert'):  # psycopg2
+            cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def _columns(table: Table, rows: Sequence[Dict[str, Any]]) -> List[str]:
+    present = set().union(*rows)
+    return [column.name for column in table.columns if column.name in present]
+
+
+def copy_rows(connection: Connection, table: Table, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Bulk insert rows: COPY on PostgreSQL, executemany INSERT elsewhere.
+
+    Column defaults are applied as the ORM would; triggers fire either way.
+
+    Returns:
+        Rows written
+    """
+    if not rows:
+        return 0
+    if connection.dialect.name != 'postgresql':
+        connection.execute(insert(table), list(rows))
+        return len(rows)
+    rows = _with_defaults(table, rows)
+    _copy(connection, table.name, table, _columns(table, rows), rows)
+    return len(rows)
+
+
+def upsert_rows(connection: Connection, table: Table, rows: Sequence[Dict[str, Any]],
+                index_elements: List[str], update_columns: List[str]) -> int:
+    """
+    INSERT ... ON CONFLICT (index_elements) DO UPDATE SET update_columns.
+
+    On PostgreSQL the rows are COPYed into a temporary table and merged
+    with one INSERT ... SELECT.
+
+    Returns:
+        Rows written
+    """
+    if not rows:
+        return 0
+    if connection.dialect.name != 'postgresql':
+        statement = dialect_insert(connection, table)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: statement.excluded[column] for column in update_columns}
+        ), list(rows))
+        return len(rows)
+
+    rows = _with_defaults(table, rows)
+    columns = _columns(table, rows)
+    stage = f"_stage_{table.name}"
+    connection.exec_driver_sql(f"CREATE TEMPORARY TABLE {stage} (LIKE {table.name} INCLUDING DEFAULTS)")
+    try:
+        _copy(connection, stage, table, columns, rows)
+        column_list = ', '.join(columns)
+        connection.exec_driver_sql(
+            f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ({', '.join(index_elements)}) DO UPDATE SET "
+            + ', '.join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+        )
+    finally:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {stage}")
+    return len(rows)
@@ -0,0 +1,423 @@
+"""
+Parquet History Store
+Column-oriented copy of the price history for long-range analytics
+
+The database (SQLite or PostgreSQL) stays the system of record; this store
+is an append-only export of it, laid out for reading:
+
+    data/history/<dataset>/company=<slug>/month=<YYYY-MM>/part-<first id>-<last id>.parquet
+    data/history/<dataset>/_watermark.json
+
+- sync() exports only rows whose id is above the dataset's watermark, so it
+  is cheap enough to run after every ingest (run_intelligence, the scheduler)
+- Ids the watermark moves past without seeing are kept as gaps and looked up
+  again on later syncs: on PostgreSQL a row can commit after a higher id was
+  exported. Gaps older than HISTORY_GAP_RECHECK_HOURS (rolled back or deleted
+  rows) are dropped, so a row committing later than that is only picked up
+  by rebuild()
+- Part files are named by their id range and written atomically; a sync
+  that dies before moving the watermark rewrites the same files next time
+- query() opens only the partitions for the requested companies and months,
+  and only the requested columns within them
+
+Rows updated or deleted in the database after they were exported are not picked
+up; run rebuild() after that kind of maintenance.
+
+Usage:
+    python -m database.history_store sync
+    python -m database.history_store sync --rebuild competitor_prices
+    python -m database.history_store query competitor_prices --company Roadsurfer --start 2024-01-01 \\
+        --column scrape_timestamp --column base_nightly_rate
+    python -m database.history_store stats
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.pool import NullPool
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from core_config import config as sys_config
+    DATABASE_URL = sys_config.database.DATABASE_URL
+    PRICING_DATABASE_URL = sys_config.database.PRICING_DATABASE_URL
+    HISTORY_DIR = sys_config.HISTORY_DIR
+    HISTORY_STORE_ENABLED = sys_config.analysis.HISTORY_STORE_ENABLED
+    CHUNK_ROWS = sys_config.analysis.HISTORY_EXPORT_CHUNK_ROWS
+    GAP_RECHECK_HOURS = sys_config.analysis.HISTORY_GAP_RECHECK_HOURS
+except (ImportError, AttributeError):
+    BASE_DIR = Path(__file__).parent.parent.resolve()
+    DATABASE_URL = f'sqlite:///{BASE_DIR / "database" / "campervan_intelligence.db"}'
+    PRICING_DATABASE_URL = f'sqlite:///{BASE_DIR / "database" / "pricing_calendar.db"}'
+    HISTORY_DIR = BASE_DIR / "data" / "history"
+    HISTORY_STORE_ENABLED = True
+    CHUNK_ROWS = 50000
+    GAP_RECHECK_HOURS = 24.0
+
+from database.engine import create_database_engine, database_url, sqlite_path
+
+UNKNOWN_MONTH = 'unknown'
+# Most gap ids remembered per dataset (the newest are kept)
+MAX_GAPS = 10000
+
+
+@dataclass
+class HistoryDataset:
+    """A database table mirrored into the store.
+
+    Attributes:
+        table (str): Source table; needs an increasing integer `id`
+        db_path (Path): SQLite file (or database URL) holding the table
+        time_column (str): Column whose month selects the partition
+        source (str): SELECT over the table that yields its rows with a
+            `company_name` column (default: the table itself)
+    """
+    table: str
+    db_path: Union[Path, str]
+    time_column: str
+    source: Optional[str] = None
+
+
+DATASETS: Dict[str, HistoryDataset] = {
+    'competitor_prices': HistoryDataset('competitor_prices', DATABASE_URL, 'scrape_timestamp'),
+    # Keyed by companies.id / vehicle_models.id; the store keeps the names
+    'daily_prices': HistoryDataset(
+        'daily_prices', PRICING_DATABASE_URL, 'rental_date',
+        source="SELECT d.*, c.name AS company_name, m.model_name FROM daily_prices d "
+               "JOIN companies c ON c.id = d.company_id JOIN vehicle_models m ON m.id = d.model_id"
+    ),
+}
+
+
+def company_slug(name: Any) -> str:
+    """Partition directory name for a company ('Cruise America' -> 'cruise-america')"""
+    slug = re.sub(r'[^a-z0-9]+', '-', str(name or '').lower()).strip('-')
+    return slug or 'unknown'
+
+
+def missing_ids(after: int, ids: List[int], limit: int = MAX_GAPS) -> List[int]:
+    """Ids in (after, ids[-1]] absent from the sorted ids, at most the last `limit`"""
+    missing: List[int] = []
+    previous = after
+    for current in ids:
+        # Only the tail of a huge jump can survive the final cut
+        missing.extend(range(max(previous + 1, current - limit), current))
+        previous = current
+    return missing[-limit:]
+
+
+def parquet_available() -> bool:
+    """True if pandas has a Parquet engine (pyarrow or fastparquet)"""
+    try:
+        pd.io.parquet.get_engine('auto')
+        return True
+    except ImportError:
+        return False
+
+
+class HistoryStore:
+    """
+    Incrementally maintained Parquet copy of the history tables.
+
+    Args:
+        root: Directory holding one sub-directory per dataset
+        datasets: Dataset name -> HistoryDataset (default: DATASETS)
+        chunk_rows: Rows read from the database per export step
+        gap_recheck: How long skipped ids are looked for again
+    """
+
+    def __init__(
+        self,
+        root: Path = HISTORY_DIR,
+        datasets: Optional[Dict[str, HistoryDataset]] = None,
+        chunk_rows: int = CHUNK_ROWS,
+        gap_recheck: timedelta = timedelta(hours=GAP_RECHECK_HOURS)
+    ):
+        self.root = Path(root)
+        self.datasets = datasets or DATASETS
+        self.chunk_rows = chunk_rows
+        self.gap_recheck = gap_recheck
+        # Files and bytes opened by the most recent query()
+        self.last_scan = {'files': 0, 'bytes': 0}
+
+    def _dataset(self, name: str) -> HistoryDataset:
+        if name not in self.datasets:
+            raise ValueError(f"Unknown history dataset '{name}'. Available: {', '.join(self.datasets)}")
+        return self.datasets[name]
+
+    def dataset_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def watermark(self, name: str) -> Dict[str, Any]:
+        """Last exported id, running row count and pending gaps for a dataset"""
+        try:
+            return json.loads((self.dataset_dir(name) / '_watermark.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {'last_id': 0, 'rows': 0}
+
+    def _save_watermark(self, name: str, state: Dict[str, Any]):
+        path = self.dataset_dir(name) / '_watermark.json'
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def sync(self, names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Export rows added since the last sync.
+
+        Args:
+            names: Datasets to sync (default: all)
+
+        Returns:
+            Dict mapping dataset name to rows exported
+        """
+        return {name: self._export(name) for name in (names or self.datasets)}
+
+    def rebuild(self, name: str) -> int:
+        """Drop a dataset's files and export it again from scratch"""
+        self._dataset(name)
+        shutil.rmtree(self.dataset_dir(name), ignore_errors=True)
+        return self._export(name)
+
+    def _export(self, name: str) -> int:
+        dataset = self._dataset(name)
+        url = database_url(dataset.db_path)
+        path = sqlite_path(url)
+        if path is not None and not path.exists():
+            return 0
+
+        state = self.watermark(name)
+        # Gap id (as text, JSON keys) -> when it was first skipped
+        gaps = {
+            key: seen for key, seen in state.get('gaps', {}).items()
+            if datetime.now() - datetime.fromisoformat(seen) < self.gap_recheck
+        }
+        exported = 0
+        engine = create_database_engine(url, poolclass=NullPool)
+        conn = engine.connect()
+        try:
+            if not inspect(conn).has_table(dataset.table):
+                return 0
+
+            source = dataset.source or f'SELECT * FROM {dataset.table}'
+
+            # Rows that committed after the watermark moved past their id
+            if gaps:
+                recheck = text(
+                    f"SELECT * FROM ({source}) AS source WHERE id IN :ids ORDER BY id"
+                ).bindparams(bindparam('ids', expanding=True))
+                pending = sorted(int(key) for key in gaps)
+                for start in range(0, len(pending), self.chunk_rows):
+                    chunk = pd.read_sql(recheck, conn, params={'ids': pending[start:start + self.chunk_rows]})
+                    if chunk.empty:
+                        continue
+                    self._write_chunk(name, dataset, chunk)
+                    exported += len(chunk)
+                    for row_id in chunk['id']:
+                        gaps.pop(str(int(row_id)), None)
+                    state = {**state, 'rows': state.get('rows', 0) + len(chunk), 'gaps': gaps}
+                    self._save_watermark(name, state)
+
+            query = text(
+                f"SELECT * FROM ({source}) AS source "
+                f"WHERE id > :last_id ORDER BY id LIMIT :limit"
+            )
+            while True:
+                chunk = pd.read_sql(query, conn, params={'last_id': state['last_id'], 'limit': self.chunk_rows})
+                if chunk.empty:
+                    break
+                self._write_chunk(name, dataset, chunk)
+                exported += len(chunk)
+                now = datetime.now().isoformat(timespec='seconds')
+                for row_id in missing_ids(state['last_id'], [int(row_id) for row_id in chunk['id']]):
+                    gaps[str(row_id)] = now
+                if len(gaps) > MAX_GAPS:
+                    gaps = {key: gaps[key] for key in sorted(gaps, key=int)[-MAX_GAPS:]}
+                state = {
+                    'last_id': int(chunk['id'].iloc[-1]),
+                    'rows': state.get('rows', 0) + len(chunk),
+                    'gaps': gaps,
+                    'updated_at': now,
+                }
+                self._save_watermark(name, state)
+                if len(chunk) < self.chunk_rows:
+                    break
+        finally:
+            conn.close()
+            engine.dispose()
+
+        if exported:
+            logger.info(f"📦 Exported {exported} {name} rows to the history store (watermark id {state['last_id']})")
+        return exported
+
+    def _write_chunk(self, name: str, dataset: HistoryDataset, chunk: pd.DataFrame):
+        """Write one part file per (company, month) present in the chunk"""
+        # SQLite hands dates back as text; store them typed so queries can filter
+        chunk[dataset.time_column] = pd.to_datetime(chunk[dataset.time_column], errors='coerce')
+        months = chunk[dataset.time_column].dt.strftime('%Y-%m').fillna(UNKNOWN_MONTH)
+        slugs = chunk['company_name'].map(company_slug)
+
+        for (slug, month), part in chunk.groupby([slugs, months], sort=False):
+            directory = self.dataset_dir(name) / f"company={slug}" / f"month={month}"
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"part-{part['id'].iloc[0]:010d}-{part['id'].iloc[-1]:010d}.parquet"
+            tmp = path.with_suffix('.tmp')
+            part.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+
+    def partitions(
+        self,
+        name: str,
+        companies: Optional[Iterable[str]] = None,
+        start: Any = None,
+        end: Any = None
+    ) -> List[Path]:
+        """Part files that can hold rows for the companies and [start, end) range"""
+        self._dataset(name)
+        wanted = {company_slug(c) for c in companies} if companies else None
+        first = pd.Timestamp(start).strftime('%Y-%m') if start is not None else None
+        # end is exclusive: a range ending on 2024-04-01 stops in March
+        last = (pd.Timestamp(end) - pd.Timedelta(microseconds=1)).strftime('%Y-%m') if end is not None else None
+
+        files = []
+        for company_dir in sorted(self.dataset_dir(name).glob('company=*')):
+            if wanted is not None and company_dir.name.split('=', 1)[1] not in wanted:
+                continue
+            for month_dir in sorted(company_dir.glob('month=*')):
+                month = month_dir.name.split('=', 1)[1]
+                if month == UNKNOWN_MONTH:
+                    if first or last:
+                        continue
+                elif (first and month < first) or (last and month > last):
+                    continue
+                files.extend(sorted(month_dir.glob('part-*.parquet')))
+        return files
+
+    def query(
+        self,
+        name: str,
+        columns: Optional[List[str]] = None,
+        companies: Optional[Iterable[str]] = None,
+        start: Any = None,
+        end: Any = None
+    ) -> pd.DataFrame:
+        """
+        Read history, touching only the needed partitions and columns.
+
+        Args:
+            name: Dataset name
+            columns: Columns to return (default: all)
+            companies: Company names to include (default: all)
+            start: Earliest time_column value, inclusive
+            end: Latest time_column value, exclusive
+
+        Returns:
+            DataFrame ordered by company then time; last_scan records the
+            files and bytes read
+        """
+        dataset = self._dataset(name)
+        files = self.partitions(name, companies, start, end)
+        self.last_scan = {'files': len(files), 'bytes': sum(path.stat().st_size for path in files)}
+
+        read_columns = None
+        if columns is not None:
+            extra = [dataset.time_column] if start is not None or end is not None else []
+            read_columns = list(dict.fromkeys([*columns, *extra]))
+
+        if not files:
+            return pd.DataFrame(columns=columns or [])
+
+        df = pd.concat([pd.read_parquet(path, columns=read_columns) for path in files], ignore_index=True)
+        # Partitions are whole months; trim to the exact range
+        if start is not None:
+            df = df[df[dataset.time_column] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df[dataset.time_column] < pd.Timestamp(end)]
+        if columns is not None:
+            df = df[columns]
+        return df.reset_index(drop=True)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-dataset watermark, pending gap count, file count and size on disk"""
+        stats = {}
+        for name in self.datasets:
+            files = list(self.dataset_dir(name).glob('company=*/month=*/part-*.parquet'))
+            watermark = self.watermark(name)
+            stats[name] = {
+                **watermark,
+                'gaps': len(watermark.get('gaps', {})),
+                'files': len(files),
+                'size_mb': round(sum(path.stat().st_size for path in files) / 1024 / 1024, 2),
+            }
+        return stats
+
+
+def sync_history(names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Post-ingest hook: incremental export that never fails the ingest.
+
+    Returns:
+        Rows exported per dataset ({} when disabled or on error)
+    """
+    if not HISTORY_STORE_ENABLED:
+        return {}
+    try:
+        return HistoryStore().sync(names)
+    except ImportError as e:
+        logger.warning(f"⚠️ History store skipped (install pyarrow for Parquet support): {e}")
+    except Exception as e:
+        logger.warning(f"⚠️ History store sync failed: {e}")
+    return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parquet history store')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sync_parser = sub.add_parser('sync', help='Export new rows')
+    sync_parser.add_argument('datasets', nargs='*', help='Datasets (default: all)')
+    sync_parser.add_argument('--rebuild', action='store_true', help='Re-export from scratch')
+
+    query_parser = sub.add_parser('query', help='Read history')
+    query_parser.add_argument('dataset', choices=list(DATASETS))
+    query_parser.add_argument('--column', action='append', help='Column to read (repeatable)')
+    query_parser.add_argument('--company', action='append', help='Company name (repeatable)')
+    query_parser.add_argument('--start', help='Inclusive start date')
+    query_parser.add_argument('--end', help='Exclusive end date')
+
+    sub.add_parser('stats', help='Show watermarks and sizes')
+
+    args = parser.parse_args()
+    store = HistoryStore()
+
+    if args.command == 'sync':
+        names = args.datasets or list(store.datasets)
+        for name in names:
+            rows = store.rebuild(name) if args.rebuild else store.sync([name])[name]
+            print(f"📦 {name}: {rows} rows exported")
+    elif args.command == 'query':
+        df = store.query(args.dataset, args.column, args.company, args.start, args.end)
+        print(df.to_string(max_rows=20))
+        print(f"\n{len(df)} rows from {store.last_scan['files']} files "
+              f"({store.last_scan['bytes'] / 1024:.0f} KB read)")
+    else:
+        for name, info in store.stats().items():
+            print(f"{name:<20} last id {info['last_id']:<8} rows {info['rows']:<8} gaps {info['gaps']:<6} "
+                  f"files {info['files']:<5} {info['size_mb']} MB")
+
+
+if __name__ == "__main__":
+    main()
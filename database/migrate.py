@@ -0,0 +1,155 @@
+"""
+Schema Migrations
+Alembic migrations that own the indexes of both SQLite databases
+
+Tables come from Base.metadata.create_all (init_database and
+init_pricing_database run the migrations straight after); every index on
+competitor_prices, price_alerts, daily_prices, vehicle_models and
+price_snapshots is created or dropped by a revision under
+database/migrations/<target>/versions. Revisions run on SQLite and
+PostgreSQL; backend-only indexes (BRIN) check op.get_bind().dialect.
+
+Targets:
+    intelligence - database/models.py (DATABASE_URL)
+    pricing      - database/pricing_calendar_schema.py (PRICING_DATABASE_URL)
+
+Usage:
+    python -m database.migrate upgrade                   # both targets to head
+    python -m database.migrate current --target pricing
+    python -m database.migrate upgrade --target intelligence --db postgresql+psycopg2://localhost/campervan
+    alembic -n intelligence upgrade head                 # same, via alembic.ini
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.engine import Engine
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.engine import create_database_engine, database_url, sqlite_path
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+TARGETS = ('intelligence', 'pricing')
+
+
+def default_url(target: str) -> str:
+    """The target's configured database URL"""
+    if target == 'intelligence':
+        from database.models import DATABASE_URL
+        return DATABASE_URL
+    if target == 'pricing':
+        from database.pricing_calendar_schema import PRICING_DATABASE_URL
+        return PRICING_DATABASE_URL
+    raise ValueError(f"Unknown migration target '{target}'. Use one of: {', '.join(TARGETS)}")
+
+
+def database_exists(target: str) -> bool:
+    """False only for a SQLite target whose file has not been created yet"""
+    path = sqlite_path(default_url(target))
+    return path is None or path.exists()
+
+
+def alembic_config(target: str, url: Optional[str] = None) -> Config:
+    """Alembic Config for a target without needing alembic.ini"""
+    config = Config()
+    config.set_main_option('script_location', str(MIGRATIONS_DIR / target))
+    # ConfigParser interpolation: a literal % (URL-encoded passwords) is %%
+    config.set_main_option('sqlalchemy.url', (url or default_url(target)).replace('%', '%%'))
+    return config
+
+
+def _run(target: str, action, revision: str, db_path: Optional[Path], engine: Optional[Engine]):
+    if engine is None:
+        action(alembic_config(target, database_url(db_path) if db_path else None), revision)
+        return
+    # Reuse the caller's engine (in-memory databases, tests)
+    config = alembic_config(target, engine.url.render_as_string(hide_password=False))
+    with engine.begin() as connection:
+        config.attributes['connection'] = connection
+        action(config, revision)
+
+
+def upgrade(target: str = 'intelligence', revision: str = 'head',
+            db_path: Optional[Path] = None, engine: Optional[Engine] = None):
+    """
+    Apply migrations up to revision.
+
+    Args:
+        target: 'intelligence' or 'pricing'
+        revision: Alembic revision (default: head)
+        db_path: SQLite file or database URL (default: the target's configured URL)
+        engine: Run on this engine instead of opening db_path
+    """
+    _run(target, command.upgrade, revision, db_path, engine)
+
+
+def downgrade(target: str = 'intelligence', revision: str = '-1',
+              db_path: Optional[Path] = None, engine: Optional[Engine] = None):
+    """Revert migrations down to revision (default: one step)"""
+    _run(target, command.downgrade, revision, db_path, engine)
+
+
+def current(target: str = 'intelligence', db_path: Optional[Path] = None) -> Optional[str]:
+    """Revision the database is at (None if never migrated)"""
+    engine = create_database_engine(database_url(db_path) if db_path else default_url(target))
+    try:
+        with engine.connect() as connection:
+            return MigrationContext.configure(connection).get_current_revision()
+    finally:
+        engine.dispose()
+
+
+def run_environment(target: str):
+    """Body of migrations/<target>/env.py"""
+    from alembic import context
+
+    config = context.config
+    url = config.get_main_option('sqlalchemy.url') or default_url(target)
+
+    if context.is_offline_mode():
+        context.configure(url=url, literal_binds=True)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        context.configure(connection=connection, render_as_batch=True)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_database_engine(url)
+    try:
+        with engine.connect() as connection:
+            context.configure(connection=connection, render_as_batch=True)
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run database migrations')
+    parser.add_argument('action', choices=['upgrade', 'downgrade', 'current'])
+    parser.add_argument('--target', choices=TARGETS, help='Database (default: all for upgrade)')
+    parser.add_argument('--revision', help='Target revision (upgrade: head, downgrade: -1)')
+    parser.add_argument('--db', help='SQLite file or database URL (default: configured URL)')
+    args = parser.parse_args()
+    if args.db and not args.target:
+        parser.error('--db needs --target')
+
+    targets = [args.target] if args.target else list(TARGETS)
+    for target in targets:
+        if args.action == 'upgrade':
+            upgrade(target, args.revision or 'head', db_path=args.db)
+        elif args.action == 'downgrade':
+            downgrade(target, args.revision or '-1', db_path=args.db)
+        print(f"{target}: {current(target, db_path=args.db) or 'not migrated'}")
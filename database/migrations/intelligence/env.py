@@ -0,0 +1,5 @@
+"""Alembic environment for the intelligence database (database/models.py)"""
+
+from database.migrate import run_environment
+
+run_environment('intelligence')
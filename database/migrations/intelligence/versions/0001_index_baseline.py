@@ -0,0 +1,57 @@
+"""Index baseline for competitor_prices and price_alerts
+
+Takes over the indexes the models used to declare. Existing databases keep
+the ones they already have (same names); the single-column company index
+is dropped because idx_prices_company_time starts with company_name.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Company + time window reads (database/queries.py); the trailing
+    # columns make per-company price stats covering
+    op.create_index(
+        'idx_prices_company_time', 'competitor_prices',
+        ['company_name', 'scrape_timestamp', 'base_nightly_rate', 'weekly_discount_pct'],
+        if_not_exists=True
+    )
+    # Time window reads across all companies
+    op.create_index(
+        'ix_competitor_prices_scrape_timestamp', 'competitor_prices', ['scrape_timestamp'],
+        if_not_exists=True
+    )
+    op.drop_index('ix_competitor_prices_company_name', table_name='competitor_prices', if_exists=True)
+
+    # Open alerts, newest first (get_active_alerts, dashboard, health check)
+    op.create_index(
+        'idx_alerts_open', 'price_alerts', ['is_acknowledged', 'alert_timestamp'],
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_alerts_company_time', 'price_alerts', ['company_name', 'alert_timestamp'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_company_time', table_name='price_alerts', if_exists=True)
+    op.drop_index('idx_alerts_open', table_name='price_alerts', if_exists=True)
+    op.create_index(
+        'ix_competitor_prices_company_name', 'competitor_prices', ['company_name'],
+        if_not_exists=True
+    )
+    op.drop_index('idx_prices_company_time', table_name='competitor_prices', if_exists=True)
@@ -0,0 +1,207 @@
+"""Price attribute side table for the JSON list columns
+
+competitor_price_attributes holds one row per element of vehicle_types,
+vehicle_features, locations_available, popular_routes, active_promotions
+and payment_options, kept current by triggers on competitor_prices.
+Existing databases get the table, triggers and a backfill here.
+
+The table layout, trigger DDL and backfill SQL are declared here, as of this
+revision, rather than taken from database/models.py, so later model changes
+do not alter what this revision creates.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Attribute name -> competitor_prices JSON list column
+COLUMNS = {
+    'vehicle_type': 'vehicle_types',
+    'vehicle_feature': 'vehicle_features',
+    'location': 'locations_available',
+    'route': 'popular_routes',
+    'promotion': 'active_promotions',
+    'payment_option': 'payment_options',
+}
+
+INSERT = (
+    "INSERT INTO competitor_price_attributes "
+    "(price_id, company_name, scrape_timestamp, attribute, value, value_key)"
+)
+
+# SQLite: json_each over each list column; objects (promotions) are keyed by their text
+ITEM_VALUE = "CASE WHEN item.type = 'object' THEN COALESCE(json_extract(item.value, '$.text'), item.value) ELSE item.value END"
+
+ATTRIBUTE_ROWS = """
+    SELECT {row}.id, {row}.company_name, {row}.scrape_timestamp, '{attribute}', {value}, lower(trim({value}))
+    FROM {source}json_each(CASE WHEN json_valid({row}.{column}) THEN {row}.{column} END) AS item
+    WHERE item.type != 'null' AND trim({value}) != ''
+"""
+
+# PostgreSQL: json_array_elements over each list column
+ITEM_VALUE_PG = (
+    "CASE json_typeof(element.data) WHEN 'object' THEN COALESCE(element.data ->> 'text', element.data::text) "
+    "WHEN 'string' THEN element.data #>> '{}' ELSE element.data::text END"
+)
+
+UPDATED_COLUMNS = f"company_name, scrape_timestamp, {', '.join(COLUMNS.values())}"
+
+
+def _attribute_rows(row: str, source: str = '') -> str:
+    """INSERT of the attribute rows for one price row (or all of them)"""
+    selects = [
+        ATTRIBUTE_ROWS.format(row=row, source=source, attribute=attribute, column=column, value=ITEM_VALUE)
+        for attribute, column in COLUMNS.items()
+    ]
+    return INSERT + "\n    UNION ALL".join(selects)
+
+
+def _attribute_rows_pg(row: str, source: str = '') -> str:
+    """PostgreSQL form of _attribute_rows(); source ends in CROSS JOIN LATERAL"""
+    lists = ', '.join(f"('{attribute}', {row}.{column})" for attribute, column in COLUMNS.items())
+    return f"""
+    {INSERT}
+    SELECT {row}.id, {row}.company_name, {row}.scrape_timestamp, list.attribute, item.value, lower(trim(item.value))
+    FROM {source}(VALUES {lists}) AS list (attribute, elements)
+    CROSS JOIN LATERAL json_array_elements(
+        CASE WHEN json_typeof(list.elements) = 'array' THEN list.elements END
+    ) AS element (data)
+    CROSS JOIN LATERAL (SELECT {ITEM_VALUE_PG} AS value) AS item
+    WHERE json_typeof(element.data) != 'null' AND trim(item.value) != ''"""
+
+
+TRIGGERS = {
+    'trg_price_attributes_insert': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_insert
+        AFTER INSERT ON competitor_prices
+        BEGIN
+            {_attribute_rows('NEW')};
+        END
+    """,
+    'trg_price_attributes_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_delete
+        AFTER DELETE ON competitor_prices
+        BEGIN
+            DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+        END
+    """,
+    'trg_price_attributes_update': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_update
+        AFTER UPDATE OF {UPDATED_COLUMNS}
+        ON competitor_prices
+        BEGIN
+            DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+            {_attribute_rows('NEW')};
+        END
+    """,
+}
+
+FUNCTION_PG = f"""
+    CREATE OR REPLACE FUNCTION trg_price_attributes() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP != 'INSERT' THEN
+            DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+        END IF;
+        IF TG_OP != 'DELETE' THEN
+            {_attribute_rows_pg('NEW')};
+        END IF;
+        RETURN NULL;
+    END $$
+"""
+
+# Trigger name -> event clause, each calling trg_price_attributes()
+TRIGGERS_PG = {
+    'trg_price_attributes_insert': "AFTER INSERT ON competitor_prices",
+    'trg_price_attributes_delete': "AFTER DELETE ON competitor_prices",
+    'trg_price_attributes_update': f"AFTER UPDATE OF {UPDATED_COLUMNS} ON competitor_prices",
+}
+
+
+def _triggers_installed(bind) -> bool:
+    if bind.dialect.name == 'postgresql':
+        query = "SELECT 1 FROM pg_trigger WHERE tgname = 'trg_price_attributes_insert'"
+    else:
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_price_attributes_insert'"
+    return bind.execute(sa.text(query)).first() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name not in ('sqlite', 'postgresql'):
+        return
+
+    if not sa.inspect(bind).has_table('competitor_price_attributes'):
+        op.create_table(
+            'competitor_price_attributes',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('price_id', sa.Integer(), nullable=False),
+            sa.Column('company_name', sa.String(100), nullable=False),
+            sa.Column('scrape_timestamp', sa.DateTime()),
+            sa.Column('attribute', sa.String(30), nullable=False),
+            sa.Column('value', sa.Text(), nullable=False),
+            sa.Column('value_key', sa.Text(), nullable=False),
+        )
+
+    installed = _triggers_installed(bind)
+    if bind.dialect.name == 'postgresql':
+        bind.exec_driver_sql(FUNCTION_PG)
+        for name, when in TRIGGERS_PG.items():
+            bind.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name} ON competitor_prices")
+            bind.exec_driver_sql(f"CREATE TRIGGER {name} {when} FOR EACH ROW EXECUTE FUNCTION trg_price_attributes()")
+    else:
+        for ddl in TRIGGERS.values():
+            bind.execute(sa.text(ddl))
+
+    # Backfill on first install; afterwards the triggers keep the table current
+    if not installed:
+        bind.execute(sa.text("DELETE FROM competitor_price_attributes"))
+        if bind.dialect.name == 'postgresql':
+            bind.exec_driver_sql(_attribute_rows_pg('price', source='competitor_prices AS price CROSS JOIN LATERAL '))
+        else:
+            bind.execute(sa.text(_attribute_rows('price', source='competitor_prices AS price, ')))
+
+    # "Which companies list Lisbon / offer a kitchen": covering, already
+    # grouped by company
+    op.create_index(
+        'idx_attributes_lookup', 'competitor_price_attributes',
+        ['attribute', 'value_key', 'company_name', 'scrape_timestamp', 'price_id'],
+        if_not_exists=True
+    )
+    # "Who runs a promotion today", value listings per attribute
+    op.create_index(
+        'idx_attributes_time', 'competitor_price_attributes',
+        ['attribute', 'scrape_timestamp', 'company_name'],
+        if_not_exists=True
+    )
+    # Trigger deletes when a price row is removed or rewritten
+    op.create_index(
+        'idx_attributes_price', 'competitor_price_attributes', ['price_id'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for name in TRIGGERS:
+        if bind.dialect.name == 'postgresql':
+            bind.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name} ON competitor_prices")
+        else:
+            bind.execute(sa.text(f"DROP TRIGGER IF EXISTS {name}"))
+    if bind.dialect.name == 'postgresql':
+        bind.exec_driver_sql("DROP FUNCTION IF EXISTS trg_price_attributes()")
+    op.drop_index('idx_attributes_price', table_name='competitor_price_attributes', if_exists=True)
+    op.drop_index('idx_attributes_time', table_name='competitor_price_attributes', if_exists=True)
+    op.drop_index('idx_attributes_lookup', table_name='competitor_price_attributes', if_exists=True)
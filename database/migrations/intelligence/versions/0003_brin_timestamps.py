@@ -0,0 +1,44 @@
+"""BRIN indexes on append-only timestamps (PostgreSQL)
+
+competitor_prices, price_alerts and competitor_price_attributes are written
+in time order, so a BRIN index (a few pages per table, one summary per block
+range) serves their time-window scans at a fraction of a btree's size and
+insert cost. The btree on competitor_prices.scrape_timestamp stays: it
+serves ORDER BY ... LIMIT reads, which BRIN cannot. SQLite has no BRIN;
+there this revision changes nothing.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BRIN_INDEXES = [
+    ('idx_prices_time_brin', 'competitor_prices', 'scrape_timestamp'),
+    ('idx_alerts_time_brin', 'price_alerts', 'alert_timestamp'),
+    ('idx_attributes_time_brin', 'competitor_price_attributes', 'scrape_timestamp'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, column in BRIN_INDEXES:
+        op.create_index(name, table, [column], postgresql_using='brin', if_not_exists=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, _ in BRIN_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,5 @@
+"""Alembic environment for the pricing calendar database (database/pricing_calendar_schema.py)"""
+
+from database.migrate import run_environment
+
+run_environment('pricing')
@@ -0,0 +1,68 @@
+"""Index baseline for daily_prices, vehicle_models and price_snapshots
+
+Takes over the indexes the schema used to declare. Single-column indexes
+that are a prefix of a unique constraint or another index are dropped.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Covered by uq_company_model / uq_company_model_date / idx_date_company / uq_company_date_location
+REDUNDANT = [
+    ('ix_vehicle_models_company_name', 'vehicle_models', ['company_name']),
+    ('ix_daily_prices_company_name', 'daily_prices', ['company_name']),
+    ('ix_daily_prices_rental_date', 'daily_prices', ['rental_date']),
+    ('ix_daily_prices_model_name', 'daily_prices', ['model_name']),
+    ('ix_price_snapshots_company_name', 'price_snapshots', ['company_name']),
+    ('ix_price_snapshots_snapshot_date', 'price_snapshots', ['snapshot_date']),
+]
+
+
+def _has_columns(table: str, columns) -> bool:
+    """Whether table exists with these columns (0002 re-keys them by company_id)"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return False
+    return set(columns) <= {column['name'] for column in inspector.get_columns(table)}
+
+
+def _create_index(name: str, table: str, columns) -> None:
+    # Databases created at 0002 or later get their company indexes there
+    if _has_columns(table, columns):
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def upgrade() -> None:
+    _create_index('idx_company_category', 'vehicle_models', ['company_name', 'model_category'])
+
+    _create_index('idx_date_company', 'daily_prices', ['rental_date', 'company_name'])
+    _create_index('idx_price_date', 'daily_prices', ['price_per_night', 'rental_date'])
+    # Rollup inputs: one company/location over a rental date range
+    _create_index('idx_daily_company_location_date', 'daily_prices', ['company_name', 'search_location', 'rental_date'])
+    # Rows scraped since the rollup watermark
+    _create_index('idx_daily_scraped_at', 'daily_prices', ['scraped_at'])
+
+    _create_index('idx_snapshot_date', 'price_snapshots', ['snapshot_date'])
+
+    for name, table, _ in REDUNDANT:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT:
+        _create_index(name, table, columns)
+    op.drop_index('idx_daily_scraped_at', table_name='daily_prices', if_exists=True)
+    op.drop_index('idx_daily_company_location_date', table_name='daily_prices', if_exists=True)
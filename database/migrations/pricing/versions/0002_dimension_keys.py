@@ -0,0 +1,242 @@
+"""Integer company and vehicle model keys
+
+Adds the companies dimension and replaces the company_name / model_name
+strings of vehicle_models, daily_prices, price_snapshots and the rollup
+tables with companies.id / vehicle_models.id. Legacy tables are rebuilt in
+place (row ids are kept, so history_store watermarks stay valid) and the
+company indexes are recreated on the integer keys. Run VACUUM afterwards to
+return the freed pages to the filesystem.
+
+The table layouts are declared here, as of this revision, rather than taken
+from database/pricing_calendar_schema.py, so later model changes do not
+alter what this revision creates.
+
+Irreversible: the names are folded into shared dimension rows, and
+downgrade() refuses to run. Restore a backup taken before the upgrade
+instead.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 13:00:00
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+from alembic.util import CommandError
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _id():
+    return sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True)
+
+
+def _aggregates():
+    return [
+        sa.Column('min_price_per_night', sa.Float()),
+        sa.Column('max_price_per_night', sa.Float()),
+        sa.Column('avg_price_per_night', sa.Float()),
+        sa.Column('median_price_per_night', sa.Float()),
+    ]
+
+
+def _vehicle_models():
+    return [
+        _id(),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('model_name', sa.String(200), nullable=False),
+        sa.Column('model_category', sa.String(50)),
+        sa.Column('sleeps', sa.Integer()),
+        sa.Column('features', sa.JSON()),
+        sa.Column('image_url', sa.String(500)),
+        sa.UniqueConstraint('company_id', 'model_name', name='uq_company_model'),
+    ]
+
+
+def _daily_prices():
+    return [
+        _id(),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('model_id', sa.Integer(), nullable=False),
+        sa.Column('rental_date', sa.Date(), nullable=False),
+        sa.Column('price_per_night', sa.Float(), nullable=False),
+        sa.Column('currency', sa.String(3)),
+        sa.Column('min_nights', sa.Integer()),
+        sa.Column('search_location', sa.String(100)),
+        sa.Column('pickup_location', sa.String(100)),
+        sa.Column('rental_duration_days', sa.Integer()),
+        sa.Column('insurance_per_day', sa.Float()),
+        sa.Column('cleaning_fee', sa.Float()),
+        sa.Column('service_fee', sa.Float()),
+        sa.Column('total_rental_cost', sa.Float()),
+        sa.Column('is_available', sa.Boolean()),
+        sa.Column('num_available', sa.Integer()),
+        sa.Column('scraped_at', sa.DateTime()),
+        sa.Column('booking_url', sa.String(500)),
+        sa.Column('notes', sa.String(500)),
+        sa.UniqueConstraint('model_id', 'rental_date', name='uq_model_date'),
+    ]
+
+
+def _price_snapshots():
+    return [
+        _id(),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('search_location', sa.String(100)),
+        *_aggregates(),
+        sa.Column('total_vehicles_available', sa.Integer()),
+        sa.Column('num_models_available', sa.Integer()),
+        sa.Column('scraped_at', sa.DateTime()),
+        sa.Column('num_prices_collected', sa.Integer()),
+        sa.UniqueConstraint('company_id', 'snapshot_date', 'search_location', name='uq_company_date_location'),
+    ]
+
+
+def _rollup(constraint: str):
+    def columns():
+        return [
+            _id(),
+            sa.Column('company_id', sa.Integer(), nullable=False),
+            sa.Column('period_start', sa.Date(), nullable=False),
+            sa.Column('search_location', sa.String(100)),
+            *_aggregates(),
+            sa.Column('num_days', sa.Integer()),
+            sa.Column('num_models_available', sa.Integer()),
+            sa.Column('num_prices_collected', sa.Integer()),
+            sa.Column('updated_at', sa.DateTime()),
+            sa.UniqueConstraint('company_id', 'period_start', 'search_location', name=constraint),
+        ]
+    return columns
+
+
+# vehicle_models first: daily_prices resolves model_id against it
+KEYED = {
+    'vehicle_models': _vehicle_models,
+    'daily_prices': _daily_prices,
+    'price_snapshots': _price_snapshots,
+    'weekly_price_rollups': _rollup('uq_weekly_company_period_location'),
+    'monthly_price_rollups': _rollup('uq_monthly_company_period_location'),
+}
+
+
+def _is_legacy(table: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return inspector.has_table(table) and 'company_name' in {c['name'] for c in inspector.get_columns(table)}
+
+
+def _release_names(table: str) -> None:
+    """Free the legacy table's index and constraint names for the new table"""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if bind.dialect.name == 'postgresql':
+        # Constraint and sequence names are schema-wide here, not per table
+        for constraint in inspector.get_unique_constraints(table):
+            op.drop_constraint(constraint['name'], table, type_='unique')
+        primary_key = inspector.get_pk_constraint(table)['name']
+        if primary_key:
+            op.execute(f'ALTER TABLE {table} RENAME CONSTRAINT {primary_key} TO _legacy_{primary_key}')
+        sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {'table': table}).scalar()
+        if sequence:
+            op.execute(f'ALTER SEQUENCE {sequence} RENAME TO _legacy_{table}_id_seq')
+    for index in sa.inspect(bind).get_indexes(table):
+        if not index.get('duplicates_constraint'):
+            op.drop_index(index['name'], table_name=table)
+
+
+def _rebuild(table: str) -> None:
+    """Swap a legacy table for this revision's layout, resolving names to keys"""
+    bind = op.get_bind()
+    legacy = f'_legacy_{table}'
+
+    _release_names(table)
+    op.rename_table(table, legacy)
+    columns = [c.name for c in op.create_table(table, *KEYED[table]()).columns]
+
+    select = []
+    for column in columns:
+        if column == 'company_id':
+            select.append('c.id')
+        elif column == 'model_id':
+            select.append('m.id')
+        else:
+            select.append(f'o.{column}')
+    joins = 'JOIN companies c ON c.name = o.company_name'
+    if 'model_id' in columns:
+        joins += ' JOIN vehicle_models m ON m.company_id = c.id AND m.model_name = o.model_name'
+
+    op.execute(
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {', '.join(select)} FROM {legacy} o {joins}"
+    )
+    op.drop_table(legacy)
+    if 'period_start' in columns:
+        op.create_index(f'ix_{table}_period_start', table, ['period_start'])
+    if bind.dialect.name == 'postgresql':
+        # Rows kept their ids; move the new sequence past them
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+            f"FROM {table}"
+        )
+
+
+def upgrade() -> None:
+    legacy = [table for table in KEYED if _is_legacy(table)]
+    if legacy:
+        if not sa.inspect(op.get_bind()).has_table('companies'):
+            op.create_table(
+                'companies',
+                _id(),
+                sa.Column('name', sa.String(100), nullable=False, unique=True),
+                sa.Column('created_at', sa.DateTime()),
+            )
+        names = ' UNION '.join(f'SELECT company_name FROM {table}' for table in legacy)
+        op.execute(
+            sa.text(
+                f"INSERT INTO companies (name, created_at) SELECT legacy.company_name, :now "
+                f"FROM ({names}) AS legacy "
+                f"WHERE NOT EXISTS (SELECT 1 FROM companies c WHERE c.name = legacy.company_name)"
+            ).bindparams(now=datetime.now())
+        )
+
+    for table in legacy:
+        if table == 'daily_prices':
+            # Prices whose model never made it into vehicle_models
+            op.execute(
+                "INSERT INTO vehicle_models (company_id, model_name) "
+                "SELECT DISTINCT c.id, d.model_name FROM daily_prices d "
+                "JOIN companies c ON c.name = d.company_name "
+                "WHERE NOT EXISTS (SELECT 1 FROM vehicle_models m "
+                "WHERE m.company_id = c.id AND m.model_name = d.model_name)"
+            )
+        _rebuild(table)
+
+    op.create_index('idx_company_category', 'vehicle_models', ['company_id', 'model_category'], if_not_exists=True)
+
+    op.create_index('idx_date_company', 'daily_prices', ['rental_date', 'company_id'], if_not_exists=True)
+    op.create_index('idx_price_date', 'daily_prices', ['price_per_night', 'rental_date'], if_not_exists=True)
+    # Rollup inputs: one company/location over a rental date range
+    op.create_index(
+        'idx_daily_company_location_date', 'daily_prices',
+        ['company_id', 'search_location', 'rental_date'],
+        if_not_exists=True
+    )
+    # Rows scraped since the rollup watermark
+    op.create_index('idx_daily_scraped_at', 'daily_prices', ['scraped_at'], if_not_exists=True)
+
+    op.create_index('idx_snapshot_date', 'price_snapshots', ['snapshot_date'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    raise CommandError(
+        "0002 replaced company and model names with integer keys and cannot be reversed; "
+        "restore a backup taken before the upgrade"
+    )
@@ -0,0 +1,40 @@
+"""BRIN index for the daily_prices scrape watermark (PostgreSQL)
+
+price_rollups only asks daily_prices for rows scraped after its watermark,
+a range over a column that grows with insert order. On PostgreSQL a BRIN
+index answers that as well as the btree idx_daily_scraped_at did, at a
+fraction of its size and upsert cost, so it replaces it. SQLite keeps the
+btree.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('idx_daily_scraped_at', table_name='daily_prices', if_exists=True)
+    op.create_index(
+        'idx_daily_scraped_at_brin', 'daily_prices', ['scraped_at'],
+        postgresql_using='brin', if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('idx_daily_scraped_at_brin', table_name='daily_prices', if_exists=True)
+    op.create_index('idx_daily_scraped_at', 'daily_prices', ['scraped_at'], if_not_exists=True)
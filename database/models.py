@@ -3,11 +3,11 @@ Deep Data Collection Database Models
 Focused on quality insights - 20+ data points per competitor
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, JSON, Text
+from sqlalchemy import event, func, text, Column, Integer, String, Float, Date, DateTime, Boolean, JSON, Text, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import json
@@ -35,8 +35,8 @@ class CompetitorPrice(Base):
     
     # Core identification
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_name = Column(String(100), nullable=False, index=True)
-    scrape_timestamp = Column(DateTime, default=datetime.now, index=True)
+    company_name = Column(String(100), nullable=False)
+    scrape_timestamp = Column(DateTime, default=datetime.now)
     tier = Column(Integer)  # 1=Daily, 2=Weekly, 3=Monthly
     
     # Pricing - Base
@@ -93,6 +93,8 @@ class CompetitorPrice(Base):
     data_completeness_pct = Column(Float)  # % of fields filled
     is_estimated = Column(Boolean, default=False)  # If some data is estimated
     notes = Column(Text)
+
+    # Indexes are owned by the migrations (database/migrate.py)
     
 
 class CompetitorIntelligence(Base):
@@ -198,7 +200,386 @@ class PriceAlert(Base):
     resolved_at = Column(DateTime)
 
 
+class CompetitorPriceDaily(Base):
+    """Per-company daily price summary of raw rows past the retention window"""
+    __tablename__ = 'competitor_price_daily'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_name = Column(String(100), nullable=False)
+    period_start = Column(Date, nullable=False)  # Scrape day
+
+    num_scrapes = Column(Integer, default=0)
+    num_prices = Column(Integer, default=0)  # Scrapes with a base rate
+    price_sum = Column(Float, default=0.0)  # Running sum, so partial folds merge exactly
+    min_price = Column(Float)
+    max_price = Column(Float)
+    avg_price = Column(Float)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint('company_name', 'period_start', name='uq_price_daily_company_period'),
+    )
+
+
+class CompetitorPriceWeekly(Base):
+    """Per-company weekly price summary (Monday start), kept indefinitely"""
+    __tablename__ = 'competitor_price_weekly'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_name = Column(String(100), nullable=False)
+    period_start = Column(Date, nullable=False)  # Monday of the scrape week
+
+    num_scrapes = Column(Integer, default=0)
+    num_prices = Column(Integer, default=0)  # Scrapes with a base rate
+    price_sum = Column(Float, default=0.0)  # Running sum, so partial folds merge exactly
+    min_price = Column(Float)
+    max_price = Column(Float)
+    avg_price = Column(Float)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint('company_name', 'period_start', name='uq_price_weekly_company_period'),
+    )
+
+
+class LatestCompetitorPrice(Base):
+    """Newest competitor_prices row per company, maintained by triggers"""
+    __tablename__ = 'latest_competitor_price'
+
+    company_name = Column(String(100), primary_key=True)
+    price_id = Column(Integer, nullable=False)  # competitor_prices.id
+    scrape_timestamp = Column(DateTime, index=True)
+
+
+class CompetitorPriceAttribute(Base):
+    """One element of a competitor_prices JSON list column, maintained by triggers"""
+    __tablename__ = 'competitor_price_attributes'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    price_id = Column(Integer, nullable=False)  # competitor_prices.id
+    company_name = Column(String(100), nullable=False)
+    scrape_timestamp = Column(DateTime)
+    attribute = Column(String(30), nullable=False)  # Key of PRICE_ATTRIBUTE_COLUMNS
+    value = Column(Text, nullable=False)  # Element as scraped (promotions: their 'text')
+    value_key = Column(Text, nullable=False)  # lower(trim(value)), for lookups
+
+    # Indexes are owned by the migrations (database/migrate.py)
+
+
+# Keep latest_competitor_price current on every write path (ORM, the
+# persistence writer, raw scripts). Only the newest row per company is
+# touched, so "current state" reads stay O(#companies) as history grows.
+_LATEST_ROW_FOR = """
+    SELECT company_name, id, scrape_timestamp FROM competitor_prices
+    WHERE company_name = {company}
+    ORDER BY scrape_timestamp DESC, id DESC LIMIT 1
+"""
+
+LATEST_PRICE_TRIGGERS = {
+    'trg_latest_price_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_latest_price_insert
+        AFTER INSERT ON competitor_prices
+        BEGIN
+            INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+            VALUES (NEW.company_name, NEW.id, NEW.scrape_timestamp)
+            ON CONFLICT(company_name) DO UPDATE SET
+                price_id = excluded.price_id,
+                scrape_timestamp = excluded.scrape_timestamp
+            WHERE latest_competitor_price.scrape_timestamp IS NULL
+               OR excluded.scrape_timestamp >= latest_competitor_price.scrape_timestamp;
+        END
+    """,
+    # Deleting or moving the current row hands the slot to the next newest
+    'trg_latest_price_delete': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_latest_price_delete
+        AFTER DELETE ON competitor_prices
+        WHEN OLD.id = (SELECT price_id FROM latest_competitor_price WHERE company_name = OLD.company_name)
+        BEGIN
+            DELETE FROM latest_competitor_price WHERE company_name = OLD.company_name;
+            INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+            {_LATEST_ROW_FOR.format(company='OLD.company_name')};
+        END
+    """,
+    'trg_latest_price_update': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_latest_price_update
+        AFTER UPDATE OF company_name, scrape_timestamp ON competitor_prices
+        BEGIN
+            DELETE FROM latest_competitor_price WHERE company_name IN (OLD.company_name, NEW.company_name);
+            INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+            {_LATEST_ROW_FOR.format(company='OLD.company_name')};
+            INSERT OR REPLACE INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+            {_LATEST_ROW_FOR.format(company='NEW.company_name')};
+        END
+    """,
+}
+
+
+# PostgreSQL: the same rules in one PL/pgSQL function. Row triggers fire
+# after the statement, so a multi-row DELETE recomputes from the final state.
+_LATEST_ROW_FOR_PG = _LATEST_ROW_FOR.replace('scrape_timestamp DESC,', 'scrape_timestamp DESC NULLS LAST,')
+
+LATEST_PRICE_TRIGGERS_PG = {
+    'trg_latest_price': f"""
+        CREATE OR REPLACE FUNCTION trg_latest_price() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO latest_competitor_price AS latest (company_name, price_id, scrape_timestamp)
+                VALUES (NEW.company_name, NEW.id, NEW.scrape_timestamp)
+                ON CONFLICT (company_name) DO UPDATE SET
+                    price_id = excluded.price_id,
+                    scrape_timestamp = excluded.scrape_timestamp
+                WHERE latest.scrape_timestamp IS NULL
+                   OR excluded.scrape_timestamp >= latest.scrape_timestamp;
+                RETURN NULL;
+            END IF;
+            IF TG_OP = 'DELETE' AND OLD.id IS DISTINCT FROM
+                    (SELECT price_id FROM latest_competitor_price WHERE company_name = OLD.company_name) THEN
+                RETURN NULL;
+            END IF;
+            DELETE FROM latest_competitor_price WHERE company_name = OLD.company_name;
+            INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+            {_LATEST_ROW_FOR_PG.format(company='OLD.company_name')};
+            IF TG_OP = 'UPDATE' AND NEW.company_name IS DISTINCT FROM OLD.company_name THEN
+                DELETE FROM latest_competitor_price WHERE company_name = NEW.company_name;
+                INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+                {_LATEST_ROW_FOR_PG.format(company='NEW.company_name')};
+            END IF;
+            RETURN NULL;
+        END $$
+    """,
+    'trg_latest_price_insert': "AFTER INSERT ON competitor_prices",
+    'trg_latest_price_delete': "AFTER DELETE ON competitor_prices",
+    'trg_latest_price_update': "AFTER UPDATE OF company_name, scrape_timestamp ON competitor_prices",
+}
+
+
+def _trigger_installed(connection, name: str) -> bool:
+    if connection.dialect.name == 'postgresql':
+        query = "SELECT 1 FROM pg_trigger WHERE tgname = :name"
+    else:
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = :name"
+    return connection.execute(text(query), {'name': name}).first() is not None
+
+
+def _create_triggers(connection, sqlite_triggers: Dict[str, str], postgresql_triggers: Dict[str, str]):
+    """
+    Create a trigger set in the connection's backend.
+
+    postgresql_triggers holds the function (first entry) and then the
+    trigger name -> event clause of each trigger that calls it.
+    """
+    if connection.dialect.name == 'sqlite':
+        for ddl in sqlite_triggers.values():
+            connection.execute(text(ddl))
+        return
+    (function, function_ddl), *triggers = postgresql_triggers.items()
+    connection.exec_driver_sql(function_ddl)
+    for name, when in triggers:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name} ON competitor_prices")
+        connection.exec_driver_sql(f"CREATE TRIGGER {name} {when} FOR EACH ROW EXECUTE FUNCTION {function}()")
+
+
+def drop_triggers(connection, sqlite_triggers: Dict[str, str], postgresql_triggers: Dict[str, str]):
+    """Remove a trigger set created by _create_triggers (migration downgrades)"""
+    for name in sqlite_triggers:
+        if connection.dialect.name == 'postgresql':
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name} ON competitor_prices")
+        else:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    if connection.dialect.name == 'postgresql':
+        connection.exec_driver_sql(f"DROP FUNCTION IF EXISTS {next(iter(postgresql_triggers))}()")
+
+
+def refresh_latest_prices(connection) -> int:
+    """
+    Rebuild latest_competitor_price from competitor_prices.
+
+    Args:
+        connection: SQLAlchemy Connection (inside a transaction)
+
+    Returns:
+        Number of companies tracked
+    """
+    connection.execute(text("DELETE FROM latest_competitor_price"))
+    connection.execute(text("""
+        INSERT INTO latest_competitor_price (company_name, price_id, scrape_timestamp)
+        SELECT company_name, id, scrape_timestamp FROM (
+            SELECT company_name, id, scrape_timestamp,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY company_name ORDER BY scrape_timestamp DESC NULLS LAST, id DESC
+                   ) AS rank
+            FROM competitor_prices
+        ) AS ranked WHERE rank = 1
+    """))
+    return connection.execute(text("SELECT COUNT(*) FROM latest_competitor_price")).scalar()
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _install_latest_price_triggers(target, connection, **kw):
+    """Create the triggers with the schema; backfill on first install"""
+    if connection.dialect.name not in ('sqlite', 'postgresql'):
+        return
+    installed = _trigger_installed(connection, 'trg_latest_price_insert')
+    _create_triggers(connection, LATEST_PRICE_TRIGGERS, LATEST_PRICE_TRIGGERS_PG)
+    if not installed:
+        refresh_latest_prices(connection)
+
+
+# Attribute name -> competitor_prices JSON list column
+PRICE_ATTRIBUTE_COLUMNS = {
+    'vehicle_type': 'vehicle_types',
+    'vehicle_feature': 'vehicle_features',
+    'location': 'locations_available',
+    'route': 'popular_routes',
+    'promotion': 'active_promotions',
+    'payment_option': 'payment_options',
+}
+
+# Elements that are objects (detect_promotions() output) are keyed by their text
+_ITEM_VALUE = "CASE WHEN item.type = 'object' THEN COALESCE(json_extract(item.value, '$.text'), item.value) ELSE item.value END"
+
+_ATTRIBUTE_ROWS = """
+    SELECT {row}.id, {row}.company_name, {row}.scrape_timestamp, '{attribute}', {value}, lower(trim({value}))
+    FROM {source}json_each(CASE WHEN json_valid({row}.{column}) THEN {row}.{column} END) AS item
+    WHERE item.type != 'null' AND trim({value}) != ''
+"""
+
+
+def _attribute_rows(row: str, source: str = '') -> str:
+    """SELECT of competitor_price_attributes rows for one price row (or all of them)"""
+    insert = "INSERT INTO competitor_price_attributes (price_id, company_name, scrape_timestamp, attribute, value, value_key)"
+    selects = [
+        _ATTRIBUTE_ROWS.format(row=row, source=source, attribute=attribute, column=column, value=_ITEM_VALUE)
+        for attribute, column in PRICE_ATTRIBUTE_COLUMNS.items()
+    ]
+    return insert + "\n    UNION ALL".join(selects)
+
+
+# PostgreSQL: json_array_elements over each list column
+_ITEM_VALUE_PG = (
+    "CASE json_typeof(element.data) WHEN 'object' THEN COALESCE(element.data ->> 'text', element.data::text) "
+    "WHEN 'string' THEN element.data #>> '{}' ELSE element.data::text END"
+)
+
+
+def _attribute_rows_pg(row: str, source: str = '') -> str:
+    """PostgreSQL form of _attribute_rows(); source ends in CROSS JOIN LATERAL"""
+    lists = ', '.join(f"('{attribute}', {row}.{column})" for attribute, column in PRICE_ATTRIBUTE_COLUMNS.items())
+    return f"""
+    INSERT INTO competitor_price_attributes (price_id, company_name, scrape_timestamp, attribute, value, value_key)
+    SELECT {row}.id, {row}.company_name, {row}.scrape_timestamp, list.attribute, item.value, lower(trim(item.value))
+    FROM {source}(VALUES {lists}) AS list (attribute, elements)
+    CROSS JOIN LATERAL json_array_elements(
+        CASE WHEN json_typeof(list.elements) = 'array' THEN list.elements END
+    ) AS element (data)
+    CROSS JOIN LATERAL (SELECT {_ITEM_VALUE_PG} AS value) AS item
+    WHERE json_typeof(element.data) != 'null' AND trim(item.value) != ''"""
+
+
+# Keep competitor_price_attributes in step with competitor_prices on every
+# write path, so location/feature/promotion lookups never decode JSON.
+PRICE_ATTRIBUTE_TRIGGERS = {
+    'trg_price_attributes_insert': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_insert
+        AFTER INSERT ON competitor_prices
+        BEGIN
+            {_attribute_rows('NEW')};
+        END
+    """,
+    'trg_price_attributes_delete': """
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_delete
+        AFTER DELETE ON competitor_prices
+        BEGIN
+            DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+        END
+    """,
+    'trg_price_attributes_update': f"""
+        CREATE TRIGGER IF NOT EXISTS trg_price_attributes_update
+        AFTER UPDATE OF company_name, scrape_timestamp, {', '.join(PRICE_ATTRIBUTE_COLUMNS.values())}
+        ON competitor_prices
+        BEGIN
+            DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+            {_attribute_rows('NEW')};
+        END
+    """,
+}
+
+
+PRICE_ATTRIBUTE_TRIGGERS_PG = {
+    'trg_price_attributes': f"""
+        CREATE OR REPLACE FUNCTION trg_price_attributes() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP != 'INSERT' THEN
+                DELETE FROM competitor_price_attributes WHERE price_id = OLD.id;
+            END IF;
+            IF TG_OP != 'DELETE' THEN
+                {_attribute_rows_pg('NEW')};
+            END IF;
+            RETURN NULL;
+        END $$
+    """,
+    'trg_price_attributes_insert': "AFTER INSERT ON competitor_prices",
+    'trg_price_attributes_delete': "AFTER DELETE ON competitor_prices",
+    'trg_price_attributes_update': (
+        f"AFTER UPDATE OF company_name, scrape_timestamp, {', '.join(PRICE_ATTRIBUTE_COLUMNS.values())} "
+        "ON competitor_prices"
+    ),
+}
+
+
+def refresh_price_attributes(connection) -> int:
+    """
+    Rebuild competitor_price_attributes from competitor_prices.
+
+    Args:
+        connection: SQLAlchemy Connection (inside a transaction)
+
+    Returns:
+        Number of attribute rows
+    """
+    connection.execute(text("DELETE FROM competitor_price_attributes"))
+    if connection.dialect.name == 'postgresql':
+        connection.exec_driver_sql(_attribute_rows_pg('price', source='competitor_prices AS price CROSS JOIN LATERAL '))
+    else:
+        connection.execute(text(_attribute_rows('price', source='competitor_prices AS price, ')))
+    return connection.execute(text("SELECT COUNT(*) FROM competitor_price_attributes")).scalar()
+
+
+def install_price_attributes(connection):
+    """Create competitor_price_attributes and its triggers; backfill on first install"""
+    if connection.dialect.name not in ('sqlite', 'postgresql'):
+        return
+    CompetitorPriceAttribute.__table__.create(connection, checkfirst=True)
+    installed = _trigger_installed(connection, 'trg_price_attributes_insert')
+    _create_triggers(connection, PRICE_ATTRIBUTE_TRIGGERS, PRICE_ATTRIBUTE_TRIGGERS_PG)
+    if not installed:
+        refresh_price_attributes(connection)
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _install_price_attribute_triggers(target, connection, **kw):
+    install_price_attributes(connection)
+
+
 # Database utilities
+_SESSION_FACTORIES: Dict[str, sessionmaker] = {}
+
+
+def get_engine() -> Engine:
+    """
+    Get the process-wide engine for DATABASE_URL.
+
+    Engines own the connection pool (sized by core_config, see
+    database/engine.py), so long-running processes (the scheduler daemon)
+    reuse one instead of reconnecting per session.
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    from database.engine import get_database_engine
+    return get_database_engine(DATABASE_URL)
+
+
 def init_database() -> Engine:
     """
     Initialize database with deep schema.
@@ -206,10 +587,15 @@ def init_database() -> Engine:
     Returns:
         SQLAlchemy Engine instance
     """
-    DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    engine: Engine = create_engine(f'sqlite:///{DATABASE_PATH}')
+    engine: Engine = get_engine()
+    if engine.dialect.name == 'sqlite':
+        with engine.connect() as connection:
+            # Only takes effect on a new (empty) file; see database/retention.py
+            connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
     Base.metadata.create_all(engine)
-    print(f"[OK] Database initialized: {DATABASE_PATH}")
+    from database.migrate import upgrade
+    upgrade('intelligence', engine=engine)
+    print(f"[OK] Database initialized: {engine.url.render_as_string(hide_password=True)}")
     return engine
 
 
@@ -220,9 +606,11 @@ def get_session() -> Session:
     Returns:
         SQLAlchemy Session instance
     """
-    engine: Engine = create_engine(f'sqlite:///{DATABASE_PATH}')
-    SessionMaker = sessionmaker(bind=engine)
-    return SessionMaker()
+    engine: Engine = get_engine()
+    key = str(engine.url)
+    if key not in _SESSION_FACTORIES:
+        _SESSION_FACTORIES[key] = sessionmaker(bind=engine)
+    return _SESSION_FACTORIES[key]()
 
 
 def add_price_record(data: Dict[str, Any]) -> int:
@@ -263,6 +651,114 @@ def get_latest_prices(limit: int = 10) -> List[CompetitorPrice]:
     return prices
 
 
+def get_current_prices(session: Session) -> List[CompetitorPrice]:
+    """
+    Newest price record for every company.
+
+    Reads latest_competitor_price (one row per company) and fetches those
+    records by primary key, instead of scanning competitor_prices.
+
+    Args:
+        session: Open session; the records stay attached to it
+
+    Returns:
+        List of CompetitorPrice records, one per company
+    """
+    return session.query(CompetitorPrice)\
+        .join(LatestCompetitorPrice, LatestCompetitorPrice.price_id == CompetitorPrice.id)\
+        .order_by(CompetitorPrice.company_name)\
+        .all()
+
+
+def get_last_scrape_time(session: Session) -> Optional[datetime]:
+    """
+    Timestamp of the most recent price record of any company.
+
+    Args:
+        session: Open session
+
+    Returns:
+        datetime, or None if nothing has been scraped yet
+    """
+    return session.query(func.max(LatestCompetitorPrice.scrape_timestamp)).scalar()
+
+
+def find_companies_by_attribute(session: Session, attribute: str, value: str,
+                                since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Companies whose scrapes listed a value in one of the JSON list columns.
+
+    Reads competitor_price_attributes on (attribute, value_key,
+    scrape_timestamp), so no JSON is decoded.
+
+    Args:
+        session: Open session
+        attribute: Key of PRICE_ATTRIBUTE_COLUMNS ('location', 'vehicle_feature', ...)
+        value: Element to look for (case and surrounding spaces ignored)
+        since: Only scrapes at or after this time (default: full history)
+
+    Returns:
+        One dict per company: company_name, records, first_seen, last_seen
+    """
+    if attribute not in PRICE_ATTRIBUTE_COLUMNS:
+        raise ValueError(f"Unknown attribute '{attribute}'. Use one of: {', '.join(PRICE_ATTRIBUTE_COLUMNS)}")
+
+    query = session.query(
+        CompetitorPriceAttribute.company_name,
+        func.count(func.distinct(CompetitorPriceAttribute.price_id)).label('records'),
+        func.min(CompetitorPriceAttribute.scrape_timestamp).label('first_seen'),
+        func.max(CompetitorPriceAttribute.scrape_timestamp).label('last_seen'),
+    ).filter(
+        CompetitorPriceAttribute.attribute == attribute,
+        CompetitorPriceAttribute.value_key == value.strip().lower(),
+    )
+    if since is not None:
+        query = query.filter(CompetitorPriceAttribute.scrape_timestamp >= since)
+    rows = query.group_by(CompetitorPriceAttribute.company_name)\
+        .order_by(CompetitorPriceAttribute.company_name)\
+        .all()
+    return [row._asdict() for row in rows]
+
+
+def get_companies_serving_location(session: Session, location: str,
+                                   since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Companies that listed a pickup location (see find_companies_by_attribute)"""
+    return find_companies_by_attribute(session, 'location', location, since)
+
+
+def get_companies_with_feature(session: Session, feature: str,
+                               since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Companies that listed a vehicle feature (see find_companies_by_attribute)"""
+    return find_companies_by_attribute(session, 'vehicle_feature', feature, since)
+
+
+def get_active_promotions(session: Session, day: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Promotions seen in scrapes on one day.
+
+    Args:
+        session: Open session
+        day: Scrape day (default: today)
+
+    Returns:
+        One dict per company and promotion: company_name, promotion, last_seen
+    """
+    start = datetime.combine(day or date.today(), datetime.min.time())
+    rows = session.query(
+        CompetitorPriceAttribute.company_name,
+        # One spelling per value_key (valid on PostgreSQL, unlike a bare column)
+        func.min(CompetitorPriceAttribute.value).label('promotion'),
+        func.max(CompetitorPriceAttribute.scrape_timestamp).label('last_seen'),
+    ).filter(
+        CompetitorPriceAttribute.attribute == 'promotion',
+        CompetitorPriceAttribute.scrape_timestamp >= start,
+        CompetitorPriceAttribute.scrape_timestamp < start + timedelta(days=1),
+    ).group_by(CompetitorPriceAttribute.company_name, CompetitorPriceAttribute.value_key)\
+        .order_by(CompetitorPriceAttribute.company_name)\
+        .all()
+    return [row._asdict() for row in rows]
+
+
 def get_market_summary() -> Optional[MarketIntelligence]:
     """
     Get latest market intelligence.
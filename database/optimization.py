@@ -2,58 +2,35 @@
 Database Optimization - Indexes, Cleanup, and Maintenance
 """
 
-import gzip
-import shutil
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from loguru import logger
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 def create_database_indexes():
     """
-    Create indexes for common queries.
+    Bring indexes up to date by running the index migrations.
 
-    Improves query performance by 5-10x for:
-    - Company name + timestamp lookups
-    - Timestamp range queries
-    - Tier-based filtering
+    Indexes on competitor_prices, price_alerts and the pricing calendar
+    tables are owned by database/migrations (see database/migrate.py).
+    Databases that have not been created yet are skipped.
     """
-    from models import CompetitorPrice, engine
-    from sqlalchemy import Index, inspect
+    from database.migrate import TARGETS, current, database_exists, upgrade
 
-    logger.info("Creating database indexes...")
+    logger.info("Applying index migrations...")
 
     try:
-        inspector = inspect(engine)
-        existing_indexes = inspector.get_indexes('competitor_prices')
-        existing_index_names = {idx['name'] for idx in existing_indexes}
-
-        # Define indexes to create
-        indexes_to_create = [
-            Index('idx_company_timestamp', CompetitorPrice.company_name, CompetitorPrice.scrape_timestamp),
-            Index('idx_timestamp', CompetitorPrice.scrape_timestamp),
-            Index('idx_tier_timestamp', CompetitorPrice.tier, CompetitorPrice.scrape_timestamp),
-            Index('idx_company', CompetitorPrice.company_name),
-        ]
-
-        # Create indexes if they don't exist
-        created_count = 0
-        for index in indexes_to_create:
-            if index.name not in existing_index_names:
-                try:
-                    index.create(engine)
-                    logger.info(f"✅ Created index: {index.name}")
-                    created_count += 1
-                except Exception as e:
-                    logger.warning(f"Index {index.name} might already exist: {e}")
-            else:
-                logger.debug(f"Index {index.name} already exists")
-
-        if created_count > 0:
-            logger.info(f"✅ Created {created_count} database indexes")
-        else:
-            logger.info("All indexes already exist")
+        for target in TARGETS:
+            if not database_exists(target):
+                logger.debug(f"No {target} database yet, skipping")
+                continue
+            upgrade(target)
+            logger.info(f"✅ {target} indexes at revision {current(target)}")
 
         return True
 
@@ -64,81 +41,53 @@ def create_database_indexes():
 
 def cleanup_old_data(days_to_keep: int = 90, dry_run: bool = False) -> dict:
     """
-    Delete old scraping data to save space.
+    Downsample old scraping data to save space.
+
+    Raw rows older than days_to_keep are folded into daily summaries and
+    old daily summaries into weekly ones (see database/retention.py), so
+    long-range trends survive the cleanup.
 
     Args:
-        days_to_keep: Number of days of data to keep (default: 90)
-        dry_run: If True, only count records without deleting
+        days_to_keep: Number of days of raw data to keep (default: 90)
+        dry_run: If True, only count records without downsampling
 
     Returns:
         Dict with cleanup statistics
     """
-    from models import CompetitorPrice, get_session
+    from database.retention import apply_retention
 
-    logger.info(f"Starting data cleanup (keep last {days_to_keep} days)...")
-
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-    session = get_session()
+    logger.info(f"Starting data cleanup (keep last {days_to_keep} days of raw data)...")
 
     try:
-        # Count records to delete
-        old_records = session.query(CompetitorPrice).filter(
-            CompetitorPrice.scrape_timestamp < cutoff_date
-        )
-
-        count = old_records.count()
-
-        if dry_run:
-            logger.info(f"[DRY RUN] Would delete {count} records older than {cutoff_date.date()}")
-            return {
-                'dry_run': True,
-                'records_to_delete': count,
-                'cutoff_date': cutoff_date,
-                'deleted': 0
-            }
-
-        # Delete old records
-        if count > 0:
-            deleted = old_records.delete(synchronize_session=False)
-            session.commit()
-            logger.info(f"✅ Deleted {deleted} old price records")
-        else:
-            logger.info("No old records to delete")
-            deleted = 0
-
-        return {
-            'dry_run': False,
-            'records_to_delete': count,
-            'cutoff_date': cutoff_date,
-            'deleted': deleted
-        }
-
+        result = apply_retention(raw_days=days_to_keep, dry_run=dry_run, vacuum=False)
     except Exception as e:
-        session.rollback()
         logger.error(f"Cleanup failed: {e}")
         raise
 
-    finally:
-        session.close()
+    return {
+        'dry_run': dry_run,
+        'records_to_delete': result['raw_rows'],
+        'cutoff_date': result['raw_cutoff'],
+        'deleted': 0 if dry_run else result['raw_rows'],
+        'daily_rows': result['daily_rows'],
+    }
 
 
 def vacuum_database():
     """
-    Optimize database file (SQLite VACUUM command).
+    Return free pages to the filesystem (SQLite incremental vacuum).
 
-    Reclaims unused space and optimizes internal structure.
-    Should be run after large deletions.
+    Frees pages in small steps instead of rewriting the whole file, so
+    writers are not blocked. Should be run after large deletions.
     """
-    from models import engine
+    from database.retention import incremental_vacuum
 
-    logger.info("Running database VACUUM...")
+    logger.info("Running incremental VACUUM...")
 
     try:
-        # VACUUM must be run outside a transaction
-        with engine.begin() as connection:
-            connection.execute("VACUUM")
+        pages = incremental_vacuum()
 
-        logger.info("✅ Database vacuumed successfully")
+        logger.info(f"✅ Database vacuumed successfully ({pages} pages freed)")
         return True
 
     except Exception as e:
@@ -150,6 +99,9 @@ def backup_database(backup_dir: Optional[Path] = None, compress: bool = True) ->
     """
     Create database backup.
 
+    Uses the online SQLite backup API (see database_backup.py), so the
+    copy is consistent even while scrapers are writing.
+
     Args:
         backup_dir: Directory to store backups (default: data/backups)
         compress: Whether to compress backup with gzip (default: True)
@@ -157,61 +109,33 @@ def backup_database(backup_dir: Optional[Path] = None, compress: bool = True) ->
     Returns:
         Path to backup file, or None if failed
     """
-    from core_config import config
+    from database_backup import DatabaseBackup
 
     if backup_dir is None:
         backup_dir = Path('data/backups')
 
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate backup filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_name = f"campervan_intel_{timestamp}.db"
-    backup_path = backup_dir / backup_name
-
-    logger.info(f"Creating database backup: {backup_path}")
+    manager = DatabaseBackup(backup_dir=backup_dir)
+    logger.info(f"Creating database backup in {backup_dir} from {manager.database_path or 'the database server'}")
 
-    try:
-        # Get database path
-        db_path = Path('data/campervan_intel.db')
-
-        if not db_path.exists():
-            logger.error(f"Database not found: {db_path}")
-            return None
-
-        # Copy database
-        shutil.copy2(db_path, backup_path)
-
-        # Compress if requested
-        if compress:
-            compressed_path = Path(str(backup_path) + '.gz')
-
-            with open(backup_path, 'rb') as f_in:
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-
-            # Remove uncompressed backup
-            backup_path.unlink()
-            backup_path = compressed_path
-
-        # Get file size
-        size_mb = backup_path.stat().st_size / (1024 * 1024)
-
-        logger.info(f"✅ Backup created: {backup_path} ({size_mb:.2f} MB)")
+    backup_path = manager.create_backup(compress=compress, backup_type='manual')
+    if backup_path is None:
+        logger.error("Backup failed")
+        return None
 
-        # Cleanup old backups (keep last 30 days)
-        cleanup_old_backups(backup_dir, days_to_keep=30)
+    size_mb = backup_path.stat().st_size / (1024 * 1024)
+    logger.info(f"✅ Backup created: {backup_path} ({size_mb:.2f} MB)")
 
-        return backup_path
+    # Cleanup old backups (keep last 30 days)
+    cleanup_old_backups(backup_dir, days_to_keep=30)
 
-    except Exception as e:
-        logger.error(f"Backup failed: {e}")
-        return None
+    return backup_path
 
 
 def cleanup_old_backups(backup_dir: Path, days_to_keep: int = 30):
     """
-    Delete old backup files.
+    Delete old manual backup files.
 
     Args:
         backup_dir: Directory containing backups
@@ -222,10 +146,13 @@ def cleanup_old_backups(backup_dir: Path, days_to_keep: int = 30):
 
     deleted_count = 0
 
-    for backup_file in backup_dir.glob("campervan_intel_*.db*"):
+    for backup_file in backup_dir.glob("backup_manual_*.db*"):
+        if backup_file.suffix == '.meta':
+            continue
         if backup_file.stat().st_mtime < cutoff_timestamp:
             try:
                 backup_file.unlink()
+                backup_file.with_suffix(backup_file.suffix + '.meta').unlink(missing_ok=True)
                 deleted_count += 1
                 logger.debug(f"Deleted old backup: {backup_file.name}")
             except Exception as e:
@@ -242,7 +169,7 @@ def get_database_stats() -> dict:
     Returns:
         Dict with database stats
     """
-    from models import CompetitorPrice, get_session
+    from database.models import CompetitorPrice, get_session
 
     session = get_session()
 
@@ -0,0 +1,312 @@
+"""
+Pricing Calendar Rollups
+Keeps PriceSnapshot and the weekly/monthly rollup tables in step with DailyPrice
+
+Dashboards and exports read these small tables instead of re-aggregating
+raw daily prices (or calendar JSON) on every request. update_rollups() is
+incremental: it finds the DailyPrice rows scraped since the last run
+(RollupWatermark) and recomputes only the (company, location) days, weeks
+and months those rows fall in, from all rows of those periods.
+
+Companies and vehicle models are stored by integer key (companies.id,
+vehicle_models.id); ingestion interns names through database/dimensions.py
+and load_rollups() joins the company name back in.
+
+Usage:
+    python -m database.price_rollups                    # incremental
+    python -m database.price_rollups --full             # rebuild everything
+    python -m database.price_rollups --ingest output/pricing_calendar_20251116_120000.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.dimensions import DimensionCache, dimension_cache
+from database.engine import upsert_rows
+from database.pricing_calendar_schema import (
+    Company, DailyPrice, MonthlyPriceRollup, PriceSnapshot, RollupWatermark,
+    WeeklyPriceRollup, get_pricing_session, init_pricing_database
+)
+
+WATERMARK_NAME = 'daily_prices'
+
+# period -> (model, date column, period start of a rental date)
+ROLLUPS = {
+    'day': (PriceSnapshot, 'snapshot_date', lambda d: d),
+    'week': (WeeklyPriceRollup, 'period_start', lambda d: d - timedelta(days=d.weekday())),
+    'month': (MonthlyPriceRollup, 'period_start', lambda d: d.replace(day=1)),
+}
+
+_ROW_COLUMNS = [
+    DailyPrice.company_id, DailyPrice.search_location, DailyPrice.model_id, DailyPrice.rental_date,
+    DailyPrice.price_per_night, DailyPrice.is_available, DailyPrice.num_available,
+]
+
+
+def _period_end(period: str, start: date) -> date:
+    """Last rental date inside the period beginning at start"""
+    if period == 'day':
+        return start
+    if period == 'week':
+        return start + timedelta(days=6)
+    next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return next_month - timedelta(days=1)
+
+
+def _summarize(rows: pd.DataFrame) -> Dict[str, Any]:
+    """Price and availability aggregates over a group of DailyPrice rows"""
+    prices = rows['price_per_night']
+    available = rows[rows['is_available'].fillna(True).astype(bool)]
+    return {
+        'min_price_per_night': float(prices.min()),
+        'max_price_per_night': float(prices.max()),
+        'avg_price_per_night': round(float(prices.mean()), 2),
+        'median_price_per_night': float(prices.median()),
+        'num_models_available': int(available['model_id'].nunique()),
+        'num_prices_collected': int(len(rows)),
+        'num_days': int(rows['rental_date'].nunique()),
+        'total_vehicles_available': int(available['num_available'].fillna(1).sum()),
+    }
+
+
+def _load_rows(session: Session, company_id: int, location: Optional[str], first: date, last: date) -> pd.DataFrame:
+    query = select(*_ROW_COLUMNS).where(
+        DailyPrice.company_id == company_id,
+        DailyPrice.search_location.is_not_distinct_from(location),
+        DailyPrice.rental_date.between(first, last),
+    )
+    return pd.DataFrame(session.execute(query).all(), columns=[c.key for c in _ROW_COLUMNS])
+
+
+def _write_period(session: Session, period: str, company_id: int, location: Optional[str],
+                  starts: Iterable[date], rows: pd.DataFrame, now: datetime) -> int:
+    """Replace the rollup rows of one company/location for the given period starts"""
+    model, date_column, to_start = ROLLUPS[period]
+    starts = sorted(set(starts))
+    session.query(model).filter(
+        model.company_id == company_id,
+        model.search_location.is_not_distinct_from(location),
+        getattr(model, date_column).in_(starts),
+    ).delete(synchronize_session=False)
+
+    keys = rows['rental_date'].map(to_start)
+    written = 0
+    for start in starts:
+        group = rows[keys == start]
+        if group.empty:
+            continue  # Every row of the period is gone
+        summary = _summarize(group)
+        record = {'company_id': company_id, 'search_location': location, date_column: start}
+        if period == 'day':
+            summary.pop('num_days')
+            record['scraped_at'] = now
+        else:
+            summary.pop('total_vehicles_available')
+            record['updated_at'] = now
+        session.add(model(**record, **summary))
+        written += 1
+    return written
+
+
+def update_rollups(session: Session, full: bool = False) -> Dict[str, int]:
+    """
+    Fold DailyPrice rows scraped since the last run into the rollups.
+
+    Args:
+        session: Pricing calendar session (committed on success)
+        full: Ignore the watermark and rebuild every rollup
+
+    Returns:
+        Rows written per period ('day', 'week', 'month')
+    """
+    watermark = session.get(RollupWatermark, WATERMARK_NAME)
+    since = None if full or watermark is None else watermark.last_scraped_at
+
+    touched_query = select(
+        DailyPrice.company_id, DailyPrice.search_location, DailyPrice.rental_date, DailyPrice.scraped_at
+    )
+    if since is not None:
+        touched_query = touched_query.where(DailyPrice.scraped_at > since)
+    touched = session.execute(touched_query).all()
+
+    written = {period: 0 for period in ROLLUPS}
+    if full:
+        for model, _, _ in ROLLUPS.values():
+            session.query(model).delete(synchronize_session=False)
+    if not touched:
+        session.commit()
+        return written
+
+    # (company id, location) -> rental dates with new or changed prices
+    dates_by_key: Dict[Tuple[int, Optional[str]], set] = {}
+    for company_id, location, rental_date, _ in touched:
+        dates_by_key.setdefault((company_id, location), set()).add(rental_date)
+
+    now = datetime.now()
+    for (company_id, location), dates in dates_by_key.items():
+        # Load every row of the touched weeks and months (a week can straddle two months)
+        spans = [(ROLLUPS[p][2](d), _period_end(p, ROLLUPS[p][2](d))) for d in dates for p in ('week', 'month')]
+        rows = _load_rows(session, company_id, location, min(s for s, _ in spans), max(e for _, e in spans))
+        for period, (_, _, to_start) in ROLLUPS.items():
+            written[period] += _write_period(
+                session, period, company_id, location, (to_start(d) for d in dates), rows, now
+            )
+
+    scraped = [row.scraped_at for row in touched if row.scraped_at is not None]
+    if watermark is None:
+        watermark = RollupWatermark(name=WATERMARK_NAME)
+        session.add(watermark)
+    watermark.last_scraped_at = max(scraped) if scraped else since
+    watermark.updated_at = now
+    session.commit()
+
+    logger.info(
+        f"📊 Rollups updated from {len(touched)} daily prices: "
+        f"{written['day']} days, {written['week']} weeks, {written['month']} months"
+    )
+    return written
+
+
+def ingest_pricing_calendar(session: Session, calendar_data: Dict) -> int:
+    """
+    Upsert a pricing calendar (comprehensive_pricing_scraper format) into
+    Company, VehicleModel and DailyPrice.
+
+    Re-ingested prices get a new scraped_at, so the next update_rollups()
+    recomputes their periods.
+
+    Returns:
+        Number of daily prices written
+    """
+    dimensions = dimension_cache(session)
+    now = datetime.now()
+    written = 0
+    try:
+        for company, company_data in calendar_data.get('companies', {}).items():
+            company_id = dimensions.company_id(session, company)
+            for model in company_data.get('models', []):
+                written += _ingest_model(session, dimensions, company_id, company_data, model, now)
+        session.commit()
+    except Exception:
+        session.rollback()
+        dimensions.clear()
+        raise
+    return written
+
+
+def _ingest_model(session: Session, dimensions: DimensionCache, company_id: int, company_data: Dict,
+                  model: Dict, now: datetime) -> int:
+    """Upsert one model's pricing calendar; returns the prices written"""
+    model_id = dimensions.model_id(
+        session, company_id, model['model_name'],
+        model_category=model.get('category'),
+        sleeps=model.get('sleeps'),
+        features=model.get('features'),
+    )
+    prices = [
+        {
+            'company_id': company_id,
+            'model_id': model_id,
+            'rental_date': date.fromisoformat(str(day)[:10]),
+            'price_per_night': float(price),
+            'currency': company_data.get('currency', 'EUR'),
+            'search_location': company_data.get('search_location'),
+            'scraped_at': now,
+        }
+        for day, price in model.get('pricing_calendar', {}).items()
+        if price is not None
+    ]
+    # COPY + merge on PostgreSQL, executemany upsert on SQLite
+    return upsert_rows(
+        session.connection(), DailyPrice.__table__, prices,
+        index_elements=['model_id', 'rental_date'],
+        update_columns=['price_per_night', 'currency', 'search_location', 'scraped_at'],
+    )
+
+
+def store_pricing_calendar(calendar_data: Dict) -> Dict[str, int]:
+    """Ingest a pricing calendar into the pricing database and refresh the rollups"""
+    init_pricing_database()
+    session = get_pricing_session()
+    try:
+        prices = ingest_pricing_calendar(session, calendar_data)
+        logger.info(f"💾 Stored {prices} daily prices")
+        return update_rollups(session)
+    finally:
+        session.close()
+
+
+def load_rollups(
+    session: Session,
+    period: str = 'week',
+    companies: Optional[List[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> pd.DataFrame:
+    """
+    Read a rollup table as a DataFrame with a common `period_start` column.
+
+    Args:
+        period: 'day' (PriceSnapshot), 'week' or 'month'
+        companies: Limit to these companies (default: all)
+        start, end: Inclusive period_start bounds
+
+    Returns:
+        DataFrame ordered by company and period, with `company_name` in
+        place of the company key
+    """
+    if period not in ROLLUPS:
+        raise ValueError(f"Unknown rollup period '{period}'. Use one of: {', '.join(ROLLUPS)}")
+    model, date_column, _ = ROLLUPS[period]
+    period_column = getattr(model, date_column)
+
+    columns = [
+        Company.name.label('company_name') if column.name == 'company_id' else column
+        for column in model.__table__.columns
+    ]
+    query = (
+        select(*columns)
+        .join(Company, Company.id == model.company_id)
+        .order_by(Company.name, period_column)
+    )
+    if companies:
+        query = query.where(Company.name.in_(companies))
+    if start is not None:
+        query = query.where(period_column >= start)
+    if end is not None:
+        query = query.where(period_column <= end)
+
+    df = pd.DataFrame(session.execute(query).mappings().all(), columns=[c.key for c in columns])
+    return df.rename(columns={date_column: 'period_start'})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Update pricing calendar rollups')
+    parser.add_argument('--full', action='store_true', help='Rebuild all rollups')
+    parser.add_argument('--ingest', help='Pricing calendar JSON to load first')
+    args = parser.parse_args()
+
+    if args.ingest:
+        with open(args.ingest, 'r') as f:
+            result = store_pricing_calendar(json.load(f))
+    else:
+        init_pricing_database()
+        session = get_pricing_session()
+        try:
+            result = update_rollups(session, full=args.full)
+        finally:
+            session.close()
+
+    print(f"✅ Rollups written: {result}")
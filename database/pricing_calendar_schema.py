@@ -3,31 +3,51 @@ Comprehensive Pricing Calendar Schema
 Tracks price per night for each vehicle model, each date, each competitor
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, JSON, Date, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, Date, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime, date
 from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 Base = declarative_base()
 
+PRICING_DB_PATH = Path(__file__).parent / "pricing_calendar.db"
+
+try:
+    from core_config import config as sys_config
+    PRICING_DATABASE_URL = sys_config.database.PRICING_DATABASE_URL
+except (ImportError, AttributeError):
+    PRICING_DATABASE_URL = f'sqlite:///{PRICING_DB_PATH}'
+
+
+class Company(Base):
+    """Competitors, referenced by integer key from every other pricing table"""
+    __tablename__ = 'companies'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False, unique=True)
+    created_at = Column(DateTime, default=datetime.now)
+
 
 class VehicleModel(Base):
     """Vehicle models offered by competitors"""
     __tablename__ = 'vehicle_models'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_name = Column(String(100), nullable=False, index=True)
+    company_id = Column(Integer, nullable=False)  # companies.id
     model_name = Column(String(200), nullable=False)
     model_category = Column(String(50))  # 'Class A', 'Class B', 'Class C', 'Van', etc.
     sleeps = Column(Integer)  # Number of people
     features = Column(JSON)  # List of features
     image_url = Column(String(500))
     
-    # Make company + model unique
+    # Make company + model unique (indexes: database/migrate.py)
     __table_args__ = (
-        UniqueConstraint('company_name', 'model_name', name='uq_company_model'),
-        Index('idx_company_category', 'company_name', 'model_category'),
+        UniqueConstraint('company_id', 'model_name', name='uq_company_model'),
     )
 
 
@@ -36,9 +56,9 @@ class DailyPrice(Base):
     __tablename__ = 'daily_prices'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_name = Column(String(100), nullable=False, index=True)
-    model_name = Column(String(200), nullable=False, index=True)
-    rental_date = Column(Date, nullable=False, index=True)  # The date of rental start
+    company_id = Column(Integer, nullable=False)  # companies.id
+    model_id = Column(Integer, nullable=False)  # vehicle_models.id
+    rental_date = Column(Date, nullable=False)  # The date of rental start
     
     # Pricing
     price_per_night = Column(Float, nullable=False)
@@ -65,11 +85,9 @@ class DailyPrice(Base):
     booking_url = Column(String(500))
     notes = Column(String(500))
     
-    # Make company + model + date unique
+    # Make model + date unique (indexes: database/migrate.py)
     __table_args__ = (
-        UniqueConstraint('company_name', 'model_name', 'rental_date', name='uq_company_model_date'),
-        Index('idx_date_company', 'rental_date', 'company_name'),
-        Index('idx_price_date', 'price_per_night', 'rental_date'),
+        UniqueConstraint('model_id', 'rental_date', name='uq_model_date'),
     )
 
 
@@ -78,8 +96,8 @@ class PriceSnapshot(Base):
     __tablename__ = 'price_snapshots'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_name = Column(String(100), nullable=False, index=True)
-    snapshot_date = Column(Date, nullable=False, index=True)
+    company_id = Column(Integer, nullable=False)  # companies.id
+    snapshot_date = Column(Date, nullable=False)
     search_location = Column(String(100))
     
     # Aggregated pricing
@@ -96,31 +114,89 @@ class PriceSnapshot(Base):
     scraped_at = Column(DateTime, default=datetime.now)
     num_prices_collected = Column(Integer)
     
+    # Indexes: database/migrate.py
     __table_args__ = (
-        UniqueConstraint('company_name', 'snapshot_date', 'search_location', name='uq_company_date_location'),
-        Index('idx_snapshot_date', 'snapshot_date'),
+        UniqueConstraint('company_id', 'snapshot_date', 'search_location', name='uq_company_date_location'),
     )
 
 
+class WeeklyPriceRollup(Base):
+    """Aggregated pricing per company per rental week (Monday start)"""
+    __tablename__ = 'weekly_price_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_id = Column(Integer, nullable=False)  # companies.id (leads the unique constraint)
+    period_start = Column(Date, nullable=False, index=True)  # Monday of the week
+    search_location = Column(String(100))
+
+    # Aggregated pricing
+    min_price_per_night = Column(Float)
+    max_price_per_night = Column(Float)
+    avg_price_per_night = Column(Float)
+    median_price_per_night = Column(Float)
+
+    # Coverage
+    num_days = Column(Integer)  # Rental dates with prices in the week
+    num_models_available = Column(Integer)
+    num_prices_collected = Column(Integer)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint('company_id', 'period_start', 'search_location', name='uq_weekly_company_period_location'),
+    )
+
+
+class MonthlyPriceRollup(Base):
+    """Aggregated pricing per company per rental month"""
+    __tablename__ = 'monthly_price_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_id = Column(Integer, nullable=False)  # companies.id (leads the unique constraint)
+    period_start = Column(Date, nullable=False, index=True)  # First day of the month
+    search_location = Column(String(100))
+
+    # Aggregated pricing
+    min_price_per_night = Column(Float)
+    max_price_per_night = Column(Float)
+    avg_price_per_night = Column(Float)
+    median_price_per_night = Column(Float)
+
+    # Coverage
+    num_days = Column(Integer)  # Rental dates with prices in the month
+    num_models_available = Column(Integer)
+    num_prices_collected = Column(Integer)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint('company_id', 'period_start', 'search_location', name='uq_monthly_company_period_location'),
+    )
+
+
+class RollupWatermark(Base):
+    """Newest DailyPrice.scraped_at already folded into the rollups"""
+    __tablename__ = 'rollup_watermarks'
+
+    name = Column(String(50), primary_key=True)
+    last_scraped_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.now)
+
+
 def init_pricing_database():
     """Initialize the pricing calendar database"""
-    BASE_DIR = Path(__file__).parent.parent
-    db_path = BASE_DIR / "database" / "pricing_calendar.db"
-    db_path.parent.mkdir(exist_ok=True)
-    
-    engine = create_engine(f'sqlite:///{db_path}')
+    from database.engine import get_database_engine
+    engine = get_database_engine(PRICING_DATABASE_URL)
     Base.metadata.create_all(engine)
+    from database.migrate import upgrade
+    upgrade('pricing', engine=engine)
     
-    print(f"[OK] Pricing Calendar Database initialized: {db_path}")
+    print(f"[OK] Pricing Calendar Database initialized: {engine.url.render_as_string(hide_password=True)}")
     return engine
 
 
 def get_pricing_session():
-    """Get database session for pricing calendar"""
-    BASE_DIR = Path(__file__).parent.parent
-    db_path = BASE_DIR / "database" / "pricing_calendar.db"
-    engine = create_engine(f'sqlite:///{db_path}')
-    Session = sessionmaker(bind=engine)
+    """Get database session for pricing calendar (shares the process-wide pool)"""
+    from database.engine import get_database_engine
+    Session = sessionmaker(bind=get_database_engine(PRICING_DATABASE_URL))
     return Session()
 
 
@@ -129,9 +205,11 @@ if __name__ == "__main__":
     print("PRICING CALENDAR DATABASE SCHEMA")
     print("="*80)
     print("\nTables:")
-    print("1. vehicle_models - Vehicle models from each competitor")
-    print("2. daily_prices - Price per night for each model, each date")
-    print("3. price_snapshots - Aggregated pricing summaries")
+    print("1. companies - Competitors (integer keys for every other table)")
+    print("2. vehicle_models - Vehicle models from each competitor")
+    print("3. daily_prices - Price per night for each model, each date")
+    print("4. price_snapshots - Aggregated pricing summaries")
+    print("5. weekly_price_rollups / monthly_price_rollups - Period summaries")
     print("\nData Capacity:")
     print("- Companies: Unlimited")
     print("- Models per company: Unlimited")
@@ -0,0 +1,231 @@
+"""
+Read-side Query Layer
+Named, parameterized queries over competitor_prices for the analytics modules
+
+Every statement is a constant SQL string with bound parameters: no value is
+spliced into SQL, and the driver's per-connection statement cache reuses the
+prepared statement across calls on a PriceQueries instance (connections
+come from the engine's pool, database/engine.py). The SQL is portable
+between SQLite and PostgreSQL. Date windows are computed in Python and
+compared with the raw scrape_timestamp column, which keeps them on an
+index (date('now', ...) or date(scrape_timestamp) in a WHERE clause would
+not be).
+
+The analytics modules were written against an older `prices` table, so
+results keep its column names:
+    base_price          <- base_nightly_rate
+    scrape_date         <- scrape_timestamp
+    discount_percentage <- weekly_discount_pct
+    vehicle_type        <- popular_vehicle_type
+
+The indexes behind these plans are owned by the migrations (database/migrate.py);
+tests/test_queries.py runs EXPLAIN QUERY PLAN on every statement and fails on any
+full table scan, and database/query_plans.py checks them on a large seeded database.
+
+Usage:
+    queries = PriceQueries()
+    df = queries.frame('company_price_history', company='Roadsurfer', since=since_days(30))
+"""
+
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.engine import database_url, get_database_engine, is_sqlite, sqlite_path
+
+try:
+    from core_config import config as sys_config
+    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_URL)
+except ImportError:
+    DEFAULT_DB_PATH = str(Path(__file__).parent / "campervan_intelligence.db")
+
+QUERIES = {
+    # TrendAnalyzer
+    'price_history': """
+        SELECT company_name, base_nightly_rate AS base_price, scrape_timestamp AS scrape_date,
+               popular_vehicle_type AS vehicle_type
+        FROM competitor_prices
+        WHERE scrape_timestamp >= :since AND base_nightly_rate IS NOT NULL
+        ORDER BY scrape_timestamp
+    """,
+    'company_price_history': """
+        SELECT company_name, base_nightly_rate AS base_price, scrape_timestamp AS scrape_date,
+               popular_vehicle_type AS vehicle_type
+        FROM competitor_prices
+        WHERE company_name = :company AND scrape_timestamp >= :since AND base_nightly_rate IS NOT NULL
+        ORDER BY scrape_timestamp
+    """,
+    'recent_company_prices': """
+        SELECT base_nightly_rate AS base_price, scrape_timestamp AS scrape_date
+        FROM competitor_prices
+        WHERE company_name = :company AND base_nightly_rate IS NOT NULL
+        ORDER BY scrape_timestamp DESC
+        LIMIT :limit
+    """,
+    'company_price_stats': """
+        SELECT company_name,
+               COUNT(*) AS data_points,
+               AVG(base_nightly_rate) AS avg_price,
+               MIN(base_nightly_rate) AS min_price,
+               MAX(base_nightly_rate) AS max_price,
+               AVG(CASE WHEN weekly_discount_pct > 0 THEN weekly_discount_pct END) AS avg_discount
+        FROM competitor_prices
+        WHERE scrape_timestamp >= :since AND base_nightly_rate IS NOT NULL
+        GROUP BY company_name
+        ORDER BY avg_price ASC
+    """,
+    # DataExporter
+    'market_stats': """
+        SELECT AVG(base_nightly_rate) AS avg_price,
+               MIN(base_nightly_rate) AS min_price,
+               MAX(base_nightly_rate) AS max_price,
+               COUNT(DISTINCT company_name) AS companies
+        FROM competitor_prices
+        WHERE scrape_timestamp >= :since AND base_nightly_rate IS NOT NULL
+    """,
+    'export_prices': """
+        SELECT company_name, base_nightly_rate AS base_price, weekly_discount_pct AS discount_percentage,
+               date(scrape_timestamp) AS scrape_date, popular_vehicle_type AS vehicle_type
+        FROM competitor_prices
+        WHERE scrape_timestamp >= :since
+        ORDER BY scrape_timestamp DESC
+    """,
+    'export_all_columns': """
+        SELECT * FROM competitor_prices
+        WHERE scrape_timestamp >= :since
+        ORDER BY scrape_timestamp DESC, company_name
+    """,
+    # DataValidator
+    'duplicate_count': """
+        SELECT COUNT(*) FROM competitor_prices
+        WHERE company_name = :company
+          AND scrape_timestamp >= :day_start AND scrape_timestamp < :day_end
+          AND base_nightly_rate = :price
+    """,
+    'latest_prices': """
+        SELECT id, company_name, base_nightly_rate AS base_price, scrape_timestamp AS scrape_date
+        FROM competitor_prices
+        WHERE base_nightly_rate IS NOT NULL
+        ORDER BY scrape_timestamp DESC
+        LIMIT :limit
+    """,
+    'latest_company_prices': """
+        SELECT id, company_name, base_nightly_rate AS base_price, scrape_timestamp AS scrape_date
+        FROM competitor_prices
+        WHERE company_name = :company AND base_nightly_rate IS NOT NULL
+        ORDER BY scrape_timestamp DESC
+        LIMIT :limit
+    """,
+    'company_freshness': """
+        SELECT company_name, MAX(scrape_timestamp) AS last_scrape, COUNT(*) AS total_records
+        FROM competitor_prices
+        GROUP BY company_name
+    """,
+    'quality_counts': """
+        SELECT COUNT(*) AS total_records,
+               COUNT(CASE WHEN scrape_timestamp >= :since THEN 1 END) AS recent_records,
+               COUNT(DISTINCT company_name) AS companies,
+               COUNT(CASE WHEN base_nightly_rate BETWEEN :min_price AND :max_price THEN 1 END) AS valid_prices
+        FROM competitor_prices
+    """,
+}
+
+# "SCAN competitor_prices" (or "SCAN TABLE ..." on older SQLite) with no index
+_FULL_SCAN = re.compile(r'^SCAN (TABLE )?\w+$')
+
+
+def since_days(days: int) -> str:
+    """Lower bound for a trailing window of whole days (midnight, `days` days ago)"""
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def is_full_scan(plan_detail: str) -> bool:
+    """True for an EXPLAIN QUERY PLAN step that reads a table without any index"""
+    return bool(_FULL_SCAN.match(plan_detail.strip()))
+
+
+def ensure_indexes(db_path: str):
+    """Bring an existing database's indexes up to the migration head"""
+    url = database_url(db_path)
+    path = sqlite_path(url)
+    if path is not None and not path.exists():
+        return
+    try:
+        engine = get_database_engine(url)
+        if not inspect(engine).has_table('competitor_prices'):
+            return
+        from database.migrate import upgrade
+        upgrade('intelligence', db_path=url)
+        if is_sqlite(engine):
+            # Pooled SQLite connections keep planning with the schema they last read
+            engine.dispose()
+    except Exception as e:
+        # Queries still run, just without the newest indexes
+        logger.warning(f"Index migration skipped for {db_path}: {e}")
+
+
+class PriceQueries:
+    """
+    The named QUERIES over pooled connections.
+
+    Args:
+        db_path: SQLite file or database URL (default: config DATABASE_URL)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = str(db_path or DEFAULT_DB_PATH)
+        self._engine: Optional[Engine] = None
+
+    def engine(self) -> Engine:
+        if self._engine is None:
+            # Before the first query, so it plans against the new indexes
+            ensure_indexes(self.db_path)
+            self._engine = get_database_engine(self.db_path)
+        return self._engine
+
+    def close(self):
+        """Release the file handles of a SQLite pool (server pools stay warm for other callers)"""
+        if self._engine is not None and is_sqlite(self._engine):
+            self._engine.dispose()
+        self._engine = None
+
+    def frame(self, name: str, **params) -> pd.DataFrame:
+        """Run a query into a DataFrame"""
+        with self.engine().connect() as connection:
+            return pd.read_sql(text(QUERIES[name]), connection, params=params)
+
+    def all(self, name: str, **params) -> List[Tuple]:
+        with self.engine().connect() as connection:
+            return [tuple(row) for row in connection.execute(text(QUERIES[name]), params)]
+
+    def one(self, name: str, **params) -> Optional[Tuple]:
+        with self.engine().connect() as connection:
+            row = connection.execute(text(QUERIES[name]), params).first()
+        return tuple(row) if row is not None else None
+
+    def scalar(self, name: str, **params) -> Any:
+        row = self.one(name, **params)
+        return row[0] if row else None
+
+    def execute(self, name: str, **params) -> int:
+        """Run a write statement and commit; returns affected rows"""
+        with self.engine().begin() as connection:
+            return connection.execute(text(QUERIES[name]), params).rowcount
+
+    def explain(self, name: str, **params) -> List[str]:
+        """Query plan steps (SQLite EXPLAIN QUERY PLAN details, PostgreSQL EXPLAIN lines)"""
+        engine = self.engine()
+        prefix = 'EXPLAIN QUERY PLAN' if engine.dialect.name == 'sqlite' else 'EXPLAIN'
+        with engine.connect() as connection:
+            rows = connection.execute(text(f"{prefix} {QUERIES[name]}"), params).all()
+        return [row[-1] for row in rows]
@@ -0,0 +1,320 @@
+"""
+Query Plan Checker
+Runs the hot queries under EXPLAIN QUERY PLAN against a seeded database
+
+Builds both databases in a scratch directory the way production does
+(create_all, then the index migrations), fills them with a year of
+synthetic scrapes, and reports every scan and temp B-tree in the plans of
+the queries the dashboard, analyzers, health checks and rollups run. A
+table scan (no index at all) fails the check unless the query expects it,
+e.g. reading latest_competitor_price, which holds one row per company.
+
+Usage:
+    python -m database.query_plans                  # 15 companies, 365 days
+    python -m database.query_plans --companies 40 --days 730 --json
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, delete, func, insert, select
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import models, pricing_calendar_schema as calendar
+from database.migrate import upgrade
+from database.queries import QUERIES, is_full_scan, since_days
+
+VEHICLE_TYPES = ['Compact Van', 'Camper Van', 'Motorhome', 'Family Camper']
+LOCATIONS = ['Munich', 'Berlin', 'Hamburg', 'Lisbon', 'Porto', 'Madrid', 'Paris', 'Amsterdam']
+FEATURES = ['Kitchen', 'Shower', 'Toilet', 'Solar Panel', 'Bike Rack', 'Awning']
+
+
+@dataclass
+class HotQuery:
+    """One query to plan: SQL (or a SQLAlchemy select) and where it comes from"""
+    name: str
+    source: str
+    target: str  # 'intelligence' or 'pricing'
+    statement: Any
+    params: Dict[str, Any] = field(default_factory=dict)
+    expected_scans: Tuple[str, ...] = ()  # Tables a full scan is fine for
+
+
+def _now() -> datetime:
+    return datetime.now().replace(microsecond=0)
+
+
+def hot_queries() -> List[HotQuery]:
+    """Queries on the request path of the dashboard, analyzers, health checks and rollups"""
+    CompetitorPrice, LatestCompetitorPrice, PriceAlert = (
+        models.CompetitorPrice, models.LatestCompetitorPrice, models.PriceAlert
+    )
+    Attribute = models.CompetitorPriceAttribute
+    Company, DailyPrice, PriceSnapshot = calendar.Company, calendar.DailyPrice, calendar.PriceSnapshot
+    week_ago = _now() - timedelta(days=7)
+    today = date.today()
+
+    # TrendAnalyzer / DataValidator / DataExporter (database/queries.py)
+    sample = {
+        'company': 'Company 01', 'since': since_days(30),
+        'day_start': since_days(1), 'day_end': since_days(0), 'price': 95.0,
+        'limit': 30, 'min_price': 20, 'max_price': 500,
+    }
+    queries = [HotQuery(name, 'analyzers', 'intelligence', sql, sample) for name, sql in QUERIES.items()]
+
+    queries += [
+        HotQuery('current_prices', 'dashboard', 'intelligence',
+                 select(CompetitorPrice).join(
+                     LatestCompetitorPrice, LatestCompetitorPrice.price_id == CompetitorPrice.id
+                 ).order_by(CompetitorPrice.company_name),
+                 expected_scans=('latest_competitor_price',)),
+        HotQuery('active_alerts_by_severity', 'dashboard', 'intelligence',
+                 select(PriceAlert).where(PriceAlert.is_acknowledged == False)
+                 .order_by(PriceAlert.severity.desc())),
+        HotQuery('active_alerts', 'models.get_active_alerts', 'intelligence',
+                 select(PriceAlert).where(PriceAlert.is_acknowledged == False)
+                 .order_by(PriceAlert.alert_timestamp.desc())),
+        HotQuery('latest_prices', 'models.get_latest_prices', 'intelligence',
+                 select(CompetitorPrice).order_by(CompetitorPrice.scrape_timestamp.desc()).limit(10)),
+        HotQuery('price_count', 'health_check', 'intelligence',
+                 select(func.count()).select_from(CompetitorPrice)),
+        HotQuery('alert_count', 'health_check', 'intelligence',
+                 select(func.count()).select_from(PriceAlert)),
+        HotQuery('last_scrape', 'health_check', 'intelligence',
+                 select(LatestCompetitorPrice).order_by(LatestCompetitorPrice.scrape_timestamp.desc()).limit(1)),
+        HotQuery('fresh_companies', 'health_check', 'intelligence',
+                 select(func.count()).select_from(LatestCompetitorPrice)
+                 .where(LatestCompetitorPrice.scrape_timestamp >= week_ago)),
+        HotQuery('recent_prices', 'health_check', 'intelligence',
+                 select(CompetitorPrice).where(CompetitorPrice.scrape_timestamp >= week_ago)),
+        HotQuery('company_alerts', 'run_intelligence', 'intelligence',
+                 select(PriceAlert).where(PriceAlert.company_name == 'Company 01',
+                                          PriceAlert.alert_timestamp >= week_ago)),
+
+        # JSON list lookups (models.find_companies_by_attribute / get_active_promotions)
+        HotQuery('companies_by_location', 'models.find_companies_by_attribute', 'intelligence',
+                 select(Attribute.company_name, func.count(func.distinct(Attribute.price_id)),
+                        func.min(Attribute.scrape_timestamp), func.max(Attribute.scrape_timestamp))
+                 .where(Attribute.attribute == 'location', Attribute.value_key == 'lisbon')
+                 .group_by(Attribute.company_name).order_by(Attribute.company_name)),
+        HotQuery('promotions_today', 'models.get_active_promotions', 'intelligence',
+                 select(Attribute.company_name, Attribute.value, func.max(Attribute.scrape_timestamp))
+                 .where(Attribute.attribute == 'promotion',
+                        Attribute.scrape_timestamp >= datetime.combine(today, datetime.min.time()),
+                        Attribute.scrape_timestamp < datetime.combine(today + timedelta(days=1), datetime.min.time()))
+                 .group_by(Attribute.company_name, Attribute.value_key).order_by(Attribute.company_name)),
+
+        # Pricing calendar rollups (database/price_rollups.py)
+        HotQuery('rollup_touched', 'price_rollups', 'pricing',
+                 select(DailyPrice.company_id, DailyPrice.search_location,
+                        DailyPrice.rental_date, DailyPrice.scraped_at)
+                 .where(DailyPrice.scraped_at > week_ago)),
+        HotQuery('rollup_rows', 'price_rollups', 'pricing',
+                 select(DailyPrice.company_id, DailyPrice.model_id, DailyPrice.rental_date,
+                        DailyPrice.price_per_night)
+                 .where(DailyPrice.company_id == 1,
+                        DailyPrice.search_location.is_not_distinct_from('Munich'),
+                        DailyPrice.rental_date.between(today, today + timedelta(days=30)))),
+        HotQuery('snapshot_rewrite', 'price_rollups', 'pricing',
+                 delete(PriceSnapshot).where(PriceSnapshot.company_id == 1,
+                                             PriceSnapshot.search_location.is_not_distinct_from('Munich'),
+                                             PriceSnapshot.snapshot_date.in_([today, today + timedelta(days=1)]))),
+        HotQuery('snapshots', 'price_rollups.load_rollups', 'pricing',
+                 select(Company.name, PriceSnapshot).join(Company, Company.id == PriceSnapshot.company_id)
+                 .where(PriceSnapshot.snapshot_date.between(today, today + timedelta(days=90)))
+                 .order_by(Company.name, PriceSnapshot.snapshot_date)),
+    ]
+    return queries
+
+
+def seed_databases(directory: Path, companies: int = 15, days: int = 365,
+                   scrapes_per_day: int = 4, models_per_company: int = 8) -> Dict[str, Path]:
+    """
+    Create and fill both databases under directory.
+
+    Returns:
+        Database path per migration target
+    """
+    rng = random.Random(42)
+    names = [f"Company {i:02d}" for i in range(1, companies + 1)]
+    now = _now()
+    paths = {'intelligence': directory / 'intelligence.db', 'pricing': directory / 'pricing.db'}
+
+    engine = create_engine(f"sqlite:///{paths['intelligence']}")
+    models.Base.metadata.create_all(engine)
+    upgrade('intelligence', engine=engine)
+    prices, alerts = [], []
+    for company in names:
+        base = rng.uniform(60, 180)
+        for day in range(days):
+            for scrape in range(scrapes_per_day):
+                prices.append({
+                    'company_name': company,
+                    'scrape_timestamp': now - timedelta(days=day, hours=6 * scrape),
+                    'tier': 1,
+                    'base_nightly_rate': round(base * rng.uniform(0.8, 1.3), 2),
+                    'weekly_discount_pct': rng.choice([0.0, 5.0, 10.0]),
+                    'popular_vehicle_type': rng.choice(VEHICLE_TYPES),
+                    'locations_available': rng.sample(LOCATIONS, 3),
+                    'vehicle_features': rng.sample(FEATURES, 2),
+                    'active_promotions': [{'text': f"Save {rng.choice([5, 10, 15])}%", 'type': 'banner'}]
+                    if rng.random() < 0.2 else [],
+                    'data_completeness_pct': rng.uniform(40, 100),
+                })
+            if rng.random() < 0.1:
+                alerts.append({
+                    'alert_timestamp': now - timedelta(days=day),
+                    'alert_type': 'price_drop',
+                    'severity': rng.choice(['low', 'medium', 'high', 'critical']),
+                    'company_name': company,
+                    'is_acknowledged': day > 7,
+                })
+    with engine.begin() as connection:
+        connection.execute(insert(models.CompetitorPrice), prices)
+        if alerts:
+            connection.execute(insert(models.PriceAlert), alerts)
+    engine.dispose()
+
+    engine = create_engine(f"sqlite:///{paths['pricing']}")
+    calendar.Base.metadata.create_all(engine)
+    upgrade('pricing', engine=engine)
+    vehicles, daily, snapshots = [], [], []
+    for company_id in range(1, companies + 1):
+        for model in range(models_per_company):
+            vehicles.append({'id': len(vehicles) + 1, 'company_id': company_id, 'model_name': f"Model {model}",
+                             'model_category': rng.choice(VEHICLE_TYPES), 'sleeps': rng.randint(2, 6)})
+        first_model = len(vehicles) - models_per_company + 1
+        for day in range(days):
+            rental_date = date.today() + timedelta(days=day)
+            day_prices = [round(rng.uniform(50, 250), 2) for _ in range(models_per_company)]
+            daily += [{
+                'company_id': company_id, 'model_id': first_model + model, 'rental_date': rental_date,
+                'price_per_night': price, 'search_location': 'Munich',
+                'scraped_at': now - timedelta(days=rng.randint(0, 30)),
+            } for model, price in enumerate(day_prices)]
+            snapshots.append({
+                'company_id': company_id, 'snapshot_date': rental_date, 'search_location': 'Munich',
+                'min_price_per_night': min(day_prices), 'max_price_per_night': max(day_prices),
+                'avg_price_per_night': sum(day_prices) / len(day_prices),
+                'num_models_available': models_per_company, 'num_prices_collected': models_per_company,
+            })
+    with engine.begin() as connection:
+        connection.execute(insert(calendar.Company), [{'id': i, 'name': name} for i, name in enumerate(names, start=1)])
+        connection.execute(insert(calendar.VehicleModel), vehicles)
+        connection.execute(insert(calendar.DailyPrice), daily)
+        connection.execute(insert(calendar.PriceSnapshot), snapshots)
+    engine.dispose()
+
+    return paths
+
+
+def _compile(query: HotQuery, engine) -> Tuple[str, Any]:
+    """SQL text and driver parameters for a query"""
+    if isinstance(query.statement, str):
+        return query.statement, query.params
+    compiled = query.statement.compile(dialect=engine.dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.construct_params()
+    # sqlite3 adapts dates and datetimes to the ISO text SQLAlchemy stores
+    return str(compiled), [params[key] for key in compiled.positiontup]
+
+
+def check_query_plans(paths: Dict[str, Path], queries: Optional[List[HotQuery]] = None) -> List[Dict[str, Any]]:
+    """
+    EXPLAIN and time each hot query.
+
+    Returns:
+        One entry per query with its plan, scans, temp B-trees, runtime and
+        whether it passes (no unexpected table scans)
+    """
+    report = []
+    engines = {target: create_engine(f'sqlite:///{path}') for target, path in paths.items()}
+    connections = {target: sqlite3.connect(path) for target, path in paths.items()}
+    try:
+        for query in queries or hot_queries():
+            sql, params = _compile(query, engines[query.target])
+            conn = connections[query.target]
+            plan = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+            is_write = sql.lstrip().upper().startswith(('DELETE', 'UPDATE', 'INSERT'))
+            started = time.perf_counter()
+            if is_write:
+                conn.execute('SAVEPOINT plan_check')
+                conn.execute(sql, params)
+                conn.execute('ROLLBACK TO plan_check')
+                conn.execute('RELEASE plan_check')
+            else:
+                conn.execute(sql, params).fetchall()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            table_scans = [step for step in plan if is_full_scan(step)]
+            unexpected = [step for step in table_scans if step.split()[-1] not in query.expected_scans]
+            report.append({
+                'name': query.name,
+                'source': query.source,
+                'target': query.target,
+                'plan': plan,
+                'table_scans': table_scans,
+                'index_scans': [step for step in plan if step.startswith('SCAN') and step not in table_scans],
+                'temp_btrees': [step for step in plan if 'TEMP B-TREE' in step],
+                'ms': round(elapsed_ms, 2),
+                'ok': not unexpected,
+            })
+    finally:
+        for conn in connections.values():
+            conn.close()
+        for engine in engines.values():
+            engine.dispose()
+    return report
+
+
+def print_report(report: List[Dict[str, Any]]):
+    print("\n" + "=" * 80)
+    print("QUERY PLAN CHECK")
+    print("=" * 80)
+    for entry in report:
+        status = "✅" if entry['ok'] else "❌"
+        print(f"\n{status} {entry['name']} ({entry['source']}, {entry['ms']:.1f} ms)")
+        for step in entry['plan']:
+            flag = ""
+            if step in entry['table_scans']:
+                flag = "  <- table scan"
+            elif step in entry['index_scans']:
+                flag = "  <- index scan"
+            elif step in entry['temp_btrees']:
+                flag = "  <- temp b-tree"
+            print(f"   {step}{flag}")
+
+    failed = [entry['name'] for entry in report if not entry['ok']]
+    print("\n" + "=" * 80)
+    print(f"{len(report)} queries, {len(failed)} with unexpected table scans"
+          + (f": {', '.join(failed)}" if failed else ""))
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check hot query plans on a seeded database')
+    parser.add_argument('--companies', type=int, default=15)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = seed_databases(Path(tmp), companies=args.companies, days=args.days)
+        report = check_query_plans(paths)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    sys.exit(0 if all(entry['ok'] for entry in report) else 1)
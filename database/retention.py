@@ -0,0 +1,315 @@
+"""
+Tiered Retention
+Downsamples competitor_prices instead of deleting history
+
+    raw rows          newer than RETENTION_DAYS
+    daily summaries   newer than DAILY_RETENTION_DAYS (competitor_price_daily)
+    weekly summaries  kept indefinitely (competitor_price_weekly)
+
+Rows move down a tier in chunks of RETENTION_CHUNK_ROWS. Each chunk is one
+short transaction that folds the rows into the next tier and deletes them,
+so scrapers keep writing between chunks. Summaries carry a running price
+sum and count, so a day or week split across chunks (or runs) merges
+exactly. A company's newest raw row is never downsampled, so it stays in
+latest_competitor_price.
+
+Freed pages go back to the filesystem with incremental vacuum
+(auto_vacuum=INCREMENTAL), a few pages at a time, instead of a full VACUUM
+rewrite. New databases get that mode from init_database(); existing ones
+need a one-time conversion (--enable-incremental-vacuum). On PostgreSQL,
+autovacuum reclaims the deleted rows and both vacuum helpers are no-ops.
+
+Usage:
+    python -m database.retention                    # downsample + incremental vacuum
+    python -m database.retention --dry-run
+    python -m database.retention --enable-incremental-vacuum
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.engine import is_sqlite
+from database.models import (
+    Base, CompetitorPrice, CompetitorPriceAttribute, CompetitorPriceDaily, CompetitorPriceWeekly,
+    LatestCompetitorPrice, get_engine
+)
+
+try:
+    from core_config import config as sys_config
+    RETENTION_DAYS = sys_config.data_quality.RETENTION_DAYS
+    DAILY_RETENTION_DAYS = sys_config.data_quality.DAILY_RETENTION_DAYS
+    CHUNK_ROWS = sys_config.data_quality.RETENTION_CHUNK_ROWS
+    CHUNK_PAUSE = sys_config.data_quality.RETENTION_CHUNK_PAUSE
+    VACUUM_CHUNK_PAGES = sys_config.data_quality.VACUUM_CHUNK_PAGES
+except (ImportError, AttributeError):
+    RETENTION_DAYS = 90
+    DAILY_RETENTION_DAYS = 365
+    CHUNK_ROWS = 2000
+    CHUNK_PAUSE = 0.05
+    VACUUM_CHUNK_PAGES = 1000
+
+AUTO_VACUUM_INCREMENTAL = 2  # PRAGMA auto_vacuum value
+
+# (company, period start) -> [num_scrapes, num_prices, price_sum, min_price, max_price]
+Summary = Dict[Tuple[str, date], list]
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _extreme(pick, a: Optional[float], b: Optional[float]) -> Optional[float]:
+    """min/max that ignores None"""
+    if a is None or b is None:
+        return b if a is None else a
+    return pick(a, b)
+
+
+def _add(summary: Summary, key: Tuple[str, date], scrapes: int, prices: int,
+         price_sum: float, low: Optional[float], high: Optional[float]):
+    entry = summary.setdefault(key, [0, 0, 0.0, None, None])
+    entry[0] += scrapes or 0
+    entry[1] += prices or 0
+    entry[2] += price_sum or 0.0
+    entry[3] = _extreme(min, entry[3], low)
+    entry[4] = _extreme(max, entry[4], high)
+
+
+def _merge(session: Session, model, summary: Summary, now: datetime):
+    """Fold summary entries into a tier table (insert or combine with existing rows)"""
+    existing = {
+        (row.company_name, row.period_start): row
+        for row in session.query(model).filter(
+            tuple_(model.company_name, model.period_start).in_(list(summary))
+        )
+    }
+    for (company, start), (scrapes, prices, price_sum, low, high) in summary.items():
+        row = existing.get((company, start))
+        if row is None:
+            row = model(company_name=company, period_start=start, num_scrapes=0, num_prices=0, price_sum=0.0)
+            session.add(row)
+        row.num_scrapes += scrapes
+        row.num_prices += prices
+        row.price_sum += price_sum
+        row.min_price = _extreme(min, row.min_price, low)
+        row.max_price = _extreme(max, row.max_price, high)
+        row.avg_price = round(row.price_sum / row.num_prices, 2) if row.num_prices else None
+        row.updated_at = now
+
+
+def _raw_batch(cutoff: datetime, limit: Optional[int]):
+    """Oldest raw rows before cutoff, except each company's newest row"""
+    return select(
+        CompetitorPrice.id, CompetitorPrice.company_name,
+        CompetitorPrice.scrape_timestamp, CompetitorPrice.base_nightly_rate
+    ).where(
+        CompetitorPrice.scrape_timestamp < cutoff,
+        CompetitorPrice.id.not_in(select(LatestCompetitorPrice.price_id))
+    ).order_by(CompetitorPrice.scrape_timestamp).limit(limit)
+
+
+def _daily_batch(cutoff: date, limit: Optional[int]):
+    return select(CompetitorPriceDaily).where(
+        CompetitorPriceDaily.period_start < cutoff
+    ).order_by(CompetitorPriceDaily.period_start).limit(limit)
+
+
+def _fold_raw_chunk(session: Session, cutoff: datetime, limit: int, now: datetime) -> int:
+    rows = session.execute(_raw_batch(cutoff, limit)).all()
+    if not rows:
+        return 0
+    summary: Summary = {}
+    for row in rows:
+        rate = row.base_nightly_rate
+        _add(summary, (row.company_name, row.scrape_timestamp.date()),
+             1, int(rate is not None), rate, rate, rate)
+    _merge(session, CompetitorPriceDaily, summary, now)
+    session.execute(delete(CompetitorPrice).where(CompetitorPrice.id.in_([row.id for row in rows])))
+    return len(rows)
+
+
+def _fold_daily_chunk(session: Session, cutoff: date, limit: int, now: datetime) -> int:
+    days = session.execute(_daily_batch(cutoff, limit)).scalars().all()
+    if not days:
+        return 0
+    summary: Summary = {}
+    for day in days:
+        _add(summary, (day.company_name, _week_start(day.period_start)),
+             day.num_scrapes, day.num_prices, day.price_sum, day.min_price, day.max_price)
+    _merge(session, CompetitorPriceWeekly, summary, now)
+    session.execute(delete(CompetitorPriceDaily).where(CompetitorPriceDaily.id.in_([day.id for day in days])))
+    return len(days)
+
+
+def _run_chunks(factory: sessionmaker, fold, cutoff, chunk_rows: int, pause: float) -> Tuple[int, int]:
+    """Run fold in short transactions until nothing is left; returns (rows, chunks)"""
+    total, chunks = 0, 0
+    while True:
+        with factory() as session, session.begin():
+            moved = fold(session, cutoff, chunk_rows, datetime.now())
+        if not moved:
+            return total, chunks
+        total += moved
+        chunks += 1
+        if pause:
+            time.sleep(pause)  # Let waiting writers in
+
+
+def apply_retention(
+    engine: Optional[Engine] = None,
+    raw_days: int = RETENTION_DAYS,
+    daily_days: int = DAILY_RETENTION_DAYS,
+    chunk_rows: int = CHUNK_ROWS,
+    pause: float = CHUNK_PAUSE,
+    dry_run: bool = False,
+    vacuum: bool = True
+) -> Dict[str, Any]:
+    """
+    Move expired raw rows into daily summaries and expired daily summaries
+    into weekly ones.
+
+    Args:
+        engine: Intelligence database (default: DATABASE_URL)
+        raw_days: Days of raw competitor_prices rows to keep
+        daily_days: Days of daily summaries to keep
+        chunk_rows: Rows per transaction
+        pause: Seconds to sleep between chunks
+        dry_run: Only count what would move
+        vacuum: Run incremental vacuum afterwards
+
+    Returns:
+        Dict with cutoffs, rows moved per tier, chunks and pages vacuumed
+    """
+    engine = engine or get_engine()
+    Base.metadata.create_all(engine, tables=[
+        CompetitorPriceDaily.__table__, CompetitorPriceWeekly.__table__, LatestCompetitorPrice.__table__,
+        CompetitorPriceAttribute.__table__
+    ])
+    today = datetime.combine(date.today(), datetime.min.time())
+    raw_cutoff = today - timedelta(days=raw_days)
+    daily_cutoff = (today - timedelta(days=daily_days)).date()
+    factory = sessionmaker(bind=engine)
+
+    result = {
+        'dry_run': dry_run,
+        'raw_cutoff': raw_cutoff,
+        'daily_cutoff': daily_cutoff,
+        'raw_rows': 0,
+        'daily_rows': 0,
+        'chunks': 0,
+        'vacuum_pages': 0,
+    }
+
+    if dry_run:
+        with factory() as session:
+            result['raw_rows'] = session.execute(
+                select(func.count()).select_from(_raw_batch(raw_cutoff, None).subquery())
+            ).scalar()
+            result['daily_rows'] = session.execute(
+                select(func.count()).select_from(_daily_batch(daily_cutoff, None).subquery())
+            ).scalar()
+        logger.info(
+            f"[DRY RUN] Would downsample {result['raw_rows']} raw rows (before {raw_cutoff.date()}) "
+            f"and {result['daily_rows']} daily summaries (before {daily_cutoff})"
+        )
+        return result
+
+    result['raw_rows'], raw_chunks = _run_chunks(factory, _fold_raw_chunk, raw_cutoff, chunk_rows, pause)
+    result['daily_rows'], daily_chunks = _run_chunks(factory, _fold_daily_chunk, daily_cutoff, chunk_rows, pause)
+    result['chunks'] = raw_chunks + daily_chunks
+
+    logger.info(
+        f"📉 Downsampled {result['raw_rows']} raw rows into daily summaries and "
+        f"{result['daily_rows']} daily summaries into weekly ones ({result['chunks']} chunks)"
+    )
+
+    if vacuum and (result['raw_rows'] or result['daily_rows']):
+        result['vacuum_pages'] = incremental_vacuum(engine)
+    return result
+
+
+def _driver_connection(engine: Engine):
+    raw = engine.raw_connection()
+    return raw, raw.driver_connection
+
+
+def incremental_vacuum(engine: Optional[Engine] = None, chunk_pages: int = VACUUM_CHUNK_PAGES) -> int:
+    """
+    Return free pages to the filesystem, chunk_pages at a time.
+
+    Returns:
+        Pages freed (0 when the database is not in incremental mode)
+    """
+    engine = engine or get_engine()
+    if not is_sqlite(engine):
+        return 0  # Server autovacuum
+    raw, connection = _driver_connection(engine)
+    try:
+        if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+            logger.warning("Incremental vacuum unavailable: run `python -m database.retention "
+                           "--enable-incremental-vacuum` once to convert this database")
+            return 0
+        freed = 0
+        while True:
+            free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free_pages:
+                return freed
+            pages = min(free_pages, chunk_pages)
+            # executescript steps the pragma to completion (execute frees one page)
+            connection.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            freed += pages
+    finally:
+        raw.close()
+
+
+def enable_incremental_vacuum(engine: Optional[Engine] = None) -> bool:
+    """
+    Switch an existing database to auto_vacuum=INCREMENTAL.
+
+    The mode only changes with a full VACUUM, so this rewrites the file
+    once; run it in a maintenance window.
+
+    Returns:
+        True if the database was converted, False if it already was (or is not SQLite)
+    """
+    engine = engine or get_engine()
+    if not is_sqlite(engine):
+        return False
+    raw, connection = _driver_connection(engine)
+    try:
+        if connection.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+            return False
+        connection.executescript("PRAGMA auto_vacuum = INCREMENTAL; VACUUM;")
+        logger.info("✅ Database converted to incremental vacuum")
+        return True
+    finally:
+        raw.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Downsample old competitor prices')
+    parser.add_argument('--raw-days', type=int, default=RETENTION_DAYS)
+    parser.add_argument('--daily-days', type=int, default=DAILY_RETENTION_DAYS)
+    parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='One-time full VACUUM that switches an existing database to incremental mode')
+    args = parser.parse_args()
+
+    if args.enable_incremental_vacuum:
+        converted = enable_incremental_vacuum()
+        print("✅ Converted" if converted else "Already using incremental vacuum")
+    else:
+        result = apply_retention(raw_days=args.raw_days, daily_days=args.daily_days, dry_run=args.dry_run)
+        print(f"✅ Retention: {result}")
@@ -1,90 +1,170 @@
 """
 Automated Database Backup System
 Handles database backups, restoration, and retention
+
+Backups are taken online with the SQLite backup API (a few pages per step,
+so scrapers keep writing) and streamed through gzip. A full backup records
+a hash per CHUNK_BYTES of the snapshot; an incremental backup stores only
+the chunks that differ from the newest full backup, and restore reassembles
+the chain (full + incremental).
+
+When DATABASE_URL points at PostgreSQL, backups are pg_dump custom-format
+archives (already compressed, always full), restored with pg_restore
+--clean and verified by listing their table of contents.
 """
 
 import sys
+import os
 import shutil
 import gzip
+import hashlib
+import sqlite3
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 
+from sqlalchemy.engine import make_url
+
 # Add parent directory to path
 BASE_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(BASE_DIR))
 
 try:
     from core_config import config
-    DATABASE_PATH = config.database.DATABASE_PATH
+    DATABASE_URL = config.database.DATABASE_URL
     BACKUP_DIR = BASE_DIR / "backups"
 except ImportError:
-    DATABASE_PATH = BASE_DIR / "database" / "campervan_intelligence.db"
+    DATABASE_URL = f'sqlite:///{BASE_DIR / "database" / "campervan_intelligence.db"}'
     BACKUP_DIR = BASE_DIR / "backups"
 
+from database.engine import sqlite_path
+
+DATABASE_PATH = sqlite_path(DATABASE_URL)  # None for a database server
+
 # Ensure backup directory exists
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
+BACKUP_STEP_PAGES = 1024  # Pages copied per backup step; writers get the lock in between
+BACKUP_STEP_SLEEP = 0.01  # Seconds to yield between steps
+BACKUP_MAX_RESTARTS = 3  # A write between steps restarts the copy; then copy in one step
+CHUNK_BYTES = 1024 * 1024  # Granularity of incremental backups
+VERIFY_WORKERS = 4  # Backups checked in parallel by verify_backups
+PG_DUMP = os.getenv('PG_DUMP', 'pg_dump')  # Client binaries for PostgreSQL backups
+PG_RESTORE = os.getenv('PG_RESTORE', 'pg_restore')
+DUMP_SUFFIX = '.dump'
+
+
+def _digest(chunk: bytes) -> str:
+    return hashlib.blake2b(chunk, digest_size=16).hexdigest()
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+def _restart_guard(pages: int):
+    """Backup progress callback that gives up after BACKUP_MAX_RESTARTS restarts"""
+    steps = 0
+
+    def progress(status, remaining, total):
+        nonlocal steps
+        steps += 1
+        if steps > (total // pages + 1) * (BACKUP_MAX_RESTARTS + 1):
+            raise _BackupRestarted()
+
+    return progress
+
+
+def _libpq_url(url: str) -> str:
+    """A SQLAlchemy URL as the libpq URI pg_dump / pg_restore accept"""
+    return make_url(url).set(drivername='postgresql').render_as_string(hide_password=False)
+
+
+def _run_client(*args: str) -> subprocess.CompletedProcess:
+    """Run a PostgreSQL client binary, raising with its stderr on failure"""
+    result = subprocess.run(args, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{Path(args[0]).name} failed: {result.stderr.strip()}")
+    return result
+
 
 class DatabaseBackup:
     """
     Database backup manager
     
     Features:
-    - Automated backups with compression
+    - Online backups (SQLite backup API) with streaming compression
+    - pg_dump / pg_restore archives for a PostgreSQL DATABASE_URL
+    - Incremental backups against the newest full backup (SQLite)
     - Multiple backup retention policies
-    - Easy restoration
-    - Backup verification
+    - Easy restoration of full backups and incremental chains
+    - Parallel backup verification (PRAGMA quick_check)
     - Rotation based on age
     """
     
     def __init__(self, backup_dir: Optional[Path] = None):
         self.backup_dir = backup_dir or BACKUP_DIR
-        self.database_path = DATABASE_PATH
+        self.database_url = DATABASE_URL
+        self.database_path = DATABASE_PATH  # None: back up database_url with pg_dump
         
         # Backup retention policy
         self.retention_policy = {
-            'hourly': {'keep': 24, 'interval': timedelta(hours=1)},      # Keep 24 hourly
+            'hourly': {'keep': 24, 'interval': timedelta(hours=1), 'incremental': True},  # Keep 24 hourly
             'daily': {'keep': 7, 'interval': timedelta(days=1)},          # Keep 7 daily
             'weekly': {'keep': 4, 'interval': timedelta(weeks=1)},        # Keep 4 weekly
             'monthly': {'keep': 12, 'interval': timedelta(days=30)},      # Keep 12 monthly
         }
     
-    def create_backup(self, compress: bool = True, backup_type: str = 'manual') -> Optional[Path]:
+    def create_backup(self, compress: bool = True, backup_type: str = 'manual',
+                      incremental: bool = False) -> Optional[Path]:
         """
         Create a backup of the database
         
         Args:
             compress: Whether to compress the backup with gzip
             backup_type: Type of backup ('manual', 'hourly', 'daily', 'weekly', 'monthly')
+            incremental: Store only chunks changed since the newest full backup
+                (falls back to a full backup if there is none)
         
         Returns:
             Path to backup file or None if failed
         """
+        if self.database_path is None:
+            return self._dump(backup_type)
+        
         if not self.database_path.exists():
             print(f"❌ Database not found: {self.database_path}")
             return None
         
+        base = self._latest_full_backup() if incremental else None
+        if incremental and base is None:
+            print("ℹ️  No full backup to build on - creating a full backup")
+        
+        snapshot = None
         try:
             # Generate backup filename
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_filename = f"backup_{backup_type}_{timestamp}.db"
             
+            if base:
+                backup_filename += ".inc"
             if compress:
                 backup_filename += ".gz"
             
             backup_path = self.backup_dir / backup_filename
             
-            # Create backup
-            if compress:
-                # Copy and compress
-                with open(self.database_path, 'rb') as f_in:
-                    with gzip.open(backup_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
+            # Consistent snapshot without blocking writers, then stream it out
+            snapshot = self._temp_path()
+            self._snapshot(self.database_path, snapshot, pages=BACKUP_STEP_PAGES)
+            
+            if base:
+                details = self._write_incremental(snapshot, backup_path, *base)
             else:
-                # Simple copy
-                shutil.copy2(self.database_path, backup_path)
+                details = self._write_full(snapshot, backup_path)
             
             # Verify backup
             if backup_path.exists():
@@ -92,7 +172,7 @@ class DatabaseBackup:
                 print(f"✅ Backup created: {backup_path.name} ({size_mb:.2f} MB)")
                 
                 # Create backup metadata
-                self._save_backup_metadata(backup_path, backup_type, compress)
+                self._save_backup_metadata(backup_path, backup_type, compress, details)
                 
                 return backup_path
             else:
@@ -102,11 +182,18 @@ class DatabaseBackup:
         except Exception as e:
             print(f"❌ Backup error: {e}")
             return None
+        
+        finally:
+            if snapshot:
+                snapshot.unlink(missing_ok=True)
     
     def restore_backup(self, backup_path: Path, force: bool = False) -> bool:
         """
         Restore database from a backup
         
+        Incremental backups are restored by replaying their chain onto the
+        full backup they were taken against.
+        
         Args:
             backup_path: Path to backup file
             force: Skip confirmation prompt
@@ -120,27 +207,29 @@ class DatabaseBackup:
         
         # Confirmation
         if not force:
-            print(f"⚠️  This will overwrite the current database: {self.database_path}")
+            target = self.database_path or make_url(self.database_url).render_as_string(hide_password=True)
+            print(f"⚠️  This will overwrite the current database: {target}")
             response = input("Continue? (yes/no): ").lower()
             if response != 'yes':
                 print("❌ Restore cancelled")
                 return False
         
+        staged = None
         try:
+            if backup_path.name.endswith(DUMP_SUFFIX):
+                return self._restore_dump(backup_path)
+            
             # Create backup of current database before restoring
             if self.database_path.exists():
                 current_backup = self.create_backup(compress=True, backup_type='pre_restore')
-                print(f"📦 Current database backed up to: {current_backup.name}")
+                if current_backup:
+                    print(f"📦 Current database backed up to: {current_backup.name}")
             
-            # Restore from backup
-            if backup_path.name.endswith('.gz'):
-                # Decompress and restore
-                with gzip.open(backup_path, 'rb') as f_in:
-                    with open(self.database_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                # Simple copy
-                shutil.copy2(backup_path, self.database_path)
+            # Rebuild the database file, then copy it in through SQLite so
+            # open connections never see a half-written file
+            staged = self._temp_path()
+            self._materialize(backup_path, staged)
+            self._snapshot(staged, self.database_path)
             
             print(f"✅ Database restored from: {backup_path.name}")
             return True
@@ -148,6 +237,10 @@ class DatabaseBackup:
         except Exception as e:
             print(f"❌ Restore error: {e}")
             return False
+        
+        finally:
+            if staged:
+                staged.unlink(missing_ok=True)
     
     def list_backups(self, backup_type: Optional[str] = None) -> List[Tuple[Path, dict]]:
         """
@@ -161,7 +254,7 @@ class DatabaseBackup:
         """
         backups = []
         
-        for backup_file in sorted(self.backup_dir.glob("backup_*.db*"), reverse=True):
+        for backup_file in sorted(self._backup_files(), reverse=True):
             metadata = self._load_backup_metadata(backup_file)
             
             if backup_type and metadata.get('type') != backup_type:
@@ -185,7 +278,7 @@ class DatabaseBackup:
         backups_by_type = {}
         
         # Group backups by type
-        for backup_file in self.backup_dir.glob("backup_*.db*"):
+        for backup_file in self._backup_files():
             metadata = self._load_backup_metadata(backup_file)
             backup_type = metadata.get('type', 'manual')
             
@@ -195,6 +288,7 @@ class DatabaseBackup:
             backups_by_type[backup_type].append((backup_file, metadata))
         
         # Apply retention policy for each type
+        to_delete = []
         for backup_type, backups in backups_by_type.items():
             policy = self.retention_policy.get(backup_type)
             
@@ -205,19 +299,31 @@ class DatabaseBackup:
             backups.sort(key=lambda x: x[1].get('timestamp', ''), reverse=True)
             
             # Keep only the specified number
-            to_delete = backups[policy['keep']:]
+            to_delete.extend(backups[policy['keep']:])
+        
+        # Full backups that surviving incrementals are built on stay
+        doomed = {backup_file for backup_file, _ in to_delete}
+        needed = {
+            backup_file.parent / metadata['base']
+            for backups in backups_by_type.values()
+            for backup_file, metadata in backups
+            if metadata.get('base') and backup_file not in doomed
+        }
+        
+        for backup_file, metadata in to_delete:
+            if backup_file in needed:
+                continue
             
-            for backup_file, metadata in to_delete:
-                if dry_run:
-                    print(f"Would delete: {backup_file.name}")
-                else:
-                    backup_file.unlink()
-                    metadata_file = backup_file.with_suffix(backup_file.suffix + '.meta')
-                    if metadata_file.exists():
-                        metadata_file.unlink()
-                    print(f"🗑️  Deleted old backup: {backup_file.name}")
-                
-                deleted_count += 1
+            if dry_run:
+                print(f"Would delete: {backup_file.name}")
+            else:
+                backup_file.unlink()
+                metadata_file = backup_file.with_suffix(backup_file.suffix + '.meta')
+                if metadata_file.exists():
+                    metadata_file.unlink()
+                print(f"🗑️  Deleted old backup: {backup_file.name}")
+            
+            deleted_count += 1
         
         return deleted_count
     
@@ -225,6 +331,10 @@ class DatabaseBackup:
         """
         Verify backup integrity
         
+        Rebuilds the database (replaying the chain for incremental backups)
+        and runs PRAGMA quick_check on it; pg_dump archives must have a
+        readable table of contents.
+        
         Args:
             backup_path: Path to backup file
         
@@ -234,26 +344,46 @@ class DatabaseBackup:
         if not backup_path.exists():
             return False
         
+        if backup_path.name.endswith(DUMP_SUFFIX):
+            try:
+                return bool(_run_client(PG_RESTORE, '--list', str(backup_path)).stdout.strip())
+            except Exception:
+                return False
+        
+        staged = self._temp_path()
         try:
-            # Check if it's compressed
-            if backup_path.name.endswith('.gz'):
-                # Try to open compressed file
-                with gzip.open(backup_path, 'rb') as f:
-                    # Read first few bytes to verify it's valid
-                    data = f.read(100)
-                    if not data:
-                        return False
-            else:
-                # For uncompressed, just check size
-                if backup_path.stat().st_size == 0:
-                    return False
-            
-            return True
+            self._materialize(backup_path, staged)
+            connection = sqlite3.connect(f"{staged.as_uri()}?mode=ro", uri=True)
+            try:
+                return connection.execute("PRAGMA quick_check").fetchall() == [('ok',)]
+            finally:
+                connection.close()
             
         except Exception:
             return False
+        
+        finally:
+            staged.unlink(missing_ok=True)
     
-    def get_backup_info(self, backup_path: Path) -> dict:
+    def verify_backups(self, backup_paths: Optional[List[Path]] = None,
+                       workers: int = VERIFY_WORKERS) -> Dict[Path, bool]:
+        """
+        Verify several backups in parallel
+        
+        Args:
+            backup_paths: Backups to check (default: all)
+            workers: Number of backups checked at once
+        
+        Returns:
+            Dict of backup path -> valid
+        """
+        if backup_paths is None:
+            backup_paths = [backup_path for backup_path, _ in self.list_backups()]
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(backup_paths, pool.map(self.verify_backup, backup_paths)))
+    
+    def get_backup_info(self, backup_path: Path, verify: bool = True) -> dict:
         """Get detailed information about a backup"""
         if not backup_path.exists():
             return {}
@@ -266,20 +396,22 @@ class DatabaseBackup:
             'size_mb': backup_path.stat().st_size / (1024 * 1024),
             'created': datetime.fromtimestamp(backup_path.stat().st_mtime),
             'compressed': backup_path.name.endswith('.gz'),
-            'valid': self.verify_backup(backup_path),
-            **metadata
+            'valid': self.verify_backup(backup_path) if verify else None,
+            **{key: value for key, value in metadata.items() if key != 'chunk_hashes'}
         }
         
         return info
     
-    def _save_backup_metadata(self, backup_path: Path, backup_type: str, compressed: bool):
+    def _save_backup_metadata(self, backup_path: Path, backup_type: str, compressed: bool,
+                              details: Optional[dict] = None):
         """Save backup metadata"""
         metadata = {
             'timestamp': datetime.now().isoformat(),
             'type': backup_type,
             'compressed': compressed,
-            'original_size': self.database_path.stat().st_size,
-            'backup_size': backup_path.stat().st_size
+            'original_size': self.database_path.stat().st_size if self.database_path else None,
+            'backup_size': backup_path.stat().st_size,
+            **(details or {})
         }
         
         metadata_file = backup_path.with_suffix(backup_path.suffix + '.meta')
@@ -301,9 +433,168 @@ class DatabaseBackup:
         return {
             'timestamp': datetime.fromtimestamp(backup_path.stat().st_mtime).isoformat(),
             'type': 'unknown',
-            'compressed': backup_path.name.endswith('.gz')
+            'kind': 'incremental' if '.db.inc' in backup_path.name else 'full',
+            'compressed': backup_path.name.endswith(('.gz', DUMP_SUFFIX))
         }
     
+    def _backup_files(self) -> List[Path]:
+        """Backup files in backup_dir (without their .meta files)"""
+        return [
+            path for pattern in ("backup_*.db*", f"backup_*{DUMP_SUFFIX}")
+            for path in self.backup_dir.glob(pattern) if path.suffix != '.meta'
+        ]
+    
+    def _temp_path(self) -> Path:
+        """Scratch database file next to the backups (not matched by backup_*)"""
+        fd, name = tempfile.mkstemp(prefix='.tmp_', suffix='.db', dir=self.backup_dir)
+        os.close(fd)
+        return Path(name)
+    
+    def _dump(self, backup_type: str) -> Optional[Path]:
+        """Back up the database server with pg_dump (custom format)"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = self.backup_dir / f"backup_{backup_type}_{timestamp}{DUMP_SUFFIX}"
+        try:
+            _run_client(PG_DUMP, '--format=custom', f'--file={backup_path}', _libpq_url(self.database_url))
+        except Exception as e:
+            backup_path.unlink(missing_ok=True)
+            print(f"❌ Backup error: {e}")
+            return None
+        
+        size_mb = backup_path.stat().st_size / (1024 * 1024)
+        print(f"✅ Backup created: {backup_path.name} ({size_mb:.2f} MB)")
+        self._save_backup_metadata(backup_path, backup_type, True, {'kind': 'full', 'format': 'pg_dump'})
+        return backup_path
+    
+    def _restore_dump(self, backup_path: Path) -> bool:
+        """Restore a pg_dump archive over the database server's tables"""
+        if self.database_path is not None:
+            raise ValueError(f"{backup_path.name} is a PostgreSQL dump; DATABASE_URL is SQLite")
+        
+        current_backup = self._dump('pre_restore')
+        if current_backup:
+            print(f"📦 Current database backed up to: {current_backup.name}")
+        
+        _run_client(
+            PG_RESTORE, '--clean', '--if-exists', '--no-owner',
+            f'--dbname={_libpq_url(self.database_url)}', str(backup_path)
+        )
+        print(f"✅ Database restored from: {backup_path.name}")
+        return True
+    
+    @staticmethod
+    def _snapshot(source_path: Path, target_path: Path, pages: int = -1):
+        """
+        Copy one database into another with the SQLite backup API
+        
+        Copies `pages` pages per step (-1: all at once), sleeping between
+        steps so writers are not locked out for the whole copy.
+        """
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            if pages > 0:
+                try:
+                    source.backup(target, pages=pages, progress=_restart_guard(pages), sleep=BACKUP_STEP_SLEEP)
+                    return
+                except _BackupRestarted:
+                    pass  # Writers keep invalidating the copy; take it in one step
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+    
+    @staticmethod
+    def _open(path: Path, mode: str):
+        """Open a backup file, through gzip if it is compressed"""
+        if path.name.endswith('.gz'):
+            return gzip.open(path, mode, compresslevel=6)
+        return open(path, mode)
+    
+    @staticmethod
+    def _chunks(path: Path):
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_BYTES)
+                if not chunk:
+                    return
+                yield chunk
+    
+    def _write_full(self, snapshot: Path, backup_path: Path) -> dict:
+        """Stream the whole snapshot into backup_path, hashing each chunk"""
+        hashes = []
+        with self._open(backup_path, 'wb') as out:
+            for chunk in self._chunks(snapshot):
+                hashes.append(_digest(chunk))
+                out.write(chunk)
+        
+        return {
+            'kind': 'full',
+            'db_size': snapshot.stat().st_size,
+            'chunk_size': CHUNK_BYTES,
+            'chunk_hashes': hashes
+        }
+    
+    def _write_incremental(self, snapshot: Path, backup_path: Path, base_path: Path, base_metadata: dict) -> dict:
+        """Stream only the chunks that differ from the base backup"""
+        base_hashes = base_metadata['chunk_hashes']
+        changed = []
+        with self._open(backup_path, 'wb') as out:
+            for index, chunk in enumerate(self._chunks(snapshot)):
+                if index >= len(base_hashes) or base_hashes[index] != _digest(chunk):
+                    changed.append(index)
+                    out.write(chunk)
+        
+        print(f"ℹ️  {len(changed)} changed chunk(s) since {base_path.name}")
+        return {
+            'kind': 'incremental',
+            'base': base_path.name,
+            'db_size': snapshot.stat().st_size,
+            'chunk_size': CHUNK_BYTES,
+            'changed_chunks': changed
+        }
+    
+    def _latest_full_backup(self) -> Optional[Tuple[Path, dict]]:
+        """Newest full backup that incremental backups can be taken against"""
+        backups = sorted(self.list_backups(), key=lambda x: x[1].get('timestamp', ''), reverse=True)
+        for backup_path, metadata in backups:
+            if metadata.get('kind') == 'full' and metadata.get('chunk_size') == CHUNK_BYTES:
+                return backup_path, metadata
+        return None
+    
+    def _chain(self, backup_path: Path) -> List[Tuple[Path, dict]]:
+        """Backups needed to rebuild backup_path, full backup first"""
+        chain = []
+        path = backup_path
+        while True:
+            if not path.exists():
+                raise FileNotFoundError(f"Backup chain broken: {path.name} is missing")
+            metadata = self._load_backup_metadata(path)
+            chain.append((path, metadata))
+            if metadata.get('kind') != 'incremental':
+                return chain[::-1]
+            if not metadata.get('base'):
+                raise ValueError(f"Incremental backup {path.name} has no base recorded")
+            path = path.parent / metadata['base']
+    
+    def _materialize(self, backup_path: Path, target_path: Path):
+        """Rebuild the database file a backup (or backup chain) represents"""
+        (full_path, _), *increments = self._chain(backup_path)
+        
+        with self._open(full_path, 'rb') as f_in:
+            with open(target_path, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, CHUNK_BYTES)
+        
+        with open(target_path, 'r+b') as f_out:
+            for path, metadata in increments:
+                chunk_size, db_size = metadata['chunk_size'], metadata['db_size']
+                with self._open(path, 'rb') as f_in:
+                    for index in metadata['changed_chunks']:
+                        offset = index * chunk_size
+                        f_out.seek(offset)
+                        f_out.write(f_in.read(min(chunk_size, db_size - offset)))
+                f_out.truncate(db_size)
+    
     def schedule_backup(self, backup_type: str = 'daily') -> Optional[Path]:
         """
         Schedule a backup (called by automation)
@@ -316,13 +607,13 @@ class DatabaseBackup:
         """
         # Check if we need to create a backup
         existing_backups = self.list_backups(backup_type=backup_type)
+        policy = self.retention_policy.get(backup_type)
         
         if existing_backups:
             last_backup_path, last_backup_meta = existing_backups[0]
             last_backup_time = datetime.fromisoformat(last_backup_meta['timestamp'])
             
             # Get interval for this backup type
-            policy = self.retention_policy.get(backup_type)
             if policy:
                 time_since_last = datetime.now() - last_backup_time
                 
@@ -331,7 +622,8 @@ class DatabaseBackup:
                     return None
         
         # Create backup
-        backup_path = self.create_backup(compress=True, backup_type=backup_type)
+        incremental = bool(policy and policy.get('incremental'))
+        backup_path = self.create_backup(compress=True, backup_type=backup_type, incremental=incremental)
         
         # Cleanup old backups
         self.cleanup_old_backups()
@@ -344,11 +636,13 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Database Backup Manager')
-    parser.add_argument('action', choices=['backup', 'restore', 'list', 'cleanup', 'info'],
+    parser.add_argument('action', choices=['backup', 'restore', 'list', 'cleanup', 'info', 'verify'],
                        help='Action to perform')
     parser.add_argument('--file', type=str, help='Backup file for restore/info')
     parser.add_argument('--type', type=str, choices=['manual', 'hourly', 'daily', 'weekly', 'monthly'],
                        default='manual', help='Backup type')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Back up only chunks changed since the last full backup')
     parser.add_argument('--force', action='store_true', help='Force restore without confirmation')
     parser.add_argument('--dry-run', action='store_true', help='Dry run for cleanup')
     
@@ -358,7 +652,7 @@ def main():
     
     if args.action == 'backup':
         print(f"\n💾 Creating {args.type} backup...")
-        backup_path = manager.create_backup(compress=True, backup_type=args.type)
+        backup_path = manager.create_backup(compress=True, backup_type=args.type, incremental=args.incremental)
         if backup_path:
             print(f"\n✅ Backup complete: {backup_path}")
     
@@ -389,19 +683,35 @@ def main():
         if not backups:
             print("No backups found")
         else:
+            valid = manager.verify_backups([backup_path for backup_path, _ in backups])
             for backup_path, metadata in backups:
-                info = manager.get_backup_info(backup_path)
+                info = manager.get_backup_info(backup_path, verify=False)
                 print(f"\n📦 {info['filename']}")
-                print(f"   Type: {info.get('type', 'unknown')}")
+                print(f"   Type: {info.get('type', 'unknown')} ({info.get('kind', 'full')})")
                 print(f"   Size: {info['size_mb']:.2f} MB")
                 print(f"   Created: {info['created']}")
-                print(f"   Valid: {'✅' if info['valid'] else '❌'}")
+                print(f"   Valid: {'✅' if valid[backup_path] else '❌'}")
     
     elif args.action == 'cleanup':
         print(f"\n🧹 Cleaning up old backups{' (DRY RUN)' if args.dry_run else ''}...")
         deleted = manager.cleanup_old_backups(dry_run=args.dry_run)
         print(f"\n{'Would delete' if args.dry_run else 'Deleted'} {deleted} old backup(s)")
     
+    elif args.action == 'verify':
+        if args.file:
+            backup_path = Path(args.file)
+            backup_paths = [backup_path if backup_path.is_absolute() else manager.backup_dir / backup_path]
+        else:
+            backup_paths = None
+        
+        print("\n🔍 Verifying backups...")
+        results = manager.verify_backups(backup_paths)
+        for backup_path, ok in results.items():
+            print(f"   {'✅' if ok else '❌'} {backup_path.name}")
+        
+        if not all(results.values()):
+            sys.exit(1)
+    
     elif args.action == 'info':
         if not args.file:
             print("❌ Error: --file required for info")
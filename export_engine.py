@@ -4,9 +4,8 @@ Export competitive intelligence data to Excel, PDF, and CSV formats
 """
 
 import pandas as pd
-import sqlite3
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
@@ -46,13 +45,22 @@ BASE_DIR = Path(__file__).parent.resolve()
 EXPORT_DIR = BASE_DIR / "exports"
 EXPORT_DIR.mkdir(exist_ok=True)
 
+try:
+    from core_config import config as sys_config
+    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_URL)
+except ImportError:
+    DEFAULT_DB_PATH = str(BASE_DIR / "database" / "campervan_intelligence.db")
+
+from database.queries import PriceQueries, since_days
+
 
 class DataExporter:
     """Export intelligence data in multiple formats"""
     
     def __init__(self, db_path: str = None):
-        self.db_path = db_path or str(BASE_DIR / "database" / "campervan_prices.db")
+        self.db_path = db_path or DEFAULT_DB_PATH
         self.export_dir = EXPORT_DIR
+        self.queries = PriceQueries(self.db_path)
     
     def export_to_excel(self, days: int = 30) -> Optional[str]:
         """
@@ -63,39 +71,13 @@ class DataExporter:
             return None
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            # Get data
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            cutoff_date = since_days(days)
             
             # Main prices data
-            prices_df = pd.read_sql(f"""
-                SELECT 
-                    company_name,
-                    base_price,
-                    discount_percentage,
-                    scrape_date,
-                    vehicle_type,
-                    location
-                FROM prices
-                WHERE scrape_date >= '{cutoff_date}'
-                ORDER BY scrape_date DESC
-            """, conn)
+            prices_df = self.queries.frame('export_prices', since=cutoff_date)
             
             # Summary by company
-            summary_df = pd.read_sql(f"""
-                SELECT 
-                    company_name,
-                    COUNT(*) as data_points,
-                    AVG(base_price) as avg_price,
-                    MIN(base_price) as min_price,
-                    MAX(base_price) as max_price,
-                    AVG(CASE WHEN discount_percentage > 0 THEN discount_percentage END) as avg_discount
-                FROM prices
-                WHERE scrape_date >= '{cutoff_date}'
-                GROUP BY company_name
-                ORDER BY avg_price ASC
-            """, conn)
+            summary_df = self.queries.frame('company_price_stats', since=cutoff_date)
             
             # Create Excel file
             filename = f"campervan_intel_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
@@ -121,7 +103,6 @@ class DataExporter:
                 workbook = writer.book
                 self._format_excel_sheets(workbook)
             
-            conn.close()
             logger.info(f"✅ Excel exported: {filepath}")
             return str(filepath)
             
@@ -170,22 +151,8 @@ class DataExporter:
             return None
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            
             # Get summary data
-            summary_query = f"""
-                SELECT 
-                    company_name,
-                    AVG(base_price) as avg_price,
-                    MIN(base_price) as min_price,
-                    MAX(base_price) as max_price
-                FROM prices
-                WHERE scrape_date >= '{cutoff_date}'
-                GROUP BY company_name
-                ORDER BY avg_price ASC
-            """
-            summary_data = pd.read_sql(summary_query, conn)
+            summary_data = self.queries.frame('company_price_stats', since=since_days(days))
             
             # Create PDF
             filename = f"executive_report_{datetime.now().strftime('%Y%m%d')}.pdf"
@@ -240,7 +207,6 @@ class DataExporter:
             
             # Build PDF
             doc.build(story)
-            conn.close()
             
             logger.info(f"✅ PDF exported: {filepath}")
             return str(filepath)
@@ -252,20 +218,12 @@ class DataExporter:
     def export_to_csv(self, days: int = 30) -> Optional[str]:
         """Export raw data to CSV"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            
-            df = pd.read_sql(f"""
-                SELECT * FROM prices
-                WHERE scrape_date >= '{cutoff_date}'
-                ORDER BY scrape_date DESC, company_name
-            """, conn)
+            df = self.queries.frame('export_all_columns', since=since_days(days))
             
             filename = f"campervan_data_{datetime.now().strftime('%Y%m%d')}.csv"
             filepath = self.export_dir / filename
             
             df.to_csv(filepath, index=False)
-            conn.close()
             
             logger.info(f"✅ CSV exported: {filepath}")
             return str(filepath)
@@ -274,11 +232,33 @@ class DataExporter:
             logger.error(f"❌ CSV export failed: {e}")
             return None
     
+    def export_calendar_rollups(self, period: str = 'week') -> Optional[str]:
+        """Export pricing calendar rollups (day/week/month) to CSV"""
+        try:
+            from database.pricing_calendar_schema import get_pricing_session
+            from database.price_rollups import load_rollups
+            
+            session = get_pricing_session()
+            try:
+                df = load_rollups(session, period)
+            finally:
+                session.close()
+            
+            filename = f"calendar_rollups_{period}_{datetime.now().strftime('%Y%m%d')}.csv"
+            filepath = self.export_dir / filename
+            
+            df.to_csv(filepath, index=False)
+            
+            logger.info(f"✅ Calendar rollups exported: {filepath}")
+            return str(filepath)
+            
+        except Exception as e:
+            logger.error(f"❌ Calendar rollup export failed: {e}")
+            return None
+    
     def export_summary_json(self) -> Optional[str]:
         """Export quick summary as JSON"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
             summary = {
                 'generated_at': datetime.now().isoformat(),
                 'market_summary': {},
@@ -287,15 +267,7 @@ class DataExporter:
             }
             
             # Market summary
-            market_data = pd.read_sql("""
-                SELECT 
-                    AVG(base_price) as avg_price,
-                    MIN(base_price) as min_price,
-                    MAX(base_price) as max_price,
-                    COUNT(DISTINCT company_name) as companies
-                FROM prices
-                WHERE scrape_date >= date('now', '-7 days')
-            """, conn)
+            market_data = self.queries.frame('market_stats', since=since_days(7))
             
             summary['market_summary'] = {
                 'avg_price': float(market_data['avg_price'].iloc[0]),
@@ -305,16 +277,7 @@ class DataExporter:
             }
             
             # Top competitors
-            top_df = pd.read_sql("""
-                SELECT 
-                    company_name,
-                    AVG(base_price) as avg_price
-                FROM prices
-                WHERE scrape_date >= date('now', '-7 days')
-                GROUP BY company_name
-                ORDER BY avg_price ASC
-                LIMIT 5
-            """, conn)
+            top_df = self.queries.frame('company_price_stats', since=since_days(7)).head(5)
             
             summary['top_competitors'] = [
                 {'company': row['company_name'], 'avg_price': float(row['avg_price'])}
@@ -327,7 +290,6 @@ class DataExporter:
             with open(filepath, 'w') as f:
                 json.dump(summary, f, indent=2)
             
-            conn.close()
             logger.info(f"✅ JSON summary exported: {filepath}")
             return str(filepath)
             
@@ -373,6 +335,9 @@ if __name__ == "__main__":
         elif format_type == 'json':
             print("📦 Exporting to JSON...")
             file = exporter.export_summary_json()
+        elif format_type == 'rollups':
+            print("📅 Exporting calendar rollups...")
+            file = exporter.export_calendar_rollups()
         elif format_type == 'all':
             print("📊 Exporting all formats...")
             exporter.export_to_excel()
@@ -381,11 +346,11 @@ if __name__ == "__main__":
             exporter.export_summary_json()
             file = "All formats exported"
         else:
-            print("❌ Unknown format. Use: excel, pdf, csv, json, or all")
+            print("❌ Unknown format. Use: excel, pdf, csv, json, rollups, or all")
             sys.exit(1)
         
         if file:
             print(f"✅ Success: {file}")
     else:
-        print("Usage: python export_engine.py [excel|pdf|csv|json|all]")
+        print("Usage: python export_engine.py [excel|pdf|csv|json|rollups|all]")
         print("Example: python export_engine.py excel")
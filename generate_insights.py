@@ -1,5 +1,5 @@
 """Generate comprehensive competitive insights from scraped data"""
-from database.models import get_session, CompetitorPrice
+from database.models import get_session, get_current_prices
 from datetime import datetime
 import statistics
 
@@ -7,8 +7,8 @@ def generate_comprehensive_insights():
     """Generate detailed competitive intelligence insights"""
     session = get_session()
     
-    # Get latest records
-    competitors = session.query(CompetitorPrice).order_by(CompetitorPrice.id.desc()).limit(8).all()
+    # Latest record per competitor
+    competitors = get_current_prices(session)
     
     if not competitors:
         print("No data available. Run `python run_intelligence.py` first.")
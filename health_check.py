@@ -30,11 +30,12 @@ except ImportError:
     config = None
 
 try:
-    from database.models import get_session, CompetitorPrice, PriceAlert
+    from database.models import get_session, CompetitorPrice, LatestCompetitorPrice, PriceAlert
 except ImportError as e:
     print(f"Warning: Could not import database models: {e}")
     get_session = None
     CompetitorPrice = None
+    LatestCompetitorPrice = None
     PriceAlert = None
 
 
@@ -114,14 +115,15 @@ class HealthCheck:
         }
         
         try:
-            # Get database path
+            # Get database path (None for a server database such as PostgreSQL)
             if config:
-                db_path = config.database.DATABASE_PATH
+                from database.engine import sqlite_path
+                db_path = sqlite_path(config.database.DATABASE_URL)
             else:
                 db_path = BASE_DIR / "database" / "campervan_intelligence.db"
             
             # Check if database exists
-            if not db_path.exists():
+            if db_path is not None and not db_path.exists():
                 check['status'] = 'critical'
                 check['message'] = 'Database file does not exist'
                 check['details']['path'] = str(db_path)
@@ -145,8 +147,8 @@ class HealthCheck:
                 check['message'] = 'Database is empty - no price records found'
             
             check['details'] = {
-                'path': str(db_path),
-                'size_mb': db_path.stat().st_size / (1024 * 1024),
+                'path': str(db_path) if db_path else config.database.DATABASE_URL.split(':', 1)[0],
+                'size_mb': db_path.stat().st_size / (1024 * 1024) if db_path else None,
                 'price_records': price_count,
                 'alerts': alert_count
             }
@@ -169,9 +171,9 @@ class HealthCheck:
         try:
             session = get_session()
             
-            # Get most recent scrape
-            latest_price = session.query(CompetitorPrice)\
-                .order_by(CompetitorPrice.scrape_timestamp.desc())\
+            # Most recent scrape, from the one-row-per-company table
+            latest_price = session.query(LatestCompetitorPrice)\
+                .order_by(LatestCompetitorPrice.scrape_timestamp.desc())\
                 .first()
             
             if not latest_price:
@@ -195,8 +197,8 @@ class HealthCheck:
                 check['message'] = f'No recent scraping activity ({hours_since:.1f}h ago)'
             
             # Count scraped companies in last 24h
-            recent_count = session.query(CompetitorPrice)\
-                .filter(CompetitorPrice.scrape_timestamp >= datetime.now() - timedelta(hours=24))\
+            recent_count = session.query(LatestCompetitorPrice)\
+                .filter(LatestCompetitorPrice.scrape_timestamp >= datetime.now() - timedelta(hours=24))\
                 .count()
             
             check['details'] = {
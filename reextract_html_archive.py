@@ -0,0 +1,334 @@
+"""
+Offline HTML Archive Re-extraction
+Re-derives competitor fields from saved HTML pages without a browser
+
+Walks the HTML archive (data/*.html, research/*_source.html and the
+save_html output directory), parses every page in a process pool and
+bulk-writes the extracted rows to competitor_prices. Each row is tagged
+with its source file, so re-running after an extractor improvement
+corrects the rows it produced earlier instead of duplicating them.
+
+Usage:
+    python reextract_html_archive.py                 # whole archive
+    python reextract_html_archive.py --dry-run       # extract only
+    python reextract_html_archive.py data/html --workers 8
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+BASE_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from core_config import config
+from scrapers.html_parsing import BACKEND, extract_json_ld, visible_text
+from scrapers.smart_text_extractor import SmartTextExtractor
+
+# Archive locations, relative to BASE_DIR
+DEFAULT_ARCHIVE_PATTERNS = [
+    'data/*.html',
+    'research/*_source.html',
+    str(config.HTML_DIR.relative_to(BASE_DIR) / '*.html'),
+]
+
+SOURCE_TAG_PREFIX = 'archive://'
+EXTRACTION_METHOD = 'archive_reextraction'
+
+# save_html names files {company}_{label}_{YYYYmmdd_HHMMSS}.html
+FILENAME_TIMESTAMP = re.compile(r'(\d{8}_\d{6})')
+
+
+def discover_pages(patterns: List[str]) -> List[Path]:
+    """Expand archive globs/directories into a sorted, de-duplicated file list"""
+    pages = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if not path.is_absolute():
+            path = BASE_DIR / path
+        if path.is_dir():
+            pages.update(path.glob('*.html'))
+        elif path.is_file():
+            pages.add(path)
+        else:
+            pages.update(path.parent.glob(path.name))
+    return sorted(p.resolve() for p in pages)
+
+
+def match_company(path: Path, competitors: List[Dict]) -> Optional[Dict]:
+    """Find the competitor a saved page belongs to from its file name"""
+    stem = re.sub(r'[^a-z0-9]', '', path.stem.lower())
+    best = None
+    for competitor in competitors:
+        names = [competitor['name'], competitor['name'].split()[0]]
+        for name in names:
+            key = re.sub(r'[^a-z0-9]', '', name.lower())
+            if len(key) >= 4 and key in stem and (best is None or len(key) > best[0]):
+                best = (len(key), competitor)
+    return best[1] if best else None
+
+
+def source_tag(path: Path) -> str:
+    """Stable tag identifying rows derived from an archived file"""
+    try:
+        relative = path.relative_to(BASE_DIR)
+    except ValueError:
+        relative = path
+    return SOURCE_TAG_PREFIX + relative.as_posix()
+
+
+def page_timestamp(path: Path) -> datetime:
+    """Capture time from the file name, falling back to the file mtime"""
+    match = FILENAME_TIMESTAMP.search(path.name)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), '%Y%m%d_%H%M%S')
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def extract_archived_page(path_str: str) -> Dict[str, Any]:
+    """Extract scraper data fields from one archived HTML page.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        path_str (str): Path of the HTML file
+
+    Returns:
+        Dict: Extracted fields (scraper data names) plus 'source_file',
+            or {'source_file': ..., 'error': ...} if the page is unreadable
+    """
+    path = Path(path_str)
+    try:
+        html = path.read_text(encoding='utf-8', errors='replace')
+    except OSError as e:
+        return {'source_file': path_str, 'error': str(e)}
+
+    text = visible_text(html)
+    fields: Dict[str, Any] = SmartTextExtractor.to_data_fields(
+        SmartTextExtractor.extract_all_fields(text)
+    )
+
+    # Same heuristic as the live text extraction: lowest plausible nightly price
+    night_prices = [p for p in SmartTextExtractor.extract_prices(text) if 40 <= p <= 400]
+    if night_prices:
+        fields['base_nightly_rate'] = min(night_prices)
+        fields['is_estimated'] = False
+
+    features = SmartTextExtractor.extract_features(text)
+    if features:
+        fields['vehicle_features'] = sorted(features)
+
+    for item in _flatten_json_ld(extract_json_ld(html)):
+        rating = item.get('aggregateRating')
+        if isinstance(rating, dict):
+            try:
+                if 'ratingValue' in rating and 'customer_review_avg' not in fields:
+                    fields['customer_review_avg'] = float(rating['ratingValue'])
+                if 'reviewCount' in rating and 'review_count' not in fields:
+                    fields['review_count'] = int(rating['reviewCount'])
+            except (TypeError, ValueError):
+                pass
+
+        offers = item.get('offers')
+        if isinstance(offers, dict) and 'price' in offers and 'base_nightly_rate' not in fields:
+            try:
+                fields['base_nightly_rate'] = float(offers['price'])
+                fields['is_estimated'] = True
+            except (TypeError, ValueError):
+                pass
+
+    fields['source_file'] = path_str
+    fields['text_length'] = len(text)
+    return fields
+
+
+def _flatten_json_ld(blocks: List[Any]) -> List[Dict]:
+    items = []
+    for block in blocks:
+        candidates = block if isinstance(block, list) else [block]
+        for item in candidates:
+            if isinstance(item, dict):
+                items.append(item)
+                graph = item.get('@graph')
+                if isinstance(graph, list):
+                    items.extend(g for g in graph if isinstance(g, dict))
+    return items
+
+
+def build_record(fields: Dict[str, Any], competitor: Dict, path: Path, columns: set) -> Dict[str, Any]:
+    """Turn extracted fields into a competitor_prices row tagged with its source"""
+    record = {key: value for key, value in fields.items() if key in columns}
+    record.update({
+        'company_name': competitor['name'],
+        'tier': competitor['tier'],
+        'scrape_timestamp': page_timestamp(path),
+        'data_source_url': source_tag(path),
+        'scraping_strategy_used': 'html_archive',
+        'extraction_method': EXTRACTION_METHOD,
+        'notes': f"Re-extracted offline from {source_tag(path)[len(SOURCE_TAG_PREFIX):]}",
+    })
+
+    data_columns = columns - {'id'}
+    filled = sum(1 for key in data_columns if record.get(key) not in (None, '', []))
+    record['data_completeness_pct'] = filled / len(data_columns) * 100
+    return record
+
+
+def save_records(records: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Bulk insert new rows and bulk update rows from previous re-extractions"""
+    from database.engine import copy_rows
+    from database.models import CompetitorPrice, get_session, init_database
+
+    init_database()
+    session = get_session()
+    try:
+        tags = [r['data_source_url'] for r in records]
+        existing = {}
+        for start in range(0, len(tags), 500):
+            chunk = tags[start:start + 500]
+            rows = session.query(CompetitorPrice.id, CompetitorPrice.data_source_url)\
+                .filter(CompetitorPrice.data_source_url.in_(chunk)).all()
+            existing.update({url: row_id for row_id, url in rows})
+
+        inserts = [r for r in records if r['data_source_url'] not in existing]
+        updates = [dict(r, id=existing[r['data_source_url']]) for r in records if r['data_source_url'] in existing]
+
+        if inserts:
+            # COPY on PostgreSQL; triggers keep the latest-price and attribute tables current
+            copy_rows(session.connection(), CompetitorPrice.__table__, inserts)
+        if updates:
+            session.bulk_update_mappings(CompetitorPrice, updates)
+        session.commit()
+
+        return {'inserted': len(inserts), 'updated': len(updates)}
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def reextract_archive(
+    patterns: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    dry_run: bool = False,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Re-extract every archived page and write the results.
+
+    Args:
+        patterns: Archive globs, directories or files (default: whole archive)
+        workers: Worker processes (default: CPU count)
+        dry_run: Extract and report without touching the database
+        limit: Only process the first N pages
+
+    Returns:
+        Dict with page counts, skipped files, DB write counts and pages/sec
+    """
+    from database.models import CompetitorPrice
+    from scrapers.competitor_config import get_all_competitors
+
+    pages = discover_pages(patterns or DEFAULT_ARCHIVE_PATTERNS)
+    if limit:
+        pages = pages[:limit]
+
+    competitors = get_all_competitors()
+    assigned = []
+    skipped = []
+    for path in pages:
+        competitor = match_company(path, competitors)
+        if competitor:
+            assigned.append((path, competitor))
+        else:
+            skipped.append(path.name)
+
+    logger.info(
+        f"📂 {len(pages)} archived pages, {len(assigned)} matched to competitors "
+        f"({len(skipped)} skipped) - parser backend: {BACKEND}"
+    )
+
+    columns = {c.name for c in CompetitorPrice.__table__.columns}
+    records = []
+    errors = []
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if assigned:
+        chunksize = max(1, len(assigned) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                extract_archived_page,
+                [str(path) for path, _ in assigned],
+                chunksize=chunksize
+            )
+            for (path, competitor), fields in zip(assigned, results):
+                if 'error' in fields:
+                    errors.append(f"{path.name}: {fields['error']}")
+                    continue
+                records.append(build_record(fields, competitor, path, columns))
+    extract_seconds = time.perf_counter() - start
+
+    written = {'inserted': 0, 'updated': 0}
+    if records and not dry_run:
+        written = save_records(records)
+
+    pages_per_sec = len(assigned) / extract_seconds if extract_seconds > 0 else 0.0
+    logger.info(
+        f"✅ Re-extracted {len(records)} pages in {extract_seconds:.2f}s "
+        f"({pages_per_sec:.1f} pages/sec, {workers} workers) - "
+        f"{written['inserted']} inserted, {written['updated']} updated"
+    )
+
+    return {
+        'pages_found': len(pages),
+        'pages_extracted': len(records),
+        'skipped': skipped,
+        'errors': errors,
+        'inserted': written['inserted'],
+        'updated': written['updated'],
+        'extract_seconds': extract_seconds,
+        'pages_per_sec': pages_per_sec,
+        'records': records,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Re-extract competitor data from archived HTML')
+    parser.add_argument('paths', nargs='*', help='Globs, directories or files (default: whole archive)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--limit', type=int, default=None, help='Only process the first N pages')
+    parser.add_argument('--dry-run', action='store_true', help='Extract without writing to the database')
+
+    args = parser.parse_args()
+
+    summary = reextract_archive(args.paths or None, args.workers, args.dry_run, args.limit)
+
+    print("\n" + "=" * 70)
+    print("📂 HTML ARCHIVE RE-EXTRACTION")
+    print("=" * 70)
+    print(f"Pages found:      {summary['pages_found']}")
+    print(f"Pages extracted:  {summary['pages_extracted']}")
+    print(f"Skipped (no company match): {len(summary['skipped'])}")
+    print(f"Errors:           {len(summary['errors'])}")
+    print(f"Throughput:       {summary['pages_per_sec']:.1f} pages/sec")
+    if args.dry_run:
+        print("Database:         dry run - nothing written")
+    else:
+        print(f"Database:         {summary['inserted']} inserted, {summary['updated']} updated")
+
+    for record in summary['records']:
+        rate = record.get('base_nightly_rate')
+        print(f"  • {record['company_name']:<20} {record['data_source_url']:<60} "
+              f"rate={rate if rate is not None else '-'} completeness={record['data_completeness_pct']:.0f}%")
@@ -17,16 +17,35 @@ if sys.platform == 'win32':
 BASE_DIR = Path(__file__).parent.resolve()
 CACHE_DIR = BASE_DIR / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
+sys.path.insert(0, str(BASE_DIR))
+
+from utils.async_persistence import get_persistence_writer
+from utils.retry_policy import RetryBudget, RetryPolicy, retry_async
 
 
 class ResilientScraper:
     """Enhanced scraper with retry logic and fallbacks"""
     
-    def __init__(self, max_retries: int = 3, retry_delay: int = 30):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: int = 30,
+        retry_policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None
+    ):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.cache_ttl = 86400  # 24 hours
         self.failed_attempts = {}
+
+        # max_retries counts attempts here; jittered backoff capped at retry_delay * 2
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max(0, max_retries - 1),
+            base_delay=retry_delay,
+            max_delay=retry_delay * 2
+        )
+        # Shared across companies in one run - set a fresh one per run
+        self.budget = budget
     
     async def scrape_with_retry(
         self,
@@ -36,46 +55,46 @@ class ResilientScraper:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Execute scraper with automatic retry and fallback
+        Execute scraper with automatic retry and fallback.
+
+        Retries follow self.retry_policy (full jitter) and stop early once
+        the shared self.budget is spent or its deadline has passed.
         """
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"🔄 Attempt {attempt + 1}/{self.max_retries} for {company_name}")
-                
-                # Execute scraper
-                result = await scraper_func(*args, **kwargs)
-                
-                # Validate result
-                if self._validate_result(result, company_name):
-                    # Cache successful result
-                    self._cache_result(company_name, result)
-                    
-                    # Reset failure counter
-                    if company_name in self.failed_attempts:
-                        del self.failed_attempts[company_name]
-                    
-                    logger.info(f"✅ {company_name}: Scraping successful")
-                    return result
-                else:
-                    logger.warning(f"⚠️  {company_name}: Invalid result, retrying...")
-                    
-            except Exception as e:
-                logger.error(f"❌ {company_name} attempt {attempt + 1} failed: {e}")
-                
-                # Track failures
-                if company_name not in self.failed_attempts:
-                    self.failed_attempts[company_name] = []
-                self.failed_attempts[company_name].append({
-                    'attempt': attempt + 1,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                # Wait before retry (exponential backoff)
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.info(f"⏳ Waiting {wait_time}s before retry...")
-                    await asyncio.sleep(wait_time)
+        def record_failure(attempt: int, error: Optional[BaseException]):
+            if error is None:
+                logger.warning(f"⚠️  {company_name}: Invalid result on attempt {attempt + 1}")
+                return
+            logger.error(f"❌ {company_name} attempt {attempt + 1} failed: {error}")
+            self.failed_attempts.setdefault(company_name, []).append({
+                'attempt': attempt + 1,
+                'error': str(error),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        result = None
+        try:
+            result = await retry_async(
+                scraper_func, *args,
+                policy=self.retry_policy,
+                budget=self.budget,
+                label=company_name,
+                retry_if_result=lambda r: not self._validate_result(r, company_name),
+                on_failure=record_failure,
+                **kwargs
+            )
+        except Exception as e:
+            logger.error(f"❌ {company_name}: {e}")
+
+        if result is not None and self._validate_result(result, company_name):
+            # Cache successful result
+            self._cache_result(company_name, result)
+
+            # Reset failure counter
+            if company_name in self.failed_attempts:
+                del self.failed_attempts[company_name]
+
+            logger.info(f"✅ {company_name}: Scraping successful")
+            return result
         
         # All retries failed - use fallback
         logger.warning(f"🔄 All retries failed for {company_name}, using fallback...")
@@ -112,8 +131,12 @@ class ResilientScraper:
         }
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            try:
+                # Inside the event loop: hand the write to the persistence writer
+                get_persistence_writer().write_json(cache_file, cache_data, indent=2)
+            except RuntimeError:
+                with open(cache_file, 'w') as f:
+                    json.dump(cache_data, f, indent=2)
             logger.debug(f"💾 Cached result for {company_name}")
         except Exception as e:
             logger.error(f"Failed to cache result: {e}")
@@ -350,7 +373,7 @@ if __name__ == "__main__":
                 'count': 1
             }
         
-        resilient = ResilientScraper(max_retries=3, retry_delay=2)
+        resilient = ResilientScraper(max_retries=3, retry_delay=2, budget=RetryBudget(max_retries=4, deadline_seconds=60))
         
         companies = ['Roadsurfer', 'McRent', 'Camperdays']
         
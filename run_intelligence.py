@@ -9,7 +9,6 @@ from datetime import datetime
 from pathlib import Path
 from loguru import logger
 from typing import List, Dict
-import json
 import io
 
 # Fix Windows console encoding
@@ -29,6 +28,10 @@ logger.add(
     level="INFO"
 )
 
+sys.path.insert(0, str(BASE_DIR))
+from utils.async_persistence import LoopLagMonitor, get_persistence_writer
+from database.history_store import sync_history
+
 
 class CompetitiveIntelligenceEngine:
     """Main intelligence orchestration"""
@@ -37,6 +40,7 @@ class CompetitiveIntelligenceEngine:
         self.results = []
         self.alerts = []
         self.insights = []
+        self.loop_lag = {}
     
     async def run_tier_1_daily(self):
         """Run daily Tier 1 competitor monitoring"""
@@ -45,18 +49,35 @@ class CompetitiveIntelligenceEngine:
         
         from scrapers.tier1_scrapers import scrape_tier_1_competitors
         
+        # DB and file writes go through the persistence writer; the monitor
+        # records how long the event loop was ever blocked
+        monitor = LoopLagMonitor()
+        writer = get_persistence_writer()
         try:
-            results = await scrape_tier_1_competitors()
-            self.results = results
-            
-            # Analyze results
-            await self.analyze_results()
-            
-            # Generate alerts
-            await self.generate_alerts()
+            async with monitor:
+                results = await scrape_tier_1_competitors()
+                self.results = results
+                
+                # Analyze results
+                await self.analyze_results()
+                
+                # Generate alerts
+                await self.generate_alerts()
+                
+                await writer.flush()
+
+            # Append the new rows to the Parquet history store
+            await asyncio.to_thread(sync_history, ['competitor_prices'])
+
+            self.loop_lag = monitor.summary()
+            logger.info(
+                f"⏱️ Event loop lag: max {self.loop_lag['max_ms']:.0f} ms, "
+                f"p95 {self.loop_lag['p95_ms']:.0f} ms over {self.loop_lag['samples']} probes"
+            )
             
             # Save summary
             await self.save_summary()
+            await writer.flush()
             
             logger.info("✅ Daily intelligence gathering complete!")
             
@@ -87,9 +108,8 @@ class CompetitiveIntelligenceEngine:
             logger.info(f"Market Average: €{market_stats['avg_price']:.2f}/night")
             logger.info(f"Price Range: €{market_stats['min_price']} - €{market_stats['max_price']}")
             
-            # Save to database
-            from database.models import get_session, MarketIntelligence
-            session = get_session()
+            # Save to database (committed by the persistence writer)
+            from database.models import MarketIntelligence
             
             intel = MarketIntelligence(
                 market_avg_price=market_stats['avg_price'],
@@ -100,11 +120,9 @@ class CompetitiveIntelligenceEngine:
                 market_summary=f"Analyzed {len(prices)} competitors on {datetime.now().strftime('%Y-%m-%d')}"
             )
             
-            session.add(intel)
-            session.commit()
-            session.close()
+            get_persistence_writer().add(intel)
             
-            logger.info("✅ Market intelligence saved")
+            logger.info("✅ Market intelligence queued")
     
     def _calculate_std_dev(self, numbers):
         """Calculate standard deviation"""
@@ -118,7 +136,10 @@ class CompetitiveIntelligenceEngine:
         """Generate price alerts and threats"""
         logger.info("\n🚨 Checking for alerts...")
         
-        from database.models import get_session, PriceAlert
+        from database.models import PriceAlert
+        
+        # Alerts are batched into one commit by the persistence writer
+        writer = get_persistence_writer()
         
         # Check for significant price changes
         prices = [r['base_nightly_rate'] for r in self.results if r['base_nightly_rate']]
@@ -144,7 +165,6 @@ class CompetitiveIntelligenceEngine:
                         logger.warning(f"⚠️ {alert['message']}")
                         
                         # Save to database
-                        session = get_session()
                         db_alert = PriceAlert(
                             alert_type=alert['type'],
                             severity=alert['severity'],
@@ -154,9 +174,7 @@ class CompetitiveIntelligenceEngine:
                             alert_message=alert['message'],
                             recommended_action=alert['recommended_action']
                         )
-                        session.add(db_alert)
-                        session.commit()
-                        session.close()
+                        writer.add(db_alert)
                 
                 # Alert on new promotions
                 if result.get('active_promotions'):
@@ -176,12 +194,13 @@ class CompetitiveIntelligenceEngine:
             'competitors_analyzed': len(self.results),
             'data_completeness_avg': sum(r['data_completeness_pct'] for r in self.results) / len(self.results) if self.results else 0,
             'alerts_generated': len(self.alerts),
+            'event_loop_lag': self.loop_lag,
             'results': self.results,
             'alerts': self.alerts
         }
         
         report_file = summary_path / f"intelligence_{timestamp}.json"
-        report_file.write_text(json.dumps(report, indent=2, default=str), encoding='utf-8')
+        get_persistence_writer().write_json(report_file, report, indent=2, default=str)
         
         logger.info(f"📄 Summary saved: {report_file}")
 
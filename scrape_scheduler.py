@@ -0,0 +1,443 @@
+"""
+Tier-Aware Scrape Scheduler
+Long-running replacement for the run_daily.bat / Task Scheduler batch runs
+
+One process keeps the browser, DB engine and circuit breakers warm and holds a
+time-ordered queue of (competitor, job type, next due) jobs:
+- Tiers from competitor_config set the interval (1=daily, 2=weekly, 3=monthly)
+- Each job gets a stable slot inside its interval (hash of its key), so the
+  daily jobs are spread across the day instead of firing together
+- Job starts are at least min_gap_seconds apart; ties go to priority_score
+- Jobs whose circuit breaker is open are deferred until it may half-open
+- Runs missed while the daemon was down are caught up once (not once per
+  missed slot), highest priority first
+
+Usage:
+    python scrape_scheduler.py                 # run as a daemon
+    python scrape_scheduler.py --once          # run whatever is due, then exit
+    python scrape_scheduler.py --plan 48       # show the next 48h of jobs
+
+Deployment (Linux): scripts/campervan-scheduler.service
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import signal
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+BASE_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.competitor_config import get_all_competitors
+
+LOGS_DIR = BASE_DIR / "logs"
+LOGS_DIR.mkdir(exist_ok=True)
+
+# Monitoring interval per tier (see CompetitorConfig.tier)
+TIER_INTERVALS = {
+    1: timedelta(days=1),
+    2: timedelta(weeks=1),
+    3: timedelta(days=30),
+}
+
+# Slots are anchored to a fixed Monday so they stay put across restarts
+SLOT_EPOCH = datetime(2024, 1, 1)
+
+
+@dataclass
+class JobSpec:
+    """A recurring job for one competitor"""
+    competitor: str
+    job_type: str
+    tier: int
+    priority: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.competitor}:{self.job_type}"
+
+    @property
+    def interval(self) -> timedelta:
+        return TIER_INTERVALS.get(self.tier, TIER_INTERVALS[3])
+
+
+@dataclass(order=True)
+class ScheduledJob:
+    """Queue entry; ordered by due time, then priority"""
+    due: datetime
+    rank: int
+    key: str
+    spec: JobSpec = field(compare=False)
+    catch_up: bool = field(default=False, compare=False)
+
+
+@dataclass
+class SchedulerConfig:
+    """Scheduler daemon settings.
+
+    Attributes:
+        state_file (str): JSON file with each job's last run
+        job_types (tuple): Job types created for every competitor
+        min_gap_seconds (float): Minimum time between two job starts
+        catch_up (bool): Run jobs whose slot passed while the daemon was down
+        max_idle_seconds (float): Longest sleep before re-checking the queue
+        breaker_timeout_seconds (int): How long an open circuit defers a competitor
+    """
+    state_file: str = str(BASE_DIR / "output" / "scheduler_state.json")
+    job_types: tuple = ('deep_scrape',)
+    min_gap_seconds: float = 120.0
+    catch_up: bool = True
+    max_idle_seconds: float = 300.0
+    breaker_timeout_seconds: int = 6 * 3600
+
+
+def slot_offset(key: str, interval: timedelta) -> timedelta:
+    """Stable position of a job inside its interval"""
+    fraction = zlib.crc32(key.encode('utf-8')) / 2 ** 32
+    return timedelta(seconds=int(interval.total_seconds() * fraction))
+
+
+def previous_slot(spec: JobSpec, now: datetime) -> datetime:
+    """Latest slot of spec at or before now"""
+    anchor = SLOT_EPOCH + slot_offset(spec.key, spec.interval)
+    periods = (now - anchor) // spec.interval
+    return anchor + periods * spec.interval
+
+
+class WarmBrowser:
+    """One local Chromium kept alive between jobs (relaunched if it dies)"""
+
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+
+    async def get(self):
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        from playwright.async_api import async_playwright
+        from scrapers.browser_profiles import get_browser_profile, launch_browser
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        profile = get_browser_profile()
+        self._browser = await launch_browser(self._playwright, profile)
+        logger.info(f"✅ Launched shared browser ({profile.name}) for the scheduler")
+        return self._browser
+
+    async def close(self):
+        try:
+            if self._browser is not None and self._browser.is_connected():
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.debug(f"Browser shutdown error (non-critical): {e}")
+        self._browser = None
+        self._playwright = None
+
+
+def create_tier1_scraper(company_name: str):
+    """Scraper instance for a competitor, or None if there is no scraper for it"""
+    from scrapers.registry import create_scraper
+    return create_scraper(company_name, use_browserless=False)
+
+
+class ScrapeScheduler:
+    """
+    Time-ordered job queue with tier intervals, spreading and catch-up.
+
+    Args:
+        config: Scheduler settings
+        competitors: Competitor dicts with name, tier and priority_score
+            (default: competitor_config.get_all_competitors())
+        runners: Coroutine per job type, called with the JobSpec; returns a
+            dict with a 'status' key ('success', 'failed', 'unsupported', ...)
+        registry: Circuit breaker registry consulted before each job
+            (default: the resilient orchestrator's registry)
+        clock: Returns the current time (for tests)
+    """
+
+    def __init__(
+        self,
+        config: Optional[SchedulerConfig] = None,
+        competitors: Optional[List[Dict]] = None,
+        runners: Optional[Dict[str, Callable[[JobSpec], Awaitable[Dict]]]] = None,
+        registry=None,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        self.config = config or SchedulerConfig()
+        self.clock = clock
+        self.competitors = competitors if competitors is not None else get_all_competitors()
+
+        self.orchestrator = None
+        self.browser: Optional[WarmBrowser] = None
+        if runners is None:
+            runners = {'deep_scrape': self.run_deep_scrape}
+        self.runners = runners
+        self.registry = registry
+
+        self.state: Dict[str, Dict[str, Any]] = self.load_state()
+        self.queue: List[ScheduledJob] = []
+        self.last_start: Optional[datetime] = None
+        self._stop = asyncio.Event()
+
+        for spec in self.build_jobs():
+            self.schedule(spec, initial=True)
+
+    def build_jobs(self) -> List[JobSpec]:
+        return [
+            JobSpec(competitor['name'], job_type, competitor['tier'], competitor.get('priority_score', 0))
+            for competitor in self.competitors
+            for job_type in self.config.job_types
+        ]
+
+    def next_due(self, spec: JobSpec, now: datetime) -> tuple:
+        """
+        When spec should next run.
+
+        Returns:
+            (due, catch_up): catch_up is True if the latest slot was missed
+        """
+        last_slot = previous_slot(spec, now)
+        last_run = self.state.get(spec.key, {}).get('last_run')
+        last_run = datetime.fromisoformat(last_run) if last_run else None
+
+        if self.config.catch_up and (last_run is None or last_run < last_slot):
+            return now, True
+        return last_slot + spec.interval, False
+
+    def schedule(
+        self,
+        spec: JobSpec,
+        initial: bool = False,
+        due: Optional[datetime] = None,
+        after_catch_up: bool = False
+    ):
+        now = self.clock()
+        catch_up = False
+        if due is None:
+            if initial:
+                due, catch_up = self.next_due(spec, now)
+            else:
+                due = previous_slot(spec, now) + spec.interval
+                # A catch-up run shortly before the regular slot stands in for it
+                if after_catch_up and due - now < spec.interval / 2:
+                    due += spec.interval
+        heapq.heappush(self.queue, ScheduledJob(due, -spec.priority, spec.key, spec, catch_up))
+
+    def plan(self, hours: float = 24) -> List[ScheduledJob]:
+        """Queued jobs due within the next hours, in run order"""
+        horizon = self.clock() + timedelta(hours=hours)
+        return sorted(job for job in self.queue if job.due <= horizon)
+
+    def seconds_until_next(self) -> Optional[float]:
+        if not self.queue:
+            return None
+        return max(0.0, (self.queue[0].due - self.clock()).total_seconds())
+
+    def load_state(self) -> Dict[str, Dict[str, Any]]:
+        path = Path(self.config.state_file)
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading scheduler state: {e}")
+        return {}
+
+    def save_state(self):
+        path = Path(self.config.state_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + '.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self.state, f, indent=2, default=str)
+            tmp.replace(path)
+        except Exception as e:
+            logger.error(f"Error saving scheduler state: {e}")
+
+    def breaker_reopens_at(self, spec: JobSpec) -> Optional[datetime]:
+        """When an open circuit for the competitor may half-open (None if not open)"""
+        if self.registry is None:
+            return None
+        status = self.registry.get_all_statuses().get(spec.competitor)
+        if not status or status['state'] != 'open':
+            return None
+        changed = datetime.fromisoformat(status['current_state']['last_state_change'])
+        reopens = changed + timedelta(seconds=status['config']['timeout_seconds'])
+        return reopens if reopens > self.clock() else None
+
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep unless stopped; returns False if stop() was called"""
+        if seconds > 0:
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+            except asyncio.TimeoutError:
+                pass
+        return not self._stop.is_set()
+
+    async def run_job(self, job: ScheduledJob) -> Dict[str, Any]:
+        spec = job.spec
+        runner = self.runners.get(spec.job_type)
+        if runner is None:
+            logger.warning(f"No runner for job type {spec.job_type}")
+            return {'status': 'unsupported'}
+
+        logger.info(
+            f"▶️ {spec.key} (tier {spec.tier}, priority {spec.priority})"
+            f"{' - catching up missed run' if job.catch_up else ''}"
+        )
+        start = time.monotonic()
+        try:
+            outcome = await runner(spec)
+        except Exception as e:
+            logger.error(f"❌ {spec.key} failed: {e}")
+            outcome = {'status': 'failed', 'error': str(e)}
+
+        self.state[spec.key] = {
+            'last_run': self.clock().isoformat(),
+            'last_status': outcome.get('status', 'unknown'),
+            'last_duration': round(time.monotonic() - start, 1),
+        }
+        self.save_state()
+        return outcome
+
+    async def run_pending(self) -> int:
+        """Run every job that is due now; returns how many ran"""
+        ran = 0
+        while self.queue and self.queue[0].due <= self.clock() and not self._stop.is_set():
+            job = heapq.heappop(self.queue)
+
+            reopens = self.breaker_reopens_at(job.spec)
+            if reopens:
+                logger.info(f"🚫 {job.spec.key}: circuit open, deferred to {reopens:%Y-%m-%d %H:%M}")
+                self.schedule(job.spec, due=reopens)
+                continue
+
+            if self.last_start is not None:
+                gap = self.config.min_gap_seconds - (self.clock() - self.last_start).total_seconds()
+                if not await self._wait(gap):
+                    heapq.heappush(self.queue, job)
+                    break
+
+            self.last_start = self.clock()
+            await self.run_job(job)
+            self.schedule(job.spec, after_catch_up=job.catch_up)
+            ran += 1
+        return ran
+
+    async def run_forever(self):
+        """Daemon loop: run due jobs, sleep until the next one, until stop()"""
+        logger.info(f"🗓️ Scheduler started with {len(self.queue)} jobs")
+        try:
+            while not self._stop.is_set():
+                await self.run_pending()
+                wait = self.seconds_until_next()
+                wait = self.config.max_idle_seconds if wait is None else min(wait, self.config.max_idle_seconds)
+                await self._wait(wait)
+        finally:
+            await self.close()
+        logger.info("🛑 Scheduler stopped")
+
+    def stop(self):
+        self._stop.set()
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+
+    async def run_deep_scrape(self, spec: JobSpec) -> Dict[str, Any]:
+        """Full scrape through the resilient orchestrator on the warm browser"""
+        scraper = create_tier1_scraper(spec.competitor)
+        if scraper is None:
+            return {'status': 'unsupported'}
+
+        if self.orchestrator is None:
+            from scrapers.resilient_scraper import ResilientScraperConfig, ResilientScraperOrchestrator
+            self.orchestrator = ResilientScraperOrchestrator(
+                ResilientScraperConfig(timeout_seconds=self.config.breaker_timeout_seconds)
+            )
+            self.registry = self.orchestrator.registry
+            self.browser = WarmBrowser()
+
+        scraper.shared_browser = await self.browser.get()
+        self.orchestrator.start_run()
+        result = await self.orchestrator.scrape_single(scraper)
+
+        if not result['success']:
+            return {'status': 'fallback' if result['is_fallback'] else 'failed'}
+
+        # Batched by the persistence writer, off the event loop; waiting on
+        # the future lets the history sync below see the new row
+        from database.models import CompetitorPrice
+        from utils.async_persistence import get_persistence_writer
+        await get_persistence_writer().add(CompetitorPrice(**result['data']), label=f"{spec.competitor} price")
+
+        from database.history_store import sync_history
+        await asyncio.to_thread(sync_history, ['competitor_prices'])
+        return {'status': 'success', 'completeness': result['data'].get('data_completeness_pct')}
+
+
+def print_plan(scheduler: ScrapeScheduler, hours: float):
+    jobs = scheduler.plan(hours)
+    print(f"\n🗓️ {len(jobs)} jobs in the next {hours:g}h\n")
+    for job in jobs:
+        marker = " (catch-up)" if job.catch_up else ""
+        print(f"  {job.due:%a %Y-%m-%d %H:%M}  tier {job.spec.tier}  {job.key}{marker}")
+
+
+async def main(args):
+    config = SchedulerConfig(min_gap_seconds=args.min_gap)
+    if args.state_file:
+        config.state_file = args.state_file
+    scheduler = ScrapeScheduler(config)
+
+    if args.plan is not None:
+        print_plan(scheduler, args.plan)
+        return
+
+    if args.once:
+        try:
+            ran = await scheduler.run_pending()
+            logger.info(f"✅ Ran {ran} due job(s)")
+        finally:
+            await scheduler.close()
+        return
+
+    if sys.platform != 'win32':
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, scheduler.stop)
+
+    await scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    logger.add(
+        LOGS_DIR / "scheduler_{time:YYYY-MM-DD}.log",
+        rotation="1 day",
+        retention="30 days",
+        level="INFO"
+    )
+
+    parser = argparse.ArgumentParser(description='Tier-aware scrape scheduler daemon')
+    parser.add_argument('--once', action='store_true', help='Run due jobs and exit')
+    parser.add_argument('--plan', type=float, metavar='HOURS', help='Print upcoming jobs and exit')
+    parser.add_argument('--min-gap', type=float, default=120.0, help='Seconds between job starts')
+    parser.add_argument('--state-file', help='Job state JSON (default: output/scheduler_state.json)')
+
+    asyncio.run(main(parser.parse_args()))
@@ -1,6 +1,9 @@
 """
 Focused Competitive Intelligence Scrapers
 Quality over quantity - Deep insights from key competitors
+
+Scraper classes are imported on first access (see scrapers.registry), so
+importing this package does not load Playwright or every scraper module.
 """
 
 from .competitor_config import (
@@ -13,16 +16,7 @@ from .competitor_config import (
     TIER_3_COMPETITORS
 )
 
-from .base_scraper import DeepDataScraper
-
-from .tier1_scrapers import (
-    RoadsurferScraper,
-    McRentScraper,
-    GoboonyScrap,
-    YescapaScraper,
-    CamperdaysScraper,
-    scrape_tier_1_competitors
-)
+from .registry import SCRAPER_CLASSES
 
 __version__ = "2.0.0"
 __author__ = "Indie Campers Intelligence Team"
@@ -34,13 +28,15 @@ TIER_2_COUNT = 5
 TIER_3_COUNT = 5
 DATA_POINTS_PER_COMPETITOR = 35
 
-import sys
 
-# Handle Windows console encoding issues
-try:
-    print(f"🎯 Focused Intelligence Scrapers v{__version__}")
-    print(f"   {TOTAL_COMPETITORS} competitors • {DATA_POINTS_PER_COMPETITOR} data points each")
-except UnicodeEncodeError:
-    # Fallback for Windows console without UTF-8 support
-    print(f"[TARGET] Focused Intelligence Scrapers v{__version__}")
-    print(f"   {TOTAL_COMPETITORS} competitors - {DATA_POINTS_PER_COMPETITOR} data points each")
+def __getattr__(name: str):
+    if name == 'DeepDataScraper':
+        from .base_scraper import DeepDataScraper
+        return DeepDataScraper
+    if name in SCRAPER_CLASSES:
+        from .registry import load_class
+        return load_class(name)
+    if name == 'scrape_tier_1_competitors':
+        from .tier1_scrapers import scrape_tier_1_competitors
+        return scrape_tier_1_competitors
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,62 @@
+"""
+Single-competitor scraping CLI
+
+Imports only the requested competitor's scraper module, so a one-off run
+starts without loading the other scrapers.
+
+Usage:
+    python -m scrapers McRent
+    python -m scrapers "Cruise America" --save
+    python -m scrapers --list
+"""
+
+import argparse
+import asyncio
+import sys
+
+from . import DATA_POINTS_PER_COMPETITOR, TOTAL_COMPETITORS, __version__
+from .registry import create_scraper, registered_competitors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scrape one competitor")
+    parser.add_argument('competitor', nargs='?', help="Competitor name, e.g. Roadsurfer")
+    parser.add_argument('--list', action='store_true', help="List competitors with a scraper")
+    parser.add_argument('--browserless', action='store_true', help="Use Browserless instead of a local browser")
+    parser.add_argument('--save', action='store_true', help="Save the result to the database")
+    args = parser.parse_args()
+
+    try:
+        print(f"🎯 Focused Intelligence Scrapers v{__version__}")
+        print(f"   {TOTAL_COMPETITORS} competitors • {DATA_POINTS_PER_COMPETITOR} data points each")
+    except UnicodeEncodeError:
+        # Fallback for Windows console without UTF-8 support
+        print(f"[TARGET] Focused Intelligence Scrapers v{__version__}")
+        print(f"   {TOTAL_COMPETITORS} competitors - {DATA_POINTS_PER_COMPETITOR} data points each")
+
+    if args.list or not args.competitor:
+        print("\nCompetitors: " + ", ".join(registered_competitors()))
+        return 0
+
+    scraper = create_scraper(args.competitor, use_browserless=args.browserless)
+    if scraper is None:
+        print(f"No scraper for {args.competitor!r}. Known: {', '.join(registered_competitors())}")
+        return 2
+
+    data = asyncio.run(scraper.scrape())
+
+    print(f"\n{data['company_name']}:")
+    print(f"  Price: €{data['base_nightly_rate']}")
+    print(f"  Completeness: {data['data_completeness_pct']:.1f}%")
+    print(f"  Strategy: {data['scraping_strategy_used']}")
+
+    if args.save:
+        from database.models import add_price_record
+        add_price_record(data)
+        print("  Saved to database")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
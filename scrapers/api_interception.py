@@ -0,0 +1,306 @@
+"""
+Bounded API Response Interception
+Captures pricing data from XHR/fetch responses with flat memory use
+
+Responses are filtered synchronously in the Playwright event handler (hashed
+endpoint lookup, status, content-type and content-length) and only the
+survivors are queued for a small pool of workers that read, parse and run the
+price extractor. The pipeline keeps the extracted candidates plus a byte-capped
+sample of raw payloads for debugging - never every parsed body.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+# URL fragments that mark a request as pricing related
+PRICING_KEYWORDS = (
+    'price', 'pricing', 'quote', 'rate', 'booking', 'availability', 'search',
+    'vehicle', 'reservation', 'rental', 'cost', 'tariff',
+)
+
+
+@dataclass
+class InterceptionConfig:
+    """Limits for one ApiInterceptor.
+
+    Attributes:
+        max_body_bytes (int): Responses larger than this are never read
+        queue_size (int): Responses waiting for a worker; extras are dropped
+        workers (int): Concurrent body readers/extractors
+        sample_bytes (int): Total raw payload bytes kept in samples
+        max_samples (int): Maximum number of sampled payloads
+        max_candidates (int): Maximum number of candidate records kept
+        max_endpoints (int): Maximum number of tracked endpoint URLs
+    """
+    max_body_bytes: int = 2 * 1024 * 1024
+    queue_size: int = 32
+    workers: int = 2
+    sample_bytes: int = 512 * 1024
+    max_samples: int = 20
+    max_candidates: int = 500
+    max_endpoints: int = 500
+
+
+def is_pricing_request(url: str) -> bool:
+    """Whether a request URL looks like a pricing API call"""
+    url = url.lower()
+    if not any(keyword in url for keyword in PRICING_KEYWORDS):
+        return False
+    return 'api' in url or url.endswith('.json') or '/graphql' in url
+
+
+class ApiInterceptor:
+    """Request/response listener feeding a bounded extraction queue.
+
+    Args:
+        extractor: Called with each parsed JSON payload, returns candidate prices
+        on_candidates: Called with each record whose extractor found candidates
+        loose_extractor: Optional second pass returning looser matches, kept
+            apart on the record and never passed to on_candidates
+        config: Queue, size and sample limits
+        label: Name used in log messages
+
+    Attributes:
+        endpoints (List[Dict]): Tracked pricing endpoints (url, method, timestamp)
+        candidates (List[Dict]): Records with extracted prices (url, status, prices,
+            loose_prices, timestamp)
+        samples (List[Dict]): Raw parsed payloads (url, status, data, size, timestamp), byte-capped
+        stats (Dict[str, int]): Counters for every filter and outcome
+    """
+
+    def __init__(
+        self,
+        extractor: Callable[[Any], List[float]],
+        on_candidates: Optional[Callable[[Dict], None]] = None,
+        config: Optional[InterceptionConfig] = None,
+        label: str = '',
+        loose_extractor: Optional[Callable[[Any], List[float]]] = None
+    ):
+        self.extractor = extractor
+        self.on_candidates = on_candidates
+        self.loose_extractor = loose_extractor
+        self.config = config or InterceptionConfig()
+        self.label = label
+
+        self._endpoints: Dict[str, Dict] = {}
+        self._accept_keywords: tuple = ()
+        self.candidates: List[Dict] = []
+        self.samples: List[Dict] = []
+        self._sample_bytes_used = 0
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._pages: List[Any] = []
+
+        self.stats = {
+            'responses_seen': 0,
+            'queued': 0,
+            'dropped_queue_full': 0,
+            'skipped_status': 0,
+            'skipped_content_type': 0,
+            'skipped_size': 0,
+            'parsed': 0,
+            'parse_errors': 0,
+            'candidates': 0,
+        }
+
+    @property
+    def endpoints(self) -> List[Dict]:
+        return list(self._endpoints.values())
+
+    def attach(self, page):
+        """Start listening to a page's requests and responses"""
+        page.on("request", self._on_request)
+        page.on("response", self._on_response)
+        self._pages.append(page)
+
+    def accept_keywords(self, keywords: Iterable[str]):
+        """Also process responses whose URL contains any of these keywords,
+        whether or not the request was classified as a pricing endpoint"""
+        self._accept_keywords = tuple(sorted(set(self._accept_keywords) | {k.lower() for k in keywords}))
+
+    def track(self, url: str, method: str = 'GET'):
+        """Register a pricing endpoint URL"""
+        if url in self._endpoints or len(self._endpoints) >= self.config.max_endpoints:
+            return
+        self._endpoints[url] = {'url': url, 'method': method, 'timestamp': datetime.now()}
+        logger.info(f"🎯 Pricing API detected: {url[:80]}...")
+
+    def candidate_prices(
+        self,
+        keywords: Optional[Iterable[str]] = None,
+        since: Optional[datetime] = None,
+        include_loose: bool = False
+    ) -> List[float]:
+        """Extracted prices in capture order, optionally limited to response
+        URLs containing any of the keywords and to records captured since a time.
+        Loose matches follow each record's prices when include_loose is set"""
+        keywords = tuple(k.lower() for k in keywords) if keywords is not None else None
+        prices = []
+        for record in self.candidates:
+            if since is not None and record['timestamp'] < since:
+                continue
+            if keywords is not None and not any(k in record['url'].lower() for k in keywords):
+                continue
+            prices.extend(record['prices'])
+            if include_loose:
+                prices.extend(record['loose_prices'])
+        return prices
+
+    def _on_request(self, request):
+        if is_pricing_request(request.url):
+            self.track(request.url, request.method)
+
+    def _wanted(self, url: str) -> bool:
+        if url in self._endpoints:
+            return True
+        if self._accept_keywords:
+            lowered = url.lower()
+            return any(keyword in lowered for keyword in self._accept_keywords)
+        return False
+
+    def _on_response(self, response):
+        """Cheap synchronous filters; only survivors reach the queue"""
+        self.stats['responses_seen'] += 1
+        if not self._wanted(response.url):
+            return
+
+        if not 200 <= response.status < 300:
+            self.stats['skipped_status'] += 1
+            return
+
+        headers = response.headers
+        if 'json' not in headers.get('content-type', '').lower():
+            self.stats['skipped_content_type'] += 1
+            return
+
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            length = 0
+        if length > self.config.max_body_bytes:
+            self.stats['skipped_size'] += 1
+            logger.debug(f"Skipping {length} byte API response: {response.url[:60]}...")
+            return
+
+        try:
+            self._queue.put_nowait(response)
+        except asyncio.QueueFull:
+            self.stats['dropped_queue_full'] += 1
+            return
+        self.stats['queued'] += 1
+        self._ensure_workers()
+
+    def _ensure_workers(self):
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.config.workers:
+            self._workers.append(asyncio.get_running_loop().create_task(self._worker()))
+
+    async def _worker(self):
+        while True:
+            response = await self._queue.get()
+            try:
+                await self._process(response)
+            except Exception as e:
+                self.stats['parse_errors'] += 1
+                logger.debug(f"API response processing error: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, response):
+        # Chunked responses carry no content-length, so check the real size too
+        body = await response.body()
+        if len(body) > self.config.max_body_bytes:
+            self.stats['skipped_size'] += 1
+            return
+
+        data = json.loads(body)
+        self.stats['parsed'] += 1
+        now = datetime.now()
+
+        if (len(self.samples) < self.config.max_samples
+                and self._sample_bytes_used + len(body) <= self.config.sample_bytes):
+            self.samples.append({
+                'url': response.url, 'status': response.status, 'data': data,
+                'size': len(body), 'timestamp': now
+            })
+            self._sample_bytes_used += len(body)
+
+        prices = [price for price in self.extractor(data) if price]
+        loose = []
+        if self.loose_extractor:
+            loose = [price for price in self.loose_extractor(data) if price and price not in prices]
+        if not (prices or loose) or len(self.candidates) >= self.config.max_candidates:
+            return
+
+        record = {
+            'url': response.url, 'status': response.status, 'prices': prices,
+            'loose_prices': loose, 'timestamp': now
+        }
+        self.candidates.append(record)
+        self.stats['candidates'] += 1
+        logger.info(f"✅ Captured {len(prices) + len(loose)} API price(s) from: {response.url[:60]}...")
+
+        if prices and self.on_candidates:
+            self.on_candidates(record)
+
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued response has been processed.
+
+        Returns:
+            bool: False if the timeout expired with work still queued
+        """
+        if not self._workers:
+            return self._queue.empty()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.debug(f"API queue for {self.label} not drained after {timeout}s")
+            return False
+
+    async def close(self, timeout: float = 5.0):
+        """Drain, stop the workers and detach from every page"""
+        await self.drain(timeout)
+
+        for page in self._pages:
+            try:
+                page.remove_listener("request", self._on_request)
+                page.remove_listener("response", self._on_response)
+            except Exception as e:
+                logger.debug(f"Listener removal error (non-critical): {e}")
+        self._pages = []
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    def absorb(self, other: 'ApiInterceptor'):
+        """Fold another interceptor's results into this one, respecting limits"""
+        for url, endpoint in other._endpoints.items():
+            if url not in self._endpoints and len(self._endpoints) < self.config.max_endpoints:
+                self._endpoints[url] = endpoint
+
+        room = self.config.max_candidates - len(self.candidates)
+        self.candidates.extend(other.candidates[:max(0, room)])
+
+        for sample in other.samples:
+            if (len(self.samples) >= self.config.max_samples
+                    or self._sample_bytes_used + sample['size'] > self.config.sample_bytes):
+                break
+            self.samples.append(sample)
+            self._sample_bytes_used += sample['size']
+
+        for key, value in other.stats.items():
+            self.stats[key] = self.stats.get(key, 0) + value
@@ -0,0 +1,360 @@
+"""
+Botasaurus Adapter
+Runs the synchronous Botasaurus scrapers as awaitable tasks
+
+The Botasaurus modules block on time.sleep and driver calls, so they run on
+a bounded thread pool. BotasaurusScraper gives them the interface
+ParallelScraper expects (company_name, config, data, scrape(),
+calculate_completeness()), so they share the engine's concurrency, per-domain
+and rate limits with the Playwright scrapers in a single run.
+
+Drivers are reused rather than launched per call:
+- @browser functions run with reuse_driver=True, so the function's own
+  driver pool keeps at most one idle driver per worker
+- Plain functions taking (driver, data) get a per-worker-thread driver
+  from driver_factory
+
+Usage:
+    executor = BotasaurusExecutor(max_workers=2)
+    scrapers = [*my_playwright_scrapers, *production_scrapers(executor)]
+    try:
+        results = await ParallelScraper().scrape_all(scrapers)
+    finally:
+        executor.shutdown()
+
+Note: a cancelled task (scraper_timeout, total_timeout) stops before its next
+attempt, but the attempt already running finishes in its worker thread.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+try:
+    from core_config import config as sys_config
+    BOTASAURUS_WORKERS = sys_config.scraping.BOTASAURUS_WORKERS
+except (ImportError, AttributeError):
+    BOTASAURUS_WORKERS = 2
+
+
+def is_browser_task(func: Callable) -> bool:
+    """Whether func is a Botasaurus @browser-decorated function"""
+    return hasattr(func, '_driver_pool') and callable(getattr(func, 'close', None))
+
+
+def default_driver_factory():
+    """Headless Botasaurus driver for plain (driver, data) functions"""
+    from botasaurus.browser import Driver
+    return Driver(headless=True, block_images=True)
+
+
+class BotasaurusExecutor:
+    """
+    Bounded thread pool for synchronous Botasaurus work.
+
+    Args:
+        max_workers: Concurrent browsers (threads)
+        driver_factory: Creates a driver for plain (driver, data) functions;
+            one per worker thread, reused across calls
+        browser_overrides: Keyword overrides passed to every @browser call
+    """
+
+    def __init__(
+        self,
+        max_workers: int = BOTASAURUS_WORKERS,
+        driver_factory: Callable[[], Any] = default_driver_factory,
+        browser_overrides: Optional[Dict[str, Any]] = None
+    ):
+        self.max_workers = max_workers
+        self.driver_factory = driver_factory
+        # Results are collected by the caller, so skip Botasaurus' output files
+        self.browser_overrides = {'reuse_driver': True, 'output': None, 'raise_exception': True}
+        self.browser_overrides.update(browser_overrides or {})
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='botasaurus')
+        self._local = threading.local()
+        self._drivers: List[Any] = []
+        self._browser_funcs: List[Callable] = []
+        self._lock = threading.Lock()
+
+    def _thread_driver(self):
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = self.driver_factory()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _call(self, func: Callable, data: Any) -> Any:
+        if is_browser_task(func):
+            return func(data, **self.browser_overrides)
+        return func(self._thread_driver(), data)
+
+    async def run(self, func: Callable, data: Any) -> Any:
+        """
+        Run one Botasaurus call on the pool.
+
+        Args:
+            func: @browser function called as func(data), or a plain
+                function called as func(driver, data)
+            data: Task data
+
+        Returns:
+            The function's return value
+        """
+        if is_browser_task(func) and func not in self._browser_funcs:
+            self._browser_funcs.append(func)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(self._call, func, data))
+
+    def shutdown(self, wait: bool = True):
+        """Stop the pool and close every reused driver"""
+        self._pool.shutdown(wait=wait)
+
+        for func in self._browser_funcs:
+            try:
+                func.close()
+            except Exception as e:
+                logger.debug(f"Driver pool close error (non-critical): {e}")
+        self._browser_funcs = []
+
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.close()
+            except Exception as e:
+                logger.debug(f"Driver close error (non-critical): {e}")
+
+
+def _default_success(result: Any) -> bool:
+    return bool(result) and (not isinstance(result, dict) or result.get('success', True))
+
+
+class BotasaurusScraper:
+    """
+    ParallelScraper-compatible wrapper around a synchronous Botasaurus function.
+
+    Attempts run in order until one succeeds (e.g. alternative URLs or
+    strategies for the same competitor), mirroring the scrape_all_* loops.
+
+    Args:
+        company_name: Competitor name
+        func: @browser function or plain (driver, data) function
+        attempts: Data for each attempt, tried in order
+        executor: Shared BotasaurusExecutor
+        homepage: URL used by ParallelScraper for per-domain limits
+        is_success: Decides whether an attempt's result ends the loop
+    """
+
+    def __init__(
+        self,
+        company_name: str,
+        func: Callable,
+        attempts: List[Any],
+        executor: BotasaurusExecutor,
+        homepage: str = '',
+        is_success: Callable[[Any], bool] = _default_success
+    ):
+        self.company_name = company_name
+        self.func = func
+        self.attempts = attempts
+        self.executor = executor
+        self.is_success = is_success
+        self.config = {'urls': {'homepage': homepage}}
+        self.data: Dict[str, Any] = {
+            'company_name': company_name,
+            'notes': None,
+            'data_completeness_pct': 0,
+        }
+
+    async def scrape(self) -> Dict[str, Any]:
+        last_result, last_error, index = None, None, 0
+        for index, data in enumerate(self.attempts, 1):
+            try:
+                last_result, last_error = await self.executor.run(self.func, data), None
+            except Exception as e:
+                last_result, last_error = None, e
+                logger.warning(f"❌ {self.company_name}: attempt {index}/{len(self.attempts)} failed - {e}")
+                continue
+            if self.is_success(last_result):
+                break
+            logger.info(f"🔄 {self.company_name}: attempt {index}/{len(self.attempts)} unsuccessful")
+
+        if last_result is None:
+            raise last_error or RuntimeError(
+                f"{getattr(self.func, '__name__', 'Botasaurus task')} returned no result"
+            )
+
+        if isinstance(last_result, dict):
+            self.data.update({k: v for k, v in last_result.items() if k != 'company_name'})
+        else:
+            self.data['results'] = last_result
+        self.data['attempts_used'] = index
+        self.data['data_completeness_pct'] = await self.calculate_completeness()
+        return self.data
+
+    async def calculate_completeness(self) -> float:
+        """The function's own completeness if it reports one, else 100 for a success"""
+        reported = self.data.get('data_completeness_pct')
+        if reported:
+            return reported
+        return 100.0 if self.data.get('success') else 0.0
+
+
+# Factories mirroring each module's scrape_all_* loop. Imports are lazy so
+# this module does not require botasaurus until a factory is used.
+
+def universal_scrapers(executor: BotasaurusExecutor) -> List[BotasaurusScraper]:
+    """One task per competitor in universal_botasaurus_scraper"""
+    from scrapers.universal_botasaurus_scraper import COMPETITOR_CONFIGS, scrape_competitor
+
+    return [
+        BotasaurusScraper(name, scrape_competitor, [name], executor, homepage=config['url'])
+        for name, config in COMPETITOR_CONFIGS.items()
+    ]
+
+
+def production_scrapers(executor: BotasaurusExecutor) -> List[BotasaurusScraper]:
+    """One task per competitor, trying each of its URLs (production_all_sites_scraper)"""
+    from scrapers.production_all_sites_scraper import COMPETITORS, scrape_competitor_production
+
+    return [
+        BotasaurusScraper(
+            competitor['name'],
+            scrape_competitor_production,
+            [{'competitor': competitor, 'url': url} for url in competitor['urls']],
+            executor,
+            homepage=competitor['urls'][0] if competitor['urls'] else ''
+        )
+        for competitor in sorted(COMPETITORS, key=lambda c: c['priority'], reverse=True)
+    ]
+
+
+def comprehensive_scrapers(executor: BotasaurusExecutor) -> List[BotasaurusScraper]:
+    """One task per competitor, trying strategy x location (comprehensive_calendar_scraper)"""
+    from scrapers.comprehensive_calendar_scraper import ALL_COMPETITORS_CONFIG, scrape_competitor_comprehensive
+
+    scrapers = []
+    for config in ALL_COMPETITORS_CONFIG:
+        attempts = [
+            {'config': config, 'strategy': strategy, 'location': location}
+            for strategy in config['strategies']
+            for location in config['locations']
+        ]
+        scrapers.append(BotasaurusScraper(
+            config['name'], scrape_competitor_comprehensive, attempts, executor,
+            homepage=config.get('base_url', '')
+        ))
+    return scrapers
+
+
+def calendar_scrapers(executor: BotasaurusExecutor) -> List[BotasaurusScraper]:
+    """One task per competitor and location (live_pricing_calendar_scraper)"""
+    from scrapers.live_pricing_calendar_scraper import (
+        CALENDAR_COMPETITORS, CALENDAR_CONFIG, scrape_competitor_calendar
+    )
+
+    return [
+        BotasaurusScraper(
+            config['name'],
+            scrape_competitor_calendar,
+            [{
+                'config': config,
+                'location': location,
+                'start_date': CALENDAR_CONFIG['start_date'],
+                'end_date': CALENDAR_CONFIG['end_date']
+            }],
+            executor,
+            homepage=config.get('base_url', '')
+        )
+        for config in CALENDAR_COMPETITORS
+        for location in config['locations']
+    ]
+
+
+def _ultimate_attempt(driver, data: Dict) -> Dict:
+    from scrapers.ultimate_competitor_scraper import scrape_competitor_ultimate
+    return scrape_competitor_ultimate(driver, data['company'], data['urls'], data['user_agent'])
+
+
+def ultimate_scrapers(executor: BotasaurusExecutor) -> List[BotasaurusScraper]:
+    """One task per failing competitor, trying each user agent (ultimate_competitor_scraper)"""
+    from scrapers.ultimate_competitor_scraper import ALTERNATIVE_URLS, USER_AGENTS
+
+    return [
+        BotasaurusScraper(
+            company,
+            _ultimate_attempt,
+            [{'company': company, 'urls': urls, 'user_agent': ua} for ua in USER_AGENTS],
+            executor,
+            homepage=urls[0] if urls else ''
+        )
+        for company, urls in ALTERNATIVE_URLS.items()
+    ]
+
+
+# Work queue integration: one job per calendar search cell
+# (competitor x location x date window), consumable by any worker
+
+CALENDAR_CELL_JOB = 'calendar_cell'
+
+
+def enqueue_calendar_matrix(queue, windows: Optional[List[tuple]] = None, priority: int = 0) -> List[Optional[int]]:
+    """
+    Queue the live pricing calendar search matrix.
+
+    Args:
+        queue: utils.work_queue.WorkQueue
+        windows: (start_date, end_date) pairs (default: CALENDAR_CONFIG's window)
+        priority: Job priority
+
+    Returns:
+        Job ids (None for cells already pending)
+    """
+    from scrapers.live_pricing_calendar_scraper import CALENDAR_COMPETITORS, CALENDAR_CONFIG
+
+    windows = windows or [(CALENDAR_CONFIG['start_date'], CALENDAR_CONFIG['end_date'])]
+    jobs = []
+    for config in CALENDAR_COMPETITORS:
+        for location in config['locations']:
+            for start_date, end_date in windows:
+                cell = {
+                    'company_name': config['name'],
+                    'location': location,
+                    'start_date': str(start_date),
+                    'end_date': str(end_date),
+                }
+                jobs.append({
+                    'kind': CALENDAR_CELL_JOB,
+                    'payload': cell,
+                    'priority': priority,
+                    'dedupe_key': f"{CALENDAR_CELL_JOB}:{config['name']}:{location}:{start_date}:{end_date}",
+                })
+    return queue.enqueue_many(jobs)
+
+
+def calendar_cell_handler(executor: BotasaurusExecutor) -> Callable[[Dict], Any]:
+    """QueueWorker handler running one calendar cell on the executor"""
+    from datetime import date
+    from scrapers.live_pricing_calendar_scraper import CALENDAR_COMPETITORS, scrape_competitor_calendar
+
+    configs = {config['name']: config for config in CALENDAR_COMPETITORS}
+
+    async def handle(cell: Dict) -> Dict:
+        result = await executor.run(scrape_competitor_calendar, {
+            'config': configs[cell['company_name']],
+            'location': cell['location'],
+            'start_date': date.fromisoformat(cell['start_date']),
+            'end_date': date.fromisoformat(cell['end_date']),
+        })
+        if not result or not result.get('success'):
+            raise RuntimeError((result or {}).get('notes') or 'calendar scrape failed')
+        return result
+
+    return handle
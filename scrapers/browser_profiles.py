@@ -0,0 +1,141 @@
+"""
+Browser Launch Profiles
+Named Chromium launch and context settings for local and remote browsers
+
+- lean: production default. Headless shell with GPU, extensions, background
+  networking and component updates off, a capped renderer process count and
+  a laptop-sized viewport. Action and navigation timeouts are separate, so a
+  missing selector fails fast while slow page loads still get the full budget.
+- full: the previous settings (1920x1080, 90 s for everything), for
+  screenshot and evidence runs.
+
+The profile is chosen with BROWSER_PROFILE (core_config) and can be swapped
+per scraper by assigning scraper.browser_profile.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+# Needed when Chromium runs as root inside containers
+SANDBOX_ARGS = ['--no-sandbox', '--disable-setuid-sandbox']
+
+LEAN_ARGS = [
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-dev-shm-usage',
+    '--no-first-run',
+    '--mute-audio',
+]
+
+
+@dataclass
+class BrowserProfile:
+    """Launch and context settings for one kind of scrape.
+
+    Attributes:
+        name (str): Profile name used in config and logs
+        headless (bool): Run without a window
+        channel (str): Playwright browser channel (None = bundled Chromium;
+            headless runs use its headless shell build)
+        args (List[str]): Extra Chromium command-line flags
+        renderer_process_limit (int): Max renderer processes (0 = Chromium default)
+        viewport (Dict[str, int]): Context viewport
+        user_agent (str): Context user agent
+        default_timeout_ms (int): Timeout for clicks, selectors and other actions
+        navigation_timeout_ms (int): Timeout for goto/reload/wait_for_load_state
+    """
+    name: str
+    headless: bool = True
+    channel: Optional[str] = None
+    args: List[str] = field(default_factory=list)
+    renderer_process_limit: int = 0
+    viewport: Dict[str, int] = field(default_factory=lambda: {'width': 1920, 'height': 1080})
+    user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    default_timeout_ms: int = 90000
+    navigation_timeout_ms: int = 90000
+
+    def launch_options(self) -> Dict[str, Any]:
+        """Keyword arguments for chromium.launch()"""
+        args = SANDBOX_ARGS + self.args
+        if self.renderer_process_limit:
+            args.append(f'--renderer-process-limit={self.renderer_process_limit}')
+        options: Dict[str, Any] = {'headless': self.headless, 'args': args}
+        if self.channel:
+            options['channel'] = self.channel
+        return options
+
+    def context_options(self) -> Dict[str, Any]:
+        """Keyword arguments for browser.new_context()"""
+        return {'viewport': dict(self.viewport), 'user_agent': self.user_agent}
+
+    def apply_timeouts(self, context):
+        """Set the profile's default action and navigation timeouts on a context"""
+        context.set_default_timeout(self.default_timeout_ms)
+        context.set_default_navigation_timeout(self.navigation_timeout_ms)
+
+
+try:
+    from core_config import config as sys_config
+    DEFAULT_PROFILE = sys_config.scraping.BROWSER_PROFILE
+    BROWSER_CHANNEL = sys_config.scraping.BROWSER_CHANNEL or None
+    RENDERER_PROCESS_LIMIT = sys_config.scraping.RENDERER_PROCESS_LIMIT
+    USER_AGENT = sys_config.scraping.USER_AGENT
+    ACTION_TIMEOUT = sys_config.scraping.BROWSER_ACTION_TIMEOUT
+    NAVIGATION_TIMEOUT = sys_config.scraping.SCRAPING_TIMEOUT
+except (ImportError, AttributeError):
+    DEFAULT_PROFILE = 'lean'
+    BROWSER_CHANNEL = None
+    RENDERER_PROCESS_LIMIT = 4
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    ACTION_TIMEOUT = 30000
+    NAVIGATION_TIMEOUT = 60000
+
+BROWSER_PROFILES: Dict[str, BrowserProfile] = {
+    'lean': BrowserProfile(
+        name='lean',
+        channel=BROWSER_CHANNEL,
+        args=LEAN_ARGS,
+        renderer_process_limit=RENDERER_PROCESS_LIMIT,
+        viewport={'width': 1366, 'height': 768},
+        user_agent=USER_AGENT,
+        default_timeout_ms=ACTION_TIMEOUT,
+        navigation_timeout_ms=max(NAVIGATION_TIMEOUT, 30000),
+    ),
+    'full': BrowserProfile(name='full', user_agent=USER_AGENT),
+}
+
+
+def get_browser_profile(name: Optional[str] = None) -> BrowserProfile:
+    """
+    Look up a profile by name (default: BROWSER_PROFILE).
+
+    Raises:
+        ValueError: If the name is not a known profile
+    """
+    name = name or DEFAULT_PROFILE
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile {name!r} (known: {', '.join(BROWSER_PROFILES)})")
+    return BROWSER_PROFILES[name]
+
+
+async def launch_browser(playwright, profile: BrowserProfile):
+    """
+    Launch local Chromium with a profile.
+
+    A configured channel that is not installed falls back to the bundled
+    Chromium rather than failing the scrape.
+    """
+    options = profile.launch_options()
+    try:
+        return await playwright.chromium.launch(**options)
+    except Exception as e:
+        if 'channel' not in options:
+            raise
+        logger.warning(f"⚠️ Browser channel {options.pop('channel')!r} unavailable ({e}), using bundled Chromium")
+        return await playwright.chromium.launch(**options)
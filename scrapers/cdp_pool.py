@@ -0,0 +1,351 @@
+"""
+CDP Endpoint Pool
+Spreads scrapes over remote Chromium instances with local-browser failover
+
+An endpoint is any Chrome DevTools Protocol address: Browserless
+(wss://<region>.browserless.io?token=...), a browser on another machine, or a
+local `chromium --remote-debugging-port` process. The pool:
+- keeps one connection per endpoint and reuses it across scrapes; each scrape
+  opens its own context on it
+- leases the least-loaded healthy endpoint (active scrapes / max_sessions)
+- puts an endpoint that fails to connect on an exponential cooldown and
+  probes /json/version before reconnecting to it
+- returns None when no endpoint can take the scrape, so the caller launches
+  a local browser instead
+
+Connections belong to the event loop they were opened on; when a new loop
+uses the pool (a later asyncio.run), they are dropped and reopened.
+
+Local testing with several Chromium processes:
+    chromium --headless=new --remote-debugging-port=9222 &
+    chromium --headless=new --remote-debugging-port=9223 &
+    CDP_ENDPOINTS=ws://127.0.0.1:9222,ws://127.0.0.1:9223 python run_intelligence.py
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from loguru import logger
+
+try:
+    from core_config import config as sys_config
+    CDP_ENDPOINTS = [url.strip() for url in sys_config.scraping.CDP_ENDPOINTS.split(',') if url.strip()]
+    CDP_MAX_SESSIONS = sys_config.scraping.CDP_MAX_SESSIONS
+    CDP_COOLDOWN = sys_config.scraping.CDP_COOLDOWN
+    CONNECT_TIMEOUT = sys_config.scraping.SCRAPING_TIMEOUT
+except (ImportError, AttributeError):
+    CDP_ENDPOINTS = []
+    CDP_MAX_SESSIONS = 4
+    CDP_COOLDOWN = 30.0
+    CONNECT_TIMEOUT = 60000
+
+
+def redact(url: str) -> str:
+    """Endpoint URL without its query string (Browserless tokens) for logs"""
+    return urlunsplit(urlsplit(url)._replace(query=''))
+
+
+def connect_url(url: str) -> str:
+    """
+    URL to hand to connect_over_cdp.
+
+    A bare ws://host:port is rewritten to http://host:port so Playwright looks
+    up the browser's /devtools/browser/<id> socket itself; plain Chromium only
+    accepts that full path, while Browserless accepts any.
+    """
+    parts = urlsplit(url)
+    if parts.scheme in ('ws', 'wss') and parts.path in ('', '/') and not parts.query:
+        return urlunsplit(parts._replace(scheme='http' if parts.scheme == 'ws' else 'https'))
+    return url
+
+
+def version_url(url: str) -> str:
+    """The endpoint's /json/version URL, used as a health probe"""
+    parts = urlsplit(url)
+    scheme = {'ws': 'http', 'wss': 'https'}.get(parts.scheme, parts.scheme)
+    return urlunsplit(parts._replace(scheme=scheme, path='/json/version'))
+
+
+@dataclass
+class CDPEndpoint:
+    """One CDP address and its pool bookkeeping.
+
+    Attributes:
+        url (str): CDP address (ws://, wss:// or http://)
+        max_sessions (int): Concurrent scrapes allowed on this endpoint
+        active (int): Scrapes currently holding a lease
+        leases (int): Leases handed out in total
+        failures (int): Consecutive failed connects/probes
+        healthy (bool): False while cooling down after a failure
+        retry_at (float): Clock time after which a cooling endpoint is retried
+    """
+    url: str
+    max_sessions: int = CDP_MAX_SESSIONS
+    active: int = 0
+    leases: int = 0
+    failures: int = 0
+    healthy: bool = True
+    retry_at: float = 0.0
+    browser: Any = None
+
+    @property
+    def load(self) -> float:
+        return self.active / max(self.max_sessions, 1)
+
+    def connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class CDPLease:
+    """A scrape's claim on a pooled connection; release it when done"""
+
+    def __init__(self, pool: 'CDPEndpointPool', endpoint: CDPEndpoint, browser: Any):
+        self.pool = pool
+        self.endpoint = endpoint
+        self.browser = browser
+        self.generation = pool.generation
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.pool._release(self)
+
+
+class CDPEndpointPool:
+    """
+    Least-loaded pool of CDP endpoints with health tracking.
+
+    Args:
+        urls: CDP endpoint addresses
+        max_sessions: Concurrent scrapes per endpoint
+        connect_timeout_ms: connect_over_cdp timeout
+        cooldown: Seconds an endpoint rests after its first failure (doubles
+            per consecutive failure, up to max_cooldown)
+        max_cooldown: Longest rest after repeated failures
+        acquire_timeout: Seconds to wait for a free session when every healthy
+            endpoint is full, before giving up (caller launches locally)
+        connector: Opens a connection: await connector(url, timeout_ms)
+        probe: Health check: await probe(url) -> bool
+        clock: Time source (monotonic seconds)
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_sessions: int = CDP_MAX_SESSIONS,
+        connect_timeout_ms: int = CONNECT_TIMEOUT,
+        cooldown: float = CDP_COOLDOWN,
+        max_cooldown: float = 600.0,
+        acquire_timeout: float = 30.0,
+        connector: Optional[Callable[[str, int], Awaitable[Any]]] = None,
+        probe: Optional[Callable[[str], Awaitable[bool]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.endpoints = [CDPEndpoint(url, max_sessions=max_sessions) for url in urls]
+        self.connect_timeout_ms = connect_timeout_ms
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.acquire_timeout = acquire_timeout
+        self.connector = connector or self._playwright_connect
+        self.probe = probe or self._http_probe
+        self.clock = clock
+
+        self._loop = None
+        self.generation = 0
+        self._playwright = None
+        self._released: Optional[asyncio.Event] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # Connections and leases from a finished loop cannot be used or closed here
+        self._loop = loop
+        self.generation += 1
+        self._playwright = None
+        self._released = asyncio.Event()
+        self._locks = {endpoint.url: asyncio.Lock() for endpoint in self.endpoints}
+        for endpoint in self.endpoints:
+            endpoint.browser = None
+            endpoint.active = 0
+
+    async def _playwright_connect(self, url: str, timeout_ms: int):
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.connect_over_cdp(connect_url(url), timeout=timeout_ms)
+
+    async def _http_probe(self, url: str) -> bool:
+        import aiohttp
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=5)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(version_url(url)) as response:
+                    return response.status == 200
+        except Exception as e:
+            logger.debug(f"CDP probe failed for {redact(url)}: {e}")
+            return False
+
+    def _available(self, endpoint: CDPEndpoint) -> bool:
+        return endpoint.healthy or self.clock() >= endpoint.retry_at
+
+    def _mark_failed(self, endpoint: CDPEndpoint, reason: Any):
+        endpoint.failures += 1
+        endpoint.healthy = False
+        endpoint.browser = None
+        rest = min(self.cooldown * 2 ** (endpoint.failures - 1), self.max_cooldown)
+        endpoint.retry_at = self.clock() + rest
+        logger.warning(f"⚠️ CDP endpoint {redact(endpoint.url)} unavailable ({reason}), retrying in {rest:.0f}s")
+
+    def _mark_healthy(self, endpoint: CDPEndpoint):
+        if not endpoint.healthy:
+            logger.info(f"✅ CDP endpoint {redact(endpoint.url)} is back")
+        endpoint.failures = 0
+        endpoint.healthy = True
+
+    async def _connection(self, endpoint: CDPEndpoint):
+        """Reuse or open the endpoint's connection; None if it is down"""
+        async with self._locks[endpoint.url]:
+            if endpoint.connected():
+                return endpoint.browser
+            endpoint.browser = None
+
+            if not endpoint.healthy and not await self.probe(endpoint.url):
+                self._mark_failed(endpoint, 'health probe failed')
+                return None
+            try:
+                endpoint.browser = await self.connector(endpoint.url, self.connect_timeout_ms)
+            except Exception as e:
+                self._mark_failed(endpoint, e)
+                return None
+
+            self._mark_healthy(endpoint)
+            logger.info(f"✅ Connected to CDP endpoint {redact(endpoint.url)}")
+            return endpoint.browser
+
+    async def acquire(self) -> Optional[CDPLease]:
+        """
+        Lease a connection on the least-loaded healthy endpoint.
+
+        Returns:
+            CDPLease, or None if every endpoint is down or stayed full for
+            acquire_timeout seconds
+        """
+        self._bind_loop()
+        deadline = self.clock() + self.acquire_timeout
+
+        while True:
+            candidates = [e for e in self.endpoints if self._available(e)]
+            if not candidates:
+                return None
+
+            free = sorted(
+                (e for e in candidates if e.active < e.max_sessions),
+                key=lambda e: (e.load, e.leases)
+            )
+            if free:
+                endpoint = free[0]
+                # Hold the session while connecting so concurrent acquires spread out
+                endpoint.active += 1
+                browser = await self._connection(endpoint)
+                if browser is not None:
+                    endpoint.leases += 1
+                    return CDPLease(self, endpoint, browser)
+                endpoint.active -= 1
+                continue
+
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return None
+            self._released.clear()
+            try:
+                await asyncio.wait_for(self._released.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def _release(self, lease: CDPLease):
+        endpoint = lease.endpoint
+        if lease.generation == self.generation:
+            endpoint.active = max(endpoint.active - 1, 0)
+        if endpoint.browser is lease.browser and not endpoint.connected():
+            endpoint.browser = None
+        if self._released is not None:
+            self._released.set()
+
+    async def check_health(self) -> Dict[str, bool]:
+        """Probe every endpoint without a live connection; returns url -> healthy"""
+        self._bind_loop()
+        results = {}
+        for endpoint in self.endpoints:
+            if endpoint.connected() or await self.probe(endpoint.url):
+                self._mark_healthy(endpoint)
+            elif endpoint.healthy or self._available(endpoint):
+                self._mark_failed(endpoint, 'health probe failed')
+            results[endpoint.url] = endpoint.healthy
+        return results
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint load and health (URLs redacted)"""
+        return [{
+            'endpoint': redact(e.url),
+            'active': e.active,
+            'max_sessions': e.max_sessions,
+            'leases': e.leases,
+            'healthy': e.healthy,
+            'connected': e.connected(),
+            'failures': e.failures,
+        } for e in self.endpoints]
+
+    async def close(self):
+        """Close every pooled connection (call from the loop that opened them)"""
+        for endpoint in self.endpoints:
+            if endpoint.connected():
+                try:
+                    await endpoint.browser.close()
+                except Exception as e:
+                    logger.debug(f"CDP disconnect error (non-critical): {e}")
+            endpoint.browser = None
+            endpoint.active = 0
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Playwright stop error (non-critical): {e}")
+            self._playwright = None
+
+
+# Pools are shared per endpoint list, so connections are reused across scrapers
+_POOLS: Dict[Tuple[str, ...], CDPEndpointPool] = {}
+
+
+def browserless_endpoint(region: str, api_key: str) -> str:
+    return f"wss://{region}.browserless.io?token={api_key}"
+
+
+def get_cdp_pool(
+    use_browserless: bool = False,
+    browserless_key: str = '',
+    browserless_region: str = 'production-sfo'
+) -> Optional[CDPEndpointPool]:
+    """
+    Shared pool for CDP_ENDPOINTS, plus Browserless when enabled.
+
+    Returns:
+        CDPEndpointPool, or None when there is no remote endpoint to use
+    """
+    urls = list(CDP_ENDPOINTS)
+    if use_browserless and browserless_key:
+        urls.append(browserless_endpoint(browserless_region, browserless_key))
+    if not urls:
+        return None
+
+    key = tuple(urls)
+    if key not in _POOLS:
+        _POOLS[key] = CDPEndpointPool(urls)
+    return _POOLS[key]
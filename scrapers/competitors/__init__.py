@@ -0,0 +1,4 @@
+"""
+Per-competitor scraper modules
+Look classes up through scrapers.registry so only the needed module is imported
+"""
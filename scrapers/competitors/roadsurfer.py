@@ -0,0 +1,1352 @@
+"""
+Roadsurfer Scraper - Tier 1 Daily Monitoring
+#1 competitor, booking simulation with API interception
+"""
+
+import asyncio
+import re
+import statistics
+from datetime import datetime, timedelta
+from loguru import logger
+from ..base_scraper import DeepDataScraper, SubPageJob
+from ..competitor_config import get_competitor_by_name
+
+
+class RoadsurferScraper(DeepDataScraper):
+    """Deep scraper for Roadsurfer - #1 Competitor"""
+
+    # URL fragments of responses worth parsing during booking simulation
+    BOOKING_API_KEYWORDS = (
+        'price', 'booking', 'search', 'quote', 'availability',
+        'vehicle', 'rent', 'rate', 'cost', 'api', 'graphql',
+    )
+    
+    def __init__(self, use_browserless: bool = True):
+        config = get_competitor_by_name("Roadsurfer")
+        super().__init__("Roadsurfer", 1, config, use_browserless)
+        self.data['scraping_strategy_used'] = 'interactive_booking_simulation'
+    
+    async def scrape_deep_data(self, page):
+        """
+        Comprehensive multi-page data collection with enhanced extraction.
+
+        Strategy:
+        1. Homepage - Reviews, promotions, structured data
+        2. Pricing page - Prices, fees, policies
+        3. Booking page - Interactive pricing
+        4. Vehicles page - Fleet info
+        5. Locations page - Station/depot data
+        6. FAQ/Terms - Policies and conditions
+
+        Steps 4-6 do not depend on each other and run in parallel tabs.
+        """
+
+        # 1. Start at homepage for reviews and general info
+        faq_url = None
+        try:
+            homepage_loaded = await self.navigate_smart(page, self.config['urls']['homepage'])
+            if homepage_loaded:
+                # Extract reviews from homepage
+                review_data = await self.extract_customer_reviews(page)
+                self.data['customer_review_avg'] = review_data['avg']
+                self.data['review_count'] = review_data['count']
+
+                # Detect promotions on homepage
+                promotions = await self.detect_promotions(page)
+                self.data['active_promotions'] = promotions
+                if promotions:
+                    self.data['promotion_text'] = promotions[0]['text']
+
+                # Enhanced data extraction from homepage
+                await self.extract_enhanced_data_from_page(page)
+
+                # Resolve the FAQ/Terms link now so its tab can open it directly
+                faq_url = await self._find_faq_url(page)
+
+        except Exception as e:
+            logger.debug(f"Homepage extraction error: {e}")
+
+        # 2. Pricing page - Extract pricing, fees, and policies
+        if self.config['urls'].get('pricing'):
+            pricing_loaded = await self.navigate_smart(page, self.config['urls']['pricing'])
+            if pricing_loaded:
+                # Wait for network to be idle (all AJAX calls complete)
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=60000)  # Increased timeout
+                except Exception as e:
+                    logger.debug(f"Network idle wait timeout (non-critical): {e}")
+                
+                # Wait longer for dynamic content to load
+                await asyncio.sleep(5)  # Increased from 3 to 5 seconds
+                
+                # Check if we got an error page
+                if await self._is_error_page(page):
+                    logger.warning("❌ Error page detected on Roadsurfer pricing page")
+                    # Try booking simulation as fallback
+                    logger.info("🎯 Attempting booking simulation for Roadsurfer...")
+                    success = await self._simulate_booking_universal(page, test_location="Munich")
+                    if success and self.data.get('base_nightly_rate'):
+                        self.data['is_estimated'] = False
+                        self.data['extraction_method'] = 'booking_simulation'
+                        logger.info(f"✅ Roadsurfer booking: €{self.data['base_nightly_rate']}/night")
+                        return  # Skip the rest if booking simulation worked
+
+                # Enhanced data extraction from pricing page
+                await self.extract_enhanced_data_from_page(page)
+
+                # Get all text and extract prices AND discounts
+                page_text = await page.evaluate('() => document.body.innerText')
+                prices = await self.extract_prices_from_text(page_text)
+
+                if prices:
+                    # Filter for reasonable per-night prices
+                    night_prices = [p for p in prices if 40 <= p <= 400]
+                    if night_prices:
+                        self.data['base_nightly_rate'] = min(night_prices)
+                        self.data['is_estimated'] = False  # Changed from True - text extraction can be accurate
+                        self.data['extraction_method'] = 'text_extraction'
+                        logger.info(f"✅ Static pricing: €{self.data['base_nightly_rate']}/night")
+
+                # Extract discounts from pricing page
+                await self._extract_discounts_from_text(page_text)
+
+                # Extract mileage info from pricing page
+                await self._extract_mileage_from_text(page_text)
+
+        # 3. If no price yet, try universal booking simulation
+        if not self.data.get('base_nightly_rate') or self.data['base_nightly_rate'] == 0:
+            booking_url = self.config['urls'].get('booking') or self.config['urls'].get('pricing')
+            if booking_url:
+                await self.navigate_smart(page, booking_url)
+            
+            # Try new universal booking simulator first
+            logger.info("🎯 Attempting universal booking simulation...")
+            success = await self._simulate_booking_universal(page, test_location="Berlin, Germany")
+            
+            if success and self.data.get('base_nightly_rate'):
+                logger.info(f"✅ Universal booking: EUR{self.data['base_nightly_rate']}/night")
+            else:
+                # Fallback to old booking simulation
+                await self._simulate_booking_for_pricing(page)
+
+        # 3-4.5. Vehicles, locations and FAQ/Terms are independent - visit them in parallel tabs
+        urls = self.config['urls']
+        subpage_jobs = []
+        if urls.get('vehicles'):
+            subpage_jobs.append(SubPageJob('vehicles', urls['vehicles'], '_scrape_vehicles'))
+        if urls.get('locations'):
+            subpage_jobs.append(SubPageJob('locations', urls['locations'], '_scrape_locations_page'))
+        if faq_url:
+            subpage_jobs.append(SubPageJob('faq_terms', faq_url, '_scrape_faq_and_terms'))
+
+        await self.scrape_subpages_parallel(page, subpage_jobs)
+
+        if not urls.get('locations'):
+            # Try to extract from current page
+            await self._scrape_locations(page)
+
+        # 5. Extract insurance and fees from current page (avoid extra navigation)
+        try:
+            await self._scrape_insurance_and_fees(page)
+        except Exception as e:
+            logger.debug(f"Insurance extraction error: {e}")
+
+        # 6. Extract policies from current page (avoid extra navigation)
+        try:
+            await self._scrape_policies(page)
+        except Exception as e:
+            logger.debug(f"Policy extraction error: {e}")
+
+        # 7. Enhanced review extraction - try to get rating if we only have count
+        try:
+            if not self.data['customer_review_avg'] and self.data['review_count']:
+                await self._extract_trustpilot_rating(page)
+        except Exception as e:
+            logger.debug(f"Trustpilot extraction error: {e}")
+
+        # 8. Try to extract fees from pricing page HTML/API
+        try:
+            if not self.data['insurance_cost_per_day'] or not self.data['cleaning_fee']:
+                await self._extract_fees_from_booking_widget(page)
+        except Exception as e:
+            logger.debug(f"Fee extraction error: {e}")
+
+        # 9. Check for referral and discount codes
+        try:
+            await self._extract_program_features(page)
+        except Exception as e:
+            logger.debug(f"Program features error: {e}")
+
+        # 10. Payment options
+        try:
+            self.data['payment_options'] = await self.detect_payment_options(page)
+        except Exception as e:
+            logger.debug(f"Payment options error: {e}")
+    
+    async def _scrape_pricing_page_static(self, page):
+        """Extract pricing information from static content (fallback method)"""
+        try:
+            # Get all text on page
+            page_text = await page.evaluate('() => document.body.innerText')
+
+            # Extract prices
+            prices = await self.extract_prices_from_text(page_text)
+            if prices:
+                # Assume lowest is base rate
+                self.data['base_nightly_rate'] = min(prices)
+                self.data['is_estimated'] = True
+                logger.info(f"Static extraction: €{self.data['base_nightly_rate']}/night (estimated)")
+
+            # Look for discount percentages
+            discount_patterns = [
+                r'save\s*(\d+)%',
+                r'(\d+)%\s*off',
+                r'discount\s*(\d+)%'
+            ]
+
+            for pattern in discount_patterns:
+                match = re.search(pattern, page_text, re.IGNORECASE)
+                if match:
+                    discount_pct = float(match.group(1))
+                    self.data['early_bird_discount_pct'] = discount_pct
+                    break
+
+            # Check for mileage info
+            if 'unlimited mileage' in page_text.lower():
+                self.data['mileage_limit_km'] = 0
+                self.data['mileage_cost_per_km'] = 0
+            else:
+                # Try to find mileage limit
+                mileage_match = re.search(r'(\d+)\s*km', page_text)
+                if mileage_match:
+                    self.data['mileage_limit_km'] = int(mileage_match.group(1))
+
+        except Exception as e:
+            logger.error(f"Static pricing extraction failed: {e}")
+
+    async def _simulate_booking_for_pricing(self, page):
+        """
+        Enhanced booking simulation with comprehensive strategies.
+
+        Strategies (in order):
+        1. Monitor ALL API calls for pricing data (improved)
+        2. Click booking triggers and fill forms with multiple fallbacks
+        3. Extract from booking results
+        4. Check collected API prices
+        5. Parse embedded JSON-LD
+        6. Static page scraping (fallback)
+        """
+        try:
+            logger.info("🔄 Enhanced booking simulation starting...")
+
+            # Strategy 1: Widen the shared API interceptor to every response that
+            # might carry pricing (it is already attached to the page)
+            started_at = datetime.now()
+            self.interceptor.accept_keywords(self.BOOKING_API_KEYWORDS)
+
+            # Strategy 2: Wait for page to fully load
+            await asyncio.sleep(3)
+
+            # Strategy 3: Look for and click booking triggers
+            await self._click_booking_trigger(page)
+
+            # Strategy 4: Try to fill booking form
+            form_filled = await self._fill_booking_form_comprehensive(page)
+
+            if form_filled:
+                # Wait for results to load
+                await asyncio.sleep(5)
+
+                # Check for price in results
+                price = await self._extract_price_from_results(page)
+                if price:
+                    self.data['base_nightly_rate'] = price
+                    self.data['is_estimated'] = False
+                    logger.info(f"✅ Booking simulation price: €{price}/night")
+                    return
+
+            # Strategy 5: Check collected API prices
+            await self.interceptor.drain()
+            # Only booking responses seen during this simulation, as before
+            api_prices = self.interceptor.candidate_prices(
+                self.BOOKING_API_KEYWORDS, since=started_at, include_loose=True
+            )
+            if api_prices:
+                # Filter reasonable prices and take median
+                valid_prices = [p for p in api_prices if 30 <= p <= 400]
+                if valid_prices:
+                    price = statistics.median(valid_prices)
+                    self.data['base_nightly_rate'] = price
+                    self.data['is_estimated'] = False
+                    logger.info(f"✅ API extracted price: €{price}/night")
+                    return
+
+            # Strategy 6: Parse embedded JSON-LD
+            price = await self._extract_from_json_ld(page)
+            if price:
+                self.data['base_nightly_rate'] = price
+                self.data['is_estimated'] = True
+                logger.info(f"✅ JSON-LD price: €{price}/night")
+                return
+
+            # Strategy 7: Static page scraping (fallback)
+            logger.warning("⚠️ Could not extract pricing after all strategies, trying static fallback")
+            await self._scrape_pricing_page_static(page)
+
+        except Exception as e:
+            logger.error(f"Booking simulation failed: {e}, falling back to static")
+            await self._scrape_pricing_page_static(page)
+
+    def _extract_loose_api_prices(self, data):
+        """Every price-like value in the payload, for the booking simulation's median"""
+        return self._extract_prices_from_json_recursive(data)
+
+    def _extract_prices_from_json_recursive(self, data, depth=0, max_depth=5):
+        """Recursively search JSON for price values"""
+        if depth > max_depth:
+            return []
+
+        prices = []
+
+        if isinstance(data, dict):
+            for key, value in data.items():
+                key_lower = key.lower()
+
+                # Check if this is a price field
+                if any(keyword in key_lower for keyword in [
+                    'price', 'rate', 'cost', 'total', 'amount', 'nightly'
+                ]):
+                    if isinstance(value, (int, float)) and 20 <= value <= 500:
+                        prices.append(float(value))
+                    elif isinstance(value, str):
+                        # Try to extract number from string
+                        match = re.search(r'(\d+(?:\.\d{2})?)', value)
+                        if match:
+                            price = float(match.group(1))
+                            if 20 <= price <= 500:
+                                prices.append(price)
+
+                # Recurse into nested structures
+                if isinstance(value, (dict, list)):
+                    prices.extend(self._extract_prices_from_json_recursive(value, depth+1, max_depth))
+
+        elif isinstance(data, list):
+            for item in data:
+                if isinstance(item, (dict, list)):
+                    prices.extend(self._extract_prices_from_json_recursive(item, depth+1, max_depth))
+
+        return prices
+
+    async def _click_booking_trigger(self, page):
+        """Try to click booking/search trigger buttons"""
+
+        # Comprehensive list of possible triggers
+        triggers = [
+            # Text-based selectors
+            'button:has-text("Book")',
+            'button:has-text("Search")',
+            'button:has-text("Find")',
+            'button:has-text("Check availability")',
+            'button:has-text("Get quote")',
+            'button:has-text("Reserve")',
+            'a:has-text("Book now")',
+            'a:has-text("Search")',
+
+            # Class/ID-based selectors
+            '[class*="booking-button"]',
+            '[class*="search-button"]',
+            '[class*="cta-button"]',
+            '[class*="book-now"]',
+            '[id*="booking"]',
+            '[id*="search"]',
+
+            # Data attribute selectors
+            '[data-testid*="booking"]',
+            '[data-testid*="search"]',
+            '[data-action="booking"]',
+            '[data-action="search"]',
+
+            # Specific competitor patterns
+            '.booking-widget-trigger',
+            '.search-form-trigger',
+            '#open-booking',
+        ]
+
+        for trigger in triggers:
+            try:
+                if await page.locator(trigger).count() > 0:
+                    await page.click(trigger, timeout=3000)
+                    logger.info(f"✅ Clicked trigger: {trigger}")
+                    await asyncio.sleep(2)
+                    return True
+            except Exception as e:
+                logger.debug(f"Trigger {trigger} failed: {e}")
+                continue
+
+        logger.debug("No booking trigger found")
+        return False
+
+    async def _fill_booking_form_comprehensive(self, page):
+        """Fill booking form with multiple strategies"""
+
+        # Sample dates (7 days from now, 7-day rental)
+        start_date = datetime.now() + timedelta(days=7)
+        end_date = start_date + timedelta(days=7)
+
+        # Date format variations
+        date_formats = [
+            start_date.strftime('%Y-%m-%d'),
+            start_date.strftime('%d/%m/%Y'),
+            start_date.strftime('%m/%d/%Y'),
+            start_date.strftime('%d.%m.%Y'),
+        ]
+
+        success = False
+
+        # Strategy 1: Fill input[type="date"]
+        date_inputs = await page.query_selector_all('input[type="date"]')
+        if len(date_inputs) >= 2:
+            try:
+                await date_inputs[0].fill(date_formats[0])
+                await date_inputs[1].fill((start_date + timedelta(days=7)).strftime('%Y-%m-%d'))
+                logger.info("✅ Filled date inputs (type=date)")
+                success = True
+            except Exception as e:
+                logger.debug(f"Date input fill failed: {e}")
+
+        # Strategy 2: Fill named inputs
+        start_input = await page.query_selector(
+            'input[name*="start"], input[name*="pickup"], input[name*="from"]'
+        )
+        end_input = await page.query_selector(
+            'input[name*="end"], input[name*="dropoff"], input[name*="to"]'
+        )
+
+        if start_input and end_input:
+            for date_format in date_formats:
+                try:
+                    await start_input.fill(date_format)
+                    await asyncio.sleep(0.3)
+                    await end_input.fill(end_date.strftime('%Y-%m-%d'))
+                    await asyncio.sleep(0.3)
+                    logger.info(f"✅ Filled named inputs with format: {date_format}")
+                    success = True
+                    break
+                except Exception as e:
+                    logger.debug(f"Named input fill failed: {e}")
+                    continue
+
+        # Strategy 3: JavaScript value setting (bypass validation)
+        try:
+            await page.evaluate('''(dates) => {
+                const startInputs = document.querySelectorAll('input[name*="start"], input[name*="pickup"]');
+                const endInputs = document.querySelectorAll('input[name*="end"], input[name*="dropoff"]');
+
+                if (startInputs[0]) startInputs[0].value = dates.start;
+                if (endInputs[0]) endInputs[0].value = dates.end;
+            }''', {
+                'start': date_formats[0],
+                'end': end_date.strftime('%Y-%m-%d')
+            })
+            logger.info("✅ Set dates via JavaScript")
+        except Exception as e:
+            logger.debug(f"JavaScript date setting failed: {e}")
+
+        # Fill location if needed
+        await self._fill_location_field(page)
+
+        # Try to submit form
+        submit_success = await self._submit_booking_form(page)
+
+        return submit_success
+
+    async def _fill_location_field(self, page):
+        """Fill location/station field"""
+
+        location_selectors = [
+            'select[name*="location"]',
+            'select[name*="station"]',
+            'select[name*="pickup"]',
+            'input[name*="location"]',
+            '[data-testid*="location"]',
+        ]
+
+        for selector in location_selectors:
+            try:
+                element = await page.query_selector(selector)
+                if not element:
+                    continue
+
+                tag_name = await element.evaluate('el => el.tagName')
+
+                if tag_name.lower() == 'select':
+                    # Select first real option (skip placeholder)
+                    await element.select_option(index=1)
+                    logger.info("✅ Selected location from dropdown")
+                    return True
+                else:
+                    # For input, try to trigger autocomplete
+                    await element.click()
+                    await asyncio.sleep(0.5)
+                    await page.keyboard.press('ArrowDown')
+                    await asyncio.sleep(0.3)
+                    await page.keyboard.press('Enter')
+                    logger.info("✅ Selected location from autocomplete")
+                    return True
+
+            except Exception as e:
+                logger.debug(f"Location fill failed for {selector}: {e}")
+                continue
+
+        return False
+
+    async def _submit_booking_form(self, page):
+        """Try to submit the booking form"""
+
+        submit_selectors = [
+            'button[type="submit"]',
+            'input[type="submit"]',
+            'button:has-text("Search")',
+            'button:has-text("Submit")',
+            'button:has-text("Continue")',
+            'button:has-text("Next")',
+            '[data-testid*="submit"]',
+            '[data-testid*="search"]',
+        ]
+
+        for selector in submit_selectors:
+            try:
+                if await page.locator(selector).count() > 0:
+                    await page.click(selector, timeout=3000)
+                    logger.info(f"✅ Clicked submit: {selector}")
+                    await asyncio.sleep(3)  # Wait for results
+                    return True
+            except Exception as e:
+                logger.debug(f"Submit failed for {selector}: {e}")
+                continue
+
+        # Try pressing Enter in form
+        try:
+            await page.keyboard.press('Enter')
+            logger.info("✅ Submitted via Enter key")
+            await asyncio.sleep(3)
+            return True
+        except Exception as e:
+            logger.debug(f"Enter key submit failed: {e}")
+
+        return False
+
+    async def _extract_price_from_results(self, page):
+        """Extract price from booking results page"""
+
+        # Wait for results to appear
+        result_selectors = [
+            '.vehicle-card',
+            '.search-result',
+            '.booking-result',
+            '[class*="vehicle"]',
+            '[class*="result"]',
+        ]
+
+        for selector in result_selectors:
+            try:
+                if await page.locator(selector).count() > 0:
+                    await page.wait_for_selector(selector, timeout=5000)
+                    break
+            except:
+                continue
+
+        # Extract all visible prices
+        page_text = await page.evaluate('() => document.body.innerText')
+        prices = await self.extract_prices_from_text(page_text)
+
+        if prices:
+            # Filter for per-night prices
+            night_prices = [p for p in prices if 30 <= p <= 400]
+            if night_prices:
+                # Take the minimum (usually base price)
+                return min(night_prices)
+
+        # Try specific price selectors
+        price_selectors = [
+            '[class*="price"]',
+            '[class*="rate"]',
+            '[class*="cost"]',
+            '[data-testid*="price"]',
+        ]
+
+        for selector in price_selectors:
+            try:
+                elements = await page.query_selector_all(selector)
+                for element in elements[:5]:  # Check first 5
+                    text = await element.inner_text()
+                    matches = re.findall(r'€?\s*(\d+(?:\.\d{2})?)', text)
+                    for match in matches:
+                        price = float(match)
+                        if 30 <= price <= 400:
+                            return price
+            except Exception as e:
+                logger.debug(f"Price selector {selector} failed: {e}")
+                continue
+
+        return None
+
+    async def _extract_from_json_ld(self, page):
+        """Extract price from JSON-LD structured data"""
+
+        try:
+            json_ld_data = await page.evaluate('''() => {
+                const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+                return Array.from(scripts).map(s => {
+                    try {
+                        return JSON.parse(s.textContent);
+                    } catch(e) {
+                        return null;
+                    }
+                }).filter(d => d !== null);
+            }''')
+
+            for data in json_ld_data:
+                # Check for Product or Service type with offers
+                if isinstance(data, dict):
+                    if 'offers' in data:
+                        offers = data['offers']
+                        if isinstance(offers, dict) and 'price' in offers:
+                            price = float(offers['price'])
+                            if 30 <= price <= 400:
+                                return price
+                        elif isinstance(offers, list):
+                            for offer in offers:
+                                if 'price' in offer:
+                                    price = float(offer['price'])
+                                    if 30 <= price <= 400:
+                                        return price
+
+        except Exception as e:
+            logger.debug(f"JSON-LD extraction failed: {e}")
+
+        return None
+
+
+    def _extract_prices_from_json(self, data, prices=None):
+        """
+        Recursively extract numeric values that look like prices from JSON data.
+
+        Args:
+            data: JSON data (dict, list, or primitive)
+            prices: List to accumulate found prices
+
+        Returns:
+            List of potential prices found
+        """
+        if prices is None:
+            prices = []
+
+        try:
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    # Look for price-related keys
+                    if any(keyword in key.lower() for keyword in ['price', 'cost', 'total', 'amount', 'rate', 'fee']):
+                        if isinstance(value, (int, float)):
+                            # Filter reasonable prices
+                            if 10 <= value <= 10000:
+                                prices.append(float(value))
+                    # Recurse into nested structures
+                    self._extract_prices_from_json(value, prices)
+            elif isinstance(data, list):
+                for item in data:
+                    self._extract_prices_from_json(item, prices)
+
+        except Exception as e:
+            logger.debug(f"JSON price extraction error: {e}")
+
+        return prices
+    
+    async def _scrape_vehicles(self, page):
+        """Extract vehicle information"""
+        try:
+            # Find vehicle cards/types
+            vehicle_elements = await page.query_selector_all('[class*="vehicle"], [class*="camper"], [class*="van"]')
+            
+            vehicle_types = []
+            for elem in vehicle_elements[:10]:
+                text = await elem.inner_text()
+                if len(text) < 100:  # Avoid large blocks
+                    vehicle_types.append(text.strip())
+            
+            self.data['vehicle_types'] = list(set(vehicle_types))[:5]
+            self.data['fleet_size_estimate'] = len(vehicle_elements)
+            
+            logger.info(f"Found {len(self.data['vehicle_types'])} vehicle types")
+            
+        except Exception as e:
+            logger.error(f"Vehicle extraction failed: {e}")
+    
+    async def _scrape_insurance_and_fees(self, page):
+        """Extract insurance packages and additional fees with enhanced patterns"""
+        try:
+            page_text = await page.evaluate('() => document.body.innerText')
+            
+            # Extract all prices from page for analysis
+            all_prices = await self.extract_prices_from_text(page_text)
+            logger.debug(f"Found {len(all_prices)} prices on insurance/fees page: {all_prices[:10]}")
+
+            # Look for insurance costs - expanded patterns
+            insurance_patterns = [
+                r'insurance.*?[€$]\s*(\d+\.?\d*)',
+                r'coverage.*?[€$]\s*(\d+\.?\d*)',
+                r'protection.*?[€$]\s*(\d+\.?\d*)',
+                r'[€$]\s*(\d+\.?\d*).*?(?:per day|daily).*?insurance',
+                r'[€$]\s*(\d+\.?\d*).*?insurance',
+                r'insurance.*?(\d+\.?\d*)\s*[€$]',
+                r'protection plan.*?(\d+\.?\d*)',
+                r'premium.*?insurance.*?(\d+\.?\d*)',
+                # More specific patterns
+                r'(\d+\.?\d*)\s*€.*?(?:insurance|coverage|protection)',
+                r'(?:insurance|coverage).*?from.*?(\d+\.?\d*)',
+            ]
+
+            for pattern in insurance_patterns:
+                matches = re.finditer(pattern, page_text, re.IGNORECASE)
+                for match in matches:
+                    try:
+                        price = float(match.group(1))
+                        if 1 < price < 150:  # Reasonable daily insurance cost (€1-150/day)
+                            self.data['insurance_cost_per_day'] = price
+                            logger.info(f"✅ Insurance: €{price}/day (pattern: {pattern[:30]}...)")
+                            break
+                    except (ValueError, IndexError):
+                        continue
+                if self.data['insurance_cost_per_day']:
+                    break
+
+            # Look for cleaning fee - expanded patterns
+            cleaning_patterns = [
+                r'cleaning.*?[€$]\s*(\d+\.?\d*)',
+                r'preparation.*?[€$]\s*(\d+\.?\d*)',
+                r'[€$]\s*(\d+\.?\d*).*?cleaning',
+                r'cleaning.*?(\d+\.?\d*)\s*[€$]',
+                r'final.*?clean.*?(\d+\.?\d*)',
+                r'service.*?fee.*?(\d+\.?\d*)',
+                r'(\d+\.?\d*)\s*€.*?cleaning'
+            ]
+
+            for pattern in cleaning_patterns:
+                matches = re.finditer(pattern, page_text, re.IGNORECASE)
+                for match in matches:
+                    try:
+                        price = float(match.group(1))
+                        if 10 < price < 500:  # Reasonable cleaning fee (€10-500)
+                            self.data['cleaning_fee'] = price
+                            logger.info(f"✅ Cleaning fee: €{price}")
+                            break
+                    except (ValueError, IndexError):
+                        continue
+                if self.data['cleaning_fee']:
+                    break
+
+            # Look for booking/service fee
+            booking_patterns = [
+                r'(?:booking|service).*?fee.*?[€$]\s*(\d+\.?\d*)',
+                r'[€$]\s*(\d+\.?\d*).*?(?:booking|service).*?fee',
+                r'booking.*?(\d+\.?\d*)\s*[€$]',
+                r'(\d+\.?\d*)\s*[€$].*?booking'
+            ]
+
+            for pattern in booking_patterns:
+                matches = re.finditer(pattern, page_text, re.IGNORECASE)
+                for match in matches:
+                    try:
+                        price = float(match.group(1))
+                        if 0 < price < 300:  # Reasonable booking fee (€0-300)
+                            self.data['booking_fee'] = price
+                            logger.info(f"✅ Booking fee: €{price}")
+                            break
+                    except (ValueError, IndexError):
+                        continue
+                if self.data['booking_fee']:
+                    break
+            
+            # Heuristic fallback: if we found multiple prices, try to infer insurance/cleaning
+            if not self.data['insurance_cost_per_day'] and all_prices:
+                # Insurance typically €5-50/day
+                insurance_candidates = [p for p in all_prices if 5 <= p <= 50]
+                if insurance_candidates:
+                    self.data['insurance_cost_per_day'] = min(insurance_candidates)
+                    self.data['is_estimated'] = True
+                    logger.info(f"✅ Insurance (estimated): €{self.data['insurance_cost_per_day']}/day")
+            
+            if not self.data['cleaning_fee'] and all_prices:
+                # Cleaning typically €50-200
+                cleaning_candidates = [p for p in all_prices if 50 <= p <= 200]
+                if cleaning_candidates:
+                    self.data['cleaning_fee'] = min(cleaning_candidates)
+                    self.data['is_estimated'] = True
+                    logger.info(f"✅ Cleaning fee (estimated): €{self.data['cleaning_fee']}")
+
+        except Exception as e:
+            logger.error(f"Insurance/fees extraction failed: {e}")
+
+    async def _scrape_locations(self, page):
+        """
+        Comprehensive location extraction with multiple strategies.
+
+        Strategies:
+        1. Check current page for location elements
+        2. Visit dedicated locations page if available
+        3. Extract from dropdowns and lists
+        4. Parse from map markers
+        5. Extract from JSON data
+        """
+        try:
+            locations = []
+
+            # Strategy 1: Check current page first
+            locations.extend(await self._extract_locations_from_page(page))
+
+            # Strategy 2: Visit dedicated locations page
+            if len(locations) < 5 and self.config['urls'].get('locations'):
+                logger.info("🔍 Visiting dedicated locations page...")
+                locations_url = self.config['urls']['locations']
+                success = await self.navigate_smart(page, locations_url)
+                if success:
+                    await asyncio.sleep(3)  # Let page load
+                    locations.extend(await self._extract_locations_from_page(page))
+
+            # Strategy 3: Extract from map markers (if present)
+            map_locations = await self._extract_locations_from_map(page)
+            if map_locations:
+                locations.extend(map_locations)
+
+            # Strategy 4: Extract from embedded JSON
+            json_locations = await self._extract_locations_from_json(page)
+            if json_locations:
+                locations.extend(json_locations)
+
+            # Clean and deduplicate
+            locations = self._clean_and_deduplicate_locations(locations)
+
+            if locations:
+                self.data['locations_available'] = locations[:20]  # Keep top 20
+                logger.info(f"✅ Extracted {len(self.data['locations_available'])} unique locations (found {len(locations)} total)")
+            else:
+                logger.warning(f"⚠️ No locations found after all strategies")
+
+        except Exception as e:
+            logger.error(f"Location extraction failed: {e}")
+
+    async def _extract_locations_from_page(self, page):
+        """Extract locations from current page using multiple selectors"""
+        locations = []
+
+        await asyncio.sleep(2)  # Let page load
+
+        # Comprehensive location selectors
+        location_selectors = [
+            # Dropdown options
+            'select[name*="location"] option',
+            'select[name*="station"] option',
+            'select[name*="pickup"] option',
+            'select[name*="depot"] option',
+            'select[id*="location"] option',
+            'select[id*="station"] option',
+
+            # List items
+            '[class*="location-item"]',
+            '[class*="station-item"]',
+            '[class*="depot-item"]',
+            'li[class*="location"]',
+            'li[class*="station"]',
+
+            # Cards and containers
+            'div[class*="location-card"]',
+            'div[class*="station-card"]',
+            '[class*="location-list"]',
+
+            # Links
+            'a[href*="location"]',
+            'a[href*="station"]',
+
+            # Data attributes
+            '[data-location]',
+            '[data-station]',
+            '[data-city]',
+
+            # Generic
+            '.location',
+            '.station',
+            '[class*="pickup"]',
+            '[class*="location"]',
+        ]
+
+        for selector in location_selectors:
+            try:
+                location_elements = await page.query_selector_all(selector)
+                if location_elements:
+                    logger.debug(f"Found {len(location_elements)} elements with selector: {selector}")
+
+                for element in location_elements[:50]:  # Check first 50
+                    text = await element.text_content()
+                    if text:
+                        text = text.strip()
+                        # More permissive filtering
+                        if text and 3 <= len(text) <= 150:
+                            # Skip common non-location text
+                            skip_words = ['select', 'choose', 'option', 'location', 'station', 'pickup']
+                            if not any(skip in text.lower() for skip in skip_words) or len(text) > 15:
+                                locations.append(text)
+
+                if len(locations) >= 10:  # Found meaningful number
+                    logger.info(f"✅ Found {len(locations)} locations with selector: {selector}")
+                    break
+            except Exception as e:
+                logger.debug(f"Selector {selector} failed: {e}")
+
+        return locations
+
+    async def _extract_locations_from_map(self, page):
+        """Extract locations from map markers"""
+        try:
+            # Try to find map markers
+            map_data = await page.evaluate('''() => {
+                // Look for Google Maps or Leaflet markers
+                const markers = [];
+
+                // Check for data attributes on map elements
+                const mapElements = document.querySelectorAll('[data-lat], [data-lng], [data-location-name]');
+                for (const elem of mapElements) {
+                    const name = elem.getAttribute('data-location-name') ||
+                                elem.getAttribute('title') ||
+                                elem.textContent?.trim();
+                    if (name && name.length > 2 && name.length < 100) {
+                        markers.push(name);
+                    }
+                }
+
+                // Check for Leaflet markers
+                if (window.L && window.L.Marker) {
+                    // Leaflet markers present
+                }
+
+                return markers;
+            }''')
+
+            if map_data:
+                logger.info(f"✅ Found {len(map_data)} locations from map markers")
+                return map_data
+
+        except Exception as e:
+            logger.debug(f"Map marker extraction failed: {e}")
+
+        return []
+
+    async def _extract_locations_from_json(self, page):
+        """Extract locations from embedded JSON data"""
+        try:
+            json_data = await page.evaluate('''() => {
+                const locations = [];
+
+                // Check window variables
+                if (window.stationData || window.locationData || window.depotData) {
+                    const data = window.stationData || window.locationData || window.depotData;
+                    if (Array.isArray(data)) {
+                        data.forEach(item => {
+                            if (item.name) locations.push(item.name);
+                            if (item.city) locations.push(item.city);
+                            if (item.location) locations.push(item.location);
+                        });
+                    }
+                }
+
+                // Check JSON-LD
+                const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+                for (const script of scripts) {
+                    try {
+                        const data = JSON.parse(script.textContent);
+                        if (data.location || data['@type'] === 'Place') {
+                            if (data.location?.address?.addressLocality) {
+                                locations.push(data.location.address.addressLocality);
+                            }
+                            if (data.name) locations.push(data.name);
+                        }
+                    } catch(e) {}
+                }
+
+                return locations;
+            }''')
+
+            if json_data:
+                logger.info(f"✅ Found {len(json_data)} locations from JSON data")
+                return json_data
+
+        except Exception as e:
+            logger.debug(f"JSON location extraction failed: {e}")
+
+        return []
+
+    async def _scrape_locations_page(self, page):
+        """Extract locations plus any enhanced data from the locations page"""
+        await self._scrape_locations(page)
+        await self.extract_enhanced_data_from_page(page)
+
+    def _clean_and_deduplicate_locations(self, locations):
+        """Clean and deduplicate location list"""
+        # Remove duplicates (case-insensitive)
+        seen = set()
+        unique_locations = []
+        for loc in locations:
+            loc_lower = loc.lower()
+            if loc_lower not in seen:
+                seen.add(loc_lower)
+                unique_locations.append(loc)
+
+        # Filter out invalid entries
+        filtered = [
+            loc for loc in unique_locations
+            if not loc.isdigit()  # Not just numbers
+            and len(loc) > 2  # Not too short
+            and not loc.startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9'))  # Not starting with number
+            and not loc.lower() in ['select', 'choose', 'option', 'all', 'any']  # Not placeholder text
+        ]
+
+        # Sort by length (longer names usually more specific)
+        filtered.sort(key=len, reverse=True)
+
+        return filtered
+
+    async def _scrape_policies(self, page):
+        """Extract rental policies"""
+        try:
+            page_text = await page.evaluate('() => document.body.innerText')
+
+            # Minimum rental days
+            min_rental_patterns = [
+                r'minimum.*?(\d+)\s*(?:day|night)',
+                r'min.*?(\d+)\s*(?:day|night)',
+                r'at least\s*(\d+)\s*(?:day|night)'
+            ]
+
+            for pattern in min_rental_patterns:
+                match = re.search(pattern, page_text, re.IGNORECASE)
+                if match:
+                    days = int(match.group(1))
+                    if 1 <= days <= 30:  # Reasonable range
+                        self.data['min_rental_days'] = days
+                        logger.info(f"✅ Min rental: {days} days")
+                        break
+
+            # Fuel policy
+            if 'full to full' in page_text.lower() or 'full-to-full' in page_text.lower():
+                self.data['fuel_policy'] = 'Full to Full'
+            elif 'same to same' in page_text.lower():
+                self.data['fuel_policy'] = 'Same to Same'
+            elif 'prepaid' in page_text.lower() and 'fuel' in page_text.lower():
+                self.data['fuel_policy'] = 'Prepaid'
+
+            # Cancellation policy
+            if 'free cancellation' in page_text.lower():
+                self.data['cancellation_policy'] = 'Free Cancellation'
+            elif 'flexible' in page_text.lower() and 'cancel' in page_text.lower():
+                self.data['cancellation_policy'] = 'Flexible'
+            elif 'refundable' in page_text.lower():
+                self.data['cancellation_policy'] = 'Refundable'
+            elif 'non-refundable' in page_text.lower():
+                self.data['cancellation_policy'] = 'Non-Refundable'
+
+            logger.info(f"✅ Policies extracted")
+
+        except Exception as e:
+            logger.error(f"Policy extraction failed: {e}")
+
+    async def _find_faq_url(self, page):
+        """Absolute URL of the first FAQ/Terms link on the current page, if any"""
+        # Common FAQ/Terms page patterns
+        faq_patterns = [
+            'faq', 'faqs', 'help', 'questions',
+            'terms', 'conditions', 'policies',
+            'rental-conditions', 'booking-terms'
+        ]
+
+        for pattern in faq_patterns:
+            try:
+                # Look for links containing the pattern
+                link = await page.query_selector(f'a[href*="{pattern}"]')
+                if link:
+                    href = await link.get_attribute('href')
+                    if href:
+                        logger.info(f"🔍 Found FAQ/Terms page: {pattern}")
+                        return href if href.startswith('http') else f"{self.config['urls']['homepage'].rstrip('/')}/{href.lstrip('/')}"
+
+            except Exception as e:
+                logger.debug(f"FAQ link {pattern} failed: {e}")
+                continue
+
+        return None
+
+    async def _scrape_faq_and_terms(self, page):
+        """
+        Extract policy data from an already loaded FAQ/Terms page.
+
+        Extracts:
+        - Detailed cancellation policies
+        - Age restrictions
+        - Additional fees
+        - Insurance details
+        - Mileage policies
+        """
+        try:
+            await asyncio.sleep(2)
+            await self.extract_enhanced_data_from_page(page)
+
+        except Exception as e:
+            logger.debug(f"FAQ/Terms scraping error: {e}")
+
+    async def _extract_trustpilot_rating(self, page):
+        """Extract Trustpilot rating when we have count but no average"""
+        try:
+            # Try to get rating from Trustpilot widget data attributes
+            trustpilot_selectors = [
+                '.trustpilot-widget',
+                '[data-template-id*="trustpilot"]',
+                '[class*="trustpilot"]',
+                '[data-businessunit-id]',
+                'iframe[src*="trustpilot"]'
+            ]
+
+            for selector in trustpilot_selectors:
+                try:
+                    element = await page.query_selector(selector)
+                    if element:
+                        # Try data-score attribute
+                        rating = await element.get_attribute('data-score')
+                        if rating:
+                            self.data['customer_review_avg'] = float(rating)
+                            logger.info(f"✅ Trustpilot rating: {rating}★")
+                            return
+
+                        # Try data-rating attribute
+                        rating = await element.get_attribute('data-rating')
+                        if rating:
+                            self.data['customer_review_avg'] = float(rating)
+                            logger.info(f"✅ Trustpilot rating: {rating}★")
+                            return
+
+                        # Try parsing from text content
+                        text = await element.text_content()
+                        if text:
+                            match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)?\s*5', text)
+                            if match:
+                                rating = float(match.group(1))
+                                if 2.5 <= rating <= 5:
+                                    self.data['customer_review_avg'] = rating
+                                    logger.info(f"✅ Trustpilot rating from text: {rating}★")
+                                    return
+                except:
+                    pass
+
+            # Fallback: assume a good rating based on high review count
+            if self.data['review_count'] > 5000:
+                # If they have 10K+ reviews and are still in business, likely 4.0+
+                self.data['customer_review_avg'] = 4.2
+                self.data['is_estimated'] = True
+                logger.info("✅ Estimated rating: 4.2★ (based on high review count)")
+        except Exception as e:
+            logger.debug(f"Trustpilot rating extraction: {e}")
+
+    async def _extract_fees_from_booking_widget(self, page):
+        """Extract fees from booking widget or pricing breakdown"""
+        try:
+            # Navigate to booking page if not already there
+            booking_url = 'https://roadsurfer.com/rv-rental/prices/'
+            current_url = page.url
+            if 'prices' not in current_url and 'booking' not in current_url:
+                await self.navigate_smart(page, booking_url)
+                await asyncio.sleep(3)
+
+            # Look for fee tables or pricing breakdowns
+            page_html = await page.content()
+
+            # Extract from HTML structure
+            fee_selectors = [
+                '[class*="fee"]',
+                '[class*="additional-cost"]',
+                '[class*="extra"]',
+                '[class*="insurance"]',
+                '[class*="cleaning"]',
+                'table td, table th'
+            ]
+
+            for selector in fee_selectors:
+                try:
+                    elements = await page.query_selector_all(selector)
+                    for elem in elements[:30]:
+                        text = await elem.text_content()
+                        if text and ('insurance' in text.lower() or 'versicherung' in text.lower()):
+                            # Try to find price nearby
+                            prices = await self.extract_prices_from_text(text)
+                            for price in prices:
+                                if 5 <= price <= 50:  # Daily insurance range
+                                    self.data['insurance_cost_per_day'] = price
+                                    logger.info(f"✅ Insurance from widget: €{price}/day")
+                                    break
+
+                        if text and ('cleaning' in text.lower() or 'reinigung' in text.lower()):
+                            prices = await self.extract_prices_from_text(text)
+                            for price in prices:
+                                if 30 <= price <= 300:  # Cleaning fee range
+                                    self.data['cleaning_fee'] = price
+                                    logger.info(f"✅ Cleaning fee from widget: €{price}")
+                                    break
+                except:
+                    pass
+
+            # If still not found, use industry standards as estimates
+            if not self.data['insurance_cost_per_day']:
+                self.data['insurance_cost_per_day'] = 15.0  # Industry standard
+                self.data['is_estimated'] = True
+                logger.info("✅ Insurance (industry standard): €15/day")
+
+            if not self.data['cleaning_fee']:
+                self.data['cleaning_fee'] = 75.0  # Industry standard
+                self.data['is_estimated'] = True
+                logger.info("✅ Cleaning fee (industry standard): €75")
+
+        except Exception as e:
+            logger.debug(f"Fee extraction from booking widget: {e}")
+
+    async def _extract_program_features(self, page):
+        """Extract referral program, discount codes, and other features"""
+        try:
+            page_text = await page.evaluate('() => document.body.innerText')
+            page_text_lower = page_text.lower()
+
+            # Check for referral program
+            if any(term in page_text_lower for term in ['refer a friend', 'referral', 'invite friend', 'earn credit']):
+                self.data['referral_program'] = True
+                logger.info("✅ Referral program: Yes")
+            else:
+                self.data['referral_program'] = False
+
+            # Check for discount codes
+            if any(term in page_text_lower for term in ['promo code', 'discount code', 'coupon', 'voucher', 'code:']):
+                self.data['discount_code_available'] = True
+                logger.info("✅ Discount codes: Available")
+            else:
+                self.data['discount_code_available'] = False
+
+            # Check for one-way rentals
+            if 'one way' in page_text_lower or 'one-way' in page_text_lower:
+                self.data['one_way_rental_allowed'] = True
+
+                # Try to find one-way fee
+                one_way_match = re.search(r'one.way.*?[€$]\s*(\d+)', page_text, re.IGNORECASE)
+                if one_way_match:
+                    fee = float(one_way_match.group(1))
+                    if 0 <= fee <= 1000:
+                        self.data['one_way_fee'] = fee
+                        logger.info(f"✅ One-way rental: €{fee} fee")
+                else:
+                    logger.info("✅ One-way rental: Allowed")
+            else:
+                self.data['one_way_rental_allowed'] = False
+
+        except Exception as e:
+            logger.debug(f"Program features extraction: {e}")
+
+    async def _extract_discounts_from_text(self, text: str):
+        """Extract discount percentages from text"""
+        try:
+            # Weekly discount
+            weekly_patterns = [
+                r'weekly.*?(\d+)%',
+                r'(\d+)%.*?week',
+                r'week.*?save.*?(\d+)%',
+                r'7\s*(?:days?|nights?).*?(\d+)%'
+            ]
+            for pattern in weekly_patterns:
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    pct = float(match.group(1))
+                    if 3 <= pct <= 50:  # Reasonable discount range
+                        self.data['weekly_discount_pct'] = pct
+                        logger.info(f"✅ Weekly discount: {pct}%")
+                        break
+            
+            # Monthly discount
+            monthly_patterns = [
+                r'monthly.*?(\d+)%',
+                r'(\d+)%.*?month',
+                r'month.*?save.*?(\d+)%',
+                r'30\s*(?:days?|nights?).*?(\d+)%'
+            ]
+            for pattern in monthly_patterns:
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    pct = float(match.group(1))
+                    if 5 <= pct <= 50:
+                        self.data['monthly_discount_pct'] = pct
+                        logger.info(f"✅ Monthly discount: {pct}%")
+                        break
+            
+            # Early bird discount
+            early_patterns = [
+                r'early.*?bird.*?(\d+)%',
+                r'book.*?early.*?(\d+)%',
+                r'advance.*?(\d+)%',
+                r'(\d+)%.*?early'
+            ]
+            for pattern in early_patterns:
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    pct = float(match.group(1))
+                    if 5 <= pct <= 40:
+                        self.data['early_bird_discount_pct'] = pct
+                        logger.info(f"✅ Early bird discount: {pct}%")
+                        break
+                        
+        except Exception as e:
+            logger.debug(f"Discount extraction: {e}")
+    
+    async def _extract_mileage_from_text(self, text: str):
+        """Extract mileage information from text"""
+        try:
+            # Check for unlimited mileage
+            if any(phrase in text.lower() for phrase in ['unlimited mileage', 'unlimited km', 'unlimited miles', 'all miles included']):
+                self.data['mileage_limit_km'] = 0
+                self.data['mileage_cost_per_km'] = 0.0
+                logger.info(f"✅ Mileage: Unlimited")
+                return
+            
+            # Look for mileage limits
+            limit_patterns = [
+                r'(\d+)\s*km.*?(?:per day|daily|included)',
+                r'(\d+)\s*miles.*?(?:per day|daily|included)',
+                r'(?:limit|maximum).*?(\d+)\s*km',
+                r'(\d{3,5})\s*km'  # Large numbers likely to be limits
+            ]
+            for pattern in limit_patterns:
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    km = int(match.group(1))
+                    if 50 <= km <= 10000:  # Reasonable daily/total limit
+                        self.data['mileage_limit_km'] = km
+                        logger.info(f"✅ Mileage limit: {km} km")
+                        break
+            
+            # Look for cost per km
+            cost_patterns = [
+                r'[€$£]\s*(\d+\.?\d*)\s*(?:per km|/km)',
+                r'(\d+\.?\d*)\s*[€$£]\s*(?:per km|/km)',
+                r'(\d+\.?\d*)\s*cents.*?km'
+            ]
+            for pattern in cost_patterns:
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    cost = float(match.group(1))
+                    if 0.01 <= cost <= 5:  # Reasonable cost per km
+                        self.data['mileage_cost_per_km'] = cost
+                        logger.info(f"✅ Mileage cost: €{cost}/km")
+                        break
+                        
+        except Exception as e:
+            logger.debug(f"Mileage extraction: {e}")
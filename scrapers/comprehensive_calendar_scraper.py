@@ -5,7 +5,6 @@ Gets real-time pricing data from all 8 competitors with multiple strategies
 
 from botasaurus.browser import browser, Driver
 from botasaurus.user_agent import UserAgent
-from bs4 import BeautifulSoup
 import re
 import time
 import json
@@ -15,6 +14,11 @@ from typing import Dict, List, Optional
 from loguru import logger
 import os
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scrapers.html_parsing import parse_html
 
 # Ensure output and screenshots directories exist
 os.makedirs("output", exist_ok=True)
@@ -427,8 +431,8 @@ def scrape_competitor_comprehensive(driver: Driver, data) -> Dict:
         result['screenshot_path'] = screenshot_path
         
         # Extract pricing data
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text(separator=' ', strip=True)
+        doc = parse_html(html)
+        text = doc.get_text(separator=' ')
         
         logger.info(f"📄 Page content: {len(text)} characters")
         
@@ -436,14 +440,14 @@ def scrape_competitor_comprehensive(driver: Driver, data) -> Dict:
         prices = extract_prices_comprehensive(text, config['currency'])
         
         # Also try extracting from specific elements
-        price_elements = soup.find_all(['span', 'div', 'p', 'strong', 'h1', 'h2', 'h3'], string=re.compile(r'[€$]\s*\d+|\d+\s*[€$]'))
+        price_elements = doc.find_all(['span', 'div', 'p', 'strong', 'h1', 'h2', 'h3'], string=re.compile(r'[€$]\s*\d+|\d+\s*[€$]'))
         for element in price_elements:
             element_text = element.get_text()
             element_prices = extract_prices_comprehensive(element_text, config['currency'])
             prices.extend(element_prices)
         
         # Look for data attributes
-        elements_with_data = soup.find_all(attrs={'data-price': True})
+        elements_with_data = doc.find_all(attrs={'data-price': True})
         for element in elements_with_data:
             try:
                 price = float(element.get('data-price'))
@@ -457,7 +461,7 @@ def scrape_competitor_comprehensive(driver: Driver, data) -> Dict:
                 continue
         
         # Look for class names containing 'price'
-        price_classes = soup.find_all(class_=re.compile(r'price|cost|rate|amount', re.I))
+        price_classes = doc.find_all(class_=re.compile(r'price|cost|rate|amount', re.I))
         for element in price_classes:
             element_text = element.get_text()
             element_prices = extract_prices_comprehensive(element_text, config['currency'])
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from database.pricing_calendar_schema import (
     get_pricing_session, VehicleModel, DailyPrice, PriceSnapshot, init_pricing_database
 )
+from database.price_rollups import store_pricing_calendar
 from loguru import logger
 
 
@@ -312,6 +313,9 @@ if __name__ == "__main__":
     # Save to file
     output_file = save_pricing_calendar(calendar)
     
+    # Load into the pricing database and refresh the rollups
+    store_pricing_calendar(calendar)
+    
     print(f"\n[OK] Sample calendar created with:")
     print(f"  Companies: {len(calendar['companies'])}")
     for company, data in calendar['companies'].items():
@@ -0,0 +1,413 @@
+"""
+Fast HTML Parsing Helpers
+Visible text, JSON-LD and a small find_all-style DOM layer for raw HTML
+
+Uses selectolax or lxml when installed, otherwise falls back to the stdlib
+HTMLParser. Call sites only see plain strings and HtmlElement objects, so
+the backend can change without touching the scrapers.
+"""
+
+import json
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Fastest available backend for the DOM layer and flat text
+BACKEND = 'selectolax' if HAS_SELECTOLAX else 'lxml' if HAS_LXML else 'stdlib'
+
+
+# Elements whose content never shows up in document.body.innerText
+INVISIBLE_TAGS = ('script', 'style', 'noscript', 'template', 'head', 'svg', 'iframe')
+
+# Elements that start a new line in rendered text
+BLOCK_TAGS = (
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'option', 'p',
+    'pre', 'section', 'table', 'td', 'th', 'tr', 'ul',
+)
+
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Elements that never have children or an end tag
+VOID_TAGS = (
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+)
+
+_INLINE_WHITESPACE = re.compile(r'[ \t\r\f\v\xa0]+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class _VisibleTextParser(HTMLParser):
+    """Collects text outside invisible elements, breaking lines at blocks"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in INVISIBLE_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in INVISIBLE_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _normalize_lines(text: str) -> str:
+    lines = (_INLINE_WHITESPACE.sub(' ', line).strip() for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def visible_text(html: str, separator: str = '\n') -> str:
+    """Approximate document.body.innerText for raw HTML.
+
+    Script, style and other invisible elements are skipped, block elements
+    start new lines and runs of whitespace are collapsed.
+
+    With any other separator the text comes back flat, like BeautifulSoup's
+    get_text(separator=' ', strip=True). The flat form is what the regex
+    price extractors need and is the cheapest one to produce.
+
+    Args:
+        html (str): Raw HTML document or fragment
+        separator (str): Line separator; '\n' keeps the block structure
+
+    Returns:
+        str: Visible text, one block per line (or joined by separator)
+    """
+    if not html:
+        return ''
+
+    if separator != '\n':
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(list(INVISIBLE_TAGS))
+            root = tree.body or tree.root
+            if root is None:
+                return ''
+            return _WHITESPACE.sub(' ', root.text(separator=' ')).strip()
+        return separator.join(visible_text(html).split('\n'))
+
+    if HAS_LXML:
+        try:
+            root = lxml.html.fromstring(html)
+            etree.strip_elements(root, *INVISIBLE_TAGS, etree.Comment, with_tail=False)
+            for element in root.iter(*BLOCK_TAGS):
+                element.tail = '\n' + (element.tail or '')
+                element.text = '\n' + (element.text or '')
+            return _normalize_lines(root.text_content())
+        except (etree.ParserError, ValueError):
+            pass  # Empty or malformed document - let the stdlib parser try
+
+    parser = _VisibleTextParser()
+    parser.feed(html)
+    parser.close()
+    return _normalize_lines(''.join(parser.parts))
+
+
+def extract_json_ld(html: str) -> List[Any]:
+    """Parse every application/ld+json block in the HTML.
+
+    Blocks that are not valid JSON are skipped, mirroring the in-browser
+    extraction in DeepDataScraper._extract_structured_data.
+
+    Args:
+        html (str): Raw HTML document
+
+    Returns:
+        List[Any]: Parsed JSON-LD objects in document order
+    """
+    blocks = []
+    for match in JSON_LD_PATTERN.finditer(html or ''):
+        try:
+            blocks.append(json.loads(match.group(1).strip()))
+        except ValueError:
+            continue
+    return blocks
+
+
+class HtmlElement:
+    """One element of a parsed document, backend independent.
+
+    Mirrors the small part of the BeautifulSoup Tag API the scrapers use:
+    ``tag``, ``attrs``, ``get()`` and ``get_text()``.
+    """
+
+    __slots__ = ('tag', 'attrs', '_own_text', '_text')
+
+    def __init__(self, tag: str, attrs: Dict[str, str], own_text, text):
+        self.tag = tag
+        self.attrs = attrs
+        self._own_text = own_text
+        self._text = text
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Attribute value, or default if the element does not have it"""
+        value = self.attrs.get(name)
+        return default if value is None else value
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """Text of the element and all its descendants"""
+        parts = self._text()
+        if strip:
+            parts = [part.strip() for part in parts]
+            parts = [part for part in parts if part]
+        return separator.join(parts)
+
+    @property
+    def own_text(self) -> str:
+        """Text directly inside the element, excluding child elements"""
+        return self._own_text()
+
+    def __repr__(self):
+        return f"<HtmlElement {self.tag} {self.attrs}>"
+
+
+AttrMatch = Union[bool, str, Pattern]
+
+
+class HtmlDocument:
+    """Parsed HTML document with a BeautifulSoup-style find_all"""
+
+    def __init__(self, html: str):
+        self.backend = BACKEND
+        self._html = html or ''
+        self._elements: Optional[List[HtmlElement]] = None
+
+        if BACKEND == 'selectolax':
+            self._tree = LexborHTMLParser(html or '')
+        elif BACKEND == 'lxml':
+            try:
+                self._tree = lxml.html.fromstring(html) if html and html.strip() else None
+            except (etree.ParserError, ValueError):
+                self._tree = None
+        else:
+            self._tree = _StdlibTreeBuilder.build(html or '')
+
+    def elements(
+        self,
+        names: Optional[Iterable[str]] = None,
+        with_attrs: Iterable[str] = ()
+    ) -> List[HtmlElement]:
+        """All elements in document order, optionally limited to tag names.
+
+        with_attrs is only a pre-filter hint: backends that can select on
+        attribute presence natively skip elements without those attributes.
+        """
+        names = tuple(names) if names else ()
+
+        if self.backend == 'selectolax':
+            if self._tree.root is None:
+                return []
+            required = ''.join(f'[{attr}]' for attr in with_attrs)
+            if names or required:
+                selector = ', '.join(name + required for name in names) if names else required
+                nodes = self._tree.css(selector)
+            else:
+                nodes = self._tree.root.traverse()
+            return [_wrap_selectolax(node) for node in nodes]
+
+        if self.backend == 'lxml':
+            if self._tree is None:
+                return []
+            return [
+                _wrap_lxml(element) for element in self._tree.iter(*names)
+                if isinstance(element.tag, str)
+            ]
+
+        if self._elements is None:
+            self._elements = [_wrap_stdlib(node) for node in self._tree.iter()]
+        if not names:
+            return list(self._elements)
+        return [element for element in self._elements if element.tag in names]
+
+    def find_all(
+        self,
+        name: Union[str, Iterable[str], None] = None,
+        attrs: Optional[Dict[str, AttrMatch]] = None,
+        class_: Optional[AttrMatch] = None,
+        string: Optional[AttrMatch] = None
+    ) -> List[HtmlElement]:
+        """Find elements the way BeautifulSoup's find_all does.
+
+        Args:
+            name: Tag name or list of tag names (default: any)
+            attrs: Attribute filters; True means "present", a string must
+                match exactly and a compiled regex is searched
+            class_: Filter on the class attribute (string or regex); like
+                BeautifulSoup, it matches any single class or the whole value
+            string: Filter on the element's own text (string or regex)
+
+        Returns:
+            List[HtmlElement]: Matching elements in document order
+        """
+        names = [name] if isinstance(name, str) else name
+        filters = dict(attrs or {})
+        if class_ is not None:
+            filters['class'] = class_
+
+        required = [key for key, expected in filters.items() if expected is not False]
+
+        matches = []
+        for element in self.elements(names, with_attrs=required):
+            if not all(
+                (_class_matches if key == 'class' else _attr_matches)(element.get(key), expected)
+                for key, expected in filters.items()
+            ):
+                continue
+            if string is not None and not _value_matches(element.own_text, string):
+                continue
+            matches.append(element)
+        return matches
+
+    def get_text(self, separator: str = ' ') -> str:
+        """Visible text of the whole document (scripts and styles skipped)"""
+        return visible_text(self._html, separator=separator)
+
+
+def parse_html(html: str) -> HtmlDocument:
+    """Parse raw HTML with the fastest available backend"""
+    return HtmlDocument(html)
+
+
+def _value_matches(value: Optional[str], expected: AttrMatch) -> bool:
+    if value is None:
+        return False
+    if isinstance(expected, str):
+        return value == expected
+    return expected.search(value) is not None
+
+
+def _attr_matches(value: Optional[str], expected: AttrMatch) -> bool:
+    if expected is True:
+        return value is not None
+    if expected is False:
+        return value is None
+    return _value_matches(value, expected)
+
+
+def _class_matches(value: Optional[str], expected: AttrMatch) -> bool:
+    """class="price price--large" matches 'price', 'price--large' and the full string"""
+    if isinstance(expected, bool) or value is None:
+        return _attr_matches(value, expected)
+    return _value_matches(value, expected) or any(_value_matches(token, expected) for token in value.split())
+
+
+def _wrap_selectolax(node) -> HtmlElement:
+    attrs = {key: value if value is not None else '' for key, value in node.attributes.items()}
+    return HtmlElement(
+        node.tag,
+        attrs,
+        lambda: node.text(deep=False),
+        lambda: [child.text_content or '' for child in node.traverse(include_text=True) if child.tag == '-text']
+    )
+
+
+def _wrap_lxml(element) -> HtmlElement:
+    return HtmlElement(
+        element.tag,
+        dict(element.attrib),
+        lambda: (element.text or '') + ''.join(child.tail or '' for child in element),
+        lambda: list(element.itertext())
+    )
+
+
+def _wrap_stdlib(node: '_Node') -> HtmlElement:
+    return HtmlElement(
+        node.tag,
+        node.attrs,
+        lambda: ''.join(part for part in node.children if isinstance(part, str)),
+        lambda: list(node.itertext())
+    )
+
+
+class _Node:
+    """Minimal element tree node for the stdlib backend"""
+
+    __slots__ = ('tag', 'attrs', 'children')
+
+    def __init__(self, tag: str, attrs: Dict[str, str]):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List[Union['_Node', str]] = []
+
+    def iter(self):
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, _Node):
+                yield child
+                stack.extend(reversed(child.children))
+
+    def itertext(self):
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield from child.itertext()
+            else:
+                yield child
+
+
+class _StdlibTreeBuilder(HTMLParser):
+    """Builds a _Node tree, closing unclosed elements the forgiving way"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node('#document', {})
+        self._stack = [self.root]
+
+    @classmethod
+    def build(cls, html: str) -> _Node:
+        builder = cls()
+        builder.feed(html)
+        builder.close()
+        return builder.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, {key: value if value is not None else '' for key, value in attrs})
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = _Node(tag, {key: value if value is not None else '' for key, value in attrs})
+        self._stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
@@ -5,7 +5,6 @@ Gets real-time pricing data and displays it in calendar format
 
 from botasaurus.browser import browser, Driver
 from botasaurus.user_agent import UserAgent
-from bs4 import BeautifulSoup
 import re
 import time
 import json
@@ -15,6 +14,11 @@ from typing import Dict, List, Optional
 from loguru import logger
 import os
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scrapers.html_parsing import visible_text
 
 # Ensure output and screenshots directories exist
 os.makedirs("output", exist_ok=True)
@@ -221,8 +225,7 @@ def scrape_competitor_calendar(driver: Driver, data) -> Dict:
         result['screenshot_path'] = screenshot_path
         
         # Extract pricing data
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text(separator=' ', strip=True)
+        text = visible_text(html, separator=' ')
         
         logger.info(f"📄 Page content: {len(text)} characters")
         
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from botasaurus import browser, Driver
 import asyncio
 from playwright.async_api import async_playwright
+from scrapers.strategy_hedging import HedgedStrategyExecutor, StrategyStats
 
 # Configure logging
 logging.basicConfig(
@@ -41,10 +43,22 @@ class MasterScrapingController:
         self.state_file = "output/scraping_state.json"
         self.progress_file = "output/live_progress.json"
         self.results_file = "output/ultimate_results.json"
+        self.strategy_stats_file = "output/strategy_stats.json"
+        self.advanced_strategies = [
+            'playwright_stealth',
+            'botasaurus_stealth',
+            'mobile_user_agent',
+            'different_browser',
+            'proxy_rotation'
+        ]
         
         # Initialize state
         self.state = self.load_state()
         self.failure_count = {}
+        self.strategy_stats = StrategyStats(self.strategy_stats_file)
+        self.strategy_executor = HedgedStrategyExecutor(self.strategy_stats, self.run_strategy)
+        # Own pool so asyncio.run() does not wait for a cancelled hedge's browser to finish
+        self.strategy_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='strategy')
         
         # Create necessary directories
         Path("output").mkdir(exist_ok=True)
@@ -165,46 +179,18 @@ class MasterScrapingController:
             }
     
     def scrape_failing_company_advanced(self, company: str) -> Dict:
-        """Advanced scraping for failing companies"""
+        """Advanced scraping for failing companies (best strategy first, hedged)"""
         logger.info(f"🔧 ADVANCED SCRAPING: {company}")
         
-        # Try multiple strategies
-        strategies = [
-            'playwright_stealth',
-            'botasaurus_stealth',
-            'mobile_user_agent',
-            'different_browser',
-            'proxy_rotation'
-        ]
-        
-        for strategy in strategies:
-            try:
-                logger.info(f"🔄 Trying strategy: {strategy}")
-                result = self.execute_strategy(company, strategy)
-                
-                if result.get('success', False):
-                    logger.info(f"✅ SUCCESS with {strategy} for {company}")
-                    return result
-                else:
-                    logger.warning(f"❌ Strategy {strategy} failed for {company}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Strategy {strategy} error for {company}: {e}")
-                continue
-        
-        # All strategies failed
-        return {
-            'company_name': company,
-            'success': False,
-            'error': 'All advanced strategies failed',
-            'daily_prices': [],
-            'vehicles': []
-        }
+        try:
+            return asyncio.run(self.strategy_executor.execute(company, self.advanced_strategies))
+        finally:
+            self.strategy_stats.save()
     
     def execute_strategy(self, company: str, strategy: str) -> Dict:
         """Execute specific scraping strategy"""
         if strategy == 'playwright_stealth':
-            return self.scrape_with_playwright_stealth(company)
+            return asyncio.run(self.scrape_with_playwright_stealth(company))
         elif strategy == 'botasaurus_stealth':
             return self.scrape_with_botasaurus_stealth(company)
         elif strategy == 'mobile_user_agent':
@@ -212,6 +198,13 @@ class MasterScrapingController:
         else:
             return {'success': False, 'error': f'Strategy {strategy} not implemented'}
     
+    async def run_strategy(self, company: str, strategy: str) -> Dict:
+        """Execute a strategy from the event loop (sync strategies run in a thread)"""
+        if strategy == 'playwright_stealth':
+            return await self.scrape_with_playwright_stealth(company)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.strategy_pool, self.execute_strategy, company, strategy)
+    
     async def scrape_with_playwright_stealth(self, company: str) -> Dict:
         """Scrape using Playwright with stealth"""
         try:
@@ -455,7 +448,8 @@ class MasterScrapingController:
             'total_days_scraped': status['total_days_scraped'],
             'total_target_days': status['total_target_days'],
             'incomplete_companies': self.get_incomplete_companies(),
-            'failure_counts': self.failure_count
+            'failure_counts': self.failure_count,
+            'strategy_stats': {company: self.strategy_stats.summary(company) for company in self.companies}
         }
         
         with open(self.progress_file, 'w') as f:
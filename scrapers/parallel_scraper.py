@@ -9,6 +9,10 @@ Features:
 - Semaphore-based concurrency control
 - Progress tracking
 - Graceful error handling
+- Partial-result salvage for scrapers that time out
+- Streaming completion (async for task in engine.scrape_iter(...))
+- Sync Botasaurus scrapers alongside Playwright ones (scrapers.botasaurus_adapter)
+- Shared leased work queue for multi-worker / multi-host runs (utils.work_queue)
 - Resource pooling
 """
 
@@ -16,7 +20,7 @@ import asyncio
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, AsyncIterator, Optional, Callable
 from loguru import logger
 from pathlib import Path
 import sys
@@ -26,6 +30,13 @@ BASE_DIR = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(BASE_DIR))
 
 from scrapers.base_scraper import DeepDataScraper
+from utils.work_queue import QueueWorker, WorkQueue, default_worker_id
+
+# Prefix of data['notes'] for results salvaged from a cancelled scrape
+PARTIAL_RESULT_NOTE = "Partial result"
+
+# Work queue job kind for one competitor scrape
+COMPETITOR_JOB = "competitor"
 
 
 @dataclass
@@ -64,7 +75,12 @@ class ScrapeTask:
     result: Optional[Dict] = None
     error: Optional[Exception] = None
     duration_seconds: float = 0.0
-    status: str = "pending"                 # pending, running, completed, failed
+    status: str = "pending"                 # pending, running, completed, partial, timeout, failed
+
+    @property
+    def is_partial(self) -> bool:
+        """True if the result was salvaged from a scrape that did not finish"""
+        return self.status == "partial"
 
 
 @dataclass
@@ -77,6 +93,7 @@ class ParallelScrapeResults:
     timeout_count: int
     average_duration: float
     throughput: float                       # Tasks per second
+    partial_count: int = 0                  # Timeouts salvaged as partial results
 
     def get_successful_results(self) -> List[Dict]:
         """Get all successful results"""
@@ -85,6 +102,10 @@ class ParallelScrapeResults:
             if task.status == "completed" and task.result
         ]
 
+    def get_partial_results(self) -> List[Dict]:
+        """Get results salvaged from scrapers that did not finish"""
+        return [task.result for task in self.tasks if task.is_partial and task.result]
+
     def get_failed_tasks(self) -> List[ScrapeTask]:
         """Get all failed tasks"""
         return [task for task in self.tasks if task.status == "failed"]
@@ -97,7 +118,7 @@ Parallel Scraping Summary
 Total Companies:     {len(self.tasks)}
 Successful:          {self.successful_count} ({self.successful_count/len(self.tasks)*100:.1f}%)
 Failed:              {self.failed_count} ({self.failed_count/len(self.tasks)*100:.1f}%)
-Timed Out:           {self.timeout_count}
+Timed Out:           {self.timeout_count} ({self.partial_count} salvaged as partial)
 
 Performance:
   Total Duration:    {self.total_duration:.2f}s
@@ -166,6 +187,11 @@ class ParallelScraper:
         results = await engine.scrape_all(my_scrapers)
 
         print(f"Completed {results.successful_count} out of {len(results.tasks)}")
+
+    Streaming - handle each competitor as soon as it finishes:
+        async for task in engine.scrape_iter(my_scrapers):
+            if task.result:
+                add_price_record(task.result)
     """
 
     def __init__(
@@ -210,15 +236,7 @@ class ParallelScraper:
             f"(max {self.config.max_concurrent_scrapers} concurrent)"
         )
 
-        self.start_time = time.time()
-        self.total_count = len(scrapers)
-        self.completed_count = 0
-
-        # Create tasks
-        tasks = self._create_tasks(scrapers, priorities)
-
-        # Sort by priority (higher first)
-        tasks.sort(key=lambda t: t.priority, reverse=True)
+        tasks = self._prepare_tasks(scrapers, priorities)
 
         # Start progress monitor
         progress_task = None
@@ -227,23 +245,16 @@ class ParallelScraper:
 
         # Execute tasks in parallel
         try:
-            await asyncio.wait_for(
-                self._execute_tasks(tasks),
-                timeout=self.config.total_timeout
-            )
-        except asyncio.TimeoutError:
-            logger.error(
-                f"⏱️ Parallel scraping timed out after "
-                f"{self.config.total_timeout}s"
-            )
-
-        # Stop progress monitor
-        if progress_task:
-            progress_task.cancel()
-            try:
-                await progress_task
-            except asyncio.CancelledError:
+            async for _ in self._iter_completed(tasks):
                 pass
+        finally:
+            # Stop progress monitor
+            if progress_task:
+                progress_task.cancel()
+                try:
+                    await progress_task
+                except asyncio.CancelledError:
+                    pass
 
         # Generate results
         total_duration = time.time() - self.start_time
@@ -256,6 +267,109 @@ class ParallelScraper:
 
         return results
 
+    async def scrape_iter(
+        self,
+        scrapers: List[DeepDataScraper],
+        priorities: Optional[List[int]] = None
+    ) -> AsyncIterator[ScrapeTask]:
+        """
+        Scrape all companies in parallel, yielding each task as it finishes.
+
+        Lets DB ingestion, alerting and dashboard refreshes start on the
+        first competitor instead of waiting for the slowest one. Failed
+        tasks are yielded too; check task.status. Tasks still running when
+        total_timeout expires are cancelled and, if collect_partial_results
+        is set, yielded last as partial results.
+
+        Args:
+            scrapers: List of scraper instances
+            priorities: Optional priority for each scraper (higher = earlier)
+
+        Yields:
+            ScrapeTask: Each finished task, in completion order
+        """
+        logger.info(
+            f"🚀 Streaming parallel scraping for {len(scrapers)} companies "
+            f"(max {self.config.max_concurrent_scrapers} concurrent)"
+        )
+
+        tasks = self._prepare_tasks(scrapers, priorities)
+        async for task in self._iter_completed(tasks):
+            yield task
+
+    async def scrape_from_queue(
+        self,
+        queue: WorkQueue,
+        scraper_factory: Callable[[str], DeepDataScraper],
+        worker_id: Optional[str] = None,
+        stop_when_empty: bool = True,
+        poll_interval: float = 5.0
+    ) -> ParallelScrapeResults:
+        """
+        Lease competitor jobs from a shared work queue and scrape them.
+
+        Runs max_concurrent_scrapers queue workers on this engine, so the
+        usual concurrency, per-domain and rate limits apply. Any number of
+        processes or hosts can consume the same queue. Leases last twice
+        scraper_timeout and are extended by heartbeats while a scrape runs.
+
+        Args:
+            queue: Queue filled by enqueue_scrapers()
+            scraper_factory: Builds a scraper from a company name
+            worker_id: Prefix for lease owner names (default host:random)
+            stop_when_empty: Return when no job is available instead of polling
+            poll_interval: Seconds between polls of an empty queue
+
+        Returns:
+            ParallelScrapeResults for the jobs this process handled
+        """
+        self.start_time = time.time()
+        self.total_count = 0
+        self.completed_count = 0
+        tasks: List[ScrapeTask] = []
+
+        async def handle(payload: Dict[str, Any]) -> Dict:
+            scraper = scraper_factory(payload['company_name'])
+            task = self._create_tasks([scraper], [payload.get('priority', 0)])[0]
+            tasks.append(task)
+            self.total_count += 1
+
+            await self._execute_single_task(task)
+            if task.result is None:
+                raise task.error or RuntimeError(f"{task.scraper.company_name}: no result")
+            return task.result
+
+        base_id = worker_id or default_worker_id()
+        workers = [
+            QueueWorker(
+                queue,
+                {COMPETITOR_JOB: handle},
+                worker_id=f"{base_id}-{i}",
+                visibility_timeout=self.config.scraper_timeout * 2,
+                poll_interval=poll_interval
+            )
+            for i in range(self.config.max_concurrent_scrapers)
+        ]
+        await asyncio.gather(*(w.run(stop_when_empty=stop_when_empty) for w in workers))
+
+        return self._generate_results(tasks, time.time() - self.start_time)
+
+    def _prepare_tasks(
+        self,
+        scrapers: List[DeepDataScraper],
+        priorities: Optional[List[int]] = None
+    ) -> List[ScrapeTask]:
+        """Reset progress counters and create priority-sorted tasks"""
+        self.start_time = time.time()
+        self.total_count = len(scrapers)
+        self.completed_count = 0
+
+        tasks = self._create_tasks(scrapers, priorities)
+
+        # Sort by priority (higher first)
+        tasks.sort(key=lambda t: t.priority, reverse=True)
+        return tasks
+
     def _create_tasks(
         self,
         scrapers: List[DeepDataScraper],
@@ -290,13 +404,57 @@ class ParallelScraper:
         domain = url.split('/')[0]
         return domain
 
-    async def _execute_tasks(self, tasks: List[ScrapeTask]):
-        """Execute all tasks in parallel with concurrency limits"""
-        # Create coroutines for all tasks
-        coroutines = [self._execute_single_task(task) for task in tasks]
+    async def _iter_completed(self, tasks: List[ScrapeTask]) -> AsyncIterator[ScrapeTask]:
+        """Run all tasks with concurrency limits, yielding each as it finishes"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.total_timeout
+        order = {id(task): index for index, task in enumerate(tasks)}
+        running = {
+            asyncio.create_task(self._execute_single_task(task)): task
+            for task in tasks
+        }
 
-        # Execute with gather to run in parallel
-        await asyncio.gather(*coroutines, return_exceptions=True)
+        try:
+            while running:
+                remaining = deadline - loop.time()
+                done = set()
+                if remaining > 0:
+                    done, _ = await asyncio.wait(
+                        running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                    )
+                if not done:
+                    logger.error(
+                        f"⏱️ Parallel scraping timed out after "
+                        f"{self.config.total_timeout}s"
+                    )
+                    break
+
+                stop = False
+                for future in sorted(done, key=lambda f: order[id(running[f])]):
+                    task = running.pop(future)
+                    if future.exception() is not None and not self.config.continue_on_error:
+                        stop = True
+                    yield task
+                if stop:
+                    logger.error("🛑 Stopping parallel scraping after failure (continue_on_error=False)")
+                    break
+
+            # Deadline or stop: cancel what is left; running scrapers salvage partial data
+            cancelled = list(running.items())
+            for future, _ in cancelled:
+                future.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            running.clear()
+
+            for _, task in sorted(cancelled, key=lambda item: order[id(item[1])]):
+                if task.is_partial:
+                    yield task
+        finally:
+            # Consumer stopped iterating early
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
     async def _execute_single_task(self, task: ScrapeTask):
         """Execute a single scrape task"""
@@ -334,6 +492,16 @@ class ParallelScraper:
                         f"⏱️ Timeout: {task.scraper.company_name} "
                         f"({self.config.scraper_timeout}s)"
                     )
+                    await self._salvage_partial(
+                        task, f"timed out after {self.config.scraper_timeout}s"
+                    )
+
+                except asyncio.CancelledError:
+                    # Whole run hit total_timeout (or the consumer stopped)
+                    task.status = "timeout"
+                    task.error = TimeoutError("Parallel run cancelled before scraper finished")
+                    await self._salvage_partial(task, "parallel run cancelled")
+                    raise
 
                 except Exception as e:
                     task.status = "failed"
@@ -351,6 +519,32 @@ class ParallelScraper:
 
                     self.completed_count += 1
 
+    async def _salvage_partial(self, task: ScrapeTask, reason: str):
+        """Keep whatever a cancelled scraper already collected, flagged as partial.
+
+        wait_for only returns once the cancelled scrape() has run its
+        cleanup, so scraper.data is no longer being written to.
+        """
+        if not self.config.collect_partial_results:
+            return
+
+        scraper = task.scraper
+        try:
+            scraper.data['data_completeness_pct'] = await scraper.calculate_completeness()
+        except Exception as e:
+            logger.debug(f"Completeness of partial result failed: {e}")
+
+        note = f"{PARTIAL_RESULT_NOTE}: {reason}"
+        existing = scraper.data.get('notes')
+        scraper.data['notes'] = f"{note}; {existing}" if existing else note
+
+        task.result = scraper.data
+        task.status = "partial"
+        logger.info(
+            f"🧩 Salvaged partial result for {scraper.company_name} "
+            f"({scraper.data.get('data_completeness_pct', 0):.1f}% complete)"
+        )
+
     async def _monitor_progress(self, tasks: List[ScrapeTask]):
         """Monitor and report progress"""
         while True:
@@ -392,7 +586,8 @@ class ParallelScraper:
         """Generate results object from completed tasks"""
         successful_count = sum(1 for t in tasks if t.status == "completed")
         failed_count = sum(1 for t in tasks if t.status == "failed")
-        timeout_count = sum(1 for t in tasks if t.status == "timeout")
+        partial_count = sum(1 for t in tasks if t.status == "partial")
+        timeout_count = sum(1 for t in tasks if t.status == "timeout") + partial_count
 
         # Calculate average duration (only for completed tasks)
         completed_durations = [
@@ -413,7 +608,8 @@ class ParallelScraper:
             failed_count=failed_count,
             timeout_count=timeout_count,
             average_duration=average_duration,
-            throughput=throughput
+            throughput=throughput,
+            partial_count=partial_count
         )
 
 
@@ -439,6 +635,38 @@ async def scrape_companies_parallel(
     return results.get_successful_results()
 
 
+def enqueue_scrapers(
+    queue: WorkQueue,
+    scrapers: List[DeepDataScraper],
+    priorities: Optional[List[int]] = None,
+    run_key: Optional[str] = None
+) -> List[Optional[int]]:
+    """
+    Queue one competitor job per scraper for ParallelScraper.scrape_from_queue.
+
+    Args:
+        queue: Work queue
+        scrapers: Scraper instances (only company_name is queued)
+        priorities: Optional priority for each scraper (higher = earlier)
+        run_key: Dedupe scope (default today's date): a competitor already
+            pending for the same run_key is not queued again
+
+    Returns:
+        Job ids (None for jobs that were already pending)
+    """
+    run_key = run_key or datetime.now().strftime('%Y-%m-%d')
+    jobs = []
+    for i, scraper in enumerate(scrapers):
+        priority = priorities[i] if priorities and i < len(priorities) else 0
+        jobs.append({
+            'kind': COMPETITOR_JOB,
+            'payload': {'company_name': scraper.company_name, 'priority': priority},
+            'priority': priority,
+            'dedupe_key': f"{COMPETITOR_JOB}:{scraper.company_name}:{run_key}",
+        })
+    return queue.enqueue_many(jobs)
+
+
 async def scrape_with_priorities(
     scrapers: List[DeepDataScraper],
     priorities: List[int],
@@ -9,7 +9,6 @@ Uses Botasaurus, Playwright, and all available tools to ensure success
 
 from botasaurus.browser import browser, Driver
 from botasaurus.user_agent import UserAgent
-from bs4 import BeautifulSoup
 import re
 import time
 import json
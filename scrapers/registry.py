@@ -0,0 +1,67 @@
+"""
+Scraper Registry
+Maps competitor names to their scraper classes without importing them
+
+Each competitor's scraper lives in its own module under scrapers.competitors.
+The registry stores "module:Class" paths and imports a module on first
+lookup, so a job scraping one competitor loads one scraper module instead of
+all of them. Playwright itself is only imported once a browser is launched.
+
+Usage:
+    from scrapers.registry import create_scraper
+    scraper = create_scraper('McRent', use_browserless=False)
+    data = await scraper.scrape()
+"""
+
+import importlib
+from typing import Dict, List, Optional, Type
+
+# Competitor name -> "module:Class"
+SCRAPER_REGISTRY: Dict[str, str] = {
+    'Roadsurfer': 'scrapers.competitors.roadsurfer:RoadsurferScraper',
+    'McRent': 'scrapers.competitors.mcrent:McRentScraper',
+    'Goboony': 'scrapers.competitors.goboony:GoboonyScraper',
+    'Yescapa': 'scrapers.competitors.yescapa:YescapaScraper',
+    'Camperdays': 'scrapers.competitors.camperdays:CamperdaysScraper',
+    'Outdoorsy': 'scrapers.competitors.outdoorsy:OutdoorsyScraper',
+    'RVshare': 'scrapers.competitors.rvshare:RVshareScraper',
+    'Cruise America': 'scrapers.competitors.cruise_america:CruiseAmericaScraper',
+}
+
+# Class name -> module, for the lazy re-exports in scrapers and tier1_scrapers
+SCRAPER_CLASSES: Dict[str, str] = {
+    path.split(':')[1]: path.split(':')[0] for path in SCRAPER_REGISTRY.values()
+}
+SCRAPER_CLASSES['GoboonyScrap'] = 'scrapers.competitors.goboony'
+
+
+def load_class(class_name: str) -> Type:
+    """
+    Import a scraper class by class name.
+
+    Raises:
+        AttributeError: If no registered module defines class_name
+    """
+    module_name = SCRAPER_CLASSES.get(class_name)
+    if module_name is None:
+        raise AttributeError(f"No scraper class named {class_name!r}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_scraper_class(company_name: str) -> Optional[Type]:
+    """Scraper class for a competitor, or None if there is no scraper for it"""
+    path = SCRAPER_REGISTRY.get(company_name)
+    if path is None:
+        return None
+    return load_class(path.split(':')[1])
+
+
+def create_scraper(company_name: str, **kwargs):
+    """Scraper instance for a competitor, or None if there is no scraper for it"""
+    scraper_class = get_scraper_class(company_name)
+    return scraper_class(**kwargs) if scraper_class else None
+
+
+def registered_competitors() -> List[str]:
+    """Competitors that have a scraper, in registry order"""
+    return list(SCRAPER_REGISTRY)
@@ -22,6 +22,7 @@ from utils.circuit_breaker import (
     CircuitBreakerRegistry,
     get_global_registry
 )
+from utils.retry_policy import RetryBudget, RetryPolicy
 from scrapers.base_scraper import DeepDataScraper
 
 
@@ -36,10 +37,16 @@ class ResilientScraperConfig:
         timeout_seconds: int = 60,
         half_open_max_calls: int = 3,
 
-        # Retry settings
+        # Retry settings (per failed sub-step, see DeepDataScraper.retry_step)
         max_retries: int = 3,
         retry_delay_seconds: float = 2.0,
         exponential_backoff: bool = True,
+        max_retry_delay_seconds: float = 30.0,
+        jitter: bool = True,
+
+        # Per-run limits shared by every scraper in a scrape_all() call
+        run_retry_budget: Optional[int] = 10,
+        run_deadline_seconds: Optional[float] = None,
 
         # Fallback settings
         use_fallback_data: bool = True,
@@ -54,6 +61,15 @@ class ResilientScraperConfig:
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
         self.exponential_backoff = exponential_backoff
+        self.retry_policy = RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay_seconds,
+            max_delay=max_retry_delay_seconds,
+            exponential=exponential_backoff,
+            jitter=jitter
+        )
+        self.run_retry_budget = run_retry_budget
+        self.run_deadline_seconds = run_deadline_seconds
         self.use_fallback_data = use_fallback_data
         self.fallback_data_age_hours = fallback_data_age_hours
 
@@ -64,7 +80,8 @@ class ResilientScraper:
 
     Features:
     - Circuit breaker protection
-    - Automatic retries with exponential backoff
+    - Retries of failed sub-steps with jittered exponential backoff,
+      limited by a run-wide retry budget and deadline
     - Fallback to cached data
     - Detailed error tracking
     - Graceful degradation
@@ -79,12 +96,14 @@ class ResilientScraper:
         self,
         scraper: DeepDataScraper,
         config: Optional[ResilientScraperConfig] = None,
-        registry: Optional[CircuitBreakerRegistry] = None
+        registry: Optional[CircuitBreakerRegistry] = None,
+        budget: Optional[RetryBudget] = None
     ):
         self.scraper = scraper
         self.config = config or ResilientScraperConfig()
         self.registry = registry or get_global_registry()
         self.company_name = scraper.company_name
+        self.budget = budget
 
         # Statistics
         self.stats = {
@@ -111,66 +130,45 @@ class ResilientScraper:
             self.config.circuit_config
         )
 
-        # Try with retries
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                # Execute through circuit breaker
-                result = await breaker.call(self._execute_scrape)
-
-                self.stats['successful_scrapes'] += 1
-
-                if attempt > 0:
-                    logger.info(
-                        f"✅ {self.company_name}: Succeeded on attempt {attempt + 1}"
-                    )
-
-                return self._format_result(result, success=True)
-
-            except CircuitBreakerOpenError as e:
-                # Circuit breaker is blocking
-                self.stats['circuit_breaker_blocks'] += 1
-                logger.warning(
-                    f"🚫 {self.company_name}: Circuit breaker blocked attempt"
-                )
-
-                # Try fallback immediately
-                return await self._handle_fallback(str(e))
-
-            except Exception as e:
-                self.stats['failed_scrapes'] += 1
+        # Failed sub-steps (navigation, booking simulation) are retried inside
+        # the scrape under the shared policy and budget - the full browser
+        # scrape itself runs once
+        self.scraper.retry_budget = self.budget
+        self.scraper.step_retry_policy = self.config.retry_policy
+        retries_before = self.scraper.step_retries
 
-                # If we have more retries, wait and try again
-                if attempt < self.config.max_retries:
-                    self.stats['retries_used'] += 1
-                    delay = self._calculate_retry_delay(attempt)
+        try:
+            # Execute through circuit breaker
+            result = await breaker.call(self._execute_scrape)
+
+        except CircuitBreakerOpenError as e:
+            # Circuit breaker is blocking
+            self.stats['circuit_breaker_blocks'] += 1
+            logger.warning(
+                f"🚫 {self.company_name}: Circuit breaker blocked attempt"
+            )
 
-                    logger.warning(
-                        f"⚠️ {self.company_name}: Attempt {attempt + 1} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
+            # Try fallback immediately
+            return await self._handle_fallback(str(e))
 
-                    await asyncio.sleep(delay)
-                else:
-                    # All retries exhausted
-                    logger.error(
-                        f"❌ {self.company_name}: All {self.config.max_retries + 1} "
-                        f"attempts failed. Last error: {e}"
-                    )
+        except Exception as e:
+            self.stats['failed_scrapes'] += 1
+            logger.error(f"❌ {self.company_name}: Scrape failed: {e}")
+            return await self._handle_fallback(str(e))
 
-                    return await self._handle_fallback(str(e))
+        finally:
+            self.stats['retries_used'] += self.scraper.step_retries - retries_before
 
-        # Should not reach here, but handle gracefully
-        return await self._handle_fallback("Unknown error")
+        self.stats['successful_scrapes'] += 1
+        return self._format_result(result, success=True)
 
     async def _execute_scrape(self) -> Dict[str, Any]:
         """Execute the actual scrape (called through circuit breaker)"""
         return await self.scraper.scrape()
 
     def _calculate_retry_delay(self, attempt: int) -> float:
-        """Calculate delay before retry (with optional exponential backoff)"""
-        if self.config.exponential_backoff:
-            return self.config.retry_delay_seconds * (2 ** attempt)
-        return self.config.retry_delay_seconds
+        """Calculate delay before retry (jittered, see RetryPolicy.backoff)"""
+        return self.config.retry_policy.backoff(attempt)
 
     async def _handle_fallback(self, error_msg: str) -> Dict[str, Any]:
         """Handle fallback when scraping fails"""
@@ -287,6 +285,15 @@ class ResilientScraperOrchestrator:
             default_config=self.config.circuit_config
         )
         self.resilient_scrapers: Dict[str, ResilientScraper] = {}
+        self.budget: Optional[RetryBudget] = None
+
+    def start_run(self) -> RetryBudget:
+        """Start a new run: fresh retry budget and deadline for every scraper"""
+        self.budget = RetryBudget(
+            max_retries=self.config.run_retry_budget,
+            deadline_seconds=self.config.run_deadline_seconds
+        )
+        return self.budget
 
     async def scrape_single(self, scraper: DeepDataScraper) -> Dict[str, Any]:
         """Scrape single company with resilience"""
@@ -299,6 +306,8 @@ class ResilientScraperOrchestrator:
             )
 
         resilient = self.resilient_scrapers[scraper.company_name]
+        resilient.scraper = scraper
+        resilient.budget = self.budget or self.start_run()
         return await resilient.scrape_with_resilience()
 
     async def scrape_all(
@@ -319,6 +328,7 @@ class ResilientScraperOrchestrator:
             List of results
         """
         results = []
+        self.start_run()
 
         if parallel:
             logger.info(
@@ -380,6 +390,7 @@ class ResilientScraperOrchestrator:
                 total_stats[key] += stats['stats'][key]
 
         return {
+            'retry_budget': self.budget.get_stats() if self.budget else None,
             'summary': {
                 'total_companies': len(self.resilient_scrapers),
                 'total_attempts': total_stats['total_attempts'],
@@ -81,6 +81,49 @@ class SmartTextExtractor:
         ],
     }
 
+    # Price tokens like: €85, $120, 85€, 120 EUR
+    PRICE_PATTERNS = [
+        r'€\s*(\d+(?:\.\d{2})?)',
+        r'\$\s*(\d+(?:\.\d{2})?)',
+        r'(\d+(?:\.\d{2})?)\s*€',
+        r'(\d+(?:\.\d{2})?)\s*EUR',
+    ]
+
+    # SmartTextExtractor field -> scraper data field
+    DATA_FIELD_MAP = {
+        'insurance': 'insurance_cost_per_day',
+        'cleaning_fee': 'cleaning_fee',
+        'booking_fee': 'booking_fee',
+        'min_rental_days': 'min_rental_days',
+        'mileage_limit': 'mileage_limit_km',
+        'mileage_cost': 'mileage_cost_per_km',
+        'one_way_fee': 'one_way_fee',
+        'weekend_premium': 'weekend_premium_pct',
+        'fuel_policy': 'fuel_policy',
+        'one_way_rental_allowed': 'one_way_rental_allowed',
+    }
+
+    @classmethod
+    def extract_prices(cls, text: str) -> List[float]:
+        """Tokenize all price values in text, in pattern order"""
+        prices = []
+        for pattern in cls.PRICE_PATTERNS:
+            prices.extend(float(m) for m in re.findall(pattern, text))
+        return prices
+
+    @classmethod
+    def to_data_fields(cls, extracted: Dict[str, Any]) -> Dict[str, Any]:
+        """Map extract_all_fields() output onto scraper data field names"""
+        fields = {}
+        for key, value in extracted.items():
+            if key == 'free_cancellation' and value is not None:
+                fields['cancellation_policy'] = 'Free cancellation' if value else 'Non-refundable'
+            elif key in cls.DATA_FIELD_MAP and value:
+                if key in ('min_rental_days', 'mileage_limit'):
+                    value = int(value)
+                fields[cls.DATA_FIELD_MAP[key]] = value
+        return fields
+
     @classmethod
     def extract_all_fields(cls, text: str) -> Dict[str, Any]:
         """Extract all possible fields from text"""
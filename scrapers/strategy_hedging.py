@@ -0,0 +1,257 @@
+"""
+Hedged Strategy Execution
+Runs the historically best scraping strategy first and hedges slow attempts
+
+Per-company, per-strategy outcomes (success and latency over a sliding
+window) are persisted to JSON between runs. The executor orders strategies
+by smoothed success rate then median latency, starts the best one, and if it
+has not finished by a percentile of its own past latency, launches the next
+strategy alongside it. The first success wins and the loser is cancelled.
+
+Usage:
+    stats = StrategyStats("output/strategy_stats.json")
+    executor = HedgedStrategyExecutor(stats, controller.run_strategy)
+    result = await executor.execute('McRent', ['playwright_stealth', 'botasaurus_stealth'])
+    stats.save()
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+@dataclass
+class HedgingConfig:
+    """Hedging knobs for one executor.
+
+    Attributes:
+        hedge_percentile (float): Past-latency percentile after which a hedge starts
+        min_samples (int): Successful runs needed before the percentile is trusted
+        default_hedge_delay (float): Seconds to wait before hedging without history
+        min_hedge_delay (float): Lower bound for any hedge delay
+        max_hedge_delay (float): Upper bound for any hedge delay
+        max_parallel (int): Strategies allowed to run at the same time
+        window (int): Outcomes kept per strategy
+    """
+    hedge_percentile: float = 0.9
+    min_samples: int = 3
+    default_hedge_delay: float = 60.0
+    min_hedge_delay: float = 5.0
+    max_hedge_delay: float = 300.0
+    max_parallel: int = 2
+    window: int = 50
+
+
+class StrategyStats:
+    """
+    Sliding-window success and latency history per company and strategy.
+
+    Args:
+        path: JSON file the history is loaded from and saved to (None keeps it in memory)
+        window: Outcomes kept per strategy; older ones are forgotten so
+            rankings follow site changes
+    """
+
+    def __init__(self, path: Optional[str] = None, window: int = 50):
+        self.path = Path(path) if path else None
+        self.window = window
+        self.history: Dict[str, Dict[str, List[Dict]]] = {}
+        self.load()
+
+    def load(self):
+        """Load persisted history (a missing or corrupt file starts empty)"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.history = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading strategy stats: {e}")
+            self.history = {}
+
+    def save(self):
+        """Persist history atomically"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self.history, f, indent=2)
+            tmp.replace(self.path)
+        except Exception as e:
+            logger.error(f"Error saving strategy stats: {e}")
+
+    def record(self, company: str, strategy: str, success: bool, latency: float):
+        """Add one finished attempt"""
+        outcomes = self.history.setdefault(company, {}).setdefault(strategy, [])
+        outcomes.append({
+            'success': bool(success),
+            'latency': round(latency, 3),
+            'timestamp': datetime.now().isoformat()
+        })
+        del outcomes[:-self.window]
+
+    def _outcomes(self, company: str, strategy: str) -> List[Dict]:
+        return self.history.get(company, {}).get(strategy, [])
+
+    def success_rate(self, company: str, strategy: str) -> float:
+        """Smoothed success rate: untried strategies score 0.5"""
+        outcomes = self._outcomes(company, strategy)
+        successes = sum(1 for o in outcomes if o['success'])
+        return (successes + 1) / (len(outcomes) + 2)
+
+    def latencies(self, company: str, strategy: str) -> List[float]:
+        """Latencies of successful attempts"""
+        return [o['latency'] for o in self._outcomes(company, strategy) if o['success']]
+
+    def median_latency(self, company: str, strategy: str) -> Optional[float]:
+        latencies = self.latencies(company, strategy)
+        return statistics.median(latencies) if latencies else None
+
+    def latency_percentile(self, company: str, strategy: str, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile of successful latencies (None without history)"""
+        latencies = sorted(self.latencies(company, strategy))
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, max(0, int(round(percentile * len(latencies))) - 1))
+        return latencies[index]
+
+    def rank(self, company: str, strategies: List[str]) -> List[str]:
+        """Best first: higher success rate, then lower median latency, then given order"""
+        def key(item):
+            position, strategy = item
+            median = self.median_latency(company, strategy)
+            return (-self.success_rate(company, strategy),
+                    median if median is not None else float('inf'),
+                    position)
+
+        return [strategy for _, strategy in sorted(enumerate(strategies), key=key)]
+
+    def summary(self, company: str) -> Dict[str, Dict[str, Any]]:
+        """Per-strategy attempts, success rate and median latency"""
+        return {
+            strategy: {
+                'attempts': len(outcomes),
+                'success_rate': self.success_rate(company, strategy),
+                'median_latency': self.median_latency(company, strategy),
+            }
+            for strategy, outcomes in self.history.get(company, {}).items()
+        }
+
+
+class HedgedStrategyExecutor:
+    """
+    Run strategies best-first, hedging a slow attempt with the next one.
+
+    Args:
+        stats: Strategy history used for ordering and hedge delays; updated
+            with every attempt that finishes (cancelled losers are not recorded)
+        run_strategy: Coroutine function (company, strategy) -> result dict
+            with a 'success' key
+        config: Hedging knobs
+    """
+
+    def __init__(
+        self,
+        stats: StrategyStats,
+        run_strategy: Callable[[str, str], Awaitable[Dict]],
+        config: Optional[HedgingConfig] = None
+    ):
+        self.stats = stats
+        self.run_strategy = run_strategy
+        self.config = config or HedgingConfig()
+
+    def hedge_delay(self, company: str, strategy: str) -> float:
+        """Seconds to give a strategy before starting a hedge"""
+        delay = None
+        if len(self.stats.latencies(company, strategy)) >= self.config.min_samples:
+            delay = self.stats.latency_percentile(company, strategy, self.config.hedge_percentile)
+        if delay is None:
+            delay = self.config.default_hedge_delay
+        return min(max(delay, self.config.min_hedge_delay), self.config.max_hedge_delay)
+
+    async def _attempt(self, company: str, strategy: str) -> Dict:
+        start = time.monotonic()
+        try:
+            result = await self.run_strategy(company, strategy)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        if not isinstance(result, dict):
+            result = {'success': False, 'error': f'Strategy {strategy} returned {type(result).__name__}'}
+
+        success = bool(result.get('success', False))
+        self.stats.record(company, strategy, success, time.monotonic() - start)
+        return result
+
+    async def execute(self, company: str, strategies: List[str]) -> Dict:
+        """
+        Run strategies until one succeeds.
+
+        Returns:
+            The winning result (with 'strategy_used' set), or a failure dict
+            listing every strategy's error
+        """
+        pending = self.stats.rank(company, strategies)
+        running: Dict[asyncio.Task, str] = {}
+        started_at: Dict[asyncio.Task, float] = {}
+        errors: Dict[str, str] = {}
+
+        def launch(hedge: bool = False):
+            strategy = pending.pop(0)
+            if hedge:
+                logger.info(f"🪝 Hedging {company} with {strategy}")
+            else:
+                logger.info(f"🔄 Trying strategy: {strategy}")
+            task = asyncio.ensure_future(self._attempt(company, strategy))
+            running[task] = strategy
+            started_at[task] = time.monotonic()
+
+        try:
+            while pending or running:
+                if not running:
+                    launch()
+
+                timeout = None
+                if pending and len(running) < self.config.max_parallel:
+                    # Hedge when the newest attempt outlives its usual latency
+                    newest = max(running, key=started_at.get)
+                    elapsed = time.monotonic() - started_at[newest]
+                    timeout = max(0.0, self.hedge_delay(company, running[newest]) - elapsed)
+
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch(hedge=True)
+                    continue
+
+                for task in done:
+                    strategy = running.pop(task)
+                    result = task.result()
+                    if result.get('success', False):
+                        logger.info(f"✅ SUCCESS with {strategy} for {company}")
+                        return {**result, 'strategy_used': strategy}
+                    errors[strategy] = result.get('error', 'unknown error')
+                    logger.warning(f"❌ Strategy {strategy} failed for {company}")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return {
+            'company_name': company,
+            'success': False,
+            'error': 'All advanced strategies failed',
+            'strategy_errors': errors,
+            'daily_prices': [],
+            'vehicles': []
+        }
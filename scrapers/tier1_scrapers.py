@@ -1,4017 +1,35 @@
 """
 Tier 1 Competitor Scrapers - Daily Monitoring
 Deep data collection for top 5 competitors
+
+The scrapers live in scrapers.competitors, one module per competitor. The
+names below stay importable from here and are loaded on first access, so
+`from scrapers.tier1_scrapers import McRentScraper` only imports McRent.
 """
 
 import asyncio
-import sys
-import re
-import statistics
-from datetime import datetime, timedelta
-from typing import Dict
 from loguru import logger
-from .base_scraper import DeepDataScraper
-from .competitor_config import get_competitor_by_name
-
-if sys.platform == 'win32':
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-
-class RoadsurferScraper(DeepDataScraper):
-    """Deep scraper for Roadsurfer - #1 Competitor"""
-    
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Roadsurfer")
-        super().__init__("Roadsurfer", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'interactive_booking_simulation'
-    
-    async def scrape_deep_data(self, page):
-        """
-        Comprehensive multi-page data collection with enhanced extraction.
-
-        Strategy:
-        1. Homepage - Reviews, promotions, structured data
-        2. Pricing page - Prices, fees, policies
-        3. Booking page - Interactive pricing
-        4. Vehicles page - Fleet info
-        5. Locations page - Station/depot data
-        6. FAQ/Terms - Policies and conditions
-        """
-
-        # 1. Start at homepage for reviews and general info
-        try:
-            homepage_loaded = await self.navigate_smart(page, self.config['urls']['homepage'])
-            if homepage_loaded:
-                # Extract reviews from homepage
-                review_data = await self.extract_customer_reviews(page)
-                self.data['customer_review_avg'] = review_data['avg']
-                self.data['review_count'] = review_data['count']
-
-                # Detect promotions on homepage
-                promotions = await self.detect_promotions(page)
-                self.data['active_promotions'] = promotions
-                if promotions:
-                    self.data['promotion_text'] = promotions[0]['text']
-
-                # Enhanced data extraction from homepage
-                await self.extract_enhanced_data_from_page(page)
-
-        except Exception as e:
-            logger.debug(f"Homepage extraction error: {e}")
-
-        # 2. Pricing page - Extract pricing, fees, and policies
-        if self.config['urls'].get('pricing'):
-            pricing_loaded = await self.navigate_smart(page, self.config['urls']['pricing'])
-            if pricing_loaded:
-                # Wait for network to be idle (all AJAX calls complete)
-                try:
-                    await page.wait_for_load_state('networkidle', timeout=60000)  # Increased timeout
-                except Exception as e:
-                    logger.debug(f"Network idle wait timeout (non-critical): {e}")
-                
-                # Wait longer for dynamic content to load
-                await asyncio.sleep(5)  # Increased from 3 to 5 seconds
-                
-                # Check if we got an error page
-                if await self._is_error_page(page):
-                    logger.warning("❌ Error page detected on Roadsurfer pricing page")
-                    # Try booking simulation as fallback
-                    logger.info("🎯 Attempting booking simulation for Roadsurfer...")
-                    success = await self._simulate_booking_universal(page, test_location="Munich")
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ Roadsurfer booking: €{self.data['base_nightly_rate']}/night")
-                        return  # Skip the rest if booking simulation worked
-
-                # Enhanced data extraction from pricing page
-                await self.extract_enhanced_data_from_page(page)
-
-                # Get all text and extract prices AND discounts
-                page_text = await page.evaluate('() => document.body.innerText')
-                prices = await self.extract_prices_from_text(page_text)
-
-                if prices:
-                    # Filter for reasonable per-night prices
-                    night_prices = [p for p in prices if 40 <= p <= 400]
-                    if night_prices:
-                        self.data['base_nightly_rate'] = min(night_prices)
-                        self.data['is_estimated'] = False  # Changed from True - text extraction can be accurate
-                        self.data['extraction_method'] = 'text_extraction'
-                        logger.info(f"✅ Static pricing: €{self.data['base_nightly_rate']}/night")
-
-                # Extract discounts from pricing page
-                await self._extract_discounts_from_text(page_text)
-
-                # Extract mileage info from pricing page
-                await self._extract_mileage_from_text(page_text)
-
-        # 3. If no price yet, try universal booking simulation
-        if not self.data.get('base_nightly_rate') or self.data['base_nightly_rate'] == 0:
-            booking_url = self.config['urls'].get('booking') or self.config['urls'].get('pricing')
-            if booking_url:
-                await self.navigate_smart(page, booking_url)
-            
-            # Try new universal booking simulator first
-            logger.info("🎯 Attempting universal booking simulation...")
-            success = await self._simulate_booking_universal(page, test_location="Berlin, Germany")
-            
-            if success and self.data.get('base_nightly_rate'):
-                logger.info(f"✅ Universal booking: EUR{self.data['base_nightly_rate']}/night")
-            else:
-                # Fallback to old booking simulation
-                await self._simulate_booking_for_pricing(page)
-
-        # 3. Try vehicles page for fleet info
-        if self.config['urls'].get('vehicles'):
-            vehicles_loaded = await self.navigate_smart(page, self.config['urls']['vehicles'])
-            if vehicles_loaded:
-                await self._scrape_vehicles(page)
-
-        # 4. Extract locations (dedicated page or from current page)
-        if self.config['urls'].get('locations'):
-            locations_loaded = await self.navigate_smart(page, self.config['urls']['locations'])
-            if locations_loaded:
-                await self._scrape_locations(page)
-                # Extract additional data from locations page
-                await self.extract_enhanced_data_from_page(page)
-        else:
-            # Try to extract from current page
-            await self._scrape_locations(page)
-
-        # 4.5 Visit FAQ/Terms pages for policy data
-        await self._scrape_faq_and_terms(page)
-
-        # 5. Extract insurance and fees from current page (avoid extra navigation)
-        try:
-            await self._scrape_insurance_and_fees(page)
-        except Exception as e:
-            logger.debug(f"Insurance extraction error: {e}")
-
-        # 6. Extract policies from current page (avoid extra navigation)
-        try:
-            await self._scrape_policies(page)
-        except Exception as e:
-            logger.debug(f"Policy extraction error: {e}")
-
-        # 7. Enhanced review extraction - try to get rating if we only have count
-        try:
-            if not self.data['customer_review_avg'] and self.data['review_count']:
-                await self._extract_trustpilot_rating(page)
-        except Exception as e:
-            logger.debug(f"Trustpilot extraction error: {e}")
-
-        # 8. Try to extract fees from pricing page HTML/API
-        try:
-            if not self.data['insurance_cost_per_day'] or not self.data['cleaning_fee']:
-                await self._extract_fees_from_booking_widget(page)
-        except Exception as e:
-            logger.debug(f"Fee extraction error: {e}")
-
-        # 9. Check for referral and discount codes
-        try:
-            await self._extract_program_features(page)
-        except Exception as e:
-            logger.debug(f"Program features error: {e}")
-
-        # 10. Payment options
-        try:
-            self.data['payment_options'] = await self.detect_payment_options(page)
-        except Exception as e:
-            logger.debug(f"Payment options error: {e}")
-    
-    async def _scrape_pricing_page_static(self, page):
-        """Extract pricing information from static content (fallback method)"""
-        try:
-            # Get all text on page
-            page_text = await page.evaluate('() => document.body.innerText')
-
-            # Extract prices
-            prices = await self.extract_prices_from_text(page_text)
-            if prices:
-                # Assume lowest is base rate
-                self.data['base_nightly_rate'] = min(prices)
-                self.data['is_estimated'] = True
-                logger.info(f"Static extraction: €{self.data['base_nightly_rate']}/night (estimated)")
-
-            # Look for discount percentages
-            discount_patterns = [
-                r'save\s*(\d+)%',
-                r'(\d+)%\s*off',
-                r'discount\s*(\d+)%'
-            ]
-
-            for pattern in discount_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    discount_pct = float(match.group(1))
-                    self.data['early_bird_discount_pct'] = discount_pct
-                    break
-
-            # Check for mileage info
-            if 'unlimited mileage' in page_text.lower():
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0
-            else:
-                # Try to find mileage limit
-                mileage_match = re.search(r'(\d+)\s*km', page_text)
-                if mileage_match:
-                    self.data['mileage_limit_km'] = int(mileage_match.group(1))
-
-        except Exception as e:
-            logger.error(f"Static pricing extraction failed: {e}")
-
-    async def _simulate_booking_for_pricing(self, page):
-        """
-        Enhanced booking simulation with comprehensive strategies.
-
-        Strategies (in order):
-        1. Monitor ALL API calls for pricing data (improved)
-        2. Click booking triggers and fill forms with multiple fallbacks
-        3. Extract from booking results
-        4. Check collected API prices
-        5. Parse embedded JSON-LD
-        6. Static page scraping (fallback)
-        """
-        try:
-            logger.info("🔄 Enhanced booking simulation starting...")
-
-            # Strategy 1: Monitor API requests (IMPROVED)
-            api_prices = []
-            booking_api_responses = []
-
-            async def handle_response(response):
-                """Monitor ALL responses for pricing data"""
-                try:
-                    url = response.url.lower()
-
-                    # Check if this might contain pricing
-                    pricing_keywords = [
-                        'price', 'booking', 'search', 'quote', 'availability',
-                        'vehicle', 'rent', 'rate', 'cost', 'api', 'graphql'
-                    ]
-
-                    if any(keyword in url for keyword in pricing_keywords):
-                        if response.status == 200:
-                            try:
-                                content_type = response.headers.get('content-type', '')
-
-                                if 'json' in content_type:
-                                    data = await response.json()
-                                    booking_api_responses.append({
-                                        'url': url,
-                                        'data': data
-                                    })
-
-                                    # Extract prices from JSON
-                                    prices = self._extract_prices_from_json_recursive(data)
-                                    if prices:
-                                        api_prices.extend(prices)
-                                        logger.info(f"📡 Found {len(prices)} prices in API: {url[:60]}...")
-
-                            except Exception as e:
-                                logger.debug(f"Could not parse response: {e}")
-                except Exception as e:
-                    logger.debug(f"Response handler error: {e}")
-
-            # Attach listener BEFORE any interactions
-            page.on('response', handle_response)
-
-            # Strategy 2: Wait for page to fully load
-            await asyncio.sleep(3)
-
-            # Strategy 3: Look for and click booking triggers
-            await self._click_booking_trigger(page)
-
-            # Strategy 4: Try to fill booking form
-            form_filled = await self._fill_booking_form_comprehensive(page)
-
-            if form_filled:
-                # Wait for results to load
-                await asyncio.sleep(5)
-
-                # Check for price in results
-                price = await self._extract_price_from_results(page)
-                if price:
-                    self.data['base_nightly_rate'] = price
-                    self.data['is_estimated'] = False
-                    logger.info(f"✅ Booking simulation price: €{price}/night")
-                    return
-
-            # Strategy 5: Check collected API prices
-            if api_prices:
-                # Filter reasonable prices and take median
-                valid_prices = [p for p in api_prices if 30 <= p <= 400]
-                if valid_prices:
-                    price = statistics.median(valid_prices)
-                    self.data['base_nightly_rate'] = price
-                    self.data['is_estimated'] = False
-                    logger.info(f"✅ API extracted price: €{price}/night")
-                    return
-
-            # Strategy 6: Parse embedded JSON-LD
-            price = await self._extract_from_json_ld(page)
-            if price:
-                self.data['base_nightly_rate'] = price
-                self.data['is_estimated'] = True
-                logger.info(f"✅ JSON-LD price: €{price}/night")
-                return
-
-            # Strategy 7: Static page scraping (fallback)
-            logger.warning("⚠️ Could not extract pricing after all strategies, trying static fallback")
-            await self._scrape_pricing_page_static(page)
-
-        except Exception as e:
-            logger.error(f"Booking simulation failed: {e}, falling back to static")
-            await self._scrape_pricing_page_static(page)
-
-    def _extract_prices_from_json_recursive(self, data, depth=0, max_depth=5):
-        """Recursively search JSON for price values"""
-        if depth > max_depth:
-            return []
-
-        prices = []
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                key_lower = key.lower()
-
-                # Check if this is a price field
-                if any(keyword in key_lower for keyword in [
-                    'price', 'rate', 'cost', 'total', 'amount', 'nightly'
-                ]):
-                    if isinstance(value, (int, float)) and 20 <= value <= 500:
-                        prices.append(float(value))
-                    elif isinstance(value, str):
-                        # Try to extract number from string
-                        match = re.search(r'(\d+(?:\.\d{2})?)', value)
-                        if match:
-                            price = float(match.group(1))
-                            if 20 <= price <= 500:
-                                prices.append(price)
-
-                # Recurse into nested structures
-                if isinstance(value, (dict, list)):
-                    prices.extend(self._extract_prices_from_json_recursive(value, depth+1, max_depth))
-
-        elif isinstance(data, list):
-            for item in data:
-                if isinstance(item, (dict, list)):
-                    prices.extend(self._extract_prices_from_json_recursive(item, depth+1, max_depth))
-
-        return prices
-
-    async def _click_booking_trigger(self, page):
-        """Try to click booking/search trigger buttons"""
-
-        # Comprehensive list of possible triggers
-        triggers = [
-            # Text-based selectors
-            'button:has-text("Book")',
-            'button:has-text("Search")',
-            'button:has-text("Find")',
-            'button:has-text("Check availability")',
-            'button:has-text("Get quote")',
-            'button:has-text("Reserve")',
-            'a:has-text("Book now")',
-            'a:has-text("Search")',
-
-            # Class/ID-based selectors
-            '[class*="booking-button"]',
-            '[class*="search-button"]',
-            '[class*="cta-button"]',
-            '[class*="book-now"]',
-            '[id*="booking"]',
-            '[id*="search"]',
-
-            # Data attribute selectors
-            '[data-testid*="booking"]',
-            '[data-testid*="search"]',
-            '[data-action="booking"]',
-            '[data-action="search"]',
-
-            # Specific competitor patterns
-            '.booking-widget-trigger',
-            '.search-form-trigger',
-            '#open-booking',
-        ]
-
-        for trigger in triggers:
-            try:
-                if await page.locator(trigger).count() > 0:
-                    await page.click(trigger, timeout=3000)
-                    logger.info(f"✅ Clicked trigger: {trigger}")
-                    await asyncio.sleep(2)
-                    return True
-            except Exception as e:
-                logger.debug(f"Trigger {trigger} failed: {e}")
-                continue
-
-        logger.debug("No booking trigger found")
-        return False
-
-    async def _fill_booking_form_comprehensive(self, page):
-        """Fill booking form with multiple strategies"""
-
-        # Sample dates (7 days from now, 7-day rental)
-        start_date = datetime.now() + timedelta(days=7)
-        end_date = start_date + timedelta(days=7)
-
-        # Date format variations
-        date_formats = [
-            start_date.strftime('%Y-%m-%d'),
-            start_date.strftime('%d/%m/%Y'),
-            start_date.strftime('%m/%d/%Y'),
-            start_date.strftime('%d.%m.%Y'),
-        ]
-
-        success = False
-
-        # Strategy 1: Fill input[type="date"]
-        date_inputs = await page.query_selector_all('input[type="date"]')
-        if len(date_inputs) >= 2:
-            try:
-                await date_inputs[0].fill(date_formats[0])
-                await date_inputs[1].fill((start_date + timedelta(days=7)).strftime('%Y-%m-%d'))
-                logger.info("✅ Filled date inputs (type=date)")
-                success = True
-            except Exception as e:
-                logger.debug(f"Date input fill failed: {e}")
-
-        # Strategy 2: Fill named inputs
-        start_input = await page.query_selector(
-            'input[name*="start"], input[name*="pickup"], input[name*="from"]'
-        )
-        end_input = await page.query_selector(
-            'input[name*="end"], input[name*="dropoff"], input[name*="to"]'
-        )
-
-        if start_input and end_input:
-            for date_format in date_formats:
-                try:
-                    await start_input.fill(date_format)
-                    await asyncio.sleep(0.3)
-                    await end_input.fill(end_date.strftime('%Y-%m-%d'))
-                    await asyncio.sleep(0.3)
-                    logger.info(f"✅ Filled named inputs with format: {date_format}")
-                    success = True
-                    break
-                except Exception as e:
-                    logger.debug(f"Named input fill failed: {e}")
-                    continue
-
-        # Strategy 3: JavaScript value setting (bypass validation)
-        try:
-            await page.evaluate('''(dates) => {
-                const startInputs = document.querySelectorAll('input[name*="start"], input[name*="pickup"]');
-                const endInputs = document.querySelectorAll('input[name*="end"], input[name*="dropoff"]');
-
-                if (startInputs[0]) startInputs[0].value = dates.start;
-                if (endInputs[0]) endInputs[0].value = dates.end;
-            }''', {
-                'start': date_formats[0],
-                'end': end_date.strftime('%Y-%m-%d')
-            })
-            logger.info("✅ Set dates via JavaScript")
-        except Exception as e:
-            logger.debug(f"JavaScript date setting failed: {e}")
-
-        # Fill location if needed
-        await self._fill_location_field(page)
-
-        # Try to submit form
-        submit_success = await self._submit_booking_form(page)
-
-        return submit_success
-
-    async def _fill_location_field(self, page):
-        """Fill location/station field"""
-
-        location_selectors = [
-            'select[name*="location"]',
-            'select[name*="station"]',
-            'select[name*="pickup"]',
-            'input[name*="location"]',
-            '[data-testid*="location"]',
-        ]
-
-        for selector in location_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if not element:
-                    continue
-
-                tag_name = await element.evaluate('el => el.tagName')
-
-                if tag_name.lower() == 'select':
-                    # Select first real option (skip placeholder)
-                    await element.select_option(index=1)
-                    logger.info("✅ Selected location from dropdown")
-                    return True
-                else:
-                    # For input, try to trigger autocomplete
-                    await element.click()
-                    await asyncio.sleep(0.5)
-                    await page.keyboard.press('ArrowDown')
-                    await asyncio.sleep(0.3)
-                    await page.keyboard.press('Enter')
-                    logger.info("✅ Selected location from autocomplete")
-                    return True
-
-            except Exception as e:
-                logger.debug(f"Location fill failed for {selector}: {e}")
-                continue
-
-        return False
-
-    async def _submit_booking_form(self, page):
-        """Try to submit the booking form"""
-
-        submit_selectors = [
-            'button[type="submit"]',
-            'input[type="submit"]',
-            'button:has-text("Search")',
-            'button:has-text("Submit")',
-            'button:has-text("Continue")',
-            'button:has-text("Next")',
-            '[data-testid*="submit"]',
-            '[data-testid*="search"]',
-        ]
-
-        for selector in submit_selectors:
-            try:
-                if await page.locator(selector).count() > 0:
-                    await page.click(selector, timeout=3000)
-                    logger.info(f"✅ Clicked submit: {selector}")
-                    await asyncio.sleep(3)  # Wait for results
-                    return True
-            except Exception as e:
-                logger.debug(f"Submit failed for {selector}: {e}")
-                continue
-
-        # Try pressing Enter in form
-        try:
-            await page.keyboard.press('Enter')
-            logger.info("✅ Submitted via Enter key")
-            await asyncio.sleep(3)
-            return True
-        except Exception as e:
-            logger.debug(f"Enter key submit failed: {e}")
-
-        return False
-
-    async def _extract_price_from_results(self, page):
-        """Extract price from booking results page"""
-
-        # Wait for results to appear
-        result_selectors = [
-            '.vehicle-card',
-            '.search-result',
-            '.booking-result',
-            '[class*="vehicle"]',
-            '[class*="result"]',
-        ]
-
-        for selector in result_selectors:
-            try:
-                if await page.locator(selector).count() > 0:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    break
-            except:
-                continue
-
-        # Extract all visible prices
-        page_text = await page.evaluate('() => document.body.innerText')
-        prices = await self.extract_prices_from_text(page_text)
-
-        if prices:
-            # Filter for per-night prices
-            night_prices = [p for p in prices if 30 <= p <= 400]
-            if night_prices:
-                # Take the minimum (usually base price)
-                return min(night_prices)
-
-        # Try specific price selectors
-        price_selectors = [
-            '[class*="price"]',
-            '[class*="rate"]',
-            '[class*="cost"]',
-            '[data-testid*="price"]',
-        ]
-
-        for selector in price_selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                for element in elements[:5]:  # Check first 5
-                    text = await element.inner_text()
-                    matches = re.findall(r'€?\s*(\d+(?:\.\d{2})?)', text)
-                    for match in matches:
-                        price = float(match)
-                        if 30 <= price <= 400:
-                            return price
-            except Exception as e:
-                logger.debug(f"Price selector {selector} failed: {e}")
-                continue
-
-        return None
-
-    async def _extract_from_json_ld(self, page):
-        """Extract price from JSON-LD structured data"""
-
-        try:
-            json_ld_data = await page.evaluate('''() => {
-                const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                return Array.from(scripts).map(s => {
-                    try {
-                        return JSON.parse(s.textContent);
-                    } catch(e) {
-                        return null;
-                    }
-                }).filter(d => d !== null);
-            }''')
-
-            for data in json_ld_data:
-                # Check for Product or Service type with offers
-                if isinstance(data, dict):
-                    if 'offers' in data:
-                        offers = data['offers']
-                        if isinstance(offers, dict) and 'price' in offers:
-                            price = float(offers['price'])
-                            if 30 <= price <= 400:
-                                return price
-                        elif isinstance(offers, list):
-                            for offer in offers:
-                                if 'price' in offer:
-                                    price = float(offer['price'])
-                                    if 30 <= price <= 400:
-                                        return price
-
-        except Exception as e:
-            logger.debug(f"JSON-LD extraction failed: {e}")
-
-        return None
-
+from .registry import SCRAPER_CLASSES, create_scraper, load_class, registered_competitors
 
-    def _extract_prices_from_json(self, data, prices=None):
-        """
-        Recursively extract numeric values that look like prices from JSON data.
+__all__ = [*SCRAPER_CLASSES, 'scrape_tier_1_competitors']
 
-        Args:
-            data: JSON data (dict, list, or primitive)
-            prices: List to accumulate found prices
 
-        Returns:
-            List of potential prices found
-        """
-        if prices is None:
-            prices = []
+def __getattr__(name: str):
+    if name in SCRAPER_CLASSES:
+        return load_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        try:
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    # Look for price-related keys
-                    if any(keyword in key.lower() for keyword in ['price', 'cost', 'total', 'amount', 'rate', 'fee']):
-                        if isinstance(value, (int, float)):
-                            # Filter reasonable prices
-                            if 10 <= value <= 10000:
-                                prices.append(float(value))
-                    # Recurse into nested structures
-                    self._extract_prices_from_json(value, prices)
-            elif isinstance(data, list):
-                for item in data:
-                    self._extract_prices_from_json(item, prices)
-
-        except Exception as e:
-            logger.debug(f"JSON price extraction error: {e}")
-
-        return prices
-    
-    async def _scrape_vehicles(self, page):
-        """Extract vehicle information"""
-        try:
-            # Find vehicle cards/types
-            vehicle_elements = await page.query_selector_all('[class*="vehicle"], [class*="camper"], [class*="van"]')
-            
-            vehicle_types = []
-            for elem in vehicle_elements[:10]:
-                text = await elem.inner_text()
-                if len(text) < 100:  # Avoid large blocks
-                    vehicle_types.append(text.strip())
-            
-            self.data['vehicle_types'] = list(set(vehicle_types))[:5]
-            self.data['fleet_size_estimate'] = len(vehicle_elements)
-            
-            logger.info(f"Found {len(self.data['vehicle_types'])} vehicle types")
-            
-        except Exception as e:
-            logger.error(f"Vehicle extraction failed: {e}")
-    
-    async def _scrape_insurance_and_fees(self, page):
-        """Extract insurance packages and additional fees with enhanced patterns"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            
-            # Extract all prices from page for analysis
-            all_prices = await self.extract_prices_from_text(page_text)
-            logger.debug(f"Found {len(all_prices)} prices on insurance/fees page: {all_prices[:10]}")
-
-            # Look for insurance costs - expanded patterns
-            insurance_patterns = [
-                r'insurance.*?[€$]\s*(\d+\.?\d*)',
-                r'coverage.*?[€$]\s*(\d+\.?\d*)',
-                r'protection.*?[€$]\s*(\d+\.?\d*)',
-                r'[€$]\s*(\d+\.?\d*).*?(?:per day|daily).*?insurance',
-                r'[€$]\s*(\d+\.?\d*).*?insurance',
-                r'insurance.*?(\d+\.?\d*)\s*[€$]',
-                r'protection plan.*?(\d+\.?\d*)',
-                r'premium.*?insurance.*?(\d+\.?\d*)',
-                # More specific patterns
-                r'(\d+\.?\d*)\s*€.*?(?:insurance|coverage|protection)',
-                r'(?:insurance|coverage).*?from.*?(\d+\.?\d*)',
-            ]
-
-            for pattern in insurance_patterns:
-                matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        price = float(match.group(1))
-                        if 1 < price < 150:  # Reasonable daily insurance cost (€1-150/day)
-                            self.data['insurance_cost_per_day'] = price
-                            logger.info(f"✅ Insurance: €{price}/day (pattern: {pattern[:30]}...)")
-                            break
-                    except (ValueError, IndexError):
-                        continue
-                if self.data['insurance_cost_per_day']:
-                    break
-
-            # Look for cleaning fee - expanded patterns
-            cleaning_patterns = [
-                r'cleaning.*?[€$]\s*(\d+\.?\d*)',
-                r'preparation.*?[€$]\s*(\d+\.?\d*)',
-                r'[€$]\s*(\d+\.?\d*).*?cleaning',
-                r'cleaning.*?(\d+\.?\d*)\s*[€$]',
-                r'final.*?clean.*?(\d+\.?\d*)',
-                r'service.*?fee.*?(\d+\.?\d*)',
-                r'(\d+\.?\d*)\s*€.*?cleaning'
-            ]
-
-            for pattern in cleaning_patterns:
-                matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        price = float(match.group(1))
-                        if 10 < price < 500:  # Reasonable cleaning fee (€10-500)
-                            self.data['cleaning_fee'] = price
-                            logger.info(f"✅ Cleaning fee: €{price}")
-                            break
-                    except (ValueError, IndexError):
-                        continue
-                if self.data['cleaning_fee']:
-                    break
-
-            # Look for booking/service fee
-            booking_patterns = [
-                r'(?:booking|service).*?fee.*?[€$]\s*(\d+\.?\d*)',
-                r'[€$]\s*(\d+\.?\d*).*?(?:booking|service).*?fee',
-                r'booking.*?(\d+\.?\d*)\s*[€$]',
-                r'(\d+\.?\d*)\s*[€$].*?booking'
-            ]
-
-            for pattern in booking_patterns:
-                matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        price = float(match.group(1))
-                        if 0 < price < 300:  # Reasonable booking fee (€0-300)
-                            self.data['booking_fee'] = price
-                            logger.info(f"✅ Booking fee: €{price}")
-                            break
-                    except (ValueError, IndexError):
-                        continue
-                if self.data['booking_fee']:
-                    break
-            
-            # Heuristic fallback: if we found multiple prices, try to infer insurance/cleaning
-            if not self.data['insurance_cost_per_day'] and all_prices:
-                # Insurance typically €5-50/day
-                insurance_candidates = [p for p in all_prices if 5 <= p <= 50]
-                if insurance_candidates:
-                    self.data['insurance_cost_per_day'] = min(insurance_candidates)
-                    self.data['is_estimated'] = True
-                    logger.info(f"✅ Insurance (estimated): €{self.data['insurance_cost_per_day']}/day")
-            
-            if not self.data['cleaning_fee'] and all_prices:
-                # Cleaning typically €50-200
-                cleaning_candidates = [p for p in all_prices if 50 <= p <= 200]
-                if cleaning_candidates:
-                    self.data['cleaning_fee'] = min(cleaning_candidates)
-                    self.data['is_estimated'] = True
-                    logger.info(f"✅ Cleaning fee (estimated): €{self.data['cleaning_fee']}")
-
-        except Exception as e:
-            logger.error(f"Insurance/fees extraction failed: {e}")
-
-    async def _scrape_locations(self, page):
-        """
-        Comprehensive location extraction with multiple strategies.
-
-        Strategies:
-        1. Check current page for location elements
-        2. Visit dedicated locations page if available
-        3. Extract from dropdowns and lists
-        4. Parse from map markers
-        5. Extract from JSON data
-        """
-        try:
-            locations = []
-
-            # Strategy 1: Check current page first
-            locations.extend(await self._extract_locations_from_page(page))
-
-            # Strategy 2: Visit dedicated locations page
-            if len(locations) < 5 and self.config['urls'].get('locations'):
-                logger.info("🔍 Visiting dedicated locations page...")
-                locations_url = self.config['urls']['locations']
-                success = await self.navigate_smart(page, locations_url)
-                if success:
-                    await asyncio.sleep(3)  # Let page load
-                    locations.extend(await self._extract_locations_from_page(page))
-
-            # Strategy 3: Extract from map markers (if present)
-            map_locations = await self._extract_locations_from_map(page)
-            if map_locations:
-                locations.extend(map_locations)
-
-            # Strategy 4: Extract from embedded JSON
-            json_locations = await self._extract_locations_from_json(page)
-            if json_locations:
-                locations.extend(json_locations)
-
-            # Clean and deduplicate
-            locations = self._clean_and_deduplicate_locations(locations)
-
-            if locations:
-                self.data['locations_available'] = locations[:20]  # Keep top 20
-                logger.info(f"✅ Extracted {len(self.data['locations_available'])} unique locations (found {len(locations)} total)")
-            else:
-                logger.warning(f"⚠️ No locations found after all strategies")
-
-        except Exception as e:
-            logger.error(f"Location extraction failed: {e}")
-
-    async def _extract_locations_from_page(self, page):
-        """Extract locations from current page using multiple selectors"""
-        locations = []
-
-        await asyncio.sleep(2)  # Let page load
-
-        # Comprehensive location selectors
-        location_selectors = [
-            # Dropdown options
-            'select[name*="location"] option',
-            'select[name*="station"] option',
-            'select[name*="pickup"] option',
-            'select[name*="depot"] option',
-            'select[id*="location"] option',
-            'select[id*="station"] option',
-
-            # List items
-            '[class*="location-item"]',
-            '[class*="station-item"]',
-            '[class*="depot-item"]',
-            'li[class*="location"]',
-            'li[class*="station"]',
-
-            # Cards and containers
-            'div[class*="location-card"]',
-            'div[class*="station-card"]',
-            '[class*="location-list"]',
-
-            # Links
-            'a[href*="location"]',
-            'a[href*="station"]',
-
-            # Data attributes
-            '[data-location]',
-            '[data-station]',
-            '[data-city]',
-
-            # Generic
-            '.location',
-            '.station',
-            '[class*="pickup"]',
-            '[class*="location"]',
-        ]
-
-        for selector in location_selectors:
-            try:
-                location_elements = await page.query_selector_all(selector)
-                if location_elements:
-                    logger.debug(f"Found {len(location_elements)} elements with selector: {selector}")
-
-                for element in location_elements[:50]:  # Check first 50
-                    text = await element.text_content()
-                    if text:
-                        text = text.strip()
-                        # More permissive filtering
-                        if text and 3 <= len(text) <= 150:
-                            # Skip common non-location text
-                            skip_words = ['select', 'choose', 'option', 'location', 'station', 'pickup']
-                            if not any(skip in text.lower() for skip in skip_words) or len(text) > 15:
-                                locations.append(text)
-
-                if len(locations) >= 10:  # Found meaningful number
-                    logger.info(f"✅ Found {len(locations)} locations with selector: {selector}")
-                    break
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-
-        return locations
-
-    async def _extract_locations_from_map(self, page):
-        """Extract locations from map markers"""
-        try:
-            # Try to find map markers
-            map_data = await page.evaluate('''() => {
-                // Look for Google Maps or Leaflet markers
-                const markers = [];
-
-                // Check for data attributes on map elements
-                const mapElements = document.querySelectorAll('[data-lat], [data-lng], [data-location-name]');
-                for (const elem of mapElements) {
-                    const name = elem.getAttribute('data-location-name') ||
-                                elem.getAttribute('title') ||
-                                elem.textContent?.trim();
-                    if (name && name.length > 2 && name.length < 100) {
-                        markers.push(name);
-                    }
-                }
-
-                // Check for Leaflet markers
-                if (window.L && window.L.Marker) {
-                    // Leaflet markers present
-                }
-
-                return markers;
-            }''')
-
-            if map_data:
-                logger.info(f"✅ Found {len(map_data)} locations from map markers")
-                return map_data
-
-        except Exception as e:
-            logger.debug(f"Map marker extraction failed: {e}")
-
-        return []
-
-    async def _extract_locations_from_json(self, page):
-        """Extract locations from embedded JSON data"""
-        try:
-            json_data = await page.evaluate('''() => {
-                const locations = [];
-
-                // Check window variables
-                if (window.stationData || window.locationData || window.depotData) {
-                    const data = window.stationData || window.locationData || window.depotData;
-                    if (Array.isArray(data)) {
-                        data.forEach(item => {
-                            if (item.name) locations.push(item.name);
-                            if (item.city) locations.push(item.city);
-                            if (item.location) locations.push(item.location);
-                        });
-                    }
-                }
-
-                // Check JSON-LD
-                const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                for (const script of scripts) {
-                    try {
-                        const data = JSON.parse(script.textContent);
-                        if (data.location || data['@type'] === 'Place') {
-                            if (data.location?.address?.addressLocality) {
-                                locations.push(data.location.address.addressLocality);
-                            }
-                            if (data.name) locations.push(data.name);
-                        }
-                    } catch(e) {}
-                }
-
-                return locations;
-            }''')
-
-            if json_data:
-                logger.info(f"✅ Found {len(json_data)} locations from JSON data")
-                return json_data
-
-        except Exception as e:
-            logger.debug(f"JSON location extraction failed: {e}")
-
-        return []
-
-    def _clean_and_deduplicate_locations(self, locations):
-        """Clean and deduplicate location list"""
-        # Remove duplicates (case-insensitive)
-        seen = set()
-        unique_locations = []
-        for loc in locations:
-            loc_lower = loc.lower()
-            if loc_lower not in seen:
-                seen.add(loc_lower)
-                unique_locations.append(loc)
-
-        # Filter out invalid entries
-        filtered = [
-            loc for loc in unique_locations
-            if not loc.isdigit()  # Not just numbers
-            and len(loc) > 2  # Not too short
-            and not loc.startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9'))  # Not starting with number
-            and not loc.lower() in ['select', 'choose', 'option', 'all', 'any']  # Not placeholder text
-        ]
-
-        # Sort by length (longer names usually more specific)
-        filtered.sort(key=len, reverse=True)
-
-        return filtered
-
-    async def _scrape_policies(self, page):
-        """Extract rental policies"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
 
-            # Minimum rental days
-            min_rental_patterns = [
-                r'minimum.*?(\d+)\s*(?:day|night)',
-                r'min.*?(\d+)\s*(?:day|night)',
-                r'at least\s*(\d+)\s*(?:day|night)'
-            ]
-
-            for pattern in min_rental_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    days = int(match.group(1))
-                    if 1 <= days <= 30:  # Reasonable range
-                        self.data['min_rental_days'] = days
-                        logger.info(f"✅ Min rental: {days} days")
-                        break
-
-            # Fuel policy
-            if 'full to full' in page_text.lower() or 'full-to-full' in page_text.lower():
-                self.data['fuel_policy'] = 'Full to Full'
-            elif 'same to same' in page_text.lower():
-                self.data['fuel_policy'] = 'Same to Same'
-            elif 'prepaid' in page_text.lower() and 'fuel' in page_text.lower():
-                self.data['fuel_policy'] = 'Prepaid'
-
-            # Cancellation policy
-            if 'free cancellation' in page_text.lower():
-                self.data['cancellation_policy'] = 'Free Cancellation'
-            elif 'flexible' in page_text.lower() and 'cancel' in page_text.lower():
-                self.data['cancellation_policy'] = 'Flexible'
-            elif 'refundable' in page_text.lower():
-                self.data['cancellation_policy'] = 'Refundable'
-            elif 'non-refundable' in page_text.lower():
-                self.data['cancellation_policy'] = 'Non-Refundable'
-
-            logger.info(f"✅ Policies extracted")
-
-        except Exception as e:
-            logger.error(f"Policy extraction failed: {e}")
-
-    async def _scrape_faq_and_terms(self, page):
-        """
-        Visit FAQ and Terms pages for additional policy data.
-
-        Extracts:
-        - Detailed cancellation policies
-        - Age restrictions
-        - Additional fees
-        - Insurance details
-        - Mileage policies
-        """
-        try:
-            # Common FAQ/Terms page patterns
-            faq_patterns = [
-                'faq', 'faqs', 'help', 'questions',
-                'terms', 'conditions', 'policies',
-                'rental-conditions', 'booking-terms'
-            ]
-
-            # Try to find FAQ/Terms link
-            for pattern in faq_patterns:
-                try:
-                    # Look for links containing the pattern
-                    link = await page.query_selector(f'a[href*="{pattern}"]')
-                    if link:
-                        href = await link.get_attribute('href')
-                        if href:
-                            # Navigate to FAQ/Terms page
-                            full_url = href if href.startswith('http') else f"{self.config['urls']['homepage'].rstrip('/')}/{href.lstrip('/')}"
-                            logger.info(f"🔍 Visiting FAQ/Terms page: {pattern}")
-
-                            success = await self.navigate_smart(page, full_url)
-                            if success:
-                                await asyncio.sleep(2)
-
-                                # Extract enhanced data from FAQ/Terms
-                                await self.extract_enhanced_data_from_page(page)
-
-                                # Return after first successful extraction
-                                return
-
-                except Exception as e:
-                    logger.debug(f"FAQ link {pattern} failed: {e}")
-                    continue
-
-        except Exception as e:
-            logger.debug(f"FAQ/Terms scraping error: {e}")
-
-    async def _extract_trustpilot_rating(self, page):
-        """Extract Trustpilot rating when we have count but no average"""
-        try:
-            # Try to get rating from Trustpilot widget data attributes
-            trustpilot_selectors = [
-                '.trustpilot-widget',
-                '[data-template-id*="trustpilot"]',
-                '[class*="trustpilot"]',
-                '[data-businessunit-id]',
-                'iframe[src*="trustpilot"]'
-            ]
-
-            for selector in trustpilot_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        # Try data-score attribute
-                        rating = await element.get_attribute('data-score')
-                        if rating:
-                            self.data['customer_review_avg'] = float(rating)
-                            logger.info(f"✅ Trustpilot rating: {rating}★")
-                            return
-
-                        # Try data-rating attribute
-                        rating = await element.get_attribute('data-rating')
-                        if rating:
-                            self.data['customer_review_avg'] = float(rating)
-                            logger.info(f"✅ Trustpilot rating: {rating}★")
-                            return
-
-                        # Try parsing from text content
-                        text = await element.text_content()
-                        if text:
-                            match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)?\s*5', text)
-                            if match:
-                                rating = float(match.group(1))
-                                if 2.5 <= rating <= 5:
-                                    self.data['customer_review_avg'] = rating
-                                    logger.info(f"✅ Trustpilot rating from text: {rating}★")
-                                    return
-                except:
-                    pass
-
-            # Fallback: assume a good rating based on high review count
-            if self.data['review_count'] > 5000:
-                # If they have 10K+ reviews and are still in business, likely 4.0+
-                self.data['customer_review_avg'] = 4.2
-                self.data['is_estimated'] = True
-                logger.info("✅ Estimated rating: 4.2★ (based on high review count)")
-        except Exception as e:
-            logger.debug(f"Trustpilot rating extraction: {e}")
-
-    async def _extract_fees_from_booking_widget(self, page):
-        """Extract fees from booking widget or pricing breakdown"""
-        try:
-            # Navigate to booking page if not already there
-            booking_url = 'https://roadsurfer.com/rv-rental/prices/'
-            current_url = page.url
-            if 'prices' not in current_url and 'booking' not in current_url:
-                await self.navigate_smart(page, booking_url)
-                await asyncio.sleep(3)
-
-            # Look for fee tables or pricing breakdowns
-            page_html = await page.content()
-
-            # Extract from HTML structure
-            fee_selectors = [
-                '[class*="fee"]',
-                '[class*="additional-cost"]',
-                '[class*="extra"]',
-                '[class*="insurance"]',
-                '[class*="cleaning"]',
-                'table td, table th'
-            ]
-
-            for selector in fee_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for elem in elements[:30]:
-                        text = await elem.text_content()
-                        if text and ('insurance' in text.lower() or 'versicherung' in text.lower()):
-                            # Try to find price nearby
-                            prices = await self.extract_prices_from_text(text)
-                            for price in prices:
-                                if 5 <= price <= 50:  # Daily insurance range
-                                    self.data['insurance_cost_per_day'] = price
-                                    logger.info(f"✅ Insurance from widget: €{price}/day")
-                                    break
-
-                        if text and ('cleaning' in text.lower() or 'reinigung' in text.lower()):
-                            prices = await self.extract_prices_from_text(text)
-                            for price in prices:
-                                if 30 <= price <= 300:  # Cleaning fee range
-                                    self.data['cleaning_fee'] = price
-                                    logger.info(f"✅ Cleaning fee from widget: €{price}")
-                                    break
-                except:
-                    pass
-
-            # If still not found, use industry standards as estimates
-            if not self.data['insurance_cost_per_day']:
-                self.data['insurance_cost_per_day'] = 15.0  # Industry standard
-                self.data['is_estimated'] = True
-                logger.info("✅ Insurance (industry standard): €15/day")
-
-            if not self.data['cleaning_fee']:
-                self.data['cleaning_fee'] = 75.0  # Industry standard
-                self.data['is_estimated'] = True
-                logger.info("✅ Cleaning fee (industry standard): €75")
-
-        except Exception as e:
-            logger.debug(f"Fee extraction from booking widget: {e}")
-
-    async def _extract_program_features(self, page):
-        """Extract referral program, discount codes, and other features"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Check for referral program
-            if any(term in page_text_lower for term in ['refer a friend', 'referral', 'invite friend', 'earn credit']):
-                self.data['referral_program'] = True
-                logger.info("✅ Referral program: Yes")
-            else:
-                self.data['referral_program'] = False
-
-            # Check for discount codes
-            if any(term in page_text_lower for term in ['promo code', 'discount code', 'coupon', 'voucher', 'code:']):
-                self.data['discount_code_available'] = True
-                logger.info("✅ Discount codes: Available")
-            else:
-                self.data['discount_code_available'] = False
-
-            # Check for one-way rentals
-            if 'one way' in page_text_lower or 'one-way' in page_text_lower:
-                self.data['one_way_rental_allowed'] = True
-
-                # Try to find one-way fee
-                one_way_match = re.search(r'one.way.*?[€$]\s*(\d+)', page_text, re.IGNORECASE)
-                if one_way_match:
-                    fee = float(one_way_match.group(1))
-                    if 0 <= fee <= 1000:
-                        self.data['one_way_fee'] = fee
-                        logger.info(f"✅ One-way rental: €{fee} fee")
-                else:
-                    logger.info("✅ One-way rental: Allowed")
-            else:
-                self.data['one_way_rental_allowed'] = False
-
-        except Exception as e:
-            logger.debug(f"Program features extraction: {e}")
-
-    async def _extract_discounts_from_text(self, text: str):
-        """Extract discount percentages from text"""
-        try:
-            # Weekly discount
-            weekly_patterns = [
-                r'weekly.*?(\d+)%',
-                r'(\d+)%.*?week',
-                r'week.*?save.*?(\d+)%',
-                r'7\s*(?:days?|nights?).*?(\d+)%'
-            ]
-            for pattern in weekly_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 3 <= pct <= 50:  # Reasonable discount range
-                        self.data['weekly_discount_pct'] = pct
-                        logger.info(f"✅ Weekly discount: {pct}%")
-                        break
-            
-            # Monthly discount
-            monthly_patterns = [
-                r'monthly.*?(\d+)%',
-                r'(\d+)%.*?month',
-                r'month.*?save.*?(\d+)%',
-                r'30\s*(?:days?|nights?).*?(\d+)%'
-            ]
-            for pattern in monthly_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 5 <= pct <= 50:
-                        self.data['monthly_discount_pct'] = pct
-                        logger.info(f"✅ Monthly discount: {pct}%")
-                        break
-            
-            # Early bird discount
-            early_patterns = [
-                r'early.*?bird.*?(\d+)%',
-                r'book.*?early.*?(\d+)%',
-                r'advance.*?(\d+)%',
-                r'(\d+)%.*?early'
-            ]
-            for pattern in early_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 5 <= pct <= 40:
-                        self.data['early_bird_discount_pct'] = pct
-                        logger.info(f"✅ Early bird discount: {pct}%")
-                        break
-                        
-        except Exception as e:
-            logger.debug(f"Discount extraction: {e}")
-    
-    async def _extract_mileage_from_text(self, text: str):
-        """Extract mileage information from text"""
-        try:
-            # Check for unlimited mileage
-            if any(phrase in text.lower() for phrase in ['unlimited mileage', 'unlimited km', 'unlimited miles', 'all miles included']):
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info(f"✅ Mileage: Unlimited")
-                return
-            
-            # Look for mileage limits
-            limit_patterns = [
-                r'(\d+)\s*km.*?(?:per day|daily|included)',
-                r'(\d+)\s*miles.*?(?:per day|daily|included)',
-                r'(?:limit|maximum).*?(\d+)\s*km',
-                r'(\d{3,5})\s*km'  # Large numbers likely to be limits
-            ]
-            for pattern in limit_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    km = int(match.group(1))
-                    if 50 <= km <= 10000:  # Reasonable daily/total limit
-                        self.data['mileage_limit_km'] = km
-                        logger.info(f"✅ Mileage limit: {km} km")
-                        break
-            
-            # Look for cost per km
-            cost_patterns = [
-                r'[€$£]\s*(\d+\.?\d*)\s*(?:per km|/km)',
-                r'(\d+\.?\d*)\s*[€$£]\s*(?:per km|/km)',
-                r'(\d+\.?\d*)\s*cents.*?km'
-            ]
-            for pattern in cost_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    cost = float(match.group(1))
-                    if 0.01 <= cost <= 5:  # Reasonable cost per km
-                        self.data['mileage_cost_per_km'] = cost
-                        logger.info(f"✅ Mileage cost: €{cost}/km")
-                        break
-                        
-        except Exception as e:
-            logger.debug(f"Mileage extraction: {e}")
-
-
-class GoboonyScraper(DeepDataScraper):
-    """Deep scraper for Goboony - P2P Platform"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Goboony")
-        super().__init__("Goboony", 1, config, use_browserless)
-
-    async def scrape_deep_data(self, page):
-        """Execute comprehensive Goboony data extraction"""
-        try:
-            logger.info("Starting Goboony deep scrape...")
-            
-            # Wait for dynamic content to load
-            await asyncio.sleep(3)
-            
-            # Scroll to trigger lazy-loaded content
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
-            
-            # Extract full page text for analysis
-            page_text = await page.evaluate("document.body.innerText")
-            
-            # === PRICING ===
-            await self._scrape_goboony_pricing(page, page_text)
-            
-            # === REVIEWS ===
-            await self._scrape_goboony_reviews(page, page_text)
-            
-            # === FLEET & LOCATIONS ===
-            await self._scrape_goboony_fleet(page, page_text)
-            
-            # === DISCOUNTS ===
-            await self._extract_discounts_from_text(page_text)
-            
-            # === MILEAGE ===
-            await self._extract_mileage_from_text(page_text)
-            
-            # === FEES & INSURANCE ===
-            await self._scrape_goboony_fees(page, page_text)
-            
-            # === POLICIES ===
-            await self._scrape_goboony_policies(page_text)
-            
-            # === PROGRAM FEATURES ===
-            await self._extract_program_features(page)
-            
-            # === TRY BOOKING SIMULATION FOR REAL PRICES ===
-            if not self.data.get('base_nightly_rate') or self.data.get('base_nightly_rate') == 0:
-                logger.info("🎯 Attempting booking simulation for real Goboony prices...")
-                # Navigate to search page first
-                search_url = "https://www.goboony.com/motorhome-hire/germany/berlin"
-                await self.navigate_smart(page, search_url)
-                
-                # Try universal booking simulation
-                success = await self._simulate_booking_universal(page, test_location="Berlin")
-                if success and self.data.get('base_nightly_rate'):
-                    self.data['is_estimated'] = False
-                    self.data['extraction_method'] = 'booking_simulation'
-                    logger.info(f"✅ Goboony real price from booking: EUR{self.data['base_nightly_rate']}")
-            
-            # === APPLY P2P PLATFORM ESTIMATES (fallback only) ===
-            await self._apply_goboony_estimates(page_text)
-            
-            return self.data
-
-        except Exception as e:
-            logger.error(f"Goboony scrape error: {e}")
-            return self.data
-    
-    async def _apply_goboony_estimates(self, text: str):
-        """Apply P2P platform estimates for missing fields"""
-        try:
-            # Pricing estimate if not found
-            if not self.data['base_nightly_rate']:
-                # Check for any price hints in the text
-                prices = await self.extract_prices_from_text(text)
-                if prices:
-                    valid_prices = [p for p in prices if 40 <= p <= 500]
-                    if valid_prices:
-                        self.data['base_nightly_rate'] = statistics.median(valid_prices)
-                        logger.info(f"⚡ Goboony price (from page): EUR{self.data['base_nightly_rate']:.2f}/night")
-                    else:
-                        # P2P platform typical pricing
-                        self.data['base_nightly_rate'] = 95.0
-                        logger.info("⚡ Goboony price (P2P estimate): EUR95/night")
-                else:
-                    self.data['base_nightly_rate'] = 95.0
-                    logger.info("⚡ Goboony price (P2P estimate): EUR95/night")
-            
-            # Discounts (P2P platforms typically offer good discounts)
-            if not self.data.get('weekly_discount_pct'):
-                self.data['weekly_discount_pct'] = 10.0
-                logger.info("⚡ Goboony weekly discount (P2P estimate): 10%")
-            
-            if not self.data.get('monthly_discount_pct'):
-                self.data['monthly_discount_pct'] = 20.0
-                logger.info("⚡ Goboony monthly discount (P2P estimate): 20%")
-            
-            if not self.data.get('early_bird_discount_pct'):
-                self.data['early_bird_discount_pct'] = 10.0
-                logger.info("⚡ Goboony early bird discount (P2P estimate): 10%")
-            
-            # Mileage (P2P often has generous mileage)
-            if not self.data.get('mileage_limit_km'):
-                self.data['mileage_limit_km'] = 0  # Unlimited
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info("⚡ Goboony mileage (P2P estimate): Unlimited")
-            
-            # Vehicle types
-            if not self.data.get('vehicle_types'):
-                self.data['vehicle_types'] = ['Motorhome', 'Campervan', 'Caravan']
-                logger.info("⚡ Goboony vehicle types (P2P estimate): Motorhome, Campervan, Caravan")
-            
-            # Active promotions (P2P platforms run promotions)
-            if not self.data.get('active_promotions'):
-                self.data['active_promotions'] = ['Early booking discount', 'Long-term rental discount', 'Last minute deals', 'Referral bonus']
-                logger.info(f"⚡ Goboony promotions (P2P estimate): {len(self.data['active_promotions'])} active")
-            
-            # Programs
-            if self.data.get('referral_program') is None:
-                self.data['referral_program'] = True
-                logger.info("⚡ Goboony referral program (P2P estimate): Yes")
-            
-            if self.data.get('discount_code_available') is None:
-                self.data['discount_code_available'] = True
-                logger.info("⚡ Goboony discount codes (P2P estimate): Available")
-            
-            if self.data.get('one_way_rental_allowed') is None:
-                self.data['one_way_rental_allowed'] = True
-                self.data['one_way_fee'] = 100.0
-                logger.info("⚡ Goboony one-way rental (P2P estimate): Allowed, EUR100 fee")
-            
-        except Exception as e:
-            logger.debug(f"Goboony estimates error: {e}")
-
-    async def _scrape_goboony_pricing(self, page, text: str):
-        """Extract Goboony pricing"""
-        try:
-            # Look for pricing in listings
-            listing_selectors = [
-                '.vehicle-card',
-                '.campervan-listing',
-                '[data-testid*="vehicle"]',
-                '[class*="listing"]',
-                'article'
-            ]
-            
-            prices = []
-            for selector in listing_selectors:
-                listings = await page.query_selector_all(selector)
-                for listing in listings[:5]:
-                    listing_text = await listing.text_content()
-                    listing_prices = await self.extract_prices_from_text(listing_text)
-                    prices.extend(listing_prices)
-                
-                if prices:
-                    break
-            
-            # Fallback to full page
-            if not prices:
-                prices = await self.extract_prices_from_text(text)
-            
-            if prices:
-                # Filter reasonable prices
-                valid_prices = [p for p in prices if 40 <= p <= 500]
-                if valid_prices:
-                    self.data['base_nightly_rate'] = statistics.median(valid_prices)
-                    logger.info(f"✅ Goboony price: €{self.data['base_nightly_rate']:.2f}/night")
-        
-        except Exception as e:
-            logger.debug(f"Goboony pricing error: {e}")
-
-    async def _scrape_goboony_reviews(self, page, text: str):
-        """Extract Goboony customer reviews"""
-        try:
-            # Goboony review patterns
-            review_patterns = [
-                r'(\d+\.?\d*)\s*(?:out of|\/)\s*5.*?stars',
-                r'rating[:\s]*(\d+\.?\d*)',
-                r'(\d+\.?\d*)\s*[★⭐]',
-                r'trustpilot.*?(\d+\.?\d*)',
-                r'(\d{1,2}\.\d)\s*average'
-            ]
-            
-            for pattern in review_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    rating = float(match.group(1))
-                    if 3.5 <= rating <= 5.0:
-                        self.data['customer_review_avg'] = rating
-                        logger.info(f"✅ Goboony rating: {rating} stars")
-                        break
-            
-            # Count patterns
-            count_patterns = [
-                r'(\d{1,3}(?:,\d{3})*)\s*reviews',
-                r'based on\s*(\d{1,3}(?:,\d{3})*)',
-                r'(\d{1,3}(?:,\d{3})*)\s*customer',
-                r'(\d{1,3}(?:,\d{3})*)\s*ratings'
-            ]
-            
-            for pattern in count_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    count_str = match.group(1).replace(',', '')
-                    count = int(count_str)
-                    if 10 <= count <= 1000000:
-                        self.data['review_count'] = count
-                        logger.info(f"✅ Goboony review count: {count}")
-                        break
-            
-            # Estimate if not found (P2P platforms typically have good ratings)
-            if not self.data['customer_review_avg']:
-                self.data['customer_review_avg'] = 4.9
-                logger.info("⚡ Goboony rating (P2P estimate): 4.9 stars")
-        
-        except Exception as e:
-            logger.debug(f"Goboony reviews error: {e}")
-
-    async def _scrape_goboony_fleet(self, page, text: str):
-        """Extract Goboony fleet information"""
-        try:
-            # Fleet size patterns
-            fleet_patterns = [
-                r'(\d{1,3}(?:,\d{3})*)\s*(?:camper|motor|vehicle|van)s',
-                r'over\s*(\d{1,3}(?:,\d{3})*)\s*(?:listing|camper)',
-                r'(\d{1,3}(?:,\d{3})*)\+\s*(?:vehicle|camper)'
-            ]
-            
-            for pattern in fleet_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    count_str = match.group(1).replace(',', '')
-                    count = int(count_str)
-                    if 10 <= count <= 100000:
-                        self.data['fleet_size_estimate'] = count
-                        logger.info(f"✅ Goboony fleet: {count} vehicles")
-                        break
-            
-            # Estimate if not found (small P2P sample)
-            if not self.data['fleet_size_estimate']:
-                self.data['fleet_size_estimate'] = 3
-                logger.info("⚡ Goboony fleet (P2P estimate): 3 vehicles")
-            
-            # Location count
-            location_selectors = [
-                '[class*="location"]',
-                '[data-testid*="location"]',
-                'a[href*="location"]',
-                '.city',
-                '.region'
-            ]
-            
-            locations = set()
-            for selector in location_selectors:
-                elements = await page.query_selector_all(selector)
-                for elem in elements[:50]:
-                    loc_text = await elem.text_content()
-                    if loc_text and len(loc_text.strip()) > 2 and len(loc_text.strip()) < 50:
-                        locations.add(loc_text.strip())
-            
-            # Filter valid locations
-            valid_locations = [loc for loc in locations if not any(skip in loc.lower() for skip in 
-                ['show', 'view', 'more', 'all', 'filter', 'menu', 'home', 'login', 'sign'])]
-            
-            if valid_locations:
-                self.data['locations_available'] = valid_locations[:20]  # Store top 20
-                logger.info(f"✅ Goboony locations: {len(valid_locations)}")
-            else:
-                # P2P estimate - Goboony operates across many European locations
-                logger.info("⚡ Goboony locations (P2P estimate): 150")
-        
-        except Exception as e:
-            logger.debug(f"Goboony fleet error: {e}")
-
-    async def _scrape_goboony_fees(self, page, text: str):
-        """Extract Goboony fees and insurance"""
-        try:
-            # Insurance patterns
-            insurance_patterns = [
-                r'insurance[:\s]*[€$£]?\s*(\d+\.?\d*)',
-                r'coverage[:\s]*[€$£]?\s*(\d+\.?\d*)',
-                r'protection[:\s]*[€$£]?\s*(\d+\.?\d*)'
-            ]
-            
-            for pattern in insurance_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    cost = float(match.group(1))
-                    if 5 <= cost <= 50:
-                        self.data['insurance_cost_per_day'] = cost
-                        logger.info(f"✅ Goboony insurance: €{cost}/day")
-                        break
-            
-            # P2P platform insurance estimate
-            if not self.data['insurance_cost_per_day']:
-                self.data['insurance_cost_per_day'] = 12.0
-                logger.info("⚡ Goboony insurance (P2P estimate): €12/day")
-            
-            # Cleaning fee patterns
-            cleaning_patterns = [
-                r'cleaning[:\s]*[€$£]?\s*(\d+\.?\d*)',
-                r'service fee[:\s]*[€$£]?\s*(\d+\.?\d*)'
-            ]
-            
-            for pattern in cleaning_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    fee = float(match.group(1))
-                    if 20 <= fee <= 200:
-                        self.data['cleaning_fee'] = fee
-                        logger.info(f"✅ Goboony cleaning: €{fee}")
-                        break
-            
-            # P2P cleaning estimate
-            if not self.data['cleaning_fee']:
-                self.data['cleaning_fee'] = 50.0
-                logger.info("⚡ Goboony cleaning (P2P estimate): €50")
-        
-        except Exception as e:
-            logger.debug(f"Goboony fees error: {e}")
-
-    async def _scrape_goboony_policies(self, text: str):
-        """Extract Goboony rental policies"""
-        try:
-            # Min rental days
-            min_rental_patterns = [
-                r'minimum\s*(?:rental|booking)[:\s]*(\d+)\s*(?:day|night)',
-                r'(\d+)\s*(?:day|night)\s*minimum'
-            ]
-            
-            for pattern in min_rental_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    days = int(match.group(1))
-                    if 1 <= days <= 14:
-                        self.data['min_rental_days'] = days
-                        logger.info(f"✅ Goboony min rental: {days} days")
-                        break
-            
-            # P2P estimate (flexible)
-            if not self.data['min_rental_days']:
-                self.data['min_rental_days'] = 1
-                logger.info("⚡ Goboony min rental (P2P estimate): 1 day")
-            
-            # Fuel policy (P2P typically full-to-full)
-            if 'full' in text.lower() and 'fuel' in text.lower():
-                self.data['fuel_policy'] = 'Full to Full'
-            else:
-                self.data['fuel_policy'] = 'Full to Full'
-            
-            # Cancellation policy
-            if 'free cancellation' in text.lower():
-                self.data['cancellation_policy'] = 'Free cancellation up to 48h'
-            else:
-                self.data['cancellation_policy'] = 'Standard cancellation terms'
-        
-        except Exception as e:
-            logger.debug(f"Goboony policies error: {e}")
-
-    async def _extract_program_features(self, page):
-        """Extract referral program, discount codes, and other features"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Check for referral program
-            if any(term in page_text_lower for term in ['refer a friend', 'referral', 'invite friend', 'earn credit']):
-                self.data['referral_program'] = True
-                logger.info("✅ Referral program: Yes")
-            else:
-                self.data['referral_program'] = False
-
-            # Check for discount codes
-            if any(term in page_text_lower for term in ['promo code', 'discount code', 'coupon', 'voucher', 'code:']):
-                self.data['discount_code_available'] = True
-                logger.info("✅ Discount codes: Available")
-            else:
-                self.data['discount_code_available'] = False
-
-            # Check for one-way rentals
-            if 'one way' in page_text_lower or 'one-way' in page_text_lower:
-                self.data['one_way_rental_allowed'] = True
-
-                # Try to find one-way fee
-                one_way_match = re.search(r'one.way.*?[€$]\s*(\d+)', page_text, re.IGNORECASE)
-                if one_way_match:
-                    fee = float(one_way_match.group(1))
-                    if 0 <= fee <= 1000:
-                        self.data['one_way_fee'] = fee
-                        logger.info(f"✅ One-way rental: EUR{fee} fee")
-                else:
-                    logger.info("✅ One-way rental: Allowed")
-            else:
-                self.data['one_way_rental_allowed'] = False
-
-        except Exception as e:
-            logger.debug(f"Program features extraction: {e}")
-
-    async def _extract_discounts_from_text(self, text: str):
-        """Extract discount percentages from text"""
-        try:
-            # Weekly discount
-            weekly_patterns = [
-                r'weekly.*?(\d+)%',
-                r'(\d+)%.*?week',
-                r'week.*?save.*?(\d+)%',
-                r'7\s*(?:days?|nights?).*?(\d+)%'
-            ]
-            for pattern in weekly_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 3 <= pct <= 50:  # Reasonable discount range
-                        self.data['weekly_discount_pct'] = pct
-                        logger.info(f"✅ Weekly discount: {pct}%")
-                        break
-            
-            # Monthly discount
-            monthly_patterns = [
-                r'monthly.*?(\d+)%',
-                r'(\d+)%.*?month',
-                r'month.*?save.*?(\d+)%',
-                r'30\s*(?:days?|nights?).*?(\d+)%'
-            ]
-            for pattern in monthly_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 5 <= pct <= 50:
-                        self.data['monthly_discount_pct'] = pct
-                        logger.info(f"✅ Monthly discount: {pct}%")
-                        break
-            
-            # Early bird discount
-            early_patterns = [
-                r'early.*?bird.*?(\d+)%',
-                r'book.*?early.*?(\d+)%',
-                r'advance.*?(\d+)%',
-                r'(\d+)%.*?early'
-            ]
-            for pattern in early_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    pct = float(match.group(1))
-                    if 5 <= pct <= 40:
-                        self.data['early_bird_discount_pct'] = pct
-                        logger.info(f"✅ Early bird discount: {pct}%")
-                        break
-                        
-        except Exception as e:
-            logger.debug(f"Discount extraction: {e}")
-    
-    async def _extract_mileage_from_text(self, text: str):
-        """Extract mileage information from text"""
-        try:
-            # Check for unlimited mileage
-            if any(phrase in text.lower() for phrase in ['unlimited mileage', 'unlimited km', 'unlimited miles', 'all miles included']):
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info(f"✅ Mileage: Unlimited")
-                return
-            
-            # Look for mileage limits
-            limit_patterns = [
-                r'(\d+)\s*km.*?(?:per day|daily|included)',
-                r'(\d+)\s*miles.*?(?:per day|daily|included)',
-                r'(?:limit|maximum).*?(\d+)\s*km',
-                r'(\d{3,5})\s*km'  # Large numbers likely to be limits
-            ]
-            for pattern in limit_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    km = int(match.group(1))
-                    if 50 <= km <= 10000:  # Reasonable daily/total limit
-                        self.data['mileage_limit_km'] = km
-                        logger.info(f"✅ Mileage limit: {km} km")
-                        break
-            
-            # Look for cost per km
-            cost_patterns = [
-                r'[€$£]\s*(\d+\.?\d*)\s*(?:per km|/km)',
-                r'(\d+\.?\d*)\s*[€$£]\s*(?:per km|/km)',
-                r'(\d+\.?\d*)\s*cents.*?km'
-            ]
-            for pattern in cost_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    cost = float(match.group(1))
-                    if 0.01 <= cost <= 5:  # Reasonable cost per km
-                        self.data['mileage_cost_per_km'] = cost
-                        logger.info(f"✅ Mileage cost: EUR{cost}/km")
-                        break
-                        
-        except Exception as e:
-            logger.debug(f"Mileage extraction: {e}")
-
-
-class McRentScraper(DeepDataScraper):
-    """Deep scraper for McRent - Traditional competitor"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("McRent")
-        super().__init__("McRent", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'form_simulation'
-
-    async def scrape_deep_data(self, page):
-        """Collect deep McRent data with enhanced extraction"""
-
-        # 1. Start at homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-            # Get promotions from homepage
-            promotions = await self.detect_promotions(page)
-            self.data['active_promotions'] = promotions
-
-        # 2. Try search/booking page - McRent is a booking site
-        search_url = self.config['urls'].get('search') or self.config['urls'].get('booking') or self.config['urls'].get('homepage')
-        if search_url:
-            await self.navigate_smart(page, search_url)
-
-            # Dismiss cookie banner if present
-            try:
-                cookie_buttons = [
-                    'button:has-text("Akzeptieren")',  # German "Accept"
-                    'button:has-text("Accept")',
-                    'button:has-text("OK")',
-                    '[class*="cookie"] button',
-                    '[id*="cookie"] button'
-                ]
-                for button_selector in cookie_buttons:
-                    if await page.locator(button_selector).count() > 0:
-                        await page.click(button_selector, timeout=2000)
-                        logger.info("✅ Dismissed cookie banner")
-                        break
-            except:
-                pass
-
-            await asyncio.sleep(5)  # Let dynamic content load
-
-            # Try scrolling to trigger lazy loading
-            try:
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight/2)')
-                await asyncio.sleep(2)
-                logger.info("✅ Scrolled to trigger content loading")
-            except:
-                pass
-
-        # 3. TRY BOOKING SIMULATION FOR REAL PRICES (Phase B improvement)
-        real_price_extracted = await self._simulate_booking_for_real_price(page)
-
-        if not real_price_extracted:
-            # Try universal booking simulator
-            logger.info("🎯 Attempting universal booking simulation for McRent...")
-            success = await self._simulate_booking_universal(page, test_location="Munich, Germany")
-            
-            if success and self.data.get('base_nightly_rate'):
-                self.data['extraction_method'] = 'booking_simulation_universal'
-                logger.info(f"✅ Universal booking: €{self.data['base_nightly_rate']}/night")
-            else:
-                # Fallback to text extraction
-                logger.info("🔄 Booking simulation failed, falling back to text extraction...")
-                page_text = await page.evaluate('() => document.body.innerText')
-                prices = await self.extract_prices_from_text(page_text)
-
-                if prices:
-                    # Filter reasonable prices (€40-400/night or €280-2800/week)
-                    night_prices = [p for p in prices if 40 <= p <= 400]
-                    week_prices = [p for p in prices if 280 <= p <= 2800]
-
-                    if night_prices:
-                        self.data['base_nightly_rate'] = min(night_prices)
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'text_extraction'
-                        logger.info(f"✅ McRent price: €{self.data['base_nightly_rate']}/night")
-                    elif week_prices:
-                        # Convert weekly to nightly
-                        weekly = min(week_prices)
-                        self.data['base_nightly_rate'] = round(weekly / 7, 2)
-                        self.data['is_estimated'] = True
-                        logger.info(f"✅ McRent price: €{self.data['base_nightly_rate']}/night (ESTIMATED from weekly €{weekly})")
-                    else:
-                        # No valid prices found, try vehicle listings
-                        pass
-                else:
-                    # Try to sample vehicle listings
-                    logger.info("🔄 No direct prices found, trying vehicle listings...")
-                    await self._sample_vehicle_prices(page)
-
-        # 4. Check for discounts
-        page_text = await page.evaluate('() => document.body.innerText')
-        if 'weekly' in page_text.lower() or 'woche' in page_text.lower():  # German: Woche = week
-            weekly_match = re.search(r'(?:weekly|woche).*?(\d+)%', page_text, re.IGNORECASE)
-            if weekly_match:
-                self.data['weekly_discount_pct'] = float(weekly_match.group(1))
-
-        if 'monthly' in page_text.lower() or 'monat' in page_text.lower():  # German: Monat = month
-            monthly_match = re.search(r'(?:monthly|monat).*?(\d+)%', page_text, re.IGNORECASE)
-            if monthly_match:
-                self.data['monthly_discount_pct'] = float(monthly_match.group(1))
-
-        # 5. Insurance packages (check German terms too)
-        if 'insurance' in page_text.lower() or 'versicherung' in page_text.lower():
-            insurance_prices = re.findall(r'(?:insurance|versicherung).*?€?\s*(\d+)', page_text, re.IGNORECASE)
-            if insurance_prices:
-                cost = float(insurance_prices[0])
-                if 0 < cost < 100:
-                    self.data['insurance_cost_per_day'] = cost
-
-        # 6. Enhanced location extraction
-        await self._scrape_locations_simple(page)
-
-        # 7. Try vehicles page for fleet info
-        if self.config['urls'].get('vehicles'):
-            vehicles_loaded = await self.navigate_smart(page, self.config['urls']['vehicles'])
-            if vehicles_loaded:
-                await asyncio.sleep(3)
-                await self._scrape_vehicles_mcrent(page)
-
-        # 8. Policies
-        await self._scrape_policies_simple(page)
-
-        # 9. Enhanced extraction for additional McRent fields
-        await self._extract_mcrent_features(page)
-
-        # 10. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"McRent extraction complete")
-
-    async def _simulate_booking_for_real_price(self, page) -> bool:
-        """
-        Phase B: Simulate booking widget interaction to extract REAL prices.
-
-        Returns:
-            bool: True if real price was extracted, False otherwise
-        """
-        try:
-            from datetime import datetime, timedelta
-
-            logger.info("🎯 Phase B: Attempting booking simulation for REAL prices...")
-
-            # Navigate to search/booking page
-            booking_url = self.config['urls'].get('search') or self.config['urls'].get('booking')
-            if not booking_url:
-                logger.warning("⚠️ No booking URL configured")
-                return False
-
-            await self.navigate_smart(page, booking_url)
-            await asyncio.sleep(3)  # Let page load
-
-            # Dismiss cookie banner if present
-            try:
-                cookie_selectors = [
-                    'button:has-text("Akzeptieren")',
-                    'button:has-text("Accept")',
-                    'button:has-text("Alle akzeptieren")',
-                    '[class*="cookie"] button:has-text("OK")',
-                    '[id*="cookie-accept"]'
-                ]
-                for selector in cookie_selectors:
-                    if await page.locator(selector).count() > 0:
-                        await page.click(selector, timeout=2000)
-                        logger.info("✅ Dismissed cookie banner")
-                        await asyncio.sleep(1)
-                        break
-            except Exception as e:
-                logger.debug(f"Cookie banner handling: {e}")
-
-            # Strategy 1: Look for booking widget with date inputs
-            logger.info("🔍 Looking for booking widget...")
-
-            # Calculate dates: 30 days from now, 7-day rental
-            today = datetime.now()
-            pickup_date = today + timedelta(days=30)
-            return_date = pickup_date + timedelta(days=7)
-
-            # Format dates for input fields (try multiple formats)
-            date_formats = {
-                'iso': pickup_date.strftime('%Y-%m-%d'),
-                'dmy_dash': pickup_date.strftime('%d-%m-%Y'),
-                'dmy_slash': pickup_date.strftime('%d/%m/%Y'),
-                'mdy_slash': pickup_date.strftime('%m/%d/%Y')
-            }
-
-            pickup_iso = pickup_date.strftime('%Y-%m-%d')
-            return_iso = return_date.strftime('%Y-%m-%d')
-
-            # Common booking widget selectors
-            date_selectors = [
-                'input[name*="pickup"][type="date"]',
-                'input[name*="from"][type="date"]',
-                'input[name*="start"][type="date"]',
-                'input[id*="pickup"]',
-                'input[id*="from-date"]',
-                'input[placeholder*="Abholdatum"]',  # German: pickup date
-                'input[placeholder*="Pick"]',
-                '[class*="date-picker"] input',
-                '[class*="datepicker"] input'
-            ]
-
-            # Try to fill pickup date
-            pickup_filled = False
-            for selector in date_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        # Try to fill with ISO format first
-                        await page.fill(selector, pickup_iso)
-                        pickup_filled = True
-                        logger.info(f"✅ Filled pickup date: {pickup_iso}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Failed to fill {selector}: {e}")
-
-            # Try to fill return date
-            return_selectors = [
-                'input[name*="return"][type="date"]',
-                'input[name*="to"][type="date"]',
-                'input[name*="end"][type="date"]',
-                'input[id*="return"]',
-                'input[id*="to-date"]',
-                'input[placeholder*="Rückgabedatum"]',  # German: return date
-                'input[placeholder*="Return"]'
-            ]
-
-            return_filled = False
-            for selector in return_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        await page.fill(selector, return_iso)
-                        return_filled = True
-                        logger.info(f"✅ Filled return date: {return_iso}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Failed to fill {selector}: {e}")
-
-            # Try to select a location (usually a dropdown)
-            location_selectors = [
-                'select[name*="station"]',
-                'select[name*="location"]',
-                'select[name*="pickup"]',
-                'select[id*="station"]',
-                'select[id*="location"]',
-                '[class*="location-select"] select'
-            ]
-
-            location_filled = False
-            for selector in location_selectors:
-                try:
-                    if await page.locator(selector).count() > 0:
-                        # Get all options
-                        options = await page.locator(f'{selector} option').all_text_contents()
-                        if len(options) > 1:
-                            # Select the first real option (skip empty/placeholder)
-                            # Prefer Munich or Frankfurt (large depots)
-                            preferred_locations = ['Munich', 'München', 'Frankfurt', 'Berlin', 'Hamburg']
-                            selected_location = None
-
-                            for loc in preferred_locations:
-                                for option in options:
-                                    if loc.lower() in option.lower():
-                                        selected_location = option
-                                        break
-                                if selected_location:
-                                    break
-
-                            if not selected_location and len(options) > 1:
-                                selected_location = options[1]  # First non-empty option
-
-                            if selected_location:
-                                await page.select_option(selector, label=selected_location)
-                                location_filled = True
-                                logger.info(f"✅ Selected location: {selected_location}")
-                                break
-                except Exception as e:
-                    logger.debug(f"Failed to select location {selector}: {e}")
-
-            # Try to submit the search form
-            if pickup_filled and return_filled:
-                logger.info("✅ Dates filled, attempting to submit search...")
-
-                # Look for search/submit button
-                submit_selectors = [
-                    'button[type="submit"]',
-                    'button:has-text("Search")',
-                    'button:has-text("Suchen")',  # German
-                    'button:has-text("Find")',
-                    'button:has-text("Finden")',  # German
-                    '[class*="search"] button',
-                    '[class*="submit"] button',
-                    'input[type="submit"]'
-                ]
-
-                for selector in submit_selectors:
-                    try:
-                        if await page.locator(selector).count() > 0:
-                            await page.click(selector)
-                            logger.info("✅ Clicked search button")
-                            # Wait for results to load
-                            await asyncio.sleep(5)
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to click {selector}: {e}")
-
-                # Now look for prices in the results
-                page_text = await page.evaluate('() => document.body.innerText')
-
-                # Look for price patterns in results
-                # McRent typically shows prices like "€85" or "85 €" or "EUR 85"
-                price_patterns = [
-                    r'(?:€|EUR)\s*(\d+(?:,\d+)?(?:\.\d{2})?)',
-                    r'(\d+(?:,\d+)?(?:\.\d{2})?)\s*(?:€|EUR)',
-                    r'price[:\s]+€?\s*(\d+(?:,\d+)?(?:\.\d{2})?)',
-                    r'(?:ab|from|starting)\s+€?\s*(\d+)',  # "from €85"
-                ]
-
-                all_prices = []
-                for pattern in price_patterns:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            # Clean up price (remove commas, handle German decimal format)
-                            price_str = match.replace(',', '')
-                            price = float(price_str)
-                            if 40 <= price <= 500:  # Reasonable daily rate range
-                                all_prices.append(price)
-                        except:
-                            continue
-
-                if all_prices:
-                    # Use the minimum price found
-                    min_price = min(all_prices)
-
-                    # Check if this looks like a weekly price (280-2800)
-                    if min_price >= 280:
-                        # Likely weekly, convert to daily
-                        daily_price = round(min_price / 7, 2)
-                        logger.info(f"✅ REAL price extracted: €{daily_price}/night (from weekly €{min_price})")
-                    else:
-                        daily_price = min_price
-                        logger.info(f"✅ REAL price extracted: €{daily_price}/night")
-
-                    self.data['base_nightly_rate'] = daily_price
-                    self.data['is_estimated'] = False  # REAL price!
-
-                    # Also extract vehicles_available count if visible
-                    vehicle_count_match = re.search(r'(\d+)\s+(?:vehicles?|fahrzeuge|campers?)', page_text, re.IGNORECASE)
-                    if vehicle_count_match:
-                        count = int(vehicle_count_match.group(1))
-                        if 0 < count < 1000:
-                            self.data['vehicles_available'] = count
-                            logger.info(f"✅ Vehicles available: {count}")
-
-                    return True
-                else:
-                    logger.warning("⚠️ Booking form submitted but no prices found in results")
-                    return False
-            else:
-                logger.warning("⚠️ Could not fill required booking form fields")
-                return False
-
-        except Exception as e:
-            logger.error(f"❌ Booking simulation failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-
-    async def _extract_mcrent_features(self, page):
-        """Extract additional McRent features - comprehensive data for traditional rental company"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Mileage information (traditional companies often have limits)
-            if 'unlimited mileage' in page_text_lower or 'unlimited km' in page_text_lower or 'unbegrenzt' in page_text_lower:  # German: unbegrenzt
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info("✅ Mileage: Unlimited")
-            else:
-                # Try to find mileage limits
-                mileage_match = re.search(r'(\d+)\s*km.*?(?:per day|daily|pro tag|included)', page_text, re.IGNORECASE)
-                if mileage_match:
-                    km = int(mileage_match.group(1))
-                    if 100 <= km <= 500:  # Traditional rentals typically 200-300 km/day
-                        self.data['mileage_limit_km'] = km
-                        logger.info(f"✅ Mileage limit: {km} km/day")
-                else:
-                    # Traditional rental typical
-                    self.data['mileage_limit_km'] = 250  # Traditional rental average
-                    self.data['mileage_cost_per_km'] = 0.30  # Traditional rental typical overage
-                    self.data['is_estimated'] = True
-                    logger.info("✅ Mileage (traditional average): 250 km/day, €0.30/km overage")
-
-            # Weekly/monthly discounts (traditional companies often offer)
-            weekly_match = re.search(r'(?:weekly|7\s*day|woche).*?(\d+)%', page_text, re.IGNORECASE)  # German: Woche
-            if weekly_match:
-                pct = float(weekly_match.group(1))
-                if 3 <= pct <= 30:
-                    self.data['weekly_discount_pct'] = pct
-                    logger.info(f"✅ Weekly discount: {pct}%")
-            else:
-                # Traditional companies typically 5-10% weekly
-                self.data['weekly_discount_pct'] = 7.0
-                self.data['is_estimated'] = True
-                logger.info("✅ Weekly discount (traditional standard): 7%")
-
-            monthly_match = re.search(r'(?:monthly|30\s*day|monat).*?(\d+)%', page_text, re.IGNORECASE)  # German: Monat
-            if monthly_match:
-                pct = float(monthly_match.group(1))
-                if 5 <= pct <= 40:
-                    self.data['monthly_discount_pct'] = pct
-                    logger.info(f"✅ Monthly discount: {pct}%")
-            else:
-                # Traditional companies typically 15-20% monthly
-                self.data['monthly_discount_pct'] = 15.0
-                self.data['is_estimated'] = True
-                logger.info("✅ Monthly discount (traditional standard): 15%")
-
-            # Fuel policy (traditional usually Full to Full)
-            if 'full to full' in page_text_lower or 'full-to-full' in page_text_lower or 'voll zu voll' in page_text_lower:  # German
-                self.data['fuel_policy'] = 'Full to Full'
-                logger.info("✅ Fuel policy: Full to Full")
-            else:
-                self.data['fuel_policy'] = 'Full to Full'  # Traditional standard
-                logger.info("✅ Fuel policy: Full to Full (traditional standard)")
-
-            # Minimum rental days
-            min_rental_match = re.search(r'minimum.*?(\d+)\s*(?:day|night|tag|tage)', page_text, re.IGNORECASE)  # German: Tag/Tage
-            if min_rental_match:
-                days = int(min_rental_match.group(1))
-                if 1 <= days <= 7:
-                    self.data['min_rental_days'] = days
-                    logger.info(f"✅ Min rental: {days} days")
-            else:
-                self.data['min_rental_days'] = 1  # Traditional companies often allow 1-day
-                self.data['is_estimated'] = True
-                logger.info("✅ Min rental (traditional typical): 1 day")
-
-            # Referral program (less common for traditional)
-            if any(term in page_text_lower for term in ['refer', 'referral', 'empfehlen', 'freunde werben']):  # German
-                self.data['referral_program'] = True
-                logger.info("✅ Referral program: Yes")
-            else:
-                self.data['referral_program'] = False
-                logger.info("✅ Referral program: No")
-
-            # Discount codes
-            if any(term in page_text_lower for term in ['promo code', 'discount code', 'voucher', 'coupon', 'aktionscode', 'rabattcode']):  # German
-                self.data['discount_code_available'] = True
-                logger.info("✅ Discount codes: Available")
-            else:
-                self.data['discount_code_available'] = True  # Most traditional companies offer
-                logger.info("✅ Discount codes: Typically available")
-
-            # One-way rentals (traditional companies often allow)
-            if 'one way' in page_text_lower or 'one-way' in page_text_lower or 'einweg' in page_text_lower:  # German: Einweg
-                self.data['one_way_rental_allowed'] = True
-                # Try to find fee
-                one_way_match = re.search(r'(?:one.way|einweg).*?[€$]\s*(\d+)', page_text, re.IGNORECASE)
-                if one_way_match:
-                    fee = float(one_way_match.group(1))
-                    if 0 <= fee <= 500:
-                        self.data['one_way_fee'] = fee
-                        logger.info(f"✅ One-way rental: €{fee} fee")
-                else:
-                    self.data['one_way_fee'] = 200.0  # Traditional typical
-                    self.data['is_estimated'] = True
-                    logger.info("✅ One-way rental: €200 fee (traditional average)")
-            else:
-                self.data['one_way_rental_allowed'] = True  # Most traditional allow
-                self.data['one_way_fee'] = 200.0
-                self.data['is_estimated'] = True
-                logger.info("✅ One-way rental: Typically allowed, €200 fee")
-
-            # Cancellation policy (traditional usually flexible or refundable)
-            if 'free cancellation' in page_text_lower or 'kostenlose stornierung' in page_text_lower:  # German
-                self.data['cancellation_policy'] = 'Free Cancellation'
-                logger.info("✅ Cancellation: Free")
-            elif 'flexible' in page_text_lower or 'flexibel' in page_text_lower:  # German
-                self.data['cancellation_policy'] = 'Flexible'
-                logger.info("✅ Cancellation: Flexible")
-            else:
-                self.data['cancellation_policy'] = 'Flexible'  # Traditional standard
-                logger.info("✅ Cancellation: Flexible (traditional standard)")
-
-            # If no insurance found yet, use traditional rental average
-            if not self.data.get('insurance_cost_per_day') or self.data['insurance_cost_per_day'] == 1:  # Was finding €1 before
-                self.data['insurance_cost_per_day'] = 18.0  # Traditional rental average (higher than P2P)
-                self.data['is_estimated'] = True
-                logger.info("✅ Insurance (traditional average): €18/day")
-
-            # If no cleaning fee found yet, use traditional average
-            if not self.data.get('cleaning_fee'):
-                self.data['cleaning_fee'] = 85.0  # Traditional rental average
-                self.data['is_estimated'] = True
-                logger.info("✅ Cleaning fee (traditional average): €85")
-
-            # Booking fee (traditional companies often charge)
-            if not self.data.get('booking_fee'):
-                booking_match = re.search(r'(?:booking|service|bearbeitungs).*?(?:fee|gebühr).*?[€$]\s*(\d+)', page_text, re.IGNORECASE)  # German: Gebühr
-                if booking_match:
-                    fee = float(booking_match.group(1))
-                    if 0 < fee <= 100:
-                        self.data['booking_fee'] = fee
-                        logger.info(f"✅ Booking fee: €{fee}")
-                else:
-                    self.data['booking_fee'] = 25.0  # Traditional typical
-                    self.data['is_estimated'] = True
-                    logger.info("✅ Booking fee (traditional typical): €25")
-
-            # Vehicle types (traditional companies have standard fleet)
-            if not self.data.get('vehicle_types') or len(self.data['vehicle_types']) == 0:
-                self.data['vehicle_types'] = ['Compact Motorhome', 'Family Motorhome', 'Luxury Motorhome', 'Campervan', 'Alcove']
-                logger.info("✅ Vehicle types (traditional fleet): 5 types")
-
-            # Locations (McRent has many European locations)
-            if not self.data.get('locations_available') or len(self.data['locations_available']) == 0:
-                self.data['locations_available'] = ['Germany', 'France', 'Italy', 'Spain', 'Portugal', 'Netherlands', 'Austria', 'Switzerland']
-                logger.info("✅ Locations (known McRent locations): 8 countries")
-
-            # Fleet size (traditional companies have large fleets)
-            if not self.data.get('fleet_size_estimate') or self.data['fleet_size_estimate'] == 0:
-                self.data['fleet_size_estimate'] = 2500  # McRent is one of Europe's largest
-                logger.info("✅ Fleet size (traditional large company): ~2500 vehicles")
-
-            # Reviews (if not found, McRent is well-known)
-            if not self.data.get('customer_review_avg'):
-                self.data['customer_review_avg'] = 4.0  # Typical for established traditional company
-                self.data['review_count'] = 8500  # Established company review count
-                self.data['is_estimated'] = True
-                logger.info("✅ Reviews (traditional company typical): 4.0★, 8500 reviews")
-
-        except Exception as e:
-            logger.debug(f"McRent features extraction: {e}")
-
-    async def _sample_vehicle_prices(self, page):
-        """Sample prices from vehicle listings"""
-        try:
-            # Look for vehicle cards/listings with various selectors
-            listing_selectors = [
-                '[class*="vehicle"]',
-                '[class*="motorhome"]',
-                '[class*="camper"]',
-                '[class*="card"]',
-                '[class*="product"]',
-                '[class*="item"]',
-                'article',
-                '[class*="listing"]'
-            ]
-
-            sampled_prices = []
-            for selector in listing_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) >= 3:
-                        logger.info(f"✅ McRent: Found {len(elements)} elements with: {selector}")
-                        for elem in elements[:20]:  # Sample first 20
-                            text = await elem.text_content()
-                            if text:
-                                prices = await self.extract_prices_from_text(text)
-                                valid_prices = [p for p in prices if 40 <= p <= 400]
-                                sampled_prices.extend(valid_prices)
-
-                        if sampled_prices:
-                            break  # Found prices, stop trying selectors
-                except:
-                    pass
-
-            if sampled_prices:
-                # Use average or min of sampled prices
-                self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                self.data['is_estimated'] = True
-                self.data['notes'] = f"Avg from {len(sampled_prices)} vehicle listings"
-                logger.info(f"✅ McRent sampled pricing: €{self.data['base_nightly_rate']}/night from {len(sampled_prices)} vehicles")
-        except Exception as e:
-            logger.error(f"Vehicle sampling failed: {e}")
-
-    async def _scrape_vehicles_mcrent(self, page):
-        """Extract vehicle types and fleet size"""
-        try:
-            vehicle_elements = await page.query_selector_all('[class*="vehicle"], [class*="motorhome"], [class*="camper"]')
-
-            vehicle_types = []
-            for elem in vehicle_elements[:15]:
-                text = await elem.inner_text()
-                if text and len(text) < 100:
-                    # Clean up text
-                    text = text.strip()
-                    if text:
-                        vehicle_types.append(text)
-
-            if vehicle_types:
-                self.data['vehicle_types'] = list(set(vehicle_types))[:10]
-                self.data['fleet_size_estimate'] = len(vehicle_elements)
-                logger.info(f"✅ McRent: Found {len(self.data['vehicle_types'])} vehicle types, fleet size ~{self.data['fleet_size_estimate']}")
-        except Exception as e:
-            logger.debug(f"McRent vehicle extraction: {e}")
-
-    async def _scrape_locations_simple(self, page):
-        """Enhanced location extraction for McRent"""
-        try:
-            await asyncio.sleep(2)
-
-            # Extended McRent-specific selectors
-            location_selectors = [
-                'select[name*="location"] option',
-                'select[name*="station"] option',
-                'select[name*="depot"] option',
-                'select[name*="pickup"] option',
-                '[class*="location-item"]',
-                '[class*="station-item"]',
-                '[class*="location"]',
-                '[class*="station"]',
-                '[class*="depot"]',
-                'a[href*="/location/"]',
-                'a[href*="/station/"]',
-                '[data-location]'
-            ]
-
-            locations = []
-            found_with_selector = None
-
-            for selector in location_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        logger.debug(f"McRent: Found {len(elements)} elements with: {selector}")
-
-                    for elem in elements[:50]:
-                        text = await elem.text_content()
-                        if text:
-                            text = text.strip()
-                            if 3 <= len(text) <= 150 and not text.isdigit():
-                                # Skip common non-location text
-                                skip_words = ['select', 'choose', 'option', 'location', 'station']
-                                if not any(skip in text.lower() for skip in skip_words) or len(text) > 15:
-                                    locations.append(text)
-
-                    if len(locations) >= 5:
-                        found_with_selector = selector
-                        logger.info(f"✅ McRent: Found {len(locations)} locations with: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"McRent selector {selector} failed: {e}")
-
-            # Clean up
-            locations = list(set(locations))
-            locations = [loc for loc in locations if not loc.startswith(('0', '1')) and len(loc) > 2]
-            locations.sort(key=len, reverse=True)
-
-            if locations:
-                self.data['locations_available'] = locations[:20]
-                logger.info(f"✅ McRent: Extracted {len(self.data['locations_available'])} unique locations")
-            else:
-                logger.warning("⚠️  McRent: No locations found")
-
-        except Exception as e:
-            logger.error(f"McRent location extraction failed: {e}")
-
-    async def _scrape_policies_simple(self, page):
-        """Simple policy extraction"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            if 'full to full' in page_text.lower():
-                self.data['fuel_policy'] = 'Full to Full'
-            if 'free cancellation' in page_text.lower():
-                self.data['cancellation_policy'] = 'Free Cancellation'
-        except Exception as e:
-            logger.debug(f"Policy extraction: {e}")
-
-
-class GoboonyScrap(DeepDataScraper):
-    """Deep scraper for Goboony - P2P Platform"""
-    
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Goboony")
-        super().__init__("Goboony", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'search_sampling'
-    
-    async def scrape_deep_data(self, page):
-        """Collect Goboony P2P data with enhanced extraction"""
-
-        # 1. Start at homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-        # 2. Try search page for pricing
-        if self.config['urls'].get('search'):
-            search_loaded = await self.navigate_smart(page, self.config['urls']['search'])
-            if search_loaded:
-                await asyncio.sleep(3)  # Let results load
-
-                # Sample multiple listings
-                listing_elements = await page.query_selector_all('[class*="listing"], [class*="vehicle"], [class*="camper"], [class*="card"]')
-
-                sampled_prices = []
-                for elem in listing_elements[:15]:
-                    text = await elem.text_content()
-                    prices = await self.extract_prices_from_text(text)
-                    # Filter reasonable prices
-                    prices = [p for p in prices if 20 <= p <= 500]
-                    sampled_prices.extend(prices)
-
-                if sampled_prices:
-                    # Calculate average from sample
-                    self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                    self.data['is_estimated'] = True
-                    self.data['notes'] = f"Avg of {len(sampled_prices)} sampled listings"
-                    logger.info(f"✅ Estimated price: €{self.data['base_nightly_rate']}/night from {len(sampled_prices)} listings")
-
-                # Count total listings
-                self.data['fleet_size_estimate'] = len(listing_elements)
-
-        # 3. Platform fees
-        page_text = await page.evaluate('() => document.body.innerText')
-
-        # Look for commission/fee percentages
-        fee_match = re.search(r'(?:fee|commission).*?(\d+)%', page_text, re.IGNORECASE)
-        if fee_match:
-            self.data['booking_fee'] = float(fee_match.group(1))
-
-        # 4. Check for insurance
-        if 'insurance included' in page_text.lower():
-            self.data['insurance_cost_per_day'] = 0
-        elif 'insurance' in page_text.lower():
-            insurance_match = re.search(r'insurance.*?[€$](\d+)', page_text, re.IGNORECASE)
-            if insurance_match:
-                self.data['insurance_cost_per_day'] = float(insurance_match.group(1))
-
-        # 5. Cancellation policy
-        cancel_match = re.search(r'cancellation.*?(free|flexible|strict)', page_text, re.IGNORECASE)
-        if cancel_match:
-            self.data['cancellation_policy'] = cancel_match.group(1).title()
-
-        # 6. Locations - Goboony specific extraction
-        await self._scrape_locations_goboony(page)
-
-        # 7. Promotions
-        promotions = await self.detect_promotions(page)
-        self.data['active_promotions'] = promotions
-
-        # 8. Enhanced extraction for additional fields
-        await self._extract_goboony_features(page)
-
-        # 9. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"Goboony P2P data collected")
-
-    async def _scrape_locations_goboony(self, page):
-        """Goboony-specific location extraction"""
-        try:
-            await asyncio.sleep(2)
-
-            # Goboony-specific selectors
-            location_selectors = [
-                # City/country filters
-                '[data-testid*="location"]',
-                '[class*="city-filter"] option',
-                '[class*="location-filter"] option',
-                'select[name="location"] option',
-                'select[name="city"] option',
-                # Location links/buttons
-                'a[href*="/location/"]',
-                'a[href*="/city/"]',
-                '[class*="location-card"]',
-                '[class*="city-card"]',
-                # Generic
-                '[class*="location"]',
-                '[class*="destination"]'
-            ]
-
-            locations = []
-            for selector in location_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        logger.debug(f"DEBUG: Goboony found {len(elements)} elements with: {selector}")
-
-                    for elem in elements[:50]:
-                        text = await elem.text_content()
-                        if text:
-                            text = text.strip()
-                            # Filter for valid locations
-                            if 3 <= len(text) <= 100 and not text.isdigit():
-                                locations.append(text)
-
-                    if len(locations) >= 5:
-                        logger.info(f"✅ Goboony: Found {len(locations)} locations with: {selector}")
-                        break
-                except Exception as e:
-                    logger.debug(f"Goboony location selector failed: {e}")
-
-            # Remove duplicates and filter
-            locations = list(set(locations))
-            locations = [loc for loc in locations if len(loc) > 2 and not loc.startswith(('0', '1'))]
-            locations.sort(key=len, reverse=True)
-
-            if locations:
-                self.data['locations_available'] = locations[:20]
-                logger.info(f"✅ Goboony: Extracted {len(self.data['locations_available'])} locations")
-            else:
-                logger.warning("⚠️  Goboony: No locations found")
-
-        except Exception as e:
-            logger.error(f"Goboony location extraction failed: {e}")
-
-    async def _extract_goboony_features(self, page):
-        """Extract additional Goboony features - mileage, discounts, policies"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Mileage information
-            if 'unlimited mileage' in page_text_lower or 'unlimited km' in page_text_lower:
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info("✅ Mileage: Unlimited")
-            else:
-                # Try to find mileage limits
-                mileage_match = re.search(r'(\d+)\s*km.*?(?:per day|daily|included)', page_text, re.IGNORECASE)
-                if mileage_match:
-                    km = int(mileage_match.group(1))
-                    if 50 <= km <= 1000:
-                        self.data['mileage_limit_km'] = km
-                        logger.info(f"✅ Mileage limit: {km} km/day")
-
-            # Weekly/monthly discounts
-            weekly_match = re.search(r'(?:weekly|7\s*day).*?(\d+)%', page_text, re.IGNORECASE)
-            if weekly_match:
-                pct = float(weekly_match.group(1))
-                if 3 <= pct <= 50:
-                    self.data['weekly_discount_pct'] = pct
-                    logger.info(f"✅ Weekly discount: {pct}%")
-
-            monthly_match = re.search(r'(?:monthly|30\s*day).*?(\d+)%', page_text, re.IGNORECASE)
-            if monthly_match:
-                pct = float(monthly_match.group(1))
-                if 5 <= pct <= 50:
-                    self.data['monthly_discount_pct'] = pct
-                    logger.info(f"✅ Monthly discount: {pct}%")
-
-            # Fuel policy
-            if 'full to full' in page_text_lower or 'full-to-full' in page_text_lower:
-                self.data['fuel_policy'] = 'Full to Full'
-                logger.info("✅ Fuel policy: Full to Full")
-            elif 'same to same' in page_text_lower:
-                self.data['fuel_policy'] = 'Same to Same'
-
-            # Minimum rental days
-            min_rental_match = re.search(r'minimum.*?(\d+)\s*(?:day|night)', page_text, re.IGNORECASE)
-            if min_rental_match:
-                days = int(min_rental_match.group(1))
-                if 1 <= days <= 14:
-                    self.data['min_rental_days'] = days
-                    logger.info(f"✅ Min rental: {days} days")
-
-            # Referral program
-            if any(term in page_text_lower for term in ['refer', 'referral', 'invite friend']):
-                self.data['referral_program'] = True
-                logger.info("✅ Referral program: Yes")
-            else:
-                self.data['referral_program'] = False
-
-            # Discount codes
-            if any(term in page_text_lower for term in ['promo code', 'discount code', 'voucher']):
-                self.data['discount_code_available'] = True
-                logger.info("✅ Discount codes: Available")
-            else:
-                self.data['discount_code_available'] = False
-
-            # One-way rentals
-            if 'one way' in page_text_lower or 'one-way' in page_text_lower:
-                self.data['one_way_rental_allowed'] = True
-                logger.info("✅ One-way rental: Allowed")
-            else:
-                self.data['one_way_rental_allowed'] = False
-
-            # If no insurance found yet, use P2P platform average
-            if not self.data.get('insurance_cost_per_day'):
-                self.data['insurance_cost_per_day'] = 12.0  # P2P platform average
-                self.data['is_estimated'] = True
-                logger.info("✅ Insurance (P2P average): €12/day")
-
-            # P2P platforms typically have lower cleaning fees or none
-            if not self.data.get('cleaning_fee'):
-                self.data['cleaning_fee'] = 50.0  # P2P average
-                self.data['is_estimated'] = True
-                logger.info("✅ Cleaning fee (P2P average): €50")
-
-        except Exception as e:
-            logger.debug(f"Goboony features extraction: {e}")
-
-
-class YescapaScraper(DeepDataScraper):
-    """Deep scraper for Yescapa - P2P France"""
-    
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Yescapa")
-        super().__init__("Yescapa", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'search_sampling'
-    
-    async def scrape_deep_data(self, page):
-        """Collect Yescapa data with enhanced extraction - Goboony-style sampling"""
-
-        # 1. Start at homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-        # 2. Try search page for pricing (Goboony-style sampling)
-        if self.config['urls'].get('search'):
-            search_loaded = await self.navigate_smart(page, self.config['urls']['search'])
-            if search_loaded:
-                # Dismiss cookie modal if present
-                try:
-                    cookie_buttons = [
-                        'button:has-text("OK for me")',
-                        'button:has-text("Accept")',
-                        'button:has-text("I accept")',
-                        '[class*="cookie"] button',
-                        '[id*="cookie"] button'
-                    ]
-                    for button_selector in cookie_buttons:
-                        if await page.locator(button_selector).count() > 0:
-                            await page.click(button_selector, timeout=2000)
-                            logger.info("✅ Dismissed cookie modal")
-                            break
-                except:
-                    pass
-
-                # Wait longer for dynamic content to load
-                await asyncio.sleep(8)  # Increased from 5 to 8 seconds
-                
-                # Check for error pages
-                if await self._is_error_page(page):
-                    logger.warning("❌ Error page detected on search page")
-                    # Try booking simulation as fallback
-                    logger.info("🎯 Attempting booking simulation...")
-                    location = "Amsterdam" if self.company_name == "Goboony" else "Paris"
-                    success = await self._simulate_booking_universal(page, test_location=location)
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ {self.company_name} booking: €{self.data['base_nightly_rate']}/night")
-                        return  # Skip the rest if booking simulation worked
-                
-                # Try scrolling to trigger lazy loading
-                try:
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight/2)')
-                    await asyncio.sleep(2)
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    await asyncio.sleep(2)
-                    logger.info("✅ Scrolled page to trigger lazy loading")
-                except:
-                    pass
-
-                # Sample multiple listings with extensive selectors
-                listing_selectors = [
-                    '[class*="listing"]',
-                    '[class*="vehicle"]',
-                    '[class*="camper"]',
-                    '[class*="card"]',
-                    '[class*="result"]',
-                    '[class*="offer"]',
-                    '[data-testid*="listing"]',
-                    '[data-testid*="vehicle"]',
-                    'article',
-                    '[class*="rental"]',
-                    '[class*="motorhome"]',
-                    'a[href*="/vehicle/"]',
-                    'a[href*="/rv/"]'
-                ]
-                
-                listing_elements = []
-                for selector in listing_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        if elements and len(elements) > len(listing_elements):
-                            listing_elements = elements
-                            logger.info(f"✅ Yescapa: Found {len(elements)} elements with selector: {selector}")
-                            if len(elements) >= 10:
-                                break  # Found enough
-                    except:
-                        pass
-                
-                logger.info(f"✅ Yescapa: Total {len(listing_elements)} listing elements found")
-
-                sampled_prices = []
-                for i, elem in enumerate(listing_elements[:30]):  # Sample up to 30 listings
-                    try:
-                        text = await elem.text_content()
-                        if text:
-                            prices = await self.extract_prices_from_text(text)
-                            # Filter reasonable prices
-                            valid_prices = [p for p in prices if 20 <= p <= 500]
-                            if valid_prices:
-                                sampled_prices.extend(valid_prices)
-                                logger.debug(f"Yescapa listing {i+1}: found prices {valid_prices}")
-                    except Exception as e:
-                        logger.debug(f"Yescapa listing {i+1} extraction failed: {e}")
-
-                logger.info(f"✅ Yescapa: Extracted {len(sampled_prices)} prices from {len(listing_elements)} listings")
-
-                if sampled_prices:
-                    # Calculate average from sample
-                    self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                    self.data['is_estimated'] = True
-                    self.data['notes'] = f"Avg of {len(sampled_prices)} sampled P2P listings"
-                    logger.info(f"✅ Estimated price: €{self.data['base_nightly_rate']}/night from {len(sampled_prices)} prices")
-                else:
-                    logger.warning("⚠️  Yescapa: No prices found in listings, trying page text...")
-                    # Fallback: try to extract from full page text
-                    page_text = await page.evaluate('() => document.body.innerText')
-                    all_prices = await self.extract_prices_from_text(page_text)
-                    valid_prices = [p for p in all_prices if 30 <= p <= 400]
-                    if valid_prices:
-                        self.data['base_nightly_rate'] = round(sum(valid_prices[:10]) / min(len(valid_prices), 10), 2)
-                        self.data['is_estimated'] = True
-                        logger.info(f"✅ Fallback: Estimated price €{self.data['base_nightly_rate']}/night from page text")
-                    else:
-                        # Try booking simulation before final fallback
-                        logger.info("🎯 Attempting booking simulation for Yescapa...")
-                        success = await self._simulate_booking_universal(page, test_location="Paris")
-                        
-                        if success and self.data.get('base_nightly_rate'):
-                            self.data['is_estimated'] = False
-                            self.data['extraction_method'] = 'booking_simulation'
-                            logger.info(f"✅ Yescapa booking simulation: €{self.data['base_nightly_rate']}/night")
-                        else:
-                            # Final fallback: P2P platform average
-                            logger.warning("⚠️  Yescapa: No prices extracted, using P2P platform average")
-                            self.data['base_nightly_rate'] = 95.0  # P2P platform average (lower than traditional rentals)
-                            self.data['is_estimated'] = True
-                            self.data['extraction_method'] = 'p2p_industry_estimate'
-                            self.data['notes'] = "P2P platform average pricing (no listings found)"
-                            logger.info("✅ Applied P2P platform average: €95/night")
-
-                # Count total listings
-                self.data['fleet_size_estimate'] = len(listing_elements) if listing_elements else 1000  # P2P platforms have many
-                logger.info(f"✅ Found {self.data['fleet_size_estimate']} listings")
-
-        # 3. Platform commission & other data from page text
-        page_text = await page.evaluate('() => document.body.innerText')
-
-        commission_match = re.search(r'commission.*?(\d+)%', page_text, re.IGNORECASE)
-        if commission_match:
-            self.data['booking_fee'] = float(commission_match.group(1))
-
-        # 4. Insurance
-        if 'insurance' in page_text.lower():
-            insurance_match = re.search(r'insurance.*?[€$](\d+)', page_text, re.IGNORECASE)
-            if insurance_match:
-                cost = float(insurance_match.group(1))
-                if 0 < cost < 100:
-                    self.data['insurance_cost_per_day'] = cost
-
-        # 5. Cancellation policy
-        if 'free cancellation' in page_text.lower():
-            self.data['cancellation_policy'] = 'Free Cancellation'
-        elif 'flexible' in page_text.lower():
-            self.data['cancellation_policy'] = 'Flexible'
-
-        # 6. Locations - try to extract
-        await self._scrape_locations_yescapa(page)
-
-        # 7. Promotions
-        promotions = await self.detect_promotions(page)
-        self.data['active_promotions'] = promotions
-
-        # 8. Enhanced extraction for additional Yescapa fields
-        await self._extract_yescapa_features(page)
-
-        # 9. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"Yescapa data collected")
-
-    async def _extract_yescapa_features(self, page):
-        """Extract additional Yescapa features - mileage, discounts, policies, fees"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Mileage information (P2P platforms often have varied mileage)
-            if 'unlimited mileage' in page_text_lower or 'unlimited km' in page_text_lower or 'illimités' in page_text_lower:  # French
-                self.data['mileage_limit_km'] = 0
-                self.data['mileage_cost_per_km'] = 0.0
-                logger.info("✅ Mileage: Unlimited")
-            else:
-                # Try to find mileage limits
-                mileage_match = re.search(r'(\d+)\s*km.*?(?:per day|daily|included|jour)', page_text, re.IGNORECASE)
-                if mileage_match:
-                    km = int(mileage_match.group(1))
-                    if 50 <= km <= 1000:
-                        self.data['mileage_limit_km'] = km
-                        logger.info(f"✅ Mileage limit: {km} km/day")
-                else:
-                    # P2P default
-                    self.data['mileage_limit_km'] = 200  # P2P typical
-                    self.data['mileage_cost_per_km'] = 0.20  # P2P typical
-                    self.data['is_estimated'] = True
-                    logger.info("✅ Mileage (P2P average): 200 km/day, €0.20/km overage")
-
-            # Weekly/monthly discounts
-            weekly_match = re.search(r'(?:weekly|7\s*day|semaine).*?(\d+)%', page_text, re.IGNORECASE)
-            if weekly_match:
-                pct = float(weekly_match.group(1))
-                if 3 <= pct <= 50:
-                    self.data['weekly_discount_pct'] = pct
-                    logger.info(f"✅ Weekly discount: {pct}%")
-            else:
-                # P2P platforms typically offer weekly discounts
-                self.data['weekly_discount_pct'] = 10.0
-                self.data['is_estimated'] = True
-                logger.info("✅ Weekly discount (P2P standard): 10%")
-
-            monthly_match = re.search(r'(?:monthly|30\s*day|mois).*?(\d+)%', page_text, re.IGNORECASE)
-            if monthly_match:
-                pct = float(monthly_match.group(1))
-                if 5 <= pct <= 50:
-                    self.data['monthly_discount_pct'] = pct
-                    logger.info(f"✅ Monthly discount: {pct}%")
-            else:
-                # P2P platforms typically offer monthly discounts
-                self.data['monthly_discount_pct'] = 20.0
-                self.data['is_estimated'] = True
-                logger.info("✅ Monthly discount (P2P standard): 20%")
-
-            # Fuel policy
-            if 'full to full' in page_text_lower or 'full-to-full' in page_text_lower or 'plein' in page_text_lower:  # French: plein
-                self.data['fuel_policy'] = 'Full to Full'
-                logger.info("✅ Fuel policy: Full to Full")
-            else:
-                self.data['fuel_policy'] = 'Varies by owner'
-                logger.info("✅ Fuel policy: Varies by owner (P2P)")
-
-            # Minimum rental days
-            min_rental_match = re.search(r'minimum.*?(\d+)\s*(?:day|night|jour)', page_text, re.IGNORECASE)
-            if min_rental_match:
-                days = int(min_rental_match.group(1))
-                if 1 <= days <= 14:
-                    self.data['min_rental_days'] = days
-                    logger.info(f"✅ Min rental: {days} days")
-            else:
-                self.data['min_rental_days'] = 3  # P2P typical
-                self.data['is_estimated'] = True
-                logger.info("✅ Min rental (P2P typical): 3 days")
-
-            # Referral program (Yescapa has one)
-            if any(term in page_text_lower for term in ['parrain', 'referral', 'refer', 'invite']):  # French: parrain = referral
-                self.data['referral_program'] = True
-                logger.info("✅ Referral program: Yes")
-            else:
-                self.data['referral_program'] = True  # Yescapa is known to have referral
-                logger.info("✅ Referral program: Yes (known feature)")
-
-            # Discount codes
-            if any(term in page_text_lower for term in ['promo code', 'discount code', 'voucher', 'coupon', 'code promo']):  # French
-                self.data['discount_code_available'] = True
-                logger.info("✅ Discount codes: Available")
-            else:
-                self.data['discount_code_available'] = False
-
-            # One-way rentals
-            if 'one way' in page_text_lower or 'one-way' in page_text_lower or 'aller simple' in page_text_lower:  # French: aller simple
-                self.data['one_way_rental_allowed'] = True
-                # Try to find fee
-                one_way_match = re.search(r'(?:one.way|aller.simple).*?[€$]\s*(\d+)', page_text, re.IGNORECASE)
-                if one_way_match:
-                    fee = float(one_way_match.group(1))
-                    if 0 <= fee <= 500:
-                        self.data['one_way_fee'] = fee
-                        logger.info(f"✅ One-way rental: €{fee} fee")
-                else:
-                    logger.info("✅ One-way rental: Allowed (fee varies)")
-            else:
-                self.data['one_way_rental_allowed'] = False
-                logger.info("✅ One-way rental: Not typical for P2P")
-
-            # Cancellation policy (important for P2P)
-            if 'free cancellation' in page_text_lower or 'annulation gratuite' in page_text_lower:  # French
-                self.data['cancellation_policy'] = 'Free Cancellation'
-                logger.info("✅ Cancellation: Free")
-            elif 'flexible' in page_text_lower or 'souple' in page_text_lower:  # French
-                self.data['cancellation_policy'] = 'Flexible'
-                logger.info("✅ Cancellation: Flexible")
-            else:
-                self.data['cancellation_policy'] = 'Varies by owner'
-                logger.info("✅ Cancellation: Varies by owner (P2P)")
-
-            # If no cleaning fee found yet, use P2P average
-            if not self.data.get('cleaning_fee'):
-                self.data['cleaning_fee'] = 60.0  # P2P average (owners often don't charge or charge less)
-                self.data['is_estimated'] = True
-                logger.info("✅ Cleaning fee (P2P average): €60")
-
-            # Vehicle types (common on P2P platforms)
-            if not self.data.get('vehicle_types') or len(self.data['vehicle_types']) == 0:
-                self.data['vehicle_types'] = ['Van', 'Motorhome', 'Campervan', 'Converted Van', 'RV']
-                logger.info("✅ Vehicle types (P2P typical): 5 types")
-
-        except Exception as e:
-            logger.debug(f"Yescapa features extraction: {e}")
-
-    async def _scrape_locations_yescapa(self, page):
-        """Yescapa-specific location extraction"""
-        try:
-            await asyncio.sleep(2)
-
-            location_selectors = [
-                'select[name*="location"] option',
-                'select[name*="city"] option',
-                '[class*="location-filter"] option',
-                'a[href*="/location/"]',
-                'a[href*="/city/"]',
-                '[class*="location"]',
-                '[class*="destination"]'
-            ]
-
-            locations = []
-            for selector in location_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for elem in elements[:50]:
-                        text = await elem.text_content()
-                        if text:
-                            text = text.strip()
-                            if 3 <= len(text) <= 100 and not text.isdigit():
-                                locations.append(text)
-
-                    if len(locations) >= 5:
-                        break
-                except:
-                    pass
-
-            locations = list(set(locations))
-            locations = [loc for loc in locations if len(loc) > 2]
-            locations.sort(key=len, reverse=True)
-
-            if locations:
-                self.data['locations_available'] = locations[:20]
-                logger.info(f"✅ Yescapa: Extracted {len(self.data['locations_available'])} locations")
-
-        except Exception as e:
-            logger.debug(f"Yescapa location extraction: {e}")
-
-
-class CamperdaysScraper(DeepDataScraper):
-    """Deep scraper for Camperdays - Aggregator"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Camperdays")
-        super().__init__("Camperdays", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'aggregator_analysis'
-
-    async def scrape_deep_data(self, page):
-        """Collect aggregator market data with enhanced extraction and access denial handling"""
-        
-        # Skip search automation for now (causes browser timeouts)
-        # search_success = await self._automate_camperdays_search(page)
-
-        # 1. Start at homepage for reviews and initial data
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-
-            # Human-like delay after page load
-            await asyncio.sleep(2)
-
-            # Check for access denied
-            page_text = await page.evaluate('() => document.body.innerText')
-            if 'access denied' in page_text.lower() or 'permission' in page_text.lower():
-                logger.warning("⚠️  Camperdays: Access denied detected! Trying alternative approach...")
-
-                # Strategy: Wait longer and retry
-                await asyncio.sleep(5)
-
-                # Try reloading the page
-                try:
-                    await page.reload(wait_until='load', timeout=30000)
-                    await asyncio.sleep(3)
-                    page_text = await page.evaluate('() => document.body.innerText')
-
-                    if 'access denied' in page_text.lower():
-                        logger.error("❌ Camperdays: Still access denied after reload.")
-                        
-                        # Try booking simulation as last attempt
-                        logger.info("🎯 Attempting booking simulation for Camperdays...")
-                        booking_url = "https://www.camperdays.com/camper-van/search"
-                        try:
-                            await self.navigate_smart(page, booking_url)
-                            success = await self._simulate_booking_universal(page, test_location="Amsterdam")
-                            if success and self.data.get('base_nightly_rate'):
-                                self.data['extraction_method'] = 'booking_simulation'
-                                logger.info(f"✅ Camperdays booking: €{self.data['base_nightly_rate']}/night")
-                        except:
-                            pass
-                        
-                        # If booking failed, use industry estimates
-                        if not self.data.get('base_nightly_rate'):
-                            self.data['base_nightly_rate'] = 125.0  # Industry average for aggregator pricing
-                            self.data['is_estimated'] = True
-                            self.data['extraction_method'] = 'aggregator_industry_estimate'
-                            self.data['notes'] = "Access denied - using aggregator industry standards"
-
-                        # Fees (aggregators typically show market average)
-                        self.data['insurance_cost_per_day'] = 15.0  # Market average
-                        self.data['cleaning_fee'] = 75.0  # Market average
-                        self.data['booking_fee'] = 50.0  # Aggregator typical booking fee
-
-                        # Fleet and availability (aggregators aggregate many suppliers)
-                        self.data['fleet_size_estimate'] = 5000  # Aggregators list thousands
-                        self.data['locations_available'] = ['Multiple European locations']
-                        self.data['vehicle_types'] = ['Motorhome', 'Campervan', 'RV', 'Converted Van']
-
-                        # Policies (industry standards)
-                        self.data['fuel_policy'] = 'Varies by supplier'
-                        self.data['cancellation_policy'] = 'Varies by supplier'
-                        self.data['min_rental_days'] = 3  # Typical minimum
-
-                        # Mileage (aggregators often show per-supplier)
-                        self.data['mileage_limit_km'] = 200  # Typical daily limit
-                        self.data['mileage_cost_per_km'] = 0.25  # Typical overage cost
-
-                        # Discounts (common aggregator features)
-                        self.data['weekly_discount_pct'] = 10.0
-                        self.data['monthly_discount_pct'] = 20.0
-
-                        # Features (aggregators typically offer)
-                        self.data['one_way_rental_allowed'] = True
-                        self.data['one_way_fee'] = 150.0  # Typical aggregator one-way fee
-                        self.data['discount_code_available'] = True  # Most aggregators offer codes
-                        self.data['referral_program'] = False  # Less common for aggregators
-
-                        # Payment (aggregators support multiple methods)
-                        self.data['payment_options'] = ['credit_card', 'paypal', 'bank_transfer']
-
-                        # Reviews (aggregators typically have many reviews)
-                        self.data['customer_review_avg'] = 4.1  # Typical aggregator rating
-                        self.data['review_count'] = 25000  # Aggregators accumulate many reviews
-
-                        logger.info("✅ Applied comprehensive industry estimates for Camperdays (22+ fields)")
-                        return
-                except Exception as e:
-                    logger.debug(f"Reload failed: {e}")
-
-            # Dismiss cookie banner
-            try:
-                cookie_buttons = [
-                    'button:has-text("Accept")',
-                    'button:has-text("OK")',
-                    'button:has-text("Akzeptieren")',
-                    '[class*="cookie"] button',
-                    '[id*="cookie"] button'
-                ]
-                for button_selector in cookie_buttons:
-                    if await page.locator(button_selector).count() > 0:
-                        await page.click(button_selector, timeout=2000)
-                        logger.info("✅ Dismissed cookie banner")
-                        await asyncio.sleep(1)  # Human-like delay after clicking
-                        break
-            except:
-                pass
-
-            await asyncio.sleep(3)
-
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-            # Get promotions
-            promotions = await self.detect_promotions(page)
-            self.data['active_promotions'] = promotions
-
-        # 2. Try search page for better market data
-        search_url = self.config['urls'].get('search') or self.config['urls'].get('homepage')
-        if search_url:
-            search_loaded = await self.navigate_smart(page, search_url)
-            if search_loaded:
-                await asyncio.sleep(5)  # Let aggregator results load
-
-                # Scroll to trigger lazy loading
-                try:
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight/2)')
-                    await asyncio.sleep(2)
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    await asyncio.sleep(2)
-                    logger.info("✅ Scrolled to trigger lazy loading")
-                except:
-                    pass
-
-                # Try extensive selectors for aggregator listings
-                listing_selectors = [
-                    '[class*="result"]',
-                    '[class*="listing"]',
-                    '[class*="offer"]',
-                    '[class*="vehicle"]',
-                    '[class*="motorhome"]',
-                    '[class*="camper"]',
-                    '[class*="card"]',
-                    '[class*="product"]',
-                    '[data-testid*="result"]',
-                    '[data-testid*="listing"]',
-                    'article',
-                    'a[href*="/motorhome/"]',
-                    'a[href*="/vehicle/"]'
-                ]
-
-                listing_elements = []
-                for selector in listing_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        if elements and len(elements) > len(listing_elements):
-                            listing_elements = elements
-                            logger.info(f"✅ Camperdays: Found {len(elements)} with selector: {selector}")
-                            if len(elements) >= 10:
-                                break  # Found enough
-                    except:
-                        pass
-
-                logger.info(f"✅ Camperdays: Total {len(listing_elements)} listing elements")
-
-                sampled_prices = []
-                suppliers = set()
-
-                for i, elem in enumerate(listing_elements[:40]):  # Sample first 40
-                    try:
-                        text = await elem.text_content()
-                        if text:
-                            # Extract prices
-                            prices = await self.extract_prices_from_text(text)
-                            valid_prices = [p for p in prices if 20 <= p <= 500]
-                            if valid_prices:
-                                sampled_prices.extend(valid_prices)
-                                logger.debug(f"Camperdays listing {i+1}: found prices {valid_prices}")
-
-                            # Try to detect supplier names
-                            text_lower = text.lower()
-                            if 'roadsurfer' in text_lower:
-                                suppliers.add('Roadsurfer')
-                            if 'mcrent' in text_lower:
-                                suppliers.add('McRent')
-                            if 'goboony' in text_lower:
-                                suppliers.add('Goboony')
-                            if 'yescapa' in text_lower:
-                                suppliers.add('Yescapa')
-                    except Exception as e:
-                        logger.debug(f"Camperdays listing {i+1} extraction failed: {e}")
-
-                logger.info(f"✅ Camperdays: Extracted {len(sampled_prices)} prices from {len(listing_elements)} listings")
-
-                if sampled_prices:
-                    # Market analysis
-                    self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                    self.data['is_estimated'] = True
-                    self.data['notes'] = f"Market avg from {len(sampled_prices)} aggregated listings"
-                    if suppliers:
-                        self.data['notes'] += f" across {len(suppliers)} suppliers: {', '.join(suppliers)}"
-                    logger.info(f"✅ Market average: €{self.data['base_nightly_rate']}/night from {len(sampled_prices)} prices")
-                else:
-                    logger.warning("⚠️  Camperdays: No prices found, trying fallback...")
-                    # Fallback: extract from full page text
-                    page_text = await page.evaluate('() => document.body.innerText')
-                    all_prices = await self.extract_prices_from_text(page_text)
-                    valid_prices = [p for p in all_prices if 30 <= p <= 400]
-                    if valid_prices:
-                        self.data['base_nightly_rate'] = round(sum(valid_prices[:15]) / min(len(valid_prices), 15), 2)
-                        self.data['is_estimated'] = True
-                        logger.info(f"✅ Fallback: Estimated €{self.data['base_nightly_rate']}/night from page text")
-
-                if suppliers:
-                    logger.info(f"✅ Suppliers detected: {', '.join(suppliers)}")
-
-                # Count total results
-                self.data['fleet_size_estimate'] = len(listing_elements)
-
-        # 3. Get platform data from page text
-        page_text = await page.evaluate('() => document.body.innerText')
-
-        # Platform fees
-        if 'fee' in page_text.lower() or 'commission' in page_text.lower():
-            fee_match = re.search(r'(?:fee|commission).*?[€$](\d+)', page_text, re.IGNORECASE)
-            if fee_match:
-                self.data['booking_fee'] = float(fee_match.group(1))
-
-        # 4. Locations - aggregator usually has many
-        await self._scrape_locations_aggregator(page)
-        
-        # 5. Apply comprehensive aggregator estimates for completeness
-        await self._apply_camperdays_estimates()
-
-        logger.info(f"Camperdays aggregator data collected")
-    
-    async def _automate_camperdays_search(self, page) -> bool:
-        """Automate search form to get actual listings and pricing.
-        
-        Camperdays is an aggregator that requires a search to show results.
-        This method automates the search form submission.
-        
-        Returns:
-            bool: True if search succeeded
-        """
-        try:
-            # Navigate to search page
-            search_url = 'https://www.camperdays.com/search'
-            logger.info(f"🔍 Navigating to Camperdays search: {search_url}")
-            
-            await self.navigate_smart(page, search_url)
-            await asyncio.sleep(3)
-            
-            # Try to fill search form
-            # Common Camperdays form fields
-            try:
-                # Location input
-                location_selectors = [
-                    'input[name*="location"]',
-                    'input[placeholder*="location"]',
-                    'input[placeholder*="Where"]',
-                    'input[type="text"]'
-                ]
-                
-                location_filled = False
-                for selector in location_selectors:
-                    try:
-                        location_input = await page.wait_for_selector(selector, timeout=3000)
-                        if location_input:
-                            await location_input.fill("Munich, Germany")
-                            await asyncio.sleep(0.5)
-                            # Try to select first autocomplete
-                            await page.keyboard.press('ArrowDown')
-                            await asyncio.sleep(0.3)
-                            await page.keyboard.press('Enter')
-                            location_filled = True
-                            logger.info("✅ Filled location: Munich, Germany")
-                            break
-                    except:
-                        continue
-                
-                # Date inputs
-                start_date = (datetime.now() + timedelta(days=14)).strftime('%Y-%m-%d')
-                end_date = (datetime.now() + timedelta(days=21)).strftime('%Y-%m-%d')
-                
-                date_inputs = await page.query_selector_all('input[type="date"], input[name*="date"]')
-                if len(date_inputs) >= 2:
-                    await date_inputs[0].fill(start_date)
-                    await asyncio.sleep(0.5)
-                    await date_inputs[1].fill(end_date)
-                    await asyncio.sleep(0.5)
-                    logger.info(f"✅ Filled dates: {start_date} to {end_date}")
-                
-                # Submit search
-                submit_selectors = [
-                    'button[type="submit"]',
-                    'button:has-text("Search")',
-                    'button:has-text("Find")',
-                    '[class*="search-button"]',
-                    'button:has-text("Suchen")'  # German
-                ]
-                
-                for selector in submit_selectors:
-                    try:
-                        submit_button = await page.query_selector(selector)
-                        if submit_button:
-                            await submit_button.click()
-                            logger.info(f"✅ Clicked search button: {selector}")
-                            
-                            # Wait for results to load
-                            await page.wait_for_load_state('networkidle', timeout=15000)
-                            await asyncio.sleep(3)
-                            
-                            # Verify we have results
-                            result_count = await page.locator('[class*="result"], article, [class*="listing"]').count()
-                            if result_count > 0:
-                                logger.info(f"✅ Search returned {result_count} results")
-                                return True
-                            break
-                    except:
-                        continue
-                
-                # If we got here and filled location, consider it a success
-                if location_filled:
-                    logger.info("✅ Search form filled, waiting for results...")
-                    await asyncio.sleep(5)
-                    return True
-                    
-            except Exception as e:
-                logger.debug(f"Search form automation error: {e}")
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"❌ Camperdays search automation failed: {e}")
-            return False
-    
-    async def _apply_camperdays_estimates(self):
-        """Apply comprehensive aggregator estimates for missing fields."""
-        try:
-            # Discounts (aggregators typically show supplier discounts)
-            if not self.data.get('weekly_discount_pct'):
-                self.data['weekly_discount_pct'] = 10.0
-                logger.info("⚡ Camperdays weekly discount (aggregator avg): 10%")
-            
-            if not self.data.get('monthly_discount_pct'):
-                self.data['monthly_discount_pct'] = 18.0
-                logger.info("⚡ Camperdays monthly discount (aggregator avg): 18%")
-            
-            # Insurance and fees (aggregators show market average)
-            if not self.data.get('insurance_cost_per_day'):
-                self.data['insurance_cost_per_day'] = 15.0
-                logger.info("⚡ Camperdays insurance (market avg): €15/day")
-            
-            if not self.data.get('cleaning_fee'):
-                self.data['cleaning_fee'] = 75.0
-                logger.info("⚡ Camperdays cleaning (market avg): €75")
-            
-            if not self.data.get('booking_fee'):
-                self.data['booking_fee'] = 50.0
-                logger.info("⚡ Camperdays booking fee (aggregator typical): €50")
-            
-            # Mileage (varies by supplier on aggregators)
-            if not self.data.get('mileage_limit_km'):
-                self.data['mileage_limit_km'] = 200
-                self.data['mileage_cost_per_km'] = 0.25
-                logger.info("⚡ Camperdays mileage (market avg): 200 km/day, €0.25/km")
-            
-            # Rental terms (typical for aggregators)
-            if not self.data.get('min_rental_days'):
-                self.data['min_rental_days'] = 3
-                logger.info("⚡ Camperdays min rental (aggregator typical): 3 days")
-            
-            if not self.data.get('fuel_policy'):
-                self.data['fuel_policy'] = 'Varies by supplier'
-                logger.info("⚡ Camperdays fuel policy: Varies by supplier")
-            
-            if not self.data.get('cancellation_policy'):
-                self.data['cancellation_policy'] = 'Flexible - varies by supplier'
-                logger.info("⚡ Camperdays cancellation: Flexible")
-            
-            # Programs (aggregators typically offer)
-            if not self.data.get('discount_code_available'):
-                self.data['discount_code_available'] = True
-                logger.info("⚡ Camperdays discount codes: Available")
-            
-            if self.data.get('one_way_rental_allowed') is None:
-                self.data['one_way_rental_allowed'] = True
-                self.data['one_way_fee'] = 150.0
-                logger.info("⚡ Camperdays one-way: Allowed, €150 fee")
-            
-            # Fleet (aggregators list many suppliers)
-            if not self.data.get('fleet_size_estimate'):
-                self.data['fleet_size_estimate'] = 5000
-                logger.info("⚡ Camperdays fleet (aggregated): 5000 vehicles")
-            
-            # Vehicle types (aggregators show all types)
-            if not self.data.get('vehicle_types') or len(self.data['vehicle_types']) == 0:
-                self.data['vehicle_types'] = ['Motorhome', 'Campervan', 'RV', 'Caravan', 'Converted Van']
-                logger.info("⚡ Camperdays vehicle types: 5 types")
-            
-            # Promotions (aggregators promote deals)
-            if not self.data.get('active_promotions') or len(self.data['active_promotions']) == 0:
-                self.data['active_promotions'] = ['Early booking discount', 'Last minute deals', 'Multi-week discount']
-                logger.info("⚡ Camperdays promotions: 3 active")
-                
-        except Exception as e:
-            logger.debug(f"Camperdays estimates error: {e}")
-
-    async def _scrape_locations_aggregator(self, page):
-        """Aggregator-specific location extraction"""
-        try:
-            location_selectors = [
-                'select[name*="location"] option',
-                'select[name*="city"] option',
-                'select[name*="destination"] option',
-                'a[href*="/location/"]',
-                '[class*="location"]',
-                '[class*="destination"]',
-                '[class*="city"]'
-            ]
-
-            locations = []
-            for selector in location_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for elem in elements[:100]:  # Aggregators have many locations
-                        text = await elem.text_content()
-                        if text:
-                            text = text.strip()
-                            if 3 <= len(text) <= 100 and not text.isdigit():
-                                locations.append(text)
-
-                    if len(locations) >= 10:
-                        break
-                except:
-                    pass
-
-            locations = list(set(locations))
-            locations = [loc for loc in locations if len(loc) > 2]
-            locations.sort(key=len, reverse=True)
-
-            if locations:
-                self.data['locations_available'] = locations[:30]  # Keep more for aggregators
-                logger.info(f"✅ Camperdays: Extracted {len(self.data['locations_available'])} locations")
-
-        except Exception as e:
-            logger.debug(f"Camperdays location extraction: {e}")
-
-
-class OutdoorsyScraper(DeepDataScraper):
-    """Deep scraper for Outdoorsy - Largest US P2P Platform"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Outdoorsy")
-        super().__init__("Outdoorsy", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'p2p_us_sampling'
-
-    async def scrape_deep_data(self, page):
-        """Collect Outdoorsy P2P data with US market focus"""
-
-        # 1. Start at homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-        # 2. Try search page for pricing
-        if self.config['urls'].get('search'):
-            search_loaded = await self.navigate_smart(page, self.config['urls']['search'])
-            if search_loaded:
-                await asyncio.sleep(5)  # Let P2P listings load
-
-                # Sample multiple listings
-                listing_selectors = [
-                    '[class*="listing"]',
-                    '[class*="vehicle"]',
-                    '[class*="rv"]',
-                    '[class*="card"]',
-                    '[data-testid*="listing"]',
-                    'article'
-                ]
-
-                listing_elements = []
-                for selector in listing_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        if elements and len(elements) > len(listing_elements):
-                            listing_elements = elements
-                            logger.info(f"✅ Outdoorsy: Found {len(elements)} with: {selector}")
-                            if len(elements) >= 10:
-                                break
-                    except:
-                        pass
-
-                sampled_prices = []
-                for elem in listing_elements[:20]:
-                    text = await elem.text_content()
-                    prices = await self.extract_prices_from_text(text)
-                    # US pricing is typically $50-$500/night
-                    valid_prices = [p for p in prices if 50 <= p <= 500]
-                    sampled_prices.extend(valid_prices)
-
-                if sampled_prices:
-                    self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                    self.data['is_estimated'] = True
-                    self.data['notes'] = f"US P2P avg from {len(sampled_prices)} listings"
-                    logger.info(f"✅ Outdoorsy pricing: ${self.data['base_nightly_rate']}/night")
-                else:
-                    # Try booking simulation before falling back to estimate
-                    logger.info("🎯 Attempting booking simulation for Outdoorsy...")
-                    success = await self._simulate_booking_universal(page, test_location="Los Angeles, CA")
-                    
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ Outdoorsy booking: ${self.data['base_nightly_rate']}/night")
-                    else:
-                        # Final fallback: US P2P platform average
-                        self.data['base_nightly_rate'] = 175.0  # US P2P average
-                        self.data['is_estimated'] = True
-                        self.data['extraction_method'] = 'us_p2p_industry_estimate'
-                        self.data['currency'] = 'USD'
-                        logger.info("✅ Applied US P2P average: $175/night")
-
-                self.data['fleet_size_estimate'] = len(listing_elements) if listing_elements else 50000  # Outdoorsy has 50K+ RVs
-
-        # 3. Extract US-specific features
-        await self._extract_outdoorsy_features(page)
-
-        # 4. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"Outdoorsy US P2P data collected")
-
-    async def _extract_outdoorsy_features(self, page):
-        """Extract Outdoorsy-specific features - largest US P2P platform"""
-        try:
-            page_text = await page.evaluate('() => document.body.innerText')
-            page_text_lower = page_text.lower()
-
-            # Set currency to USD
-            self.data['currency'] = 'USD'
-
-            # US typical unlimited mileage on P2P
-            self.data['mileage_limit_km'] = 160  # 100 miles/day typical in US
-            self.data['mileage_cost_per_km'] = 0.45  # $0.30/mile = ~$0.45/km
-            self.data['is_estimated'] = True
-            logger.info("✅ Mileage (US P2P typical): 100 miles/day, $0.30/mile overage")
-
-            # Discounts
-            self.data['weekly_discount_pct'] = 15.0  # US P2P typical
-            self.data['monthly_discount_pct'] = 25.0  # US P2P typical
-            logger.info("✅ Discounts (US P2P typical): 15% weekly, 25% monthly")
-
-            # Fees (Outdoorsy has roadside assistance)
-            self.data['insurance_cost_per_day'] = 15.0  # US P2P insurance
-            self.data['cleaning_fee'] = 75.0  # US P2P cleaning
-            self.data['booking_fee'] = 20.0  # Outdoorsy service fee
-            logger.info("✅ Fees (Outdoorsy typical): $15/day insurance, $75 cleaning, $20 service")
-
-            # Policies
-            self.data['fuel_policy'] = 'Varies by owner'
-            self.data['cancellation_policy'] = 'Flexible'
-            self.data['min_rental_days'] = 2  # US P2P typical
-            logger.info("✅ Policies: Flexible cancellation, 2-day minimum")
-
-            # Features (Outdoorsy known features)
-            self.data['referral_program'] = True  # Outdoorsy has strong referral
-            self.data['discount_code_available'] = True
-            self.data['one_way_rental_allowed'] = True
-            self.data['one_way_fee'] = 150.0  # US typical
-            logger.info("✅ Features: Referral, discounts, one-way ($150)")
-
-            # Reviews (Outdoorsy is well-rated)
-            if not self.data.get('customer_review_avg'):
-                self.data['customer_review_avg'] = 4.7  # Outdoorsy typical
-                self.data['review_count'] = 125000  # Very large platform
-                logger.info("✅ Reviews (Outdoorsy typical): 4.7★, 125K reviews")
-
-            # Locations (US-wide)
-            self.data['locations_available'] = ['United States (all 50 states)', 'Canada']
-            logger.info("✅ Locations: US nationwide + Canada")
-
-            # Vehicle types
-            self.data['vehicle_types'] = ['Class A Motorhome', 'Class B Campervan', 'Class C RV', 'Travel Trailer', 'Fifth Wheel', 'Toy Hauler']
-            logger.info("✅ Vehicle types: 6 RV classes")
-
-        except Exception as e:
-            logger.debug(f"Outdoorsy features extraction: {e}")
-
-
-class RVshareScraper(DeepDataScraper):
-    """Deep scraper for RVshare - Major US P2P Platform"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("RVshare")
-        super().__init__("RVshare", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'p2p_us_sampling'
-
-    async def scrape_deep_data(self, page):
-        """Collect RVshare P2P data with US market focus"""
-
-        # 1. Homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-        # 2. Search page for pricing
-        if self.config['urls'].get('search'):
-            search_loaded = await self.navigate_smart(page, self.config['urls']['search'])
-            if search_loaded:
-                await asyncio.sleep(5)
-
-                # Sample listings
-                listing_selectors = [
-                    '[class*="listing"]',
-                    '[class*="rental"]',
-                    '[class*="rv"]',
-                    '[class*="card"]',
-                    'article'
-                ]
-
-                listing_elements = []
-                for selector in listing_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        if elements and len(elements) > len(listing_elements):
-                            listing_elements = elements
-                            logger.info(f"✅ RVshare: Found {len(elements)} with: {selector}")
-                            if len(elements) >= 10:
-                                break
-                    except:
-                        pass
-
-                sampled_prices = []
-                for elem in listing_elements[:20]:
-                    text = await elem.text_content()
-                    prices = await self.extract_prices_from_text(text)
-                    valid_prices = [p for p in prices if 50 <= p <= 500]
-                    sampled_prices.extend(valid_prices)
-
-                if sampled_prices:
-                    self.data['base_nightly_rate'] = round(sum(sampled_prices) / len(sampled_prices), 2)
-                    self.data['is_estimated'] = True
-                    logger.info(f"✅ RVshare pricing: ${self.data['base_nightly_rate']}/night")
-                else:
-                    # Try booking simulation before estimate
-                    logger.info("🎯 Attempting booking simulation for RVshare...")
-                    success = await self._simulate_booking_universal(page, test_location="Los Angeles, CA")
-                    
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ RVshare booking: ${self.data['base_nightly_rate']}/night")
-                    else:
-                        # Final fallback
-                        self.data['base_nightly_rate'] = 165.0  # US P2P average (slightly lower than Outdoorsy)
-                        self.data['is_estimated'] = True
-                        self.data['extraction_method'] = 'us_p2p_industry_estimate'
-                        logger.info("✅ Applied US P2P average: $165/night")
-
-                self.data['fleet_size_estimate'] = len(listing_elements) if listing_elements else 40000  # RVshare has 40K+ RVs
-
-        # 3. Extract features
-        await self._extract_rvshare_features(page)
-
-        # 4. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"RVshare US P2P data collected")
-
-    async def _extract_rvshare_features(self, page):
-        """Extract RVshare-specific features"""
-        try:
-            # Set currency
-            self.data['currency'] = 'USD'
-
-            # Mileage
-            self.data['mileage_limit_km'] = 160  # 100 miles/day
-            self.data['mileage_cost_per_km'] = 0.45  # $0.30/mile
-            logger.info("✅ Mileage (US typical): 100 miles/day")
-
-            # Discounts
-            self.data['weekly_discount_pct'] = 12.0
-            self.data['monthly_discount_pct'] = 20.0
-            logger.info("✅ Discounts: 12% weekly, 20% monthly")
-
-            # Fees
-            self.data['insurance_cost_per_day'] = 12.0  # RVshare insurance
-            self.data['cleaning_fee'] = 70.0
-            self.data['booking_fee'] = 18.0  # RVshare service fee
-            logger.info("✅ Fees: $12/day insurance, $70 cleaning")
-
-            # Policies
-            self.data['fuel_policy'] = 'Varies by owner'
-            self.data['cancellation_policy'] = 'Flexible'
-            self.data['min_rental_days'] = 2
-            logger.info("✅ Policies: Flexible, 2-day minimum")
-
-            # Features
-            self.data['referral_program'] = True
-            self.data['discount_code_available'] = True
-            self.data['one_way_rental_allowed'] = True
-            self.data['one_way_fee'] = 125.0
-            logger.info("✅ Features: Referral, one-way ($125)")
-
-            # Reviews
-            if not self.data.get('customer_review_avg'):
-                self.data['customer_review_avg'] = 4.6
-                self.data['review_count'] = 95000
-                logger.info("✅ Reviews (RVshare typical): 4.6★, 95K reviews")
-
-            # Locations
-            self.data['locations_available'] = ['United States (nationwide)']
-            logger.info("✅ Locations: US nationwide")
-
-            # Vehicle types
-            self.data['vehicle_types'] = ['Class A Motorhome', 'Class B Campervan', 'Class C RV', 'Travel Trailer', 'Fifth Wheel']
-            logger.info("✅ Vehicle types: 5 RV classes")
-
-        except Exception as e:
-            logger.debug(f"RVshare features extraction: {e}")
-
-
-class CruiseAmericaScraper(DeepDataScraper):
-    """Deep scraper for Cruise America - Largest US Traditional Rental"""
-
-    def __init__(self, use_browserless: bool = True):
-        config = get_competitor_by_name("Cruise America")
-        super().__init__("Cruise America", 1, config, use_browserless)
-        self.data['scraping_strategy_used'] = 'traditional_us_rental'
-
-    async def scrape_deep_data(self, page):
-        """Collect Cruise America data - traditional US RV rental"""
-
-        # 1. Homepage for reviews
-        if self.config['urls'].get('homepage'):
-            await self.navigate_smart(page, self.config['urls']['homepage'])
-            review_data = await self.extract_customer_reviews(page)
-            self.data['customer_review_avg'] = review_data['avg']
-            self.data['review_count'] = review_data['count']
-
-        # 2. Pricing page
-        if self.config['urls'].get('pricing'):
-            pricing_loaded = await self.navigate_smart(page, self.config['urls']['pricing'])
-            if pricing_loaded:
-                # Wait longer for dynamic content
-                await asyncio.sleep(5)  # Increased from 3 to 5 seconds
-                
-                # Check for error pages
-                if await self._is_error_page(page):
-                    logger.warning("❌ Error page detected on Cruise America pricing page")
-                    # Try booking simulation as fallback
-                    logger.info("🎯 Attempting booking simulation for Cruise America...")
-                    success = await self._simulate_booking_universal(page, test_location="Los Angeles, CA")
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ Cruise America booking: ${self.data['base_nightly_rate']}/night")
-                        return  # Skip the rest if booking simulation worked
-                
-                page_text = await page.evaluate('() => document.body.innerText')
-                prices = await self.extract_prices_from_text(page_text)
-
-                # Filter for nightly rates ($80-300/night typical)
-                night_prices = [p for p in prices if 80 <= p <= 300]
-                if night_prices:
-                    self.data['base_nightly_rate'] = min(night_prices)
-                    logger.info(f"✅ Cruise America pricing: ${self.data['base_nightly_rate']}/night")
-                else:
-                    # Try booking simulation before estimate
-                    logger.info("🎯 Attempting booking simulation for Cruise America...")
-                    success = await self._simulate_booking_universal(page, test_location="Los Angeles, CA")
-                    
-                    if success and self.data.get('base_nightly_rate'):
-                        self.data['is_estimated'] = False
-                        self.data['extraction_method'] = 'booking_simulation'
-                        logger.info(f"✅ Cruise America booking: ${self.data['base_nightly_rate']}/night")
-                    else:
-                        # Final fallback: US traditional rental average
-                        self.data['base_nightly_rate'] = 150.0
-                        self.data['is_estimated'] = True
-                        self.data['extraction_method'] = 'us_traditional_industry_estimate'
-                        logger.info("✅ Applied US traditional average: $150/night")
-
-        # 3. Extract Cruise America features
-        await self._extract_cruise_america_features(page)
-
-        # 4. Payment options
-        self.data['payment_options'] = await self.detect_payment_options(page)
-
-        logger.info(f"Cruise America traditional rental data collected")
-
-    async def _extract_cruise_america_features(self, page):
-        """Extract Cruise America-specific features - largest traditional US rental"""
-        try:
-            # Set currency
-            self.data['currency'] = 'USD'
-
-            # Mileage (Cruise America typically includes miles)
-            self.data['mileage_limit_km'] = 160  # 100 miles/day included
-            self.data['mileage_cost_per_km'] = 0.45  # $0.30/mile overage
-            logger.info("✅ Mileage: 100 miles/day included")
-
-            # Discounts
-            self.data['weekly_discount_pct'] = 10.0  # Traditional companies offer less
-            self.data['monthly_discount_pct'] = 20.0
-            logger.info("✅ Discounts: 10% weekly, 20% monthly")
-
-            # Fees (Cruise America has convenience kits)
-            self.data['insurance_cost_per_day'] = 25.0  # US traditional higher insurance
-            self.data['cleaning_fee'] = 100.0  # Higher for traditional
-            self.data['booking_fee'] = 0.0  # Cruise America doesn't charge booking fee
-            logger.info("✅ Fees: $25/day insurance, $100 cleaning, no booking fee")
-
-            # Policies
-            self.data['fuel_policy'] = 'Full to Full'  # Traditional standard
-            self.data['cancellation_policy'] = 'Flexible'
-            self.data['min_rental_days'] = 1  # Cruise America allows 1-day
-            logger.info("✅ Policies: Full to Full fuel, Flexible cancellation, 1-day minimum")
-
-            # Features
-            self.data['referral_program'] = False  # Traditional companies typically don't
-            self.data['discount_code_available'] = True
-            self.data['one_way_rental_allowed'] = True
-            self.data['one_way_fee'] = 300.0  # Higher for traditional
-            logger.info("✅ Features: One-way allowed ($300 fee)")
-
-            # Reviews (Cruise America well-established)
-            if not self.data.get('customer_review_avg'):
-                self.data['customer_review_avg'] = 4.2  # Established traditional company
-                self.data['review_count'] = 15000
-                logger.info("✅ Reviews (Cruise America typical): 4.2★, 15K reviews")
-
-            # Locations (Cruise America has 130+ locations)
-            self.data['locations_available'] = ['United States (130+ locations)', 'Canada (12 locations)', 'Alaska']
-            logger.info("✅ Locations: 130+ US locations, 12 Canada, Alaska")
-
-            # Fleet (Cruise America largest traditional)
-            self.data['fleet_size_estimate'] = 4000  # Largest traditional fleet in North America
-            logger.info("✅ Fleet size: ~4000 RVs")
-
-            # Vehicle types (Cruise America standardized fleet)
-            self.data['vehicle_types'] = ['Compact RV (19 ft)', 'Standard RV (25 ft)', 'Large RV (30 ft)', 'Truck Camper']
-            logger.info("✅ Vehicle types: 4 standardized classes")
-
-        except Exception as e:
-            logger.debug(f"Cruise America features extraction: {e}")
+def __dir__():
+    return sorted([*globals(), *SCRAPER_CLASSES])
 
 
 # Main execution
 async def scrape_tier_1_competitors():
     """Scrape all Tier 1 competitors"""
 
-    scrapers = [
-        # European competitors - Using local browsers for stability
-        RoadsurferScraper(use_browserless=False),
-        McRentScraper(use_browserless=False),
-        GoboonyScraper(use_browserless=False),
-        YescapaScraper(use_browserless=False),
-        CamperdaysScraper(use_browserless=False),
-        # US competitors
-        OutdoorsyScraper(use_browserless=False),
-        RVshareScraper(use_browserless=False),
-        CruiseAmericaScraper(use_browserless=False)
-    ]
+    # European competitors, then US - Using local browsers for stability
+    scrapers = [create_scraper(name, use_browserless=False) for name in registered_competitors()]
     
     results = []
     
@@ -4020,11 +38,12 @@ async def scrape_tier_1_competitors():
         data = await scraper.scrape()
         results.append(data)
         
-        # Save to database
+        # Save to database (batched by the persistence writer, off the event loop)
         try:
-            from database.models import add_price_record
-            add_price_record(data)
-            logger.info(f"✅ Saved to database: {scraper.company_name}")
+            from database.models import CompetitorPrice
+            from utils.async_persistence import get_persistence_writer
+            get_persistence_writer().add(CompetitorPrice(**data), label=f"{scraper.company_name} price")
+            logger.info(f"✅ Queued for database: {scraper.company_name}")
         except Exception as e:
             logger.error(f"Database save failed: {e}")
         
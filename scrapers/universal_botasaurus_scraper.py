@@ -4,12 +4,16 @@ Headless, cloud-ready, scalable scraping system
 """
 
 import re
+import sys
+from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 from botasaurus.browser import browser, Driver
 from botasaurus.user_agent import UserAgent
 from loguru import logger
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scrapers.html_parsing import visible_text
 
 
 COMPETITOR_CONFIGS = {
@@ -188,8 +192,7 @@ def scrape_competitor(driver: Driver, company_name: str) -> Dict:
         title = driver.title
         
         # Extract text
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text(separator=' ', strip=True)
+        text = visible_text(html, separator=' ')
         
         # Check Cloudflare
         cloudflare_found = "Just a moment" in html or "Checking your browser" in html
@@ -198,8 +201,7 @@ def scrape_competitor(driver: Driver, company_name: str) -> Dict:
             logger.warning("🛡️ Cloudflare detected - waiting...")
             time.sleep(5)
             html = driver.page_html
-            soup = BeautifulSoup(html, 'html.parser')
-            text = soup.get_text(separator=' ', strip=True)
+            text = visible_text(html, separator=' ')
             cloudflare_found = "Just a moment" in html
             
             if cloudflare_found:
@@ -0,0 +1,115 @@
+"""
+Tests for the async persistence writer and the event-loop lag monitor
+"""
+
+import asyncio
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.models import Base, PriceAlert
+from utils.async_persistence import LoopLagMonitor, PersistenceWriter
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def alert(company: str) -> PriceAlert:
+    return PriceAlert(alert_type='price_undercut', severity='high', company_name=company,
+                      alert_message=f"{company} undercut")
+
+
+class SlowCommitSession:
+    """Session whose commit blocks like a commit waiting on the SQLite lock"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        time.sleep(self.delay)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestPersistenceWriter:
+    """Test batching, error isolation and shutdown"""
+
+    @pytest.mark.asyncio
+    async def test_rows_batched_into_few_commits(self, session_factory):
+        """Test that queued rows share commits and futures resolve to their ids"""
+        writer = PersistenceWriter(session_factory)
+        futures = [writer.add(alert(f"Company {n}")) for n in range(20)]
+
+        ids = await asyncio.gather(*futures)
+        await writer.close()
+
+        assert len(set(ids)) == 20 and all(ids)
+        assert writer.stats['commits'] < 5
+        assert session_factory().query(PriceAlert).count() == 20
+
+    @pytest.mark.asyncio
+    async def test_failed_write_only_loses_itself(self, session_factory, tmp_path):
+        """Test that one bad operation does not roll back the rest of its batch"""
+        writer = PersistenceWriter(session_factory)
+
+        def broken(session):
+            raise ValueError("bad row")
+
+        good = writer.add(alert('McRent'))
+        bad = writer.submit_db(broken)
+        written = writer.write_text(tmp_path / 'page.html', '<html></html>')
+
+        assert await good
+        with pytest.raises(ValueError):
+            await bad
+        await written
+        await writer.close()
+
+        assert session_factory().query(PriceAlert).count() == 1
+        assert (tmp_path / 'page.html').read_text(encoding='utf-8') == '<html></html>'
+        assert writer.stats['errors'] == 1
+
+    def test_queued_writes_survive_loop_shutdown(self, tmp_path):
+        """Test that fire-and-forget writes still land when asyncio.run returns"""
+        async def scrape():
+            writer = PersistenceWriter(lambda: SlowCommitSession(0.05))
+            for n in range(5):
+                writer.write_text(tmp_path / f"page_{n}.html", str(n))
+
+        asyncio.run(scrape())
+
+        assert sorted(p.name for p in tmp_path.glob('page_*.html')) == [f"page_{n}.html" for n in range(5)]
+
+
+class TestLoopLagMonitor:
+    """Test that the monitor shows blocking commits and their removal"""
+
+    @pytest.mark.asyncio
+    async def test_writer_keeps_loop_responsive(self):
+        """Test that a slow commit blocks the loop when inline but not via the writer"""
+        async with LoopLagMonitor(interval=0.01) as inline:
+            await asyncio.sleep(0.03)
+            session = SlowCommitSession(0.3)
+            session.commit()
+            await asyncio.sleep(0.03)
+
+        writer = PersistenceWriter(lambda: SlowCommitSession(0.3))
+        async with LoopLagMonitor(interval=0.01) as offloaded:
+            await writer.add(object())
+        await writer.close()
+
+        assert inline.summary()['max_ms'] >= 250
+        assert offloaded.summary()['max_ms'] < 100
+        assert offloaded.summary()['samples'] >= 10
@@ -0,0 +1,172 @@
+"""
+Tests for the CDP endpoint pool
+Tests least-loaded leasing, connection reuse, cooldown and local failover
+"""
+
+import unittest
+import sys
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.base_scraper import DeepDataScraper
+from scrapers.cdp_pool import CDPEndpointPool, connect_url, version_url
+
+
+class StubScraper(DeepDataScraper):
+    """Minimal scraper for scrape() wiring tests"""
+
+    def __init__(self):
+        super().__init__('Test Company', 1, {'urls': {'homepage': 'https://example.com'}}, use_browserless=False)
+
+    async def scrape_deep_data(self, page):
+        pass
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBrowser:
+    def __init__(self, url: str):
+        self.url = url
+        self.alive = True
+
+    def is_connected(self) -> bool:
+        return self.alive
+
+
+class FakeCDP:
+    """Connector/probe pair with switchable endpoint outages"""
+
+    def __init__(self):
+        self.down = set()
+        self.connects = []
+
+    async def connect(self, url: str, timeout_ms: int):
+        self.connects.append(url)
+        if url in self.down:
+            raise ConnectionError("connection refused")
+        return FakeBrowser(url)
+
+    async def probe(self, url: str) -> bool:
+        return url not in self.down
+
+
+class TestCDPEndpointPool(unittest.TestCase):
+    """Test endpoint selection and health handling"""
+
+    URLS = ['ws://10.0.0.1:9222', 'ws://10.0.0.2:9222']
+
+    def setUp(self):
+        self.cdp = FakeCDP()
+        self.clock = FakeClock()
+
+    def make_pool(self, **kwargs) -> CDPEndpointPool:
+        return CDPEndpointPool(
+            self.URLS, max_sessions=2, cooldown=30, acquire_timeout=0.05,
+            connector=self.cdp.connect, probe=self.cdp.probe, clock=self.clock, **kwargs
+        )
+
+    def test_least_loaded_and_connection_reuse(self):
+        """Test that leases alternate endpoints and share one connection each"""
+        async def run():
+            pool = self.make_pool()
+            leases = [await pool.acquire() for _ in range(4)]
+
+            self.assertEqual([l.endpoint.url for l in leases], self.URLS * 2)
+            self.assertIs(leases[0].browser, leases[2].browser)
+            # Both endpoints at max_sessions: the next scrape gives up (local launch)
+            self.assertIsNone(await pool.acquire())
+
+            leases[1].release()
+            leases[1].release()  # releasing twice is harmless
+            again = await pool.acquire()
+            self.assertEqual(again.endpoint.url, self.URLS[1])
+            self.assertEqual(len(self.cdp.connects), 2)
+
+        asyncio.run(run())
+
+    def test_failed_endpoint_cools_down_then_recovers(self):
+        """Test failover to healthy endpoints, None when all are down, and recovery"""
+        async def run():
+            pool = self.make_pool()
+            self.cdp.down.add(self.URLS[0])
+
+            first = await pool.acquire()
+            self.assertEqual(first.endpoint.url, self.URLS[1])
+            self.assertFalse(pool.endpoints[0].healthy)
+
+            self.cdp.down.add(self.URLS[1])
+            first.browser.alive = False
+            first.release()
+            self.assertIsNone(await pool.acquire())
+
+            # Not retried during the cooldown, then probed and reconnected
+            self.cdp.down.clear()
+            self.clock.now += 10
+            self.assertIsNone(await pool.acquire())
+            self.clock.now += 60
+            lease = await pool.acquire()
+            self.assertIsNotNone(lease)
+            self.assertTrue(all(e.healthy for e in pool.endpoints if e.url == lease.endpoint.url))
+
+        asyncio.run(run())
+
+    def test_url_helpers(self):
+        """Test CDP address rewriting for Playwright and the health probe"""
+        self.assertEqual(connect_url('ws://127.0.0.1:9222'), 'http://127.0.0.1:9222')
+        browserless = 'wss://production-sfo.browserless.io?token=abc'
+        self.assertEqual(connect_url(browserless), browserless)
+        self.assertEqual(version_url(browserless), 'https://production-sfo.browserless.io/json/version?token=abc')
+
+    def test_scrape_releases_pooled_browser(self):
+        """Test that scrape() releases its lease and leaves the connection open"""
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        context = MagicMock(close=AsyncMock())
+        context.new_page = AsyncMock(return_value=MagicMock(close=AsyncMock()))
+        browser.new_context = AsyncMock(return_value=context)
+
+        async def connect(url, timeout_ms):
+            return browser
+
+        pool = CDPEndpointPool(self.URLS[:1], connector=connect, probe=self.cdp.probe)
+        scraper = StubScraper()
+        scraper.retry_step = AsyncMock(return_value=False)
+
+        with patch('scrapers.base_scraper.get_cdp_pool', return_value=pool):
+            asyncio.run(scraper.scrape())
+
+        browser.new_context.assert_awaited_once()
+        browser.close.assert_not_called()
+        self.assertEqual(pool.endpoints[0].active, 0)
+        self.assertEqual(pool.endpoints[0].leases, 1)
+
+
+def run_all_tests():
+    """Run all CDP pool tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestCDPEndpointPool))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+"""
+Tests for the database backup manager
+Tests online backups, incremental chains, restore and parallel verification
+"""
+
+import unittest
+import sys
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from database_backup import DatabaseBackup
+
+
+def table_rows(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute("SELECT id, company, price FROM prices ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+class TestDatabaseBackup(unittest.TestCase):
+    """Test backups of a live SQLite database"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.db_path = root / 'live.db'
+        self.backup_dir = root / 'backups'
+        self.backup_dir.mkdir()
+
+        # ~4 MB spread over several chunks
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("CREATE TABLE prices (id INTEGER PRIMARY KEY, company TEXT, price REAL, notes TEXT)")
+        connection.executemany(
+            "INSERT INTO prices (company, price, notes) VALUES (?, ?, ?)",
+            [(f'Company {i % 10}', 50.0 + i % 200, 'x' * 400) for i in range(10000)]
+        )
+        connection.commit()
+        connection.close()
+
+        self.manager = DatabaseBackup(backup_dir=self.backup_dir)
+        self.manager.database_path = self.db_path
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_backup_while_writing(self):
+        """Test that a backup taken during writes is a consistent database"""
+        stop = threading.Event()
+
+        def writer():
+            connection = sqlite3.connect(self.db_path, timeout=10)
+            while not stop.wait(0.001):
+                connection.execute("INSERT INTO prices (company, price, notes) VALUES ('Writer', 99.0, 'y')")
+                connection.commit()
+            connection.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            backup_path = self.manager.create_backup(compress=True, backup_type='daily')
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertIsNotNone(backup_path)
+        self.assertTrue(self.manager.verify_backup(backup_path))
+        self.assertEqual(self.manager._load_backup_metadata(backup_path)['kind'], 'full')
+
+    def test_incremental_chain_restore(self):
+        """Test that an incremental stores changed chunks only and restores exactly"""
+        full = self.manager.create_backup(compress=True, backup_type='daily')
+
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("UPDATE prices SET price = price + 1 WHERE id <= 20")
+        connection.commit()
+        connection.close()
+        expected = table_rows(self.db_path)
+
+        incremental = self.manager.create_backup(compress=True, backup_type='hourly', incremental=True)
+        metadata = self.manager._load_backup_metadata(incremental)
+        self.assertEqual(metadata['kind'], 'incremental')
+        self.assertEqual(metadata['base'], full.name)
+        self.assertLess(len(metadata['changed_chunks']), metadata['db_size'] // metadata['chunk_size'])
+        self.assertLess(incremental.stat().st_size, full.stat().st_size / 2)
+
+        # Diverge the live database, then restore the chain over it
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("DELETE FROM prices WHERE id > 100")
+        connection.commit()
+        connection.close()
+
+        self.assertTrue(self.manager.restore_backup(incremental, force=True))
+        self.assertEqual(table_rows(self.db_path), expected)
+        self.assertTrue(self.manager.list_backups(backup_type='pre_restore'))
+
+    def test_parallel_verification_flags_corruption(self):
+        """Test that verify_backups runs quick_check on each backup"""
+        good = self.manager.create_backup(compress=True, backup_type='daily')
+        incremental = self.manager.create_backup(compress=True, backup_type='hourly', incremental=True)
+        bad = self.manager.create_backup(compress=False, backup_type='weekly')
+        with open(bad, 'r+b') as f:
+            f.seek(4096)
+            f.write(b'\xff' * 8192)
+
+        results = self.manager.verify_backups()
+        self.assertEqual(results, {good: True, bad: False, incremental: True})
+        self.assertNotIn('.meta', {path.suffix for path in results})
+
+    def test_cleanup_keeps_base_of_incrementals(self):
+        """Test that retention never removes a full backup still in a chain"""
+        full = self.manager.create_backup(compress=True, backup_type='daily')
+        incremental = self.manager.create_backup(compress=True, backup_type='hourly', incremental=True)
+        self.manager.retention_policy['daily']['keep'] = 0
+
+        self.assertEqual(self.manager.cleanup_old_backups(), 0)
+        self.assertTrue(full.exists())
+        self.assertTrue(self.manager.verify_backup(incremental))
+
+        self.manager.retention_policy['hourly']['keep'] = 0
+        self.assertEqual(self.manager.cleanup_old_backups(), 2)
+        self.assertEqual(self.manager.list_backups(), [])
+
+    def test_schedule_backup_on_empty_directory(self):
+        """Test that the first scheduled backup of a type is taken, then skipped until due"""
+        daily = self.manager.schedule_backup('daily')
+        self.assertIsNotNone(daily)
+        self.assertEqual(self.manager._load_backup_metadata(daily)['kind'], 'full')
+        self.assertIsNone(self.manager.schedule_backup('daily'))
+
+        # Incremental policy: builds on the daily full backup
+        hourly = self.manager.schedule_backup('hourly')
+        self.assertIsNotNone(hourly)
+        self.assertEqual(self.manager._load_backup_metadata(hourly)['kind'], 'incremental')
+
+    def test_schedule_incremental_without_full_backup(self):
+        """Test that a first incremental-policy backup falls back to a full one"""
+        hourly = self.manager.schedule_backup('hourly')
+        self.assertIsNotNone(hourly)
+        self.assertEqual(self.manager._load_backup_metadata(hourly)['kind'], 'full')
+
+
+def run_all_tests():
+    """Run all backup tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestDatabaseBackup))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
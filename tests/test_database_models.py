@@ -27,6 +27,13 @@ from database.models import (
     CompetitorIntelligence,
     MarketIntelligence,
     PriceAlert,
+    LatestCompetitorPrice,
+    CompetitorPriceAttribute,
+    get_current_prices,
+    get_last_scrape_time,
+    get_companies_serving_location,
+    get_companies_with_feature,
+    get_active_promotions,
     Base
 )
 from sqlalchemy import create_engine
@@ -490,6 +497,160 @@ class TestDataIntegrity(unittest.TestCase):
         self.assertIsInstance(retrieved.scrape_timestamp, datetime)
 
 
+class TestLatestCompetitorPrice(unittest.TestCase):
+    """Test the trigger-maintained latest price per company"""
+    
+    def setUp(self):
+        """Create a temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db_path = self.temp_db.name
+        self.temp_db.close()
+        self.engine = create_engine(f'sqlite:///{self.temp_db_path}')
+        Base.metadata.create_all(self.engine)
+        Session = sessionmaker(bind=self.engine)
+        self.session = Session()
+    
+    def tearDown(self):
+        """Clean up"""
+        if hasattr(self, 'session') and self.session:
+            self.session.close()
+        if hasattr(self, 'engine') and self.engine:
+            self.engine.dispose()
+        if os.path.exists(self.temp_db_path):
+            try:
+                os.unlink(self.temp_db_path)
+            except PermissionError:
+                pass
+    
+    def add_price(self, company, days_ago, rate):
+        price = CompetitorPrice(
+            company_name=company,
+            scrape_timestamp=datetime(2024, 6, 30) - timedelta(days=days_ago),
+            base_nightly_rate=rate
+        )
+        self.session.add(price)
+        self.session.commit()
+        return price
+    
+    def current_rates(self):
+        return {p.company_name: p.base_nightly_rate for p in get_current_prices(self.session)}
+    
+    def test_insert_keeps_newest_per_company(self):
+        """Test that inserts update the row only when they are newer"""
+        self.add_price('Roadsurfer', 5, 100.0)
+        self.add_price('Roadsurfer', 1, 110.0)
+        self.add_price('Roadsurfer', 3, 90.0)  # Late backfill of an older scrape
+        self.add_price('McRent', 2, 80.0)
+        
+        self.assertEqual(self.current_rates(), {'McRent': 80.0, 'Roadsurfer': 110.0})
+        self.assertEqual(self.session.query(LatestCompetitorPrice).count(), 2)
+        self.assertEqual(get_last_scrape_time(self.session), datetime(2024, 6, 29))
+    
+    def test_delete_falls_back_to_previous_record(self):
+        """Test that deleting the newest record promotes the next newest"""
+        self.add_price('Roadsurfer', 5, 100.0)
+        newest = self.add_price('Roadsurfer', 1, 110.0)
+        
+        self.session.delete(newest)
+        self.session.commit()
+        self.assertEqual(self.current_rates(), {'Roadsurfer': 100.0})
+    
+    def test_existing_history_is_backfilled(self):
+        """Test that installing the table on an existing database fills it"""
+        self.add_price('Roadsurfer', 5, 100.0)
+        self.add_price('Roadsurfer', 1, 110.0)
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TRIGGER trg_latest_price_insert")
+            conn.exec_driver_sql("DELETE FROM latest_competitor_price")
+        
+        Base.metadata.create_all(self.engine)
+        self.assertEqual(self.current_rates(), {'Roadsurfer': 110.0})
+
+
+class TestPriceAttributes(unittest.TestCase):
+    """Test the trigger-maintained side table of JSON list elements"""
+    
+    def setUp(self):
+        """Create a temporary database for testing"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db_path = self.temp_db.name
+        self.temp_db.close()
+        self.engine = create_engine(f'sqlite:///{self.temp_db_path}')
+        Base.metadata.create_all(self.engine)
+        Session = sessionmaker(bind=self.engine)
+        self.session = Session()
+        self.today = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    
+    def tearDown(self):
+        """Clean up"""
+        if hasattr(self, 'session') and self.session:
+            self.session.close()
+        if hasattr(self, 'engine') and self.engine:
+            self.engine.dispose()
+        if os.path.exists(self.temp_db_path):
+            try:
+                os.unlink(self.temp_db_path)
+            except PermissionError:
+                pass
+    
+    def add_price(self, company, days_ago, **fields):
+        price = CompetitorPrice(
+            company_name=company,
+            scrape_timestamp=self.today - timedelta(days=days_ago),
+            **fields
+        )
+        self.session.add(price)
+        self.session.commit()
+        return price
+    
+    def companies(self, rows):
+        return [row['company_name'] for row in rows]
+    
+    def test_insert_populates_lookups(self):
+        """Test location, feature and promotion lookups after ingest"""
+        self.add_price('Roadsurfer', 0, locations_available=['Lisbon', 'Munich'],
+                       vehicle_features=['Kitchen', 'Shower'],
+                       active_promotions=[{'text': 'Summer Sale -15%', 'type': 'banner', 'discount_pct': 15.0}])
+        self.add_price('McRent', 40, locations_available=[' lisbon '], vehicle_features=['Kitchen'])
+        self.add_price('Indie Campers', 0, locations_available=['Porto'], payment_options=None)
+        
+        self.assertEqual(self.companies(get_companies_serving_location(self.session, 'LISBON')),
+                         ['McRent', 'Roadsurfer'])
+        recent = get_companies_serving_location(self.session, 'Lisbon', since=self.today - timedelta(days=30))
+        self.assertEqual(self.companies(recent), ['Roadsurfer'])
+        self.assertEqual(self.companies(get_companies_with_feature(self.session, 'kitchen')),
+                         ['McRent', 'Roadsurfer'])
+        
+        promotions = get_active_promotions(self.session)
+        self.assertEqual([(p['company_name'], p['promotion']) for p in promotions],
+                         [('Roadsurfer', 'Summer Sale -15%')])
+        self.assertEqual(get_active_promotions(self.session, day=(self.today - timedelta(days=1)).date()), [])
+    
+    def test_update_and_delete_follow_the_row(self):
+        """Test that rewriting or deleting a price row rewrites its attributes"""
+        price = self.add_price('Roadsurfer', 0, locations_available=['Lisbon'])
+        
+        price.locations_available = ['Faro']
+        self.session.commit()
+        self.assertEqual(get_companies_serving_location(self.session, 'Lisbon'), [])
+        self.assertEqual(self.companies(get_companies_serving_location(self.session, 'Faro')), ['Roadsurfer'])
+        
+        self.session.delete(price)
+        self.session.commit()
+        self.assertEqual(self.session.query(CompetitorPriceAttribute).count(), 0)
+    
+    def test_existing_history_is_backfilled(self):
+        """Test that installing the triggers on an existing database fills the table"""
+        self.add_price('Roadsurfer', 3, locations_available=['Lisbon'], popular_routes=['Lisbon-Porto'])
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TRIGGER trg_price_attributes_insert")
+            conn.exec_driver_sql("DELETE FROM competitor_price_attributes")
+        
+        Base.metadata.create_all(self.engine)
+        values = {(a.attribute, a.value) for a in self.session.query(CompetitorPriceAttribute)}
+        self.assertEqual(values, {('location', 'Lisbon'), ('route', 'Lisbon-Porto')})
+
+
 def run_all_tests():
     """Run all database tests"""
     # Create test suite
@@ -502,6 +663,8 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestMarketIntelligenceModel))
     suite.addTests(loader.loadTestsFromTestCase(TestPriceAlertModel))
     suite.addTests(loader.loadTestsFromTestCase(TestDataIntegrity))
+    suite.addTests(loader.loadTestsFromTestCase(TestLatestCompetitorPrice))
+    suite.addTests(loader.loadTestsFromTestCase(TestPriceAttributes))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
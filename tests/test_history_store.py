@@ -0,0 +1,155 @@
+"""
+Tests for the Parquet history store
+Tests incremental export, watermarks and partition/column pruning
+"""
+
+import unittest
+import sys
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from database.models import Base, CompetitorPrice
+from database.history_store import HistoryDataset, HistoryStore, company_slug, missing_ids, parquet_available
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class HistoryStoreTestCase(unittest.TestCase):
+    """Temporary SQLite database and store root"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / 'intel.db'
+        self.engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.store = HistoryStore(
+            root=self.temp_dir / 'history',
+            datasets={'competitor_prices': HistoryDataset('competitor_prices', self.db_path, 'scrape_timestamp')},
+            chunk_rows=4
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def add_prices(self, rows, ids=None):
+        session = self.Session()
+        for i, (company, timestamp, rate) in enumerate(rows):
+            session.add(CompetitorPrice(id=ids[i] if ids else None, company_name=company,
+                                        scrape_timestamp=timestamp, base_nightly_rate=rate, notes='x' * 200))
+        session.commit()
+        session.close()
+
+
+class TestPartitionPruning(HistoryStoreTestCase):
+    """Test partition selection (no Parquet engine needed)"""
+
+    def test_partitions_selected_by_company_and_month(self):
+        """Test that only matching company/month directories are opened"""
+        for slug, month in [('roadsurfer', '2024-01'), ('roadsurfer', '2024-02'), ('roadsurfer', '2024-04'),
+                            ('mcrent', '2024-02'), ('roadsurfer', 'unknown')]:
+            directory = self.store.dataset_dir('competitor_prices') / f"company={slug}" / f"month={month}"
+            directory.mkdir(parents=True)
+            (directory / 'part-0000000001-0000000001.parquet').touch()
+
+        files = self.store.partitions('competitor_prices', companies=['Roadsurfer'], start='2024-02-01', end='2024-04-01')
+        self.assertEqual([f.parent.name for f in files], ['month=2024-02'])
+        self.assertEqual(len(self.store.partitions('competitor_prices')), 5)
+        self.assertEqual(company_slug('Cruise America'), 'cruise-america')
+
+        with self.assertRaises(ValueError):
+            self.store.partitions('prices')
+
+    def test_missing_ids_between_exports(self):
+        """Test that skipped ids are found and huge jumps keep only the newest"""
+        self.assertEqual(missing_ids(0, [1, 2, 3]), [])
+        self.assertEqual(missing_ids(2, [4, 7, 8]), [3, 5, 6])
+        self.assertEqual(missing_ids(0, [1, 1000000], limit=3), [999997, 999998, 999999])
+
+
+@unittest.skipUnless(parquet_available(), "Parquet engine (pyarrow) not installed")
+class TestHistoryExport(HistoryStoreTestCase):
+    """Test incremental export and pruned queries"""
+
+    def test_incremental_sync_uses_watermark(self):
+        """Test that each sync exports only rows added since the last one"""
+        self.add_prices([('Roadsurfer', datetime(2024, month, 10), 100.0 + month) for month in range(1, 7)])
+        self.add_prices([('McRent', datetime(2024, 3, 5), 90.0)])
+
+        self.assertEqual(self.store.sync(), {'competitor_prices': 7})
+        self.assertEqual(self.store.watermark('competitor_prices')['last_id'], 7)
+        self.assertEqual(self.store.sync(), {'competitor_prices': 0})
+
+        self.add_prices([('McRent', datetime(2024, 3, 20), 95.0)])
+        self.assertEqual(self.store.sync(), {'competitor_prices': 1})
+        self.assertEqual(len(list((self.store.dataset_dir('competitor_prices') / 'company=mcrent').rglob('*.parquet'))), 2)
+
+        df = self.store.query('competitor_prices')
+        self.assertEqual(sorted(df['id']), list(range(1, 9)))
+
+        # A rebuild produces the same rows from scratch
+        self.assertEqual(self.store.rebuild('competitor_prices'), 8)
+
+    def test_late_commit_below_watermark_is_exported(self):
+        """Test that a row committed after a higher id was exported is picked up later"""
+        self.add_prices([('Roadsurfer', datetime(2024, 1, day), 100.0) for day in (1, 2, 4)], ids=[1, 2, 4])
+
+        self.assertEqual(self.store.sync(), {'competitor_prices': 3})
+        self.assertEqual(list(self.store.watermark('competitor_prices')['gaps']), ['3'])
+        self.assertEqual(self.store.stats()['competitor_prices']['gaps'], 1)
+
+        self.add_prices([('Roadsurfer', datetime(2024, 1, 3), 100.0)], ids=[3])
+        self.assertEqual(self.store.sync(), {'competitor_prices': 1})
+        self.assertEqual(self.store.watermark('competitor_prices')['gaps'], {})
+        self.assertEqual(sorted(self.store.query('competitor_prices')['id']), [1, 2, 3, 4])
+        self.assertEqual(self.store.sync(), {'competitor_prices': 0})
+
+    def test_expired_gaps_are_not_rechecked(self):
+        """Test that gaps older than the recheck window are given up"""
+        self.store.gap_recheck = timedelta(0)
+        self.add_prices([('Roadsurfer', datetime(2024, 1, day), 100.0) for day in (1, 3)], ids=[1, 3])
+        self.store.sync()
+
+        self.add_prices([('Roadsurfer', datetime(2024, 1, 2), 100.0)], ids=[2])
+        self.assertEqual(self.store.sync(), {'competitor_prices': 0})
+        self.assertEqual(sorted(self.store.query('competitor_prices')['id']), [1, 3])
+
+    def test_query_reads_only_needed_partitions_and_columns(self):
+        """Test company/date pruning and exact range trimming"""
+        self.add_prices([('Roadsurfer', datetime(2024, month, 10), 100.0 + month) for month in range(1, 7)])
+        self.add_prices([('McRent', datetime(2024, month, 10), 80.0) for month in range(1, 7)])
+        self.store.sync()
+
+        df = self.store.query('competitor_prices', columns=['scrape_timestamp', 'base_nightly_rate'],
+                              companies=['Roadsurfer'], start='2024-02-15', end='2024-05-01')
+
+        self.assertEqual(list(df.columns), ['scrape_timestamp', 'base_nightly_rate'])
+        self.assertEqual(list(df['base_nightly_rate']), [103.0, 104.0])
+        # February to April of one company: three of the twelve partitions
+        self.assertEqual(self.store.last_scan['files'], 3)
+
+
+def run_all_tests():
+    """Run all history store tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestPartitionPruning))
+    suite.addTests(loader.loadTestsFromTestCase(TestHistoryExport))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,173 @@
+"""
+Tests for the browser-free HTML parsing layer and archive re-extraction
+"""
+
+import unittest
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers import html_parsing
+from scrapers.html_parsing import visible_text, extract_json_ld, parse_html
+from reextract_html_archive import extract_archived_page, match_company, page_timestamp
+
+
+SAMPLE_PAGE = """
+<html>
+<head><title>Roadsurfer</title><style>.price { color: red; }</style></head>
+<body>
+  <script>var price = "€999";</script>
+  <div class="hero">Campervans from <span>€85</span> per night</div>
+  <ul><li>Insurance: €15 per day</li><li>Full to full fuel policy</li></ul>
+  <p>Solar panel &amp; kitchen included</p>
+  <script type="application/ld+json">
+    {"@type": "Organization", "aggregateRating": {"ratingValue": "4.6", "reviewCount": "2310"}}
+  </script>
+  <script type="application/ld+json">{not valid json</script>
+</body>
+</html>
+"""
+
+
+class TestVisibleText(unittest.TestCase):
+    """Test visible text extraction"""
+
+    def test_skips_scripts_and_styles(self):
+        """Test that script and style content is not part of the text"""
+        text = visible_text(SAMPLE_PAGE)
+
+        self.assertNotIn('999', text)
+        self.assertNotIn('color', text)
+        self.assertNotIn('ratingValue', text)
+
+    def test_keeps_inline_text_on_one_line(self):
+        """Test that inline elements do not break lines but blocks do"""
+        lines = visible_text(SAMPLE_PAGE).split('\n')
+
+        self.assertIn('Campervans from €85 per night', lines)
+        self.assertIn('Insurance: €15 per day', lines)
+        self.assertIn('Solar panel & kitchen included', lines)
+
+    def test_flat_text_matches_get_text(self):
+        """Test the flat form used by the botasaurus scrapers"""
+        text = visible_text(SAMPLE_PAGE, separator=' ')
+
+        self.assertNotIn('\n', text)
+        self.assertIn('Campervans from €85 per night Insurance: €15 per day', text)
+        self.assertNotIn('999', text)
+
+    def test_empty_document(self):
+        """Test empty input"""
+        self.assertEqual(visible_text(''), '')
+        self.assertEqual(visible_text('', separator=' '), '')
+
+
+class TestHtmlDocument(unittest.TestCase):
+    """Test the find_all DOM layer on every installed backend"""
+
+    PRICE_PAGE = """
+    <div class="card Price-Box"><span>€85</span> per night<p data-price="120">From</p></div>
+    <ul><li class="rate">Insurance <strong>€ 15</strong></li><li data-price>Fuel</li></ul>
+    <img src="van.jpg" alt="van"><p>No price here</p>
+    """
+
+    def backends(self):
+        backends = ['stdlib']
+        if html_parsing.HAS_LXML:
+            backends.append('lxml')
+        if html_parsing.HAS_SELECTOLAX:
+            backends.append('selectolax')
+        return backends
+
+    def setUp(self):
+        self.default_backend = html_parsing.BACKEND
+
+    def tearDown(self):
+        html_parsing.BACKEND = self.default_backend
+
+    def test_find_all(self):
+        """Test tag, attribute, class and string filters"""
+        for backend in self.backends():
+            with self.subTest(backend=backend):
+                html_parsing.BACKEND = backend
+                doc = parse_html(self.PRICE_PAGE)
+
+                priced = doc.find_all(['span', 'p', 'strong'], string=re.compile(r'[€$]\s*\d+'))
+                self.assertEqual([e.get_text() for e in priced], ['€85', '€ 15'])
+
+                with_data = doc.find_all(attrs={'data-price': True})
+                self.assertEqual([e.get('data-price') for e in with_data], ['120', ''])
+
+                classed = doc.find_all(class_=re.compile(r'price|rate', re.I))
+                self.assertEqual([e.tag for e in classed], ['div', 'li'])
+                self.assertEqual(classed[1].get_text(' ', strip=True), 'Insurance € 15')
+
+                self.assertEqual(len(doc.find_all('p')), 2)
+                self.assertEqual(parse_html('').find_all('div'), [])
+
+    def test_class_matches_single_tokens(self):
+        """Test that class_ matches one class of a multi-class element, as BeautifulSoup does"""
+        page = '<span class="price price--large">€99</span><span class="priceless">-</span><b class="">x</b>'
+        for backend in self.backends():
+            with self.subTest(backend=backend):
+                html_parsing.BACKEND = backend
+                doc = parse_html(page)
+
+                self.assertEqual([e.get_text() for e in doc.find_all(class_='price')], ['€99'])
+                self.assertEqual([e.get_text() for e in doc.find_all(class_='price--large')], ['€99'])
+                self.assertEqual(len(doc.find_all(class_='price price--large')), 1)
+                self.assertEqual(len(doc.find_all(attrs={'class': 'price'})), 1)
+                self.assertEqual(len(doc.find_all('span', class_=re.compile(r'^price$'))), 1)
+                self.assertEqual(doc.find_all(class_='large'), [])
+                self.assertEqual(len(doc.find_all(class_=True)), 3)
+
+
+class TestJsonLd(unittest.TestCase):
+    """Test JSON-LD extraction"""
+
+    def test_parses_valid_blocks_only(self):
+        """Test that invalid JSON-LD blocks are skipped"""
+        blocks = extract_json_ld(SAMPLE_PAGE)
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0]['aggregateRating']['ratingValue'], '4.6')
+
+
+class TestArchiveReextraction(unittest.TestCase):
+    """Test offline re-extraction of archived pages"""
+
+    def test_extract_archived_page(self):
+        """Test that an archived page yields scraper data fields"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'Roadsurfer_source_20251018_133853.html'
+            path.write_text(SAMPLE_PAGE, encoding='utf-8')
+
+            fields = extract_archived_page(str(path))
+
+        self.assertEqual(fields['base_nightly_rate'], 85.0)
+        self.assertEqual(fields['insurance_cost_per_day'], 15.0)
+        self.assertEqual(fields['fuel_policy'], 'Full to Full')
+        self.assertEqual(fields['customer_review_avg'], 4.6)
+        self.assertEqual(fields['review_count'], 2310)
+        self.assertIn('solar_panel', fields['vehicle_features'])
+
+    def test_match_company_and_timestamp_from_filename(self):
+        """Test that save_html file names map to a competitor and capture time"""
+        competitors = [
+            {'name': 'Roadsurfer', 'tier': 1},
+            {'name': 'Cruise America', 'tier': 2},
+        ]
+        path = Path('CruiseAmerica_source_20251018_133853.html')
+
+        self.assertEqual(match_company(path, competitors)['name'], 'Cruise America')
+        self.assertIsNone(match_company(Path('unknown_page.html'), competitors))
+        self.assertEqual(page_timestamp(path).strftime('%Y-%m-%d %H:%M'), '2025-10-18 13:38')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests for the index migrations and the query plan checker
+Tests migration ownership of indexes, upgrades of legacy databases and hot query plans
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from sqlalchemy import create_engine, inspect, text
+
+from database import models, pricing_calendar_schema as calendar
+from database.migrate import current, downgrade, upgrade
+from database.query_plans import check_query_plans, seed_databases
+
+OWNED_TABLES = [
+    'competitor_prices', 'price_alerts', 'competitor_price_attributes',
+    'daily_prices', 'vehicle_models', 'price_snapshots',
+]
+
+
+# Pricing tables as created before revision 0002 (company and model names)
+LEGACY_PRICING_TABLES = [
+    "CREATE TABLE vehicle_models (id INTEGER PRIMARY KEY, company_name VARCHAR(100) NOT NULL, "
+    "model_name VARCHAR(200) NOT NULL, model_category VARCHAR(50), sleeps INTEGER, features JSON, "
+    "image_url VARCHAR(500), CONSTRAINT uq_company_model UNIQUE (company_name, model_name))",
+    "CREATE TABLE daily_prices (id INTEGER PRIMARY KEY, company_name VARCHAR(100) NOT NULL, "
+    "model_name VARCHAR(200) NOT NULL, rental_date DATE NOT NULL, price_per_night FLOAT NOT NULL, "
+    "currency VARCHAR(3), min_nights INTEGER, search_location VARCHAR(100), pickup_location VARCHAR(100), "
+    "rental_duration_days INTEGER, insurance_per_day FLOAT, cleaning_fee FLOAT, service_fee FLOAT, "
+    "total_rental_cost FLOAT, is_available BOOLEAN, num_available INTEGER, scraped_at DATETIME, "
+    "booking_url VARCHAR(500), notes VARCHAR(500), "
+    "CONSTRAINT uq_company_model_date UNIQUE (company_name, model_name, rental_date))",
+    "CREATE INDEX idx_date_company ON daily_prices (rental_date, company_name)",
+    "CREATE TABLE price_snapshots (id INTEGER PRIMARY KEY, company_name VARCHAR(100) NOT NULL, "
+    "snapshot_date DATE NOT NULL, search_location VARCHAR(100), min_price_per_night FLOAT, "
+    "max_price_per_night FLOAT, avg_price_per_night FLOAT, median_price_per_night FLOAT, "
+    "total_vehicles_available INTEGER, num_models_available INTEGER, scraped_at DATETIME, "
+    "num_prices_collected INTEGER, "
+    "CONSTRAINT uq_company_date_location UNIQUE (company_name, snapshot_date, search_location))",
+]
+
+
+def index_names(engine, table):
+    return {index['name'] for index in inspect(engine).get_indexes(table)}
+
+
+class TestIndexMigrations(unittest.TestCase):
+    """Test that migrations create, drop and revert indexes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / 'intelligence.db'
+        self.engine = create_engine(f'sqlite:///{self.db_path}')
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_models_leave_indexes_to_migrations(self):
+        """Test that owned tables declare no indexes and get them from upgrade"""
+        tables = {**models.Base.metadata.tables, **calendar.Base.metadata.tables}
+        for name in OWNED_TABLES:
+            self.assertEqual(tables[name].indexes, set(), name)
+
+        models.Base.metadata.create_all(self.engine)
+        self.assertEqual(index_names(self.engine, 'competitor_prices'), set())
+
+        upgrade('intelligence', db_path=self.db_path)
+        self.assertEqual(current('intelligence', db_path=self.db_path), '0003')
+        self.assertEqual(
+            index_names(self.engine, 'competitor_prices'),
+            {'idx_prices_company_time', 'ix_competitor_prices_scrape_timestamp'}
+        )
+        self.assertIn('idx_alerts_open', index_names(self.engine, 'price_alerts'))
+        self.assertIn('idx_attributes_lookup', index_names(self.engine, 'competitor_price_attributes'))
+
+    def test_legacy_database_upgrade_and_downgrade(self):
+        """Test that redundant legacy indexes are dropped and restored"""
+        models.Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE INDEX ix_competitor_prices_company_name ON competitor_prices (company_name)"
+            ))
+            connection.execute(text(
+                "CREATE INDEX ix_competitor_prices_scrape_timestamp ON competitor_prices (scrape_timestamp)"
+            ))
+
+        upgrade('intelligence', engine=self.engine)
+        indexes = index_names(self.engine, 'competitor_prices')
+        self.assertNotIn('ix_competitor_prices_company_name', indexes)
+        self.assertIn('ix_competitor_prices_scrape_timestamp', indexes)
+
+        downgrade('intelligence', revision='base', engine=self.engine)
+        indexes = index_names(self.engine, 'competitor_prices')
+        self.assertIn('ix_competitor_prices_company_name', indexes)
+        self.assertNotIn('idx_prices_company_time', indexes)
+        self.assertIsNone(current('intelligence', db_path=self.db_path))
+
+    def test_price_attributes_backfilled_and_removed(self):
+        """Test that 0002 backfills attributes on an older database and its downgrade drops the triggers"""
+        models.Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            for name in models.PRICE_ATTRIBUTE_TRIGGERS:
+                connection.execute(text(f"DROP TRIGGER {name}"))
+            connection.execute(text("DROP TABLE competitor_price_attributes"))
+            connection.execute(text(
+                "INSERT INTO competitor_prices (company_name, locations_available, active_promotions) "
+                "VALUES ('Roadsurfer', '[\"Lisbon\", \"Porto\"]', '[{\"text\": \"Spring Sale\"}]')"
+            ))
+
+        upgrade('intelligence', engine=self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO competitor_prices (company_name, locations_available) VALUES ('McRent', '[\"Faro\"]')"
+            ))
+            rows = connection.execute(text(
+                "SELECT company_name, attribute, value FROM competitor_price_attributes ORDER BY id"
+            )).fetchall()
+        self.assertEqual([tuple(row) for row in rows], [
+            ('Roadsurfer', 'location', 'Lisbon'), ('Roadsurfer', 'location', 'Porto'),
+            ('Roadsurfer', 'promotion', 'Spring Sale'), ('McRent', 'location', 'Faro'),
+        ])
+
+        downgrade('intelligence', revision='0001', engine=self.engine)
+        with self.engine.connect() as connection:
+            triggers = connection.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_price_attributes%'"
+            )).fetchall()
+        self.assertEqual(triggers, [])
+        self.assertNotIn('idx_attributes_lookup', index_names(self.engine, 'competitor_price_attributes'))
+
+    def test_legacy_pricing_names_become_keys(self):
+        """Test that 0002 moves name-keyed pricing rows onto integer keys"""
+        with self.engine.begin() as connection:
+            for statement in LEGACY_PRICING_TABLES:
+                connection.execute(text(statement))
+            connection.execute(text(
+                "INSERT INTO vehicle_models (id, company_name, model_name, sleeps) VALUES "
+                "(7, 'Roadsurfer', 'Beach Hotel', 4), (9, 'McRent', 'Compact Plus', 2)"
+            ))
+            connection.execute(text(
+                "INSERT INTO daily_prices (id, company_name, model_name, rental_date, price_per_night) VALUES "
+                "(1, 'Roadsurfer', 'Beach Hotel', '2025-06-01', 120.0), "
+                "(2, 'McRent', 'Compact Plus', '2025-06-01', 95.0), "
+                "(5, 'McRent', 'Surf Van', '2025-06-02', 99.0)"
+            ))
+            connection.execute(text(
+                "INSERT INTO price_snapshots (company_name, snapshot_date, min_price_per_night) "
+                "VALUES ('McRent', '2025-06-01', 95.0)"
+            ))
+        calendar.Base.metadata.create_all(self.engine)
+
+        upgrade('pricing', engine=self.engine)
+        self.assertEqual(current('pricing', db_path=self.db_path), '0003')
+        columns = {c['name'] for c in inspect(self.engine).get_columns('daily_prices')}
+        self.assertTrue({'company_id', 'model_id'} <= columns)
+        self.assertNotIn('company_name', columns)
+        self.assertIn('idx_daily_company_location_date', index_names(self.engine, 'daily_prices'))
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT d.id, c.name, m.model_name, m.sleeps, d.price_per_night FROM daily_prices d "
+                "JOIN companies c ON c.id = d.company_id JOIN vehicle_models m ON m.id = d.model_id ORDER BY d.id"
+            )).all()
+            snapshot = connection.execute(text(
+                "SELECT c.name FROM price_snapshots s JOIN companies c ON c.id = s.company_id"
+            )).scalar_one()
+        self.assertEqual([tuple(row) for row in rows], [
+            (1, 'Roadsurfer', 'Beach Hotel', 4, 120.0),
+            (2, 'McRent', 'Compact Plus', 2, 95.0),
+            (5, 'McRent', 'Surf Van', None, 99.0),  # Price without a vehicle_models row
+        ])
+        self.assertEqual(snapshot, 'McRent')
+
+
+class TestQueryPlans(unittest.TestCase):
+    """Test the hot queries on a seeded database"""
+
+    def test_no_unexpected_table_scans(self):
+        """Test that every hot query is index-backed"""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = seed_databases(Path(tmp), companies=3, days=20)
+            self.assertEqual(current('pricing', db_path=paths['pricing']), '0003')
+            report = check_query_plans(paths)
+
+        failures = {entry['name']: entry['plan'] for entry in report if not entry['ok']}
+        self.assertEqual(failures, {})
+        sources = {entry['source'] for entry in report}
+        self.assertTrue({'analyzers', 'dashboard', 'health_check', 'price_rollups'} <= sources)
+
+
+def run_all_tests():
+    """Run all migration tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestIndexMigrations))
+    suite.addTests(loader.loadTestsFromTestCase(TestQueryPlans))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
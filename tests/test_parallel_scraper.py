@@ -0,0 +1,270 @@
+"""
+Tests for the Parallel Scraping Engine
+Tests partial-result salvage, streaming completion, Botasaurus scrapers and the work queue
+"""
+
+import unittest
+import sys
+import time
+import threading
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.parallel_scraper import (
+    ParallelScraper,
+    ParallelScraperConfig,
+    PARTIAL_RESULT_NOTE,
+    enqueue_scrapers
+)
+from utils.work_queue import SQLiteWorkQueue
+from scrapers.botasaurus_adapter import BotasaurusExecutor, BotasaurusScraper
+
+# Windows async compatibility
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+class FakeScraper:
+    """Stands in for DeepDataScraper: fills data step by step, no browser"""
+
+    def __init__(self, company_name: str, delay: float, fail: bool = False):
+        self.company_name = company_name
+        self.config = {'urls': {'homepage': f'https://{company_name.lower()}.example'}}
+        self.delay = delay
+        self.fail = fail
+        self.data = {
+            'company_name': company_name,
+            'base_nightly_rate': None,
+            'review_count': None,
+            'notes': None,
+            'data_completeness_pct': 0,
+        }
+
+    async def scrape(self):
+        self.data['base_nightly_rate'] = 99.0
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("site changed")
+        self.data['review_count'] = 120
+        return self.data
+
+    async def calculate_completeness(self) -> float:
+        filled = sum(1 for v in self.data.values() if v not in [None, '', [], 0])
+        return filled / len(self.data) * 100
+
+
+def fast_config(**overrides) -> ParallelScraperConfig:
+    settings = dict(
+        max_concurrent_scrapers=5,
+        requests_per_minute=60000,
+        enable_progress_callback=False,
+    )
+    settings.update(overrides)
+    return ParallelScraperConfig(**settings)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestPartialResults(unittest.TestCase):
+    """Test salvaging data from scrapers that time out"""
+
+    def test_scraper_timeout_returns_partial_data(self):
+        """Test that a timed-out scraper keeps what it already collected"""
+        engine = ParallelScraper(fast_config(scraper_timeout=0.05))
+        slow = FakeScraper('Slow', delay=1.0)
+
+        results = run(engine.scrape_all([FakeScraper('Fast', delay=0), slow]))
+
+        self.assertEqual(results.successful_count, 1)
+        self.assertEqual(results.partial_count, 1)
+        self.assertEqual(results.timeout_count, 1)
+
+        partial = results.get_partial_results()
+        self.assertEqual(len(partial), 1)
+        self.assertEqual(partial[0]['base_nightly_rate'], 99.0)
+        self.assertIsNone(partial[0]['review_count'])
+        self.assertTrue(partial[0]['notes'].startswith(PARTIAL_RESULT_NOTE))
+        self.assertGreater(partial[0]['data_completeness_pct'], 0)
+
+    def test_partial_collection_can_be_disabled(self):
+        """Test the plain timeout behaviour when salvage is off"""
+        engine = ParallelScraper(fast_config(scraper_timeout=0.05, collect_partial_results=False))
+
+        results = run(engine.scrape_all([FakeScraper('Slow', delay=1.0)]))
+
+        self.assertEqual(results.tasks[0].status, 'timeout')
+        self.assertIsNone(results.tasks[0].result)
+        self.assertEqual(results.partial_count, 0)
+
+
+class TestScrapeIter(unittest.TestCase):
+    """Test the streaming completion API"""
+
+    def test_yields_in_completion_order(self):
+        """Test that fast scrapers are available before slow ones finish"""
+        engine = ParallelScraper(fast_config())
+        scrapers = [
+            FakeScraper('Slow', delay=0.15),
+            FakeScraper('Broken', delay=0.05, fail=True),
+            FakeScraper('Fast', delay=0),
+        ]
+
+        async def collect():
+            return [(task.scraper.company_name, task.status) async for task in engine.scrape_iter(scrapers)]
+
+        finished = run(collect())
+
+        self.assertEqual(finished, [('Fast', 'completed'), ('Broken', 'failed'), ('Slow', 'completed')])
+
+    def test_total_timeout_yields_partial_results_last(self):
+        """Test that the run deadline cancels stragglers and salvages them"""
+        engine = ParallelScraper(fast_config(total_timeout=0.1, scraper_timeout=10))
+        scrapers = [FakeScraper('Stuck', delay=5), FakeScraper('Fast', delay=0)]
+
+        async def collect():
+            return [task async for task in engine.scrape_iter(scrapers)]
+
+        finished = run(collect())
+
+        self.assertEqual([t.scraper.company_name for t in finished], ['Fast', 'Stuck'])
+        self.assertTrue(finished[1].is_partial)
+        self.assertEqual(finished[1].result['base_nightly_rate'], 99.0)
+
+
+class TestWorkQueue(unittest.TestCase):
+    """Test consuming competitor jobs from the shared work queue"""
+
+    def test_scrape_from_queue(self):
+        """Test that queued competitors are scraped once and results stored"""
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = SQLiteWorkQueue(str(Path(tmp) / 'work_queue.db'))
+            names = ['Roadsurfer', 'McRent', 'Broken']
+            enqueue_scrapers(queue, [FakeScraper(n, delay=0) for n in names], priorities=[1, 3, 2])
+            # Re-queuing the same run is a no-op while jobs are pending
+            self.assertEqual(enqueue_scrapers(queue, [FakeScraper('McRent', delay=0)]), [None])
+
+            def factory(name):
+                return FakeScraper(name, delay=0.01, fail=name == 'Broken')
+
+            engine = ParallelScraper(fast_config(max_concurrent_scrapers=2))
+            results = run(engine.scrape_from_queue(queue, factory))
+
+            self.assertEqual(results.successful_count, 2)
+            self.assertEqual(results.failed_count, 1)
+            self.assertEqual(sorted(r['payload']['company_name'] for r in queue.results()), ['McRent', 'Roadsurfer'])
+            # The failure goes back to the queue for a later attempt
+            self.assertEqual(queue.stats()['queued'], 1)
+            queue.close()
+
+
+class FakeBrowserTask:
+    """Mimics a @browser function: sync, blocking, with a driver pool"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._driver_pool = []
+        self.calls = []
+        self.closed = False
+        self.__name__ = 'fake_browser_task'
+
+    def __call__(self, data, **overrides):
+        self.calls.append((data, overrides))
+        time.sleep(self.delay)
+        return {'success': data != 'bad-url', 'base_nightly_rate': 80.0}
+
+    def close(self):
+        self.closed = True
+
+
+class TestBotasaurusAdapter(unittest.TestCase):
+    """Test running sync Botasaurus scrapers in the async engine"""
+
+    def test_mixed_run_does_not_block_event_loop(self):
+        """Test that blocking Botasaurus tasks run in threads beside async scrapers"""
+        executor = BotasaurusExecutor(max_workers=2)
+        task = FakeBrowserTask(delay=0.2)
+        scrapers = [
+            BotasaurusScraper('McRent', task, ['bad-url', 'good-url'], executor, homepage='https://mcrent.de/'),
+            BotasaurusScraper('Yescapa', task, ['good-url'], executor, homepage='https://yescapa.com/'),
+            FakeScraper('Async', delay=0.05),
+        ]
+        engine = ParallelScraper(fast_config())
+
+        start = time.perf_counter()
+        try:
+            results = run(engine.scrape_all(scrapers))
+        finally:
+            executor.shutdown()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results.successful_count, 3)
+        mcrent = results.tasks[0].result
+        self.assertEqual(mcrent['attempts_used'], 2)
+        self.assertEqual(mcrent['data_completeness_pct'], 100.0)
+        # Three 0.2s calls on two workers take ~0.4s, not 0.6s back to back
+        self.assertLess(elapsed, 0.6)
+        self.assertTrue(all(o['reuse_driver'] for _, o in task.calls))
+        self.assertTrue(task.closed)
+
+    def test_plain_functions_reuse_one_driver_per_worker(self):
+        """Test that (driver, data) functions get a per-thread reused driver"""
+        created = []
+
+        def factory():
+            created.append(threading.get_ident())
+            return object()
+
+        seen = []
+
+        def scrape_page(driver, data):
+            seen.append(driver)
+            return {'success': True, 'url': data}
+
+        executor = BotasaurusExecutor(max_workers=1, driver_factory=factory)
+        scraper = BotasaurusScraper('Roadsurfer', scrape_page, ['a'], executor)
+
+        async def scrape_twice():
+            await scraper.scrape()
+            return await scraper.scrape()
+
+        try:
+            result = run(scrape_twice())
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(result['url'], 'a')
+        self.assertEqual(len(created), 1)
+        self.assertIs(seen[0], seen[1])
+
+
+def run_all_tests():
+    """Run all parallel scraper tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestPartialResults))
+    suite.addTests(loader.loadTestsFromTestCase(TestScrapeIter))
+    suite.addTests(loader.loadTestsFromTestCase(TestBotasaurusAdapter))
+    suite.addTests(loader.loadTestsFromTestCase(TestWorkQueue))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
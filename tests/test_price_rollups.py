@@ -0,0 +1,135 @@
+"""
+Tests for the pricing calendar rollups
+Tests calendar ingestion, snapshot aggregates and incremental recomputation
+"""
+
+import unittest
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.dimensions import dimension_cache
+from database.pricing_calendar_schema import Base, Company, DailyPrice, PriceSnapshot, VehicleModel, WeeklyPriceRollup
+from database.price_rollups import ingest_pricing_calendar, load_rollups, update_rollups
+
+
+def calendar(prices_by_model, start=date(2025, 3, 24), location='Munich', company='Roadsurfer'):
+    """Pricing calendar in comprehensive_pricing_scraper format (one company)"""
+    return {'companies': {company: {
+        'currency': 'EUR',
+        'search_location': location,
+        'models': [
+            {
+                'model_name': name,
+                'category': 'Van',
+                'sleeps': 2,
+                'pricing_calendar': {str(start + timedelta(days=i)): price for i, price in enumerate(prices)}
+            }
+            for name, prices in prices_by_model.items()
+        ]
+    }}}
+
+
+class TestPriceRollups(unittest.TestCase):
+    """Test rollup contents and incremental updates"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        # Mon 24 Mar - Fri 4 Apr 2025: two weeks, two months
+        ingest_pricing_calendar(self.session, calendar({
+            'Beach Hotel': [100.0] * 12,
+            'Surfer Suite': [130.0 + i for i in range(12)],
+            'Camper Cabin': [70.0] * 12,
+        }))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_snapshots_and_period_rollups(self):
+        """Test per-day snapshots and weekly/monthly aggregates"""
+        written = update_rollups(self.session)
+        self.assertEqual(written, {'day': 12, 'week': 2, 'month': 2})
+
+        snapshot = self.session.query(PriceSnapshot).filter_by(snapshot_date=date(2025, 3, 24)).one()
+        self.assertEqual(snapshot.min_price_per_night, 70.0)
+        self.assertEqual(snapshot.max_price_per_night, 130.0)
+        self.assertEqual(snapshot.median_price_per_night, 100.0)
+        self.assertEqual(snapshot.num_models_available, 3)
+
+        week = self.session.query(WeeklyPriceRollup).filter_by(period_start=date(2025, 3, 31)).one()
+        self.assertEqual(week.num_days, 5)
+        self.assertEqual(week.num_prices_collected, 15)
+        self.assertEqual(week.max_price_per_night, 141.0)
+
+        months = load_rollups(self.session, 'month')
+        self.assertEqual(list(months['period_start']), [date(2025, 3, 1), date(2025, 4, 1)])
+        self.assertEqual(list(months['num_days']), [8, 4])
+
+    def test_only_touched_periods_are_recomputed(self):
+        """Test that a re-scraped date rewrites just its day, week and month"""
+        update_rollups(self.session)
+        self.assertEqual(update_rollups(self.session), {'day': 0, 'week': 0, 'month': 0})
+
+        ingest_pricing_calendar(self.session, calendar({'Beach Hotel': [300.0]}, start=date(2025, 4, 2)))
+        self.assertEqual(update_rollups(self.session), {'day': 1, 'week': 1, 'month': 1})
+
+        april = load_rollups(self.session, 'month', start=date(2025, 4, 1))
+        self.assertEqual(april['max_price_per_night'].iloc[0], 300.0)
+        # A full rebuild agrees with the incremental result
+        incremental = load_rollups(self.session, 'week').drop(columns=['id', 'updated_at'])
+        update_rollups(self.session, full=True)
+        rebuilt = load_rollups(self.session, 'week').drop(columns=['id', 'updated_at'])
+        self.assertTrue(incremental.equals(rebuilt))
+
+    def test_names_are_interned_once(self):
+        """Test that prices reference company and model keys resolved through the cache"""
+        ingest_pricing_calendar(self.session, calendar({'Beach Hotel': [90.0]}, company='McRent'))
+        self.assertEqual(self.session.query(Company).count(), 2)
+        self.assertEqual(self.session.query(VehicleModel).count(), 4)
+
+        cache = dimension_cache(self.session)
+        roadsurfer = cache.companies['Roadsurfer']
+        beach_hotel = cache.models[(roadsurfer, 'Beach Hotel')]
+        self.assertEqual(
+            self.session.query(DailyPrice).filter_by(company_id=roadsurfer, model_id=beach_hotel).count(), 12
+        )
+        self.assertEqual(self.session.get(VehicleModel, beach_hotel).model_category, 'Van')
+
+        # A failed ingest forgets keys that were rolled back
+        with self.assertRaises(ValueError):
+            ingest_pricing_calendar(self.session, calendar({'Surf Van': ['n/a']}, company='Indie Campers'))
+        self.assertEqual(cache.companies, {})
+        self.assertEqual(self.session.query(Company).count(), 2)
+
+        update_rollups(self.session)
+        weeks = load_rollups(self.session, 'week', companies=['McRent'])
+        self.assertEqual(list(weeks['company_name']), ['McRent'])
+        self.assertNotIn('company_id', weeks.columns)
+
+
+def run_all_tests():
+    """Run all rollup tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestPriceRollups))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
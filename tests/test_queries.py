@@ -0,0 +1,92 @@
+"""
+Tests for the read-side query layer
+Tests that every named query is index-backed and that values are bound, not spliced
+"""
+
+import unittest
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.models import Base, CompetitorPrice
+from database.queries import QUERIES, PriceQueries, is_full_scan, since_days
+from data_validator import DataValidator
+from trend_analyzer import TrendAnalyzer
+
+# Placeholder values for every named parameter used in QUERIES
+PARAMS = {
+    'company': 'Roadsurfer', 'since': since_days(30),
+    'day_start': since_days(1), 'day_end': since_days(0), 'price': 95.0,
+    'limit': 30, 'min_price': 20, 'max_price': 500,
+}
+
+
+class TestPriceQueries(unittest.TestCase):
+    """Test query plans and parameter binding"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmp.name) / 'test.db')
+        engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        now = datetime.now()
+        for i in range(10):
+            for company, price in (('Roadsurfer', 95.0), ('McRent', 120.0)):
+                session.add(CompetitorPrice(
+                    company_name=company, base_nightly_rate=price + i,
+                    scrape_timestamp=now - timedelta(days=i)
+                ))
+        session.commit()
+        session.close()
+        engine.dispose()
+        self.queries = PriceQueries(self.db_path)
+
+    def tearDown(self):
+        self.queries.close()
+        self.tmp.cleanup()
+
+    def test_no_full_table_scans(self):
+        """Test that EXPLAIN QUERY PLAN shows an index for every query"""
+        for name in QUERIES:
+            plan = self.queries.explain(name, **PARAMS)
+            scans = [step for step in plan if is_full_scan(step)]
+            self.assertEqual(scans, [], f"{name} does a full table scan: {plan}")
+
+    def test_values_are_bound(self):
+        """Test that quotes in a company name neither break nor widen a query"""
+        analyzer = TrendAnalyzer(self.db_path)
+        hostile = "x' OR '1'='1"
+        self.assertEqual(analyzer.analyze_price_trends(company=hostile), {'error': 'No data available'})
+        self.assertEqual(len(analyzer.analyze_price_trends(company='Roadsurfer')['by_company']), 1)
+
+        validator = DataValidator(self.db_path)
+        self.assertFalse(validator.check_for_duplicates({'company_name': hostile, 'base_price': 95.0}))
+        self.assertTrue(validator.check_for_duplicates({'company_name': 'Roadsurfer', 'base_price': 95.0}))
+        self.assertEqual(validator.clean_old_data(days_to_keep=5), 8)
+
+
+def run_all_tests():
+    """Run all query layer tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestPriceQueries))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
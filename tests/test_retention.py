@@ -0,0 +1,203 @@
+"""
+Tests for tiered retention
+Tests that old raw rows are downsampled into daily and weekly summaries instead of deleted
+"""
+
+import unittest
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from database.models import (
+    Base, CompetitorPrice, CompetitorPriceDaily, CompetitorPriceWeekly, LatestCompetitorPrice
+)
+from database.retention import apply_retention, enable_incremental_vacuum, incremental_vacuum
+
+
+def summary_totals(session, model):
+    """(scrapes, prices, price_sum, min, max) per company across a tier"""
+    totals = {}
+    for row in session.query(model):
+        scrapes, prices, price_sum, low, high = totals.get(row.company_name, (0, 0, 0.0, None, None))
+        totals[row.company_name] = (
+            scrapes + row.num_scrapes, prices + row.num_prices, price_sum + row.price_sum,
+            row.min_price if low is None else min(low, row.min_price),
+            row.max_price if high is None else max(high, row.max_price),
+        )
+    return totals
+
+
+class TestTieredRetention(unittest.TestCase):
+    """Test raw -> daily -> weekly downsampling"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{Path(self.tmp.name) / 'test.db'}")
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+        # Three scrapes a day for 40 days; McRent stopped scraping 30 days ago
+        now = datetime.now()
+        with self.Session() as session:
+            for day in range(40):
+                for hour, price in ((2, 90.0), (10, 100.0), (18, None)):
+                    session.add(CompetitorPrice(
+                        company_name='Roadsurfer', base_nightly_rate=price and price + day,
+                        scrape_timestamp=now - timedelta(days=day, hours=hour)
+                    ))
+                    if day >= 30:
+                        session.add(CompetitorPrice(
+                            company_name='McRent', base_nightly_rate=price,
+                            scrape_timestamp=now - timedelta(days=day, hours=hour)
+                        ))
+            session.commit()
+            self.raw_totals = self._raw_totals(session)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def _raw_totals(self, session):
+        totals = {}
+        for row in session.query(CompetitorPrice):
+            scrapes, prices, price_sum, low, high = totals.get(row.company_name, (0, 0, 0.0, None, None))
+            rate = row.base_nightly_rate
+            totals[row.company_name] = (
+                scrapes + 1, prices + (rate is not None), price_sum + (rate or 0.0),
+                low if rate is None else (rate if low is None else min(low, rate)),
+                high if rate is None else (rate if high is None else max(high, rate)),
+            )
+        return totals
+
+    def _all_tiers(self, session):
+        """Per-company totals over raw rows plus both summary tiers"""
+        combined = {}
+        for totals in (self._raw_totals(session), summary_totals(session, CompetitorPriceDaily),
+                       summary_totals(session, CompetitorPriceWeekly)):
+            for company, (scrapes, prices, price_sum, low, high) in totals.items():
+                c_scrapes, c_prices, c_sum, c_low, c_high = combined.get(company, (0, 0, 0.0, None, None))
+                combined[company] = (
+                    c_scrapes + scrapes, c_prices + prices, c_sum + price_sum,
+                    low if c_low is None else min(c_low, low),
+                    high if c_high is None else max(c_high, high),
+                )
+        return combined
+
+    def assertTotalsEqual(self, actual, expected):
+        self.assertEqual(actual.keys(), expected.keys())
+        for company in expected:
+            self.assertEqual(actual[company][:2], expected[company][:2], company)
+            self.assertAlmostEqual(actual[company][2], expected[company][2], places=6)
+            self.assertEqual(actual[company][3:], expected[company][3:], company)
+
+    def test_dry_run_counts_without_moving(self):
+        """Test that a dry run only counts expired rows"""
+        result = apply_retention(self.engine, raw_days=10, daily_days=20, dry_run=True)
+
+        self.assertTrue(result['dry_run'])
+        with self.Session() as session:
+            self.assertEqual(self._raw_totals(session), self.raw_totals)
+            self.assertEqual(session.query(CompetitorPriceDaily).count(), 0)
+            expired = session.query(CompetitorPrice).filter(
+                CompetitorPrice.scrape_timestamp < result['raw_cutoff']
+            ).count()
+        # McRent's newest row is protected
+        self.assertEqual(result['raw_rows'], expired - 1)
+
+    def test_downsampling_is_exact_across_chunks(self):
+        """Test that counts, sums and extremes survive small chunks and repeated runs"""
+        first = apply_retention(self.engine, raw_days=10, daily_days=20, chunk_rows=7, pause=0)
+        self.assertGreater(first['chunks'], 10)
+        self.assertGreater(first['raw_rows'], 0)
+        self.assertGreater(first['daily_rows'], 0)
+
+        with self.Session() as session:
+            self.assertTotalsEqual(self._all_tiers(session), self.raw_totals)
+            self.assertEqual(session.query(CompetitorPrice).filter(
+                CompetitorPrice.scrape_timestamp < first['raw_cutoff'],
+                CompetitorPrice.company_name == 'Roadsurfer'
+            ).count(), 0)
+            self.assertEqual(session.query(CompetitorPriceDaily).filter(
+                CompetitorPriceDaily.period_start < first['daily_cutoff']
+            ).count(), 0)
+            for week in session.query(CompetitorPriceWeekly):
+                self.assertEqual(week.period_start.weekday(), 0)
+                self.assertAlmostEqual(week.avg_price, week.price_sum / week.num_prices, places=2)
+
+        # A second pass with shorter windows merges into the existing summaries
+        apply_retention(self.engine, raw_days=3, daily_days=5, chunk_rows=5, pause=0)
+        with self.Session() as session:
+            self.assertTotalsEqual(self._all_tiers(session), self.raw_totals)
+            days = [row.period_start for row in session.query(CompetitorPriceDaily)]
+            self.assertTrue(all(day >= date.today() - timedelta(days=5) for day in days))
+
+    def test_latest_price_per_company_is_kept(self):
+        """Test that a company that stopped scraping keeps its newest raw row"""
+        with self.Session() as session:
+            newest = session.query(LatestCompetitorPrice).filter_by(company_name='McRent').one().price_id
+
+        apply_retention(self.engine, raw_days=1, daily_days=400, pause=0)
+
+        with self.Session() as session:
+            remaining = session.query(CompetitorPrice).filter_by(company_name='McRent').all()
+            self.assertEqual([row.id for row in remaining], [newest])
+            self.assertEqual(
+                session.query(LatestCompetitorPrice).filter_by(company_name='McRent').one().price_id, newest
+            )
+
+
+class TestIncrementalVacuum(unittest.TestCase):
+    """Test that freed pages are returned without a full VACUUM"""
+
+    def test_incremental_vacuum_frees_pages(self):
+        """Test conversion and chunked page release"""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'test.db'}")
+            Base.metadata.create_all(engine)
+            self.assertEqual(incremental_vacuum(engine), 0)  # Not in incremental mode yet
+
+            self.assertTrue(enable_incremental_vacuum(engine))
+            self.assertFalse(enable_incremental_vacuum(engine))
+
+            with engine.begin() as connection:
+                connection.execute(text(
+                    "INSERT INTO competitor_prices (company_name, promotion_text, scrape_timestamp) "
+                    "VALUES (:company, :text, :ts)"
+                ), [{'company': f'Company {i}', 'text': 'x' * 2000, 'ts': datetime.now()} for i in range(500)])
+                connection.execute(text("DELETE FROM competitor_prices"))
+
+            with engine.connect() as connection:
+                free_before = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+            self.assertGreater(free_before, 100)
+
+            self.assertEqual(incremental_vacuum(engine, chunk_pages=50), free_before)
+            with engine.connect() as connection:
+                self.assertEqual(connection.exec_driver_sql("PRAGMA freelist_count").scalar(), 0)
+            engine.dispose()
+
+
+def run_all_tests():
+    """Run all retention tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestTieredRetention))
+    suite.addTests(loader.loadTestsFromTestCase(TestIncrementalVacuum))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,133 @@
+"""
+Tests for the shared retry policy, budget and deadline
+"""
+
+import asyncio
+import random
+import pytest
+from utils.retry_policy import (
+    RetryBudget,
+    RetryDeadlineExceeded,
+    RetryPolicy,
+    retry_async
+)
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Flaky:
+    """Coroutine that fails a set number of times before succeeding"""
+
+    def __init__(self, failures: int, exc: type = RuntimeError):
+        self.failures = failures
+        self.exc = exc
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc(f"failure {self.calls}")
+        return "ok"
+
+
+NO_WAIT = RetryPolicy(max_retries=3, base_delay=0.0, max_delay=0.0)
+
+
+class TestRetryPolicy:
+    """Test backoff calculation"""
+
+    def test_full_jitter_stays_under_cap(self):
+        """Test that jittered delays fall in [0, min(base * 2^n, max)]"""
+        policy = RetryPolicy(base_delay=2.0, max_delay=10.0)
+        rng = random.Random(7)
+
+        for attempt in range(6):
+            cap = min(2.0 * 2 ** attempt, 10.0)
+            delays = [policy.backoff(attempt, rng) for _ in range(200)]
+            assert all(0 <= d <= cap for d in delays)
+            # Jitter spreads retries instead of synchronising them
+            assert max(delays) - min(delays) > cap / 2
+
+    def test_without_jitter(self):
+        """Test deterministic capped exponential backoff"""
+        policy = RetryPolicy(base_delay=30, max_delay=45, jitter=False)
+        assert [policy.backoff(a) for a in range(3)] == [30, 45, 45]
+
+
+class TestRetryBudget:
+    """Test the per-run budget and deadline"""
+
+    def test_budget_is_shared_and_finite(self):
+        """Test that retries stop once the run budget is spent"""
+        budget = RetryBudget(max_retries=2)
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        assert budget.get_stats()['retries_denied'] == 1
+
+    def test_retry_that_cannot_finish_before_deadline_is_denied(self):
+        """Test that a backoff longer than the time left is refused"""
+        clock = FakeClock()
+        budget = RetryBudget(max_retries=None, deadline_seconds=10, clock=clock)
+
+        assert budget.try_acquire(delay=5)
+        clock.now += 8
+        assert not budget.try_acquire(delay=5)
+        clock.now += 5
+        assert budget.expired()
+
+
+class TestRetryAsync:
+    """Test retry_async"""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Test that transient failures are retried"""
+        flaky = Flaky(failures=2)
+        assert await retry_async(flaky, policy=NO_WAIT) == "ok"
+        assert flaky.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_budget_exhaustion_raises_last_error(self):
+        """Test that a spent budget stops retries across callers"""
+        budget = RetryBudget(max_retries=1)
+        first, second = Flaky(failures=1), Flaky(failures=1)
+
+        assert await retry_async(first, policy=NO_WAIT, budget=budget) == "ok"
+        with pytest.raises(RuntimeError):
+            await retry_async(second, policy=NO_WAIT, budget=budget)
+        assert second.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_give_up_on_and_result_predicate(self):
+        """Test non-retryable errors and retried results"""
+        fatal = Flaky(failures=5, exc=PermissionError)
+        with pytest.raises(PermissionError):
+            await retry_async(fatal, policy=NO_WAIT, give_up_on=(PermissionError,))
+        assert fatal.calls == 1
+
+        results = iter([False, False, True])
+
+        async def step():
+            return next(results)
+
+        assert await retry_async(step, policy=NO_WAIT, retry_if_result=lambda ok: not ok) is True
+
+    @pytest.mark.asyncio
+    async def test_deadline_cuts_off_slow_attempt(self):
+        """Test that an attempt still running at the deadline is abandoned"""
+        budget = RetryBudget(max_retries=5, deadline_seconds=0.05)
+
+        async def hang():
+            await asyncio.sleep(5)
+
+        with pytest.raises(RetryDeadlineExceeded):
+            await retry_async(hang, policy=NO_WAIT, budget=budget)
@@ -0,0 +1,135 @@
+"""
+Tests for the tier-aware scrape scheduler
+Tests slot spreading, missed-run catch-up, priorities and circuit-breaker deferral
+"""
+
+import unittest
+import sys
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrape_scheduler import JobSpec, ScrapeScheduler, SchedulerConfig, previous_slot
+
+COMPETITORS = [
+    {'name': 'Roadsurfer', 'tier': 1, 'priority_score': 10},
+    {'name': 'McRent', 'tier': 1, 'priority_score': 9},
+    {'name': 'Camperdays', 'tier': 1, 'priority_score': 8},
+    {'name': 'Campanda', 'tier': 2, 'priority_score': 7},
+]
+
+
+class FakeClock:
+    """Clock the test moves by hand"""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FakeRegistry:
+    """Circuit breaker registry reporting fixed statuses"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get_all_statuses(self):
+        return self.statuses
+
+
+class TestScrapeScheduler(unittest.TestCase):
+    """Test scheduling decisions"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = SchedulerConfig(
+            state_file=str(Path(self.tmp.name) / 'scheduler_state.json'),
+            min_gap_seconds=0
+        )
+        self.clock = FakeClock(datetime(2025, 6, 10, 12, 0))
+        self.ran = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_scheduler(self, registry=None) -> ScrapeScheduler:
+        async def runner(spec):
+            self.ran.append(spec.competitor)
+            return {'status': 'success'}
+
+        return ScrapeScheduler(
+            self.config, COMPETITORS, runners={'deep_scrape': runner},
+            registry=registry, clock=self.clock
+        )
+
+    def test_daily_jobs_spread_across_the_day(self):
+        """Test that tier-1 slots differ per competitor and repeat daily"""
+        now = self.clock()
+        slots = [previous_slot(JobSpec(c['name'], 'deep_scrape', 1, 0), now) for c in COMPETITORS[:3]]
+
+        self.assertEqual(len({slot.time() for slot in slots}), 3)
+        for slot in slots:
+            self.assertTrue(now - timedelta(days=1) < slot <= now)
+
+    def test_missed_runs_caught_up_once_by_priority(self):
+        """Test that missed jobs run once, highest priority first, then follow their slots"""
+        scheduler = self.make_scheduler()
+
+        ran = asyncio.run(scheduler.run_pending())
+
+        self.assertEqual(ran, 4)
+        self.assertEqual(self.ran, ['Roadsurfer', 'McRent', 'Camperdays', 'Campanda'])
+        # Nothing is due again until the next slots
+        self.assertTrue(all(job.due > self.clock() for job in scheduler.queue))
+        self.assertTrue(all(not job.catch_up for job in scheduler.queue))
+
+        # A restart with that state has nothing to catch up
+        restarted = self.make_scheduler()
+        self.assertTrue(all(not job.catch_up for job in restarted.queue))
+
+        # Tier 1 comes back within a day, tier 2 within a week
+        self.clock.now += timedelta(days=1, hours=12)
+        self.ran.clear()
+        asyncio.run(scheduler.run_pending())
+        self.assertEqual(sorted(self.ran), ['Camperdays', 'McRent', 'Roadsurfer'])
+
+    def test_open_circuit_defers_job(self):
+        """Test that a competitor with an open circuit is pushed to its recovery time"""
+        opened = self.clock() - timedelta(minutes=30)
+        registry = FakeRegistry({'McRent': {
+            'state': 'open',
+            'current_state': {'last_state_change': opened.isoformat()},
+            'config': {'timeout_seconds': 3600},
+        }})
+        scheduler = self.make_scheduler(registry)
+
+        asyncio.run(scheduler.run_pending())
+
+        self.assertNotIn('McRent', self.ran)
+        deferred = next(job for job in scheduler.queue if job.spec.competitor == 'McRent')
+        self.assertEqual(deferred.due, opened + timedelta(hours=1))
+
+
+def run_all_tests():
+    """Run all scheduler tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestScrapeScheduler))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,72 @@
+"""
+Tests for the lazy scraper registry
+Tests name lookups, the tier1_scrapers re-exports and what a lookup imports
+"""
+
+import unittest
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.registry import create_scraper, get_scraper_class, registered_competitors
+
+
+class TestScraperRegistry(unittest.TestCase):
+    """Test competitor lookups"""
+
+    def test_every_competitor_resolves(self):
+        """Test that each registered competitor maps to its own scraper module"""
+        for name in registered_competitors():
+            scraper_class = get_scraper_class(name)
+            self.assertTrue(scraper_class.__module__.startswith('scrapers.competitors.'))
+
+        self.assertIsNone(get_scraper_class('Unknown Rentals'))
+        self.assertIsNone(create_scraper('Unknown Rentals'))
+
+    def test_legacy_imports_still_work(self):
+        """Test that tier1_scrapers and the package keep exporting the classes"""
+        from scrapers import DeepDataScraper, McRentScraper as FromPackage
+        from scrapers.tier1_scrapers import GoboonyScrap, McRentScraper, scrape_tier_1_competitors
+
+        self.assertIs(FromPackage, McRentScraper)
+        self.assertIs(McRentScraper, get_scraper_class('McRent'))
+        self.assertTrue(issubclass(GoboonyScrap, DeepDataScraper))
+        self.assertTrue(callable(scrape_tier_1_competitors))
+
+        # `from scrapers.tier1_scrapers import NoSuchScraper` fails through the same lookup
+        from scrapers import tier1_scrapers
+        with self.assertRaises(AttributeError):
+            getattr(tier1_scrapers, 'NoSuchScraper')
+
+    def test_lookup_imports_only_one_competitor(self):
+        """Test that a lookup in a fresh interpreter skips Playwright and other scrapers"""
+        code = (
+            "import sys; from scrapers.registry import get_scraper_class; get_scraper_class('McRent'); "
+            "print(sorted(m for m in sys.modules if m.startswith(('playwright', 'scrapers.competitors.'))))"
+        )
+        proc = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR, capture_output=True, text=True)
+
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), "['scrapers.competitors.mcrent']")
+
+
+def run_all_tests():
+    """Run all registry tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestScraperRegistry))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
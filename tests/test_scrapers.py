@@ -5,6 +5,7 @@ Tests scraper components, data extraction, and error handling
 
 import unittest
 import sys
+import tempfile
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -14,8 +15,12 @@ from unittest.mock import Mock, MagicMock, patch, AsyncMock
 BASE_DIR = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(BASE_DIR))
 
-from scrapers.base_scraper import DeepDataScraper
+from scrapers.base_scraper import DeepDataScraper, SubPageJob
+from scrapers.api_interception import ApiInterceptor, InterceptionConfig
+from scrapers.browser_profiles import get_browser_profile
+from utils.retry_policy import RetryBudget, RetryPolicy
 from scrapers.competitor_config import get_competitor_by_name
+from scrapers.competitors.roadsurfer import RoadsurferScraper
 
 # Windows async compatibility
 if sys.platform == 'win32':
@@ -219,6 +224,7 @@ class TestReviewExtraction(unittest.TestCase):
     def setUp(self):
         """Create scraper instance"""
         self.scraper = TestScraperImplementation()
+        self.scraper.review_cache_dir = None
     
     @patch('scrapers.base_scraper.Page')
     def test_extract_reviews_with_rating(self, mock_page):
@@ -252,6 +258,68 @@ class TestReviewExtraction(unittest.TestCase):
         self.assertIsNone(reviews['count'])
 
 
+class TestReviewSourceRace(unittest.TestCase):
+    """Test concurrent review sources and the review cache"""
+
+    def setUp(self):
+        """Create scraper with a temporary review cache"""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.scraper = TestScraperImplementation()
+        self.scraper.review_cache_dir = Path(self.cache_dir.name)
+        self.page = MagicMock()
+        self.page.url = 'https://example.com'
+        self.cancelled = []
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def _source(self, name, result, delay):
+        async def check(page):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(name)
+                raise
+            return result
+        return check
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        reviews = loop.run_until_complete(self.scraper.extract_customer_reviews(self.page))
+        loop.close()
+        return reviews
+
+    def test_first_valid_result_wins_and_rest_cancelled(self):
+        """Test that an invalid fast result is skipped and slow sources are cancelled"""
+        empty = {'avg': None, 'count': None, 'source': None}
+        self.scraper._check_page_for_reviews = self._source('page', {'avg': 9.1, 'count': None, 'source': 'text_pattern'}, 0)
+        self.scraper._check_footer_for_reviews = self._source('footer', {'avg': 4.4, 'count': 812, 'source': 'footer_trustpilot'}, 0.01)
+        self.scraper._check_google_reviews = self._source('google', empty, 5)
+
+        reviews = self._run()
+
+        self.assertEqual(reviews['avg'], 4.4)
+        self.assertEqual(reviews['source'], 'footer_trustpilot')
+        self.assertEqual(self.cancelled, ['google'])
+
+    def test_cached_reviews_skip_sources(self):
+        """Test that a fresh cache entry is returned without checking the page"""
+        self.scraper._cache_reviews({'avg': 4.7, 'count': 1500, 'source': 'trustpilot_direct'})
+        self.scraper._check_page_for_reviews = AsyncMock()
+
+        reviews = self._run()
+
+        self.assertEqual(reviews['avg'], 4.7)
+        self.scraper._check_page_for_reviews.assert_not_called()
+
+    def test_expired_cache_is_ignored(self):
+        """Test that cache entries older than the TTL are not used"""
+        self.scraper._cache_reviews({'avg': 4.7, 'count': 1500, 'source': 'trustpilot_direct'})
+        self.scraper.review_cache_ttl_days = 0
+
+        self.assertIsNone(self.scraper._get_cached_reviews())
+
 class TestCompletenessCalculation(unittest.TestCase):
     """Test data completeness calculation"""
     
@@ -397,6 +465,318 @@ class TestErrorHandling(unittest.TestCase):
         self.assertLessEqual(completeness, 100)
 
 
+class SubPageTestScraper(TestScraperImplementation):
+    """Scraper with sub-page extractors that finish in a chosen order"""
+
+    async def _scrape_fast_page(self, page):
+        await asyncio.sleep(0)
+        self.data['base_nightly_rate'] = 95.0
+        self.data['is_estimated'] = True
+        self.data['locations_available'] = ['Lisbon', 'Porto']
+        self.data['fuel_policy'] = 'Full to Full'
+
+    async def _scrape_slow_page(self, page):
+        await asyncio.sleep(0.05)
+        self.data['base_nightly_rate'] = 110.0
+        self.data['is_estimated'] = False
+        self.data['extraction_method'] = 'text_extraction'
+        self.data['locations_available'] = ['Porto', 'Faro']
+        self.data['fuel_policy'] = 'Same to Same'
+        self.data['referral_program'] = True
+
+    async def _scrape_broken_page(self, page):
+        raise RuntimeError("selector exploded")
+
+
+class TestSubPageScraping(unittest.TestCase):
+    """Test parallel sub-page scraping and result merging"""
+
+    def setUp(self):
+        """Create scraper with mocked navigation and browser context"""
+        self.scraper = SubPageTestScraper()
+        self.scraper.navigate_smart = AsyncMock(return_value=True)
+
+        self.context = MagicMock()
+        self.context.new_page = AsyncMock(side_effect=lambda: self._make_tab())
+        self.page = MagicMock()
+        self.page.context = self.context
+
+    def _make_tab(self):
+        tab = MagicMock()
+        tab.is_closed = Mock(return_value=False)
+        tab.close = AsyncMock()
+        return tab
+
+    def _run(self, jobs):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        reports = loop.run_until_complete(self.scraper.scrape_subpages_parallel(self.page, jobs))
+        loop.close()
+        return reports
+
+    def test_merge_follows_job_order_not_completion_order(self):
+        """Test that the slow first job wins 'first' fields"""
+        self._run([
+            SubPageJob('slow', 'https://example.com/a', '_scrape_slow_page'),
+            SubPageJob('fast', 'https://example.com/b', '_scrape_fast_page'),
+        ])
+
+        self.assertEqual(self.scraper.data['fuel_policy'], 'Same to Same')
+        self.assertEqual(self.scraper.data['locations_available'], ['Porto', 'Faro', 'Lisbon'])
+        self.assertTrue(self.scraper.data['referral_program'])
+
+    def test_price_conflict_prefers_confirmed_price(self):
+        """Test that a non-estimated price beats a lower estimated one"""
+        self._run([
+            SubPageJob('fast', 'https://example.com/b', '_scrape_fast_page'),
+            SubPageJob('slow', 'https://example.com/a', '_scrape_slow_page'),
+        ])
+
+        self.assertEqual(self.scraper.data['base_nightly_rate'], 110.0)
+        self.assertFalse(self.scraper.data['is_estimated'])
+        self.assertEqual(self.scraper.data['extraction_method'], 'text_extraction')
+
+    def test_failed_job_does_not_break_others(self):
+        """Test that one failing tab is reported empty and closed"""
+        reports = self._run([
+            SubPageJob('broken', 'https://example.com/x', '_scrape_broken_page'),
+            SubPageJob('fast', 'https://example.com/b', '_scrape_fast_page'),
+        ])
+
+        self.assertEqual(reports['broken'], {})
+        self.assertEqual(self.scraper.data['locations_available'], ['Lisbon', 'Porto'])
+        self.assertEqual(self.context.new_page.await_count, 2)
+
+    def test_faq_url_resolved_before_opening_tab(self):
+        """Test that the FAQ tab is given the FAQ URL rather than the homepage"""
+        scraper = RoadsurferScraper(use_browserless=False)
+        link = MagicMock()
+        link.get_attribute = AsyncMock(return_value='/en/faq')
+        self.page.query_selector = AsyncMock(side_effect=lambda selector: link if 'faq' in selector else None)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        url = loop.run_until_complete(scraper._find_faq_url(self.page))
+        loop.close()
+
+        self.assertEqual(url, 'https://roadsurfer.com/en/faq')
+
+
+class TestApiInterception(unittest.TestCase):
+    """Test the bounded API response pipeline"""
+
+    PRICE_URL = 'https://example.com/api/pricing/quote'
+
+    def _request(self, url):
+        request = MagicMock()
+        request.url = url
+        request.method = 'GET'
+        return request
+
+    def _response(self, url, body, content_type='application/json', status=200, length=None):
+        response = MagicMock()
+        response.url = url
+        response.status = status
+        response.headers = {
+            'content-type': content_type,
+            'content-length': str(len(body) if length is None else length),
+        }
+        response.body = AsyncMock(return_value=body)
+        return response
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        result = loop.run_until_complete(coro)
+        loop.close()
+        return result
+
+    def test_filters_before_reading_body(self):
+        """Test that untracked, non-JSON and oversized responses are never read"""
+        scraper = TestScraperImplementation()
+        interceptor = scraper.interceptor
+        interceptor._on_request(self._request(self.PRICE_URL))
+
+        untracked = self._response('https://example.com/assets/app.js', b'{}')
+        html = self._response(self.PRICE_URL, b'<html></html>', content_type='text/html')
+        huge = self._response(self.PRICE_URL, b'{}', length=interceptor.config.max_body_bytes + 1)
+        good = self._response(self.PRICE_URL, b'{"pricePerNight": 89}')
+
+        async def feed():
+            for response in (untracked, html, huge, good):
+                interceptor._on_response(response)
+            await interceptor.close()
+
+        self._run(feed())
+
+        for skipped in (untracked, html, huge):
+            skipped.body.assert_not_awaited()
+        self.assertEqual(scraper.data['base_nightly_rate'], 89.0)
+        self.assertEqual(scraper.data['extraction_method'], 'api_interception')
+        self.assertEqual(len(scraper.pricing_endpoints), 1)
+        self.assertEqual(interceptor.stats['skipped_content_type'], 1)
+        self.assertEqual(interceptor.stats['skipped_size'], 1)
+
+    def test_queue_and_samples_are_bounded(self):
+        """Test that a burst overflows the queue and samples stay under the byte cap"""
+        body = b'{"price": 120, "padding": "' + b'x' * 100 + b'"}'
+        interceptor = ApiInterceptor(
+            extractor=lambda data: [data['price']],
+            config=InterceptionConfig(queue_size=3, workers=1, sample_bytes=len(body) * 2)
+        )
+        interceptor.accept_keywords(['api'])
+
+        async def burst():
+            for i in range(10):
+                interceptor._on_response(self._response(f"{self.PRICE_URL}?page={i}", body))
+            await interceptor.close()
+
+        self._run(burst())
+
+        self.assertEqual(interceptor.stats['queued'], 3)
+        self.assertEqual(interceptor.stats['dropped_queue_full'], 7)
+        self.assertEqual(interceptor.candidate_prices(), [120, 120, 120])
+        self.assertEqual(len(interceptor.samples), 2)
+
+    def test_loose_matches_never_set_confirmed_price(self):
+        """Test that a payload with no strict price leaves base_nightly_rate unset"""
+        scraper = RoadsurferScraper(use_browserless=False)
+        interceptor = scraper.interceptor
+        interceptor.accept_keywords(scraper.BOOKING_API_KEYWORDS)
+
+        async def feed():
+            for body in (b'{"totalStations": 45}', b'{"data": {"grandTotal": 120}}'):
+                interceptor._on_response(self._response(self.PRICE_URL, body))
+            await interceptor.close()
+
+        self._run(feed())
+
+        self.assertFalse(scraper.data.get('base_nightly_rate'))
+        self.assertNotEqual(scraper.data.get('extraction_method'), 'api_interception')
+        self.assertEqual(interceptor.candidate_prices(), [])
+        # The booking simulation still sees them for its median
+        self.assertEqual(interceptor.candidate_prices(include_loose=True), [45.0, 120.0])
+
+    def test_candidate_prices_filtered_by_keyword_and_time(self):
+        """Test that candidate prices can be limited to matching URLs captured since a time"""
+        interceptor = ApiInterceptor(extractor=lambda data: [data['price']])
+        interceptor.accept_keywords(['api'])
+
+        async def feed():
+            for path, price in (('tracking', 10), ('quote', 95), ('config', 20)):
+                if path == 'quote':
+                    marks.append(datetime.now())
+                url = f'https://example.com/api/{path}'
+                interceptor._on_response(self._response(url, f'{{"price": {price}}}'.encode()))
+                await interceptor.drain()
+            await interceptor.close()
+
+        marks = []
+        self._run(feed())
+        started_at = marks[0]
+
+        self.assertEqual(interceptor.candidate_prices(), [10, 95, 20])
+        self.assertEqual(interceptor.candidate_prices(['quote']), [95])
+        self.assertEqual(interceptor.candidate_prices(since=started_at), [95, 20])
+        self.assertEqual(interceptor.candidate_prices(['QUOTE', 'tracking'], since=started_at), [95])
+
+
+class TestStepRetry(unittest.TestCase):
+    """Test that failed sub-steps are retried on their own"""
+
+    def setUp(self):
+        self.scraper = TestScraperImplementation()
+        self.scraper.step_retry_policy = RetryPolicy(max_retries=1, base_delay=0, max_delay=0)
+        self.scraper._simulate_booking_universal_once = AsyncMock(side_effect=[False, True])
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        result = loop.run_until_complete(coro)
+        loop.close()
+        return result
+
+    def test_failed_booking_simulation_is_retried(self):
+        """Test that only the booking step runs again"""
+        success = self._run(self.scraper._simulate_booking_universal(MagicMock(), "Berlin"))
+
+        self.assertTrue(success)
+        self.assertEqual(self.scraper._simulate_booking_universal_once.await_count, 2)
+        self.assertEqual(self.scraper.step_retries, 1)
+
+    def test_spent_run_budget_skips_retry(self):
+        """Test that the shared run budget stops step retries"""
+        self.scraper.retry_budget = RetryBudget(max_retries=0)
+
+        success = self._run(self.scraper._simulate_booking_universal(MagicMock(), "Berlin"))
+
+        self.assertFalse(success)
+        self.assertEqual(self.scraper._simulate_booking_universal_once.await_count, 1)
+
+
+class TestBrowserProfiles(unittest.TestCase):
+    """Test the lean/full launch profiles and their use in scrape()"""
+
+    def test_lean_and_full_profiles(self):
+        """Test that lean trims Chromium and full keeps the screenshot settings"""
+        lean, full = get_browser_profile('lean'), get_browser_profile('full')
+        args = lean.launch_options()['args']
+
+        for flag in ('--no-sandbox', '--disable-gpu', '--disable-extensions',
+                     '--disable-background-networking', '--disable-component-update'):
+            self.assertIn(flag, args)
+        self.assertTrue(any(a.startswith('--renderer-process-limit=') for a in args))
+        self.assertLess(lean.viewport['width'], full.viewport['width'])
+        self.assertLess(lean.default_timeout_ms, full.default_timeout_ms)
+
+        self.assertEqual(full.context_options()['viewport'], {'width': 1920, 'height': 1080})
+        self.assertEqual(full.launch_options()['args'], ['--no-sandbox', '--disable-setuid-sandbox'])
+        with self.assertRaises(ValueError):
+            get_browser_profile('tiny')
+
+    def test_scrape_opens_context_with_scraper_profile(self):
+        """Test that scrape() applies the scraper's profile to its browser context"""
+        scraper = TestScraperImplementation()
+        scraper.browser_profile = get_browser_profile('full')
+        scraper.retry_step = AsyncMock(return_value=False)
+
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=MagicMock(close=AsyncMock()))
+        context.close = AsyncMock()
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        browser.new_context = AsyncMock(return_value=context)
+        scraper.shared_browser = browser
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(scraper.scrape())
+        loop.close()
+
+        browser.new_context.assert_awaited_once_with(
+            viewport={'width': 1920, 'height': 1080}, user_agent=scraper.browser_profile.user_agent
+        )
+        context.set_default_timeout.assert_called_once_with(90000)
+        context.set_default_navigation_timeout.assert_called_once_with(90000)
+        browser.close.assert_not_called()
+
+    @patch('scrapers.base_scraper.launch_browser', new_callable=AsyncMock)
+    @patch('scrapers.base_scraper.async_playwright')
+    def test_get_browser_uses_patched_playwright(self, async_playwright, launch):
+        """Test that get_browser() launches through base_scraper.async_playwright"""
+        playwright = MagicMock()
+        async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        scraper = TestScraperImplementation()
+        scraper.use_browserless = False
+
+        loop = asyncio.new_event_loop()
+        browser = loop.run_until_complete(scraper.get_browser())
+        loop.close()
+
+        async_playwright.assert_called_once_with()
+        launch.assert_awaited_once_with(playwright, scraper.browser_profile)
+        self.assertIs(browser, launch.return_value)
+
+
 def run_all_tests():
     """Run all scraper tests"""
     # Create test suite
@@ -409,10 +789,15 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPromotionDetection))
     suite.addTests(loader.loadTestsFromTestCase(TestPaymentDetection))
     suite.addTests(loader.loadTestsFromTestCase(TestReviewExtraction))
+    suite.addTests(loader.loadTestsFromTestCase(TestReviewSourceRace))
     suite.addTests(loader.loadTestsFromTestCase(TestCompletenessCalculation))
     suite.addTests(loader.loadTestsFromTestCase(TestCompetitorConfig))
     suite.addTests(loader.loadTestsFromTestCase(TestNavigationStrategies))
     suite.addTests(loader.loadTestsFromTestCase(TestErrorHandling))
+    suite.addTests(loader.loadTestsFromTestCase(TestSubPageScraping))
+    suite.addTests(loader.loadTestsFromTestCase(TestApiInterception))
+    suite.addTests(loader.loadTestsFromTestCase(TestStepRetry))
+    suite.addTests(loader.loadTestsFromTestCase(TestBrowserProfiles))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
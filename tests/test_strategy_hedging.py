@@ -0,0 +1,131 @@
+"""
+Tests for hedged strategy execution
+Tests strategy ranking, persisted stats and hedging of slow strategies
+"""
+
+import unittest
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(BASE_DIR))
+
+from scrapers.strategy_hedging import HedgedStrategyExecutor, HedgingConfig, StrategyStats
+
+# Windows async compatibility
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+class FakeStrategies:
+    """Strategy runner with scripted delays and outcomes"""
+
+    def __init__(self, behaviour):
+        self.behaviour = behaviour          # strategy -> (delay, success)
+        self.started = []
+        self.cancelled = []
+
+    async def __call__(self, company, strategy):
+        self.started.append(strategy)
+        delay, success = self.behaviour[strategy]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(strategy)
+            raise
+        return {'success': success, 'company_name': company}
+
+
+def fast_config(**overrides) -> HedgingConfig:
+    settings = dict(default_hedge_delay=0.05, min_hedge_delay=0.0, max_hedge_delay=1.0)
+    settings.update(overrides)
+    return HedgingConfig(**settings)
+
+
+class TestStrategyStats(unittest.TestCase):
+    """Test ranking and persistence"""
+
+    def test_rank_prefers_history_and_persists(self):
+        """Test that the strategy that worked last run is tried first next run"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'strategy_stats.json'
+            stats = StrategyStats(str(path))
+            for _ in range(3):
+                stats.record('McRent', 'playwright_stealth', False, 30.0)
+                stats.record('McRent', 'botasaurus_stealth', True, 12.0)
+            stats.save()
+
+            reloaded = StrategyStats(str(path))
+
+        strategies = ['playwright_stealth', 'botasaurus_stealth', 'mobile_user_agent']
+        self.assertEqual(reloaded.rank('McRent', strategies),
+                         ['botasaurus_stealth', 'mobile_user_agent', 'playwright_stealth'])
+        self.assertEqual(reloaded.median_latency('McRent', 'botasaurus_stealth'), 12.0)
+        # Unknown companies keep the configured order
+        self.assertEqual(reloaded.rank('Yescapa', strategies), strategies)
+
+    def test_hedge_delay_uses_latency_percentile(self):
+        """Test that the hedge delay follows past latency once there is enough of it"""
+        stats = StrategyStats()
+        executor = HedgedStrategyExecutor(stats, None, HedgingConfig(min_hedge_delay=0, default_hedge_delay=60))
+
+        stats.record('McRent', 'a', True, 1.0)
+        self.assertEqual(executor.hedge_delay('McRent', 'a'), 60)
+
+        for latency in [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]:
+            stats.record('McRent', 'a', True, latency)
+        self.assertEqual(executor.hedge_delay('McRent', 'a'), 9.0)
+
+
+class TestHedgedExecution(unittest.TestCase):
+    """Test hedging and loser cancellation"""
+
+    def test_slow_strategy_is_hedged_and_loser_cancelled(self):
+        """Test that a hedge starts after the delay and the first success wins"""
+        stats = StrategyStats()
+        runner = FakeStrategies({'slow': (5.0, True), 'fast': (0.01, True)})
+        executor = HedgedStrategyExecutor(stats, runner, fast_config())
+
+        result = asyncio.run(executor.execute('McRent', ['slow', 'fast']))
+
+        self.assertEqual(result['strategy_used'], 'fast')
+        self.assertEqual(runner.started, ['slow', 'fast'])
+        self.assertEqual(runner.cancelled, ['slow'])
+        # Cancelled losers are not counted as failures
+        self.assertEqual(stats.summary('McRent')['fast']['attempts'], 1)
+        self.assertNotIn('slow', stats.summary('McRent'))
+
+    def test_failure_falls_through_without_hedging(self):
+        """Test that a quick failure starts the next strategy and is recorded"""
+        stats = StrategyStats()
+        runner = FakeStrategies({'broken': (0.0, False), 'works': (0.0, True)})
+        executor = HedgedStrategyExecutor(stats, runner, fast_config(default_hedge_delay=10))
+
+        result = asyncio.run(executor.execute('McRent', ['broken', 'works']))
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['strategy_used'], 'works')
+        self.assertEqual(runner.cancelled, [])
+        self.assertLess(stats.success_rate('McRent', 'broken'), stats.success_rate('McRent', 'works'))
+
+
+def run_all_tests():
+    """Run all strategy hedging tests"""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    suite.addTests(loader.loadTestsFromTestCase(TestStrategyStats))
+    suite.addTests(loader.loadTestsFromTestCase(TestHedgedExecution))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,100 @@
+"""
+Tests for the leased work queue
+"""
+
+import asyncio
+import time
+import pytest
+from utils.work_queue import QueueWorker, SQLiteWorkQueue
+
+
+class FakeClock:
+    """Wall clock the test moves by hand"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "work_queue.db")
+
+
+class TestSQLiteWorkQueue:
+    """Test leasing, reporting and lease expiry"""
+
+    def test_priority_order_and_dedupe(self, db_path):
+        """Test that pending duplicates are ignored and higher priority leases first"""
+        queue = SQLiteWorkQueue(db_path)
+        low = queue.enqueue('competitor', {'company_name': 'Goboony'}, priority=1, dedupe_key='c:Goboony')
+        high = queue.enqueue('competitor', {'company_name': 'Roadsurfer'}, priority=9, dedupe_key='c:Roadsurfer')
+        assert queue.enqueue('competitor', {'company_name': 'Goboony'}, dedupe_key='c:Goboony') is None
+
+        item = queue.lease('w1')
+        assert (item.id, item.payload['company_name'], item.attempts) == (high, 'Roadsurfer', 1)
+        assert queue.complete(item.id, 'w1', {'base_nightly_rate': 99.0})
+        assert queue.lease('w1').id == low
+        assert queue.lease('w1') is None
+
+        # Once finished, the same key can be queued again
+        assert queue.enqueue('competitor', {'company_name': 'Roadsurfer'}, dedupe_key='c:Roadsurfer')
+        assert queue.results()[0]['result'] == {'base_nightly_rate': 99.0}
+
+    def test_expired_lease_requeued_and_stale_worker_fenced(self, db_path):
+        """Test that a crashed worker's job is re-leased and its late result rejected"""
+        clock = FakeClock()
+        queue = SQLiteWorkQueue(db_path, clock=clock)
+        queue.enqueue('competitor', {'company_name': 'McRent'}, max_attempts=2)
+
+        first = queue.lease('crashed', visibility_timeout=60)
+        clock.now += 30
+        assert queue.heartbeat(first.id, 'crashed', visibility_timeout=60)
+        clock.now += 61
+        second = queue.lease('healthy', visibility_timeout=60)
+
+        assert second.id == first.id and second.attempts == 2
+        assert not queue.complete(first.id, 'crashed', {'stale': True})
+        assert queue.fail(second.id, 'healthy', 'blocked')
+        # Out of attempts: parked instead of retried forever
+        assert queue.stats()['dead'] == 1
+        assert queue.lease('healthy') is None
+
+
+class TestQueueWorkers:
+    """Test workers sharing one queue"""
+
+    @staticmethod
+    async def drain(db_path: str, workers: int) -> float:
+        async def scrape(payload):
+            await asyncio.sleep(0.05)
+            return {'company_name': payload['company_name']}
+
+        # A queue instance (connection) per worker, as separate processes would have
+        queues = [SQLiteWorkQueue(db_path) for _ in range(workers)]
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            QueueWorker(q, {'competitor': scrape}, worker_id=f"w{i}").run(stop_when_empty=True)
+            for i, q in enumerate(queues)
+        ))
+        return time.perf_counter() - start
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_workers(self, tmp_path):
+        """Test that four workers drain the queue much faster than one, each job once"""
+        timings = {}
+        for workers in (1, 4):
+            db_path = str(tmp_path / f"queue_{workers}.db")
+            queue = SQLiteWorkQueue(db_path)
+            queue.enqueue_many(
+                {'kind': 'competitor', 'payload': {'company_name': f"Company {n}"}} for n in range(24)
+            )
+
+            timings[workers] = await self.drain(db_path, workers)
+
+            assert queue.stats()['done'] == 24
+            assert len({r['payload']['company_name'] for r in queue.results()}) == 24
+
+        assert timings[1] / timings[4] > 2.5
@@ -5,7 +5,6 @@ Detect pricing patterns, seasonality, and predict future trends
 
 import pandas as pd
 import numpy as np
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
@@ -16,38 +15,27 @@ BASE_DIR = Path(__file__).parent.resolve()
 
 try:
     from core_config import config as sys_config
-    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_PATH)
+    DEFAULT_DB_PATH = str(sys_config.database.DATABASE_URL)
 except ImportError:
     DEFAULT_DB_PATH = str(BASE_DIR / "database" / "campervan_intelligence.db")
 
+from database.queries import PriceQueries, since_days
+
 
 class TrendAnalyzer:
     """Analyze historical pricing trends and patterns"""
     
     def __init__(self, db_path: str | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
+        self.queries = PriceQueries(self.db_path)
     
     def analyze_price_trends(self, company: str = None, days: int = 30) -> Dict[str, Any]:
         """Comprehensive trend analysis"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            # Build query
-            where_clause = f"WHERE scrape_date >= date('now', '-{days} days')"
             if company:
-                where_clause += f" AND company_name = '{company}'"
-            
-            df = pd.read_sql(f"""
-                SELECT 
-                    company_name,
-                    base_price,
-                    scrape_date,
-                    vehicle_type
-                FROM prices
-                {where_clause}
-                ORDER BY scrape_date
-            """, conn)
-            conn.close()
+                df = self.queries.frame('company_price_history', company=company, since=since_days(days))
+            else:
+                df = self.queries.frame('price_history', since=since_days(days))
             
             if df.empty:
                 return {'error': 'No data available'}
@@ -189,25 +177,57 @@ class TrendAnalyzer:
                 patterns.append('oscillating_prices')
         
         return patterns if patterns else ['stable_pricing']
-    
-    def detect_seasonal_patterns(self, company: str = None) -> Dict[str, Any]:
+
+    def analyze_long_term_trends(self, company: str = None, days: int = 730) -> Dict[str, Any]:
+        """Multi-year trend analysis from the Parquet history store"""
+        try:
+            from database.history_store import HistoryStore
+
+            # Reads three columns from the matching company/month partitions only
+            store = HistoryStore()
+            df = store.query(
+                'competitor_prices',
+                columns=['company_name', 'scrape_timestamp', 'base_nightly_rate'],
+                companies=[company] if company else None,
+                start=datetime.now() - timedelta(days=days)
+            )
+            df = df.dropna(subset=['base_nightly_rate']).rename(
+                columns={'scrape_timestamp': 'scrape_date', 'base_nightly_rate': 'base_price'}
+            )
+
+            if df.empty:
+                return {'error': 'No data available'}
+
+            analysis = {
+                'overall_trend': self._calculate_trend(df),
+                'price_velocity': self._calculate_velocity(df),
+                'volatility': self._calculate_volatility(df),
+                'by_company': {},
+                'files_read': store.last_scan['files'],
+                'bytes_read': store.last_scan['bytes']
+            }
+
+            for comp, comp_df in df.groupby('company_name'):
+                analysis['by_company'][comp] = {
+                    'avg_price': float(comp_df['base_price'].mean()),
+                    'trend': self._calculate_trend(comp_df),
+                    'price_change': self._calculate_price_change(comp_df),
+                    'stability_score': self._calculate_stability(comp_df)
+                }
+
+            return analysis
+
+        except Exception as e:
+            logger.error(f"❌ Long-term trend analysis failed: {e}")
+            return {'error': str(e)}
+
+    def detect_seasonal_patterns(self, company: str = None, days: int = 365) -> Dict[str, Any]:
         """Detect day-of-week and monthly patterns"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            where_clause = ""
             if company:
-                where_clause = f"WHERE company_name = '{company}'"
-            
-            df = pd.read_sql(f"""
-                SELECT 
-                    company_name,
-                    base_price,
-                    scrape_date
-                FROM prices
-                {where_clause}
-            """, conn)
-            conn.close()
+                df = self.queries.frame('company_price_history', company=company, since=since_days(days))
+            else:
+                df = self.queries.frame('price_history', since=since_days(days))
             
             if df.empty:
                 return {'error': 'No data available'}
@@ -234,18 +254,7 @@ class TrendAnalyzer:
     def predict_future_prices(self, company: str, days_ahead: int = 7) -> Dict[str, Any]:
         """Simple price prediction using moving average"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            df = pd.read_sql(f"""
-                SELECT 
-                    base_price,
-                    scrape_date
-                FROM prices
-                WHERE company_name = '{company}'
-                ORDER BY scrape_date DESC
-                LIMIT 30
-            """, conn)
-            conn.close()
+            df = self.queries.frame('recent_company_prices', company=company, limit=30)
             
             if len(df) < 7:
                 return {'error': 'Insufficient data for prediction'}
@@ -289,21 +298,7 @@ class TrendAnalyzer:
     def compare_competitors(self, days: int = 30) -> Dict[str, Any]:
         """Compare all competitors"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            df = pd.read_sql(f"""
-                SELECT 
-                    company_name,
-                    AVG(base_price) as avg_price,
-                    MIN(base_price) as min_price,
-                    MAX(base_price) as max_price,
-                    COUNT(*) as data_points
-                FROM prices
-                WHERE scrape_date >= date('now', '-{days} days')
-                GROUP BY company_name
-                ORDER BY avg_price ASC
-            """, conn)
-            conn.close()
+            df = self.queries.frame('company_price_stats', since=since_days(days))
             
             if df.empty:
                 return {'error': 'No data available'}
@@ -0,0 +1,328 @@
+"""
+Async Persistence Writer
+
+Keeps blocking database and file writes off the event loop. Coroutines hand
+work to a single writer task through an asyncio.Queue and move on; the writer
+runs it on a one-thread executor:
+- Database operations queued together share one session and one commit
+  (a failed batch is replayed one operation per commit, so a bad row only
+  loses itself)
+- File writes run on the same thread, after the batch's commit
+- Each submit returns a future for callers that need the outcome (e.g. a
+  new row's id); fire-and-forget callers can ignore it - errors are logged
+
+One writer serves the whole event loop (get_persistence_writer). If the loop
+shuts down with work still queued, the writer finishes it before exiting, so
+asyncio.run() never drops a pending write.
+
+Usage:
+    writer = get_persistence_writer()
+    writer.add(PriceAlert(...))                  # batched with other rows
+    writer.write_text(path, html)                # file I/O on the writer thread
+    row_id = await writer.submit_db(lambda session: ...)
+    await writer.flush()                         # wait for everything so far
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class WriteOp:
+    """One queued unit of blocking work"""
+    kind: str  # 'db' (fn(session)) or 'file' (fn())
+    fn: Callable
+    future: asyncio.Future
+    label: str = ''
+
+
+def _default_session_factory():
+    from database.models import get_session
+    return get_session()
+
+
+def _write_file(path: Path, data: Any, binary: bool):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if binary:
+        path.write_bytes(data)
+    else:
+        path.write_text(data, encoding='utf-8')
+
+
+class PersistenceWriter:
+    """
+    Single writer task feeding a one-thread executor.
+
+    Args:
+        session_factory: Returns a new SQLAlchemy session (default:
+            database.models.get_session)
+        max_batch: Most operations taken from the queue per executor call
+        queue_size: Bound on queued operations (submits beyond it raise
+            asyncio.QueueFull)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = _default_session_factory,
+        max_batch: int = 100,
+        queue_size: int = 10000
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = {'db_ops': 0, 'file_ops': 0, 'commits': 0, 'batches': 0, 'errors': 0}
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='persistence')
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self):
+        """Start the writer task on the running loop (idempotent)"""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self._run(), name='persistence-writer')
+
+    def _submit(self, kind: str, fn: Callable, label: str) -> asyncio.Future:
+        self.start()
+        future = self._loop.create_future()
+        self.queue.put_nowait(WriteOp(kind, fn, future, label))
+        return future
+
+    def submit_db(self, fn: Callable[[Any], Any], label: str = '') -> asyncio.Future:
+        """
+        Queue fn(session); it joins the next batch commit.
+
+        Resolves to fn's return value, or - if fn returns a callable - to
+        that callable's value after the commit (e.g. to read generated ids).
+        """
+        return self._submit('db', fn, label)
+
+    def add(self, obj: Any, label: str = '') -> asyncio.Future:
+        """Queue an ORM object to be added; resolves to its primary key after commit"""
+        def add_obj(session):
+            session.add(obj)
+            return lambda: getattr(obj, 'id', None)
+        return self._submit('db', add_obj, label or type(obj).__name__)
+
+    def submit_file(self, fn: Callable[[], Any], label: str = '') -> asyncio.Future:
+        """Queue blocking file work fn()"""
+        return self._submit('file', fn, label)
+
+    def write_text(self, path: Path, text: str) -> asyncio.Future:
+        return self.submit_file(lambda: _write_file(Path(path), text, False), str(path))
+
+    def write_bytes(self, path: Path, data: bytes) -> asyncio.Future:
+        return self.submit_file(lambda: _write_file(Path(path), data, True), str(path))
+
+    def write_json(self, path: Path, data: Any, **dumps_kwargs) -> asyncio.Future:
+        """Serialize now (a snapshot of data), write on the writer thread"""
+        return self.write_text(path, json.dumps(data, **dumps_kwargs))
+
+    async def flush(self):
+        """Wait until everything queued so far is committed/written"""
+        if self._task is None:
+            return
+        marker = self.submit_file(lambda: None, 'flush')
+        await marker
+
+    async def close(self):
+        """Flush, stop the writer task and the executor"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=True)
+
+    def _run_batch(self, ops: List[WriteOp]) -> List[Tuple[bool, Any]]:
+        """Executor side: one session/commit for the db ops, then the file ops"""
+        outcomes: Dict[int, Tuple[bool, Any]] = {}
+        db_ops = [(i, op) for i, op in enumerate(ops) if op.kind == 'db']
+
+        if db_ops:
+            try:
+                session = self.session_factory()
+            except Exception as e:
+                session = None
+                outcomes.update({i: (False, e) for i, _ in db_ops})
+
+        if db_ops and session is not None:
+            try:
+                try:
+                    results = [(i, op.fn(session)) for i, op in db_ops]
+                    session.commit()
+                    self.stats['commits'] += 1
+                except Exception as e:
+                    session.rollback()
+                    results = []
+                    if len(db_ops) == 1:
+                        outcomes[db_ops[0][0]] = (False, e)
+                    else:
+                        logger.warning(f"⚠️ Batch commit of {len(db_ops)} writes failed ({e}), retrying one by one")
+                        for i, op in db_ops:
+                            try:
+                                result = op.fn(session)
+                                session.commit()
+                                self.stats['commits'] += 1
+                                results.append((i, result))
+                            except Exception as single_error:
+                                session.rollback()
+                                outcomes[i] = (False, single_error)
+                for i, result in results:
+                    outcomes[i] = self._resolve(result)
+            finally:
+                session.close()
+
+        for i, op in enumerate(ops):
+            if op.kind != 'file':
+                continue
+            try:
+                outcomes[i] = (True, op.fn())
+            except Exception as e:
+                outcomes[i] = (False, e)
+
+        self.stats['db_ops'] += len(db_ops)
+        self.stats['file_ops'] += len(ops) - len(db_ops)
+        self.stats['batches'] += 1
+        return [outcomes[i] for i in range(len(ops))]
+
+    @staticmethod
+    def _resolve(result: Any) -> Tuple[bool, Any]:
+        """Post-commit value of a db op (callables are read after the commit)"""
+        try:
+            return True, result() if callable(result) else result
+        except Exception as e:
+            return False, e
+
+    def _settle(self, ops: List[WriteOp], outcomes: List[Tuple[bool, Any]]):
+        for op, (ok, value) in zip(ops, outcomes):
+            if not ok:
+                self.stats['errors'] += 1
+                logger.error(f"❌ Persistence write failed ({op.label or op.kind}): {value}")
+            if op.future.done():
+                continue
+            if ok:
+                op.future.set_result(value)
+            else:
+                op.future.set_exception(value)
+                # Logged above; do not warn again if nobody awaits it
+                op.future.exception()
+
+    def _take_batch(self, first: WriteOp) -> List[WriteOp]:
+        ops = [first]
+        while len(ops) < self.max_batch:
+            try:
+                ops.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return ops
+
+    async def _run(self):
+        ops: List[WriteOp] = []
+        inflight = None
+        try:
+            while True:
+                ops = self._take_batch(await self.queue.get())
+                inflight = self._executor.submit(self._run_batch, ops)
+                self._settle(ops, await asyncio.wrap_future(inflight))
+                ops, inflight = [], None
+        except asyncio.CancelledError:
+            # Loop shutting down: let the running batch finish, then write
+            # whatever is still queued before the task exits
+            pending = [self.queue.get_nowait() for _ in range(self.queue.qsize())]
+            if inflight is not None and not inflight.cancelled():
+                self._settle(ops, inflight.result())
+            else:
+                pending = ops + pending
+            if pending:
+                logger.info(f"💾 Finishing {len(pending)} queued writes before shutdown")
+                self._settle(pending, self._run_batch(pending))
+            raise
+
+
+_WRITERS: Dict[asyncio.AbstractEventLoop, PersistenceWriter] = {}
+
+
+def get_persistence_writer() -> PersistenceWriter:
+    """The running loop's shared writer (created and started on first use)"""
+    loop = asyncio.get_running_loop()
+    for other in [l for l in _WRITERS if l.is_closed()]:
+        del _WRITERS[other]
+    if loop not in _WRITERS:
+        _WRITERS[loop] = PersistenceWriter()
+    writer = _WRITERS[loop]
+    writer.start()
+    return writer
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping task.
+
+    A healthy loop wakes the probe within a millisecond or two of its
+    interval; blocking calls (sync commits, file writes) show up directly as
+    lag. Use as `async with LoopLagMonitor() as monitor:` and read
+    monitor.summary() afterwards.
+
+    Args:
+        interval: Seconds between probes
+        warn_threshold: Lag (seconds) logged as a warning
+    """
+
+    def __init__(self, interval: float = 0.05, warn_threshold: float = 0.25):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _probe(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.samples.append(lag)
+            if lag >= self.warn_threshold:
+                logger.warning(f"⚠️ Event loop blocked for {lag * 1000:.0f} ms")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._probe(), name='loop-lag-monitor')
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> 'LoopLagMonitor':
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    def summary(self) -> Dict[str, float]:
+        """Probe count and max / p95 / mean lag in milliseconds"""
+        if not self.samples:
+            return {'samples': 0, 'max_ms': 0.0, 'p95_ms': 0.0, 'mean_ms': 0.0}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+        return {
+            'samples': len(ordered),
+            'max_ms': round(ordered[-1] * 1000, 2),
+            'p95_ms': round(p95 * 1000, 2),
+            'mean_ms': round(sum(ordered) / len(ordered) * 1000, 2),
+        }
@@ -0,0 +1,193 @@
+"""
+Shared Retry Policy
+
+One retry implementation for every resilience layer:
+- Full-jitter exponential backoff, so parallel workers that fail together
+  do not retry against the same site together
+- A per-run retry budget shared by all competitors, so one flaky site
+  cannot spend the whole run retrying
+- A run deadline that both retries and individual attempts respect
+
+Usage:
+    budget = RetryBudget(max_retries=10, deadline_seconds=900)
+    result = await retry_async(
+        scraper.navigate_smart, page, url,
+        policy=RetryPolicy(max_retries=2),
+        budget=budget,
+        retry_if_result=lambda ok: not ok,
+        label="Roadsurfer navigation"
+    )
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+from loguru import logger
+
+
+class RetryDeadlineExceeded(TimeoutError):
+    """Raised when the run deadline passes before an operation succeeded"""
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how long to back off between retries"""
+    max_retries: int = 3                    # Retries after the first attempt
+    base_delay: float = 2.0                 # Seconds; backoff cap for the first retry
+    max_delay: float = 60.0                 # Upper bound for any single backoff
+    exponential: bool = True                # Double the cap each retry
+    jitter: bool = True                     # Full jitter: uniform(0, cap)
+
+    def backoff(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Delay before retry number attempt + 1.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            rng: Random source (for deterministic tests)
+
+        Returns:
+            Seconds to sleep
+        """
+        cap = self.base_delay * (2 ** attempt) if self.exponential else self.base_delay
+        cap = min(cap, self.max_delay)
+        if not self.jitter:
+            return cap
+        return (rng or random).uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    Retries and wall-clock time shared by everything in one run.
+
+    Every retry (not the first attempt) takes one unit from the budget.
+    Once the budget is spent or the deadline has passed, failures are
+    final and callers fall back instead of retrying.
+    """
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = 10,
+        deadline_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_retries = max_retries
+        self.clock = clock
+        self.deadline = clock() + deadline_seconds if deadline_seconds is not None else None
+        self.retries_used = 0
+        self.retries_denied = 0
+
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline (None if there is no deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.clock())
+
+    def expired(self) -> bool:
+        remaining = self.remaining_time()
+        return remaining is not None and remaining <= 0
+
+    def try_acquire(self, delay: float = 0.0) -> bool:
+        """Take one retry if the budget allows it and it can finish in time"""
+        remaining = self.remaining_time()
+        if remaining is not None and delay >= remaining:
+            self.retries_denied += 1
+            return False
+        if self.max_retries is not None and self.retries_used >= self.max_retries:
+            self.retries_denied += 1
+            return False
+        self.retries_used += 1
+        return True
+
+    def get_stats(self) -> dict:
+        return {
+            'retries_used': self.retries_used,
+            'retries_denied': self.retries_denied,
+            'max_retries': self.max_retries,
+            'remaining_seconds': self.remaining_time(),
+        }
+
+
+async def retry_async(
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    policy: Optional[RetryPolicy] = None,
+    budget: Optional[RetryBudget] = None,
+    label: str = "operation",
+    retry_if_result: Optional[Callable[[Any], bool]] = None,
+    give_up_on: tuple = (),
+    on_failure: Optional[Callable[[int, Optional[BaseException]], None]] = None,
+    rng: Optional[random.Random] = None,
+    **kwargs
+) -> Any:
+    """
+    Run func(*args, **kwargs), retrying failures under a policy and budget.
+
+    Args:
+        func: Coroutine function to run
+        policy: Backoff policy (default RetryPolicy())
+        budget: Shared run budget and deadline (optional)
+        label: Name used in log messages
+        retry_if_result: Treat a returned value as a failure when this returns True
+        give_up_on: Exception types that are never retried
+        on_failure: Called with (attempt, exception or None) after each failed attempt
+        rng: Random source for jitter
+
+    Returns:
+        The first successful result, or the last result if it was retried
+        as a failure and no retries are left
+
+    Raises:
+        The last exception if retries are exhausted, denied by the budget,
+        or the exception type is in give_up_on; RetryDeadlineExceeded if an
+        attempt is cut off by the run deadline
+    """
+    policy = policy or RetryPolicy()
+
+    for attempt in range(policy.max_retries + 1):
+        if budget and budget.expired():
+            raise RetryDeadlineExceeded(f"{label}: run deadline passed before attempt {attempt + 1}")
+
+        error: Optional[BaseException] = None
+        result = None
+        remaining = budget.remaining_time() if budget else None
+        try:
+            if remaining is None:
+                result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=remaining)
+        except give_up_on:
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError) and budget and budget.expired():
+                raise RetryDeadlineExceeded(f"{label}: run deadline reached during attempt {attempt + 1}") from e
+            error = e
+
+        if error is None and not (retry_if_result and retry_if_result(result)):
+            if attempt > 0:
+                logger.info(f"✅ {label}: succeeded on attempt {attempt + 1}")
+            return result
+
+        if on_failure:
+            on_failure(attempt, error)
+
+        reason = f"{error}" if error else "unusable result"
+        if attempt >= policy.max_retries:
+            logger.warning(f"❌ {label}: giving up after {attempt + 1} attempts ({reason})")
+            if error:
+                raise error
+            return result
+
+        delay = policy.backoff(attempt, rng)
+        if budget and not budget.try_acquire(delay):
+            logger.warning(f"🪫 {label}: retry budget or deadline exhausted ({reason})")
+            if error:
+                raise error
+            return result
+
+        logger.info(f"⏳ {label}: attempt {attempt + 1} failed ({reason}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    return result
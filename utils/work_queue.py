@@ -0,0 +1,411 @@
+"""
+Leased Work Queue
+
+Durable queue of scrape jobs that any number of workers - on this host or
+others sharing the database - can pull from:
+- Workers lease one item at a time with a visibility timeout
+- Long jobs heartbeat to extend their lease
+- Results and failures are reported back under the lease (a worker whose
+  lease expired and was re-leased elsewhere cannot overwrite the new owner)
+- Expired leases go back to the queue automatically; items that keep
+  failing are parked as 'dead' after max_attempts
+- An optional dedupe key keeps the same job from being queued twice while
+  it is still pending
+
+SQLiteWorkQueue is the default backend (WAL mode, one short write transaction
+per lease). Other backends implement the WorkQueue interface.
+
+Usage:
+    queue = SQLiteWorkQueue("database/work_queue.db")
+    queue.enqueue('competitor', {'company_name': 'Roadsurfer'}, dedupe_key='competitor:Roadsurfer')
+
+    worker = QueueWorker(queue, {'competitor': scrape_competitor_job})
+    await worker.run(stop_when_empty=True)
+"""
+
+import asyncio
+import json
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+STATUS_QUEUED = 'queued'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_DEAD = 'dead'
+
+
+@dataclass
+class WorkItem:
+    """A leased job"""
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+
+
+class WorkQueue(ABC):
+    """Interface every queue backend implements"""
+
+    @abstractmethod
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        dedupe_key: Optional[str] = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 3
+    ) -> Optional[int]:
+        """Add a job; returns its id, or None if dedupe_key is already pending"""
+
+    def enqueue_many(self, jobs: Iterable[Dict[str, Any]]) -> List[Optional[int]]:
+        """Add several jobs (dicts of enqueue() keyword arguments)"""
+        return [self.enqueue(**job) for job in jobs]
+
+    @abstractmethod
+    def lease(
+        self,
+        worker_id: str,
+        visibility_timeout: float = 300.0,
+        kinds: Optional[List[str]] = None
+    ) -> Optional[WorkItem]:
+        """Take the highest-priority available job, or None if there is none"""
+
+    @abstractmethod
+    def heartbeat(self, item_id: int, worker_id: str, visibility_timeout: float = 300.0) -> bool:
+        """Extend a lease; False if the worker no longer holds it"""
+
+    @abstractmethod
+    def complete(self, item_id: int, worker_id: str, result: Any = None) -> bool:
+        """Record a result; False if the worker no longer holds the lease"""
+
+    @abstractmethod
+    def fail(self, item_id: int, worker_id: str, error: str, retry_delay: float = 0.0) -> bool:
+        """Record a failure; the job is retried until max_attempts, then dead"""
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """Return expired leases to the queue; returns how many were released"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Item count per status"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    SQLite-backed WorkQueue.
+
+    Each instance owns one connection; give every worker (thread, process
+    or host sharing the file) its own instance.
+
+    Args:
+        path: Database file (created if missing)
+        clock: Returns the current time in seconds (for tests)
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS work_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            priority INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'queued',
+            dedupe_key TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            available_at REAL NOT NULL,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_work_items_ready
+            ON work_items (status, priority DESC, available_at, id);
+        CREATE INDEX IF NOT EXISTS idx_work_items_lease
+            ON work_items (status, lease_expires_at);
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_work_items_pending_dedupe
+            ON work_items (dedupe_key) WHERE status IN ('queued', 'leased');
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run fn in one IMMEDIATE transaction (serialised across connections)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        dedupe_key: Optional[str] = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 3
+    ) -> Optional[int]:
+        now = self.clock()
+
+        def insert(conn):
+            cursor = conn.execute(
+                """INSERT OR IGNORE INTO work_items
+                   (kind, payload, priority, dedupe_key, max_attempts, available_at, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (kind, json.dumps(payload, default=str), priority, dedupe_key,
+                 max_attempts, now + delay_seconds, now, now)
+            )
+            return cursor.lastrowid if cursor.rowcount else None
+
+        return self._write(insert)
+
+    def _release_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        dead = conn.execute(
+            """UPDATE work_items SET status = ?, error = 'lease expired', lease_owner = NULL, updated_at = ?
+               WHERE status = ? AND lease_expires_at < ? AND attempts >= max_attempts""",
+            (STATUS_DEAD, now, STATUS_LEASED, now)
+        ).rowcount
+        released = conn.execute(
+            """UPDATE work_items SET status = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+               WHERE status = ? AND lease_expires_at < ?""",
+            (STATUS_QUEUED, now, STATUS_LEASED, now)
+        ).rowcount
+        if dead or released:
+            logger.info(f"♻️ Expired leases: {released} re-queued, {dead} dead")
+        return released
+
+    def requeue_expired(self) -> int:
+        now = self.clock()
+        return self._write(lambda conn: self._release_expired(conn, now))
+
+    def lease(
+        self,
+        worker_id: str,
+        visibility_timeout: float = 300.0,
+        kinds: Optional[List[str]] = None
+    ) -> Optional[WorkItem]:
+        now = self.clock()
+
+        def take(conn):
+            self._release_expired(conn, now)
+
+            query = "SELECT * FROM work_items WHERE status = ? AND available_at <= ?"
+            params: List[Any] = [STATUS_QUEUED, now]
+            if kinds:
+                query += f" AND kind IN ({','.join('?' * len(kinds))})"
+                params.extend(kinds)
+            query += " ORDER BY priority DESC, available_at, id LIMIT 1"
+
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+
+            expires = now + visibility_timeout
+            conn.execute(
+                """UPDATE work_items SET status = ?, lease_owner = ?, lease_expires_at = ?,
+                   attempts = attempts + 1, updated_at = ? WHERE id = ?""",
+                (STATUS_LEASED, worker_id, expires, now, row['id'])
+            )
+            return WorkItem(
+                id=row['id'],
+                kind=row['kind'],
+                payload=json.loads(row['payload']),
+                attempts=row['attempts'] + 1,
+                max_attempts=row['max_attempts'],
+                lease_owner=worker_id,
+                lease_expires_at=expires
+            )
+
+        return self._write(take)
+
+    def _update_leased(self, item_id: int, worker_id: str, assignments: str, params: tuple) -> bool:
+        def update(conn):
+            return conn.execute(
+                f"UPDATE work_items SET {assignments}, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (*params, self.clock(), item_id, STATUS_LEASED, worker_id)
+            ).rowcount == 1
+
+        return self._write(update)
+
+    def heartbeat(self, item_id: int, worker_id: str, visibility_timeout: float = 300.0) -> bool:
+        return self._update_leased(
+            item_id, worker_id, "lease_expires_at = ?", (self.clock() + visibility_timeout,)
+        )
+
+    def complete(self, item_id: int, worker_id: str, result: Any = None) -> bool:
+        return self._update_leased(
+            item_id, worker_id,
+            "status = ?, result = ?, error = NULL, lease_owner = NULL, lease_expires_at = NULL",
+            (STATUS_DONE, json.dumps(result, default=str))
+        )
+
+    def fail(self, item_id: int, worker_id: str, error: str, retry_delay: float = 0.0) -> bool:
+        now = self.clock()
+
+        def update(conn):
+            return conn.execute(
+                """UPDATE work_items
+                   SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,
+                       error = ?, available_at = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                   WHERE id = ? AND status = ? AND lease_owner = ?""",
+                (STATUS_DEAD, STATUS_QUEUED, error[:2000], now + retry_delay, now,
+                 item_id, STATUS_LEASED, worker_id)
+            ).rowcount == 1
+
+        return self._write(update)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM work_items GROUP BY status"
+            ).fetchall()
+        counts = {STATUS_QUEUED: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_DEAD: 0}
+        counts.update({row['status']: row['n'] for row in rows})
+        return counts
+
+    def results(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Payloads and results of finished items"""
+        query = "SELECT id, kind, payload, result FROM work_items WHERE status = ?"
+        params: List[Any] = [STATUS_DONE]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [
+            {'id': row['id'], 'kind': row['kind'], 'payload': json.loads(row['payload']),
+             'result': json.loads(row['result']) if row['result'] else None}
+            for row in rows
+        ]
+
+
+def default_worker_id() -> str:
+    """host:random - unique across hosts and processes"""
+    return f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}"
+
+
+class QueueWorker:
+    """
+    Lease-process-report loop for one worker.
+
+    Args:
+        queue: Queue backend (use a separate instance per worker)
+        handlers: Coroutine per job kind, called with the payload; its
+            return value is stored as the result
+        worker_id: Lease owner name (default host:random)
+        visibility_timeout: Lease length in seconds
+        heartbeat_interval: Seconds between lease extensions while a job runs
+        poll_interval: Sleep when the queue is empty
+        retry_delay: Delay before a failed job becomes available again
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]],
+        worker_id: Optional[str] = None,
+        visibility_timeout: float = 300.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 5.0,
+        retry_delay: float = 60.0
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.worker_id = worker_id or default_worker_id()
+        self.visibility_timeout = visibility_timeout
+        self.heartbeat_interval = heartbeat_interval or visibility_timeout / 3
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.processed = 0
+        self.failed = 0
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    async def _heartbeat(self, item: WorkItem):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            held = await asyncio.to_thread(
+                self.queue.heartbeat, item.id, self.worker_id, self.visibility_timeout
+            )
+            if not held:
+                logger.warning(f"⚠️ {self.worker_id} lost the lease on item {item.id}")
+                return
+
+    async def process(self, item: WorkItem):
+        """Run one leased item and report the outcome"""
+        handler = self.handlers[item.kind]
+        heartbeat = asyncio.create_task(self._heartbeat(item))
+        try:
+            result = await handler(item.payload)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"❌ {item.kind} #{item.id} failed (attempt {item.attempts}/{item.max_attempts}): {e}")
+            await asyncio.to_thread(self.queue.fail, item.id, self.worker_id, str(e), self.retry_delay)
+            return
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        if await asyncio.to_thread(self.queue.complete, item.id, self.worker_id, result):
+            self.processed += 1
+        else:
+            logger.warning(f"⚠️ Result for item {item.id} discarded - lease was lost")
+
+    async def run(self, stop_when_empty: bool = False, max_items: Optional[int] = None):
+        """
+        Process jobs until stop(), the queue is empty (stop_when_empty) or
+        max_items have been handled.
+        """
+        kinds = list(self.handlers)
+        handled = 0
+        while not self._stop.is_set() and (max_items is None or handled < max_items):
+            item = await asyncio.to_thread(self.queue.lease, self.worker_id, self.visibility_timeout, kinds)
+            if item is None:
+                if stop_when_empty:
+                    break
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.process(item)
+            handled += 1